@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the scrapers, using recorded snapshots instead of the live wikis.
+
+    record   Save snapshots of the Hoyolab list pages (/aggregate/2, /4, /5), the weapon
+             detail pages and the Fandom Character/List page (needs network, run once)
+    run      Serve the snapshots from a local HTTP server, run HoyolabScraper and
+             fandom.get_character_data against them and report items/sec, wall time
+             and peak Python memory over repeated runs
+    compare  Diff two result files, e.g. from two commits
+
+Usage:
+    uv run --project scripts/pyproject.toml scripts/benchmark.py record
+    uv run --project scripts/pyproject.toml scripts/benchmark.py run --repeat 5
+    uv run --project scripts/pyproject.toml scripts/benchmark.py compare OLD.json NEW.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, TypedDict, cast
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from playwright.sync_api import Page, Route
+
+import fandom
+from hoyolab import (
+    ARTIFACT_LIST_PATH,
+    BASE_URL,
+    CHARACTER_LIST_PATH,
+    ENTRY_LANGUAGE_CODES,
+    ENTRY_PATH,
+    WEAPON_LIST_PATH,
+    HoyolabScraper,
+    extract_id_from_url,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(SCRIPT_DIR, ".cache", "bench", "fixtures")
+RESULT_DIR = os.path.join(SCRIPT_DIR, ".cache", "bench", "results")
+
+LANGUAGES = ["en", "zh"]
+# Entry pages are requested with full locale codes, fixtures are named by language
+FIXTURE_LANGUAGES = {locale: lang for lang, locale in ENTRY_LANGUAGE_CODES.items()}
+FANDOM_LIST_PATH = urlparse(fandom.CHARACTERS_URL).path
+
+# (list path, card selector, image selector) per category, as used by HoyolabScraper
+LIST_PAGES: dict[str, tuple[str, str, str]] = {
+    "characters": (
+        CHARACTER_LIST_PATH,
+        "article.character-card",
+        "article.character-card img.d-img-show",
+    ),
+    "weapons": (
+        WEAPON_LIST_PATH,
+        ".genshin-show-weapon-item",
+        ".genshin-show-weapon-item img.d-img-show",
+    ),
+    "artifacts": (ARTIFACT_LIST_PATH, "div.artifact-card", "div.artifact-card img.d-img-show"),
+}
+
+# Strip scripts so the snapshot stays static, and point entry links at the local server.
+# Links open in a new tab, which is what the scrapers wait for when clicking a card.
+SNAPSHOT_SCRIPT = """
+([base, entryPath, lang]) => {
+  document.querySelectorAll('script, link[rel="preload"], link[rel="modulepreload"]')
+    .forEach((el) => el.remove());
+  document.querySelectorAll('a[href]').forEach((a) => {
+    let href = a.getAttribute('href');
+    if (href.startsWith(base)) href = href.slice(base.length);
+    if (href.startsWith(entryPath)) {
+      href = href.split('?')[0] + '?lang=' + lang;
+      a.setAttribute('target', '_blank');
+    }
+    a.setAttribute('href', href);
+  });
+  return '<!DOCTYPE html>' + document.documentElement.outerHTML;
+}
+"""
+
+# Cards that open their detail page from JS get wrapped in a plain link instead
+LINK_CARDS_SCRIPT = """
+([selector, hrefs]) => {
+  document.querySelectorAll(selector).forEach((card, i) => {
+    if (!hrefs[i] || card.closest('a[href]')) return;
+    const a = document.createElement('a');
+    a.setAttribute('href', hrefs[i]);
+    card.replaceWith(a);
+    a.appendChild(card);
+  });
+}
+"""
+
+STUB_PAGE = b"<!DOCTYPE html><html><body></body></html>"
+
+
+class RunResult(TypedDict):
+    wall_s: float
+    items: int
+    items_per_s: float
+    peak_mb: float
+
+
+class BenchmarkResult(TypedDict):
+    runs: list[RunResult]
+    median_wall_s: float
+    median_items_per_s: float
+    max_peak_mb: float
+
+
+def fixture_name(path: str, lang: str | None) -> str:
+    name = path.strip("/").replace("/", "_") or "index"
+    if lang:
+        lang = FIXTURE_LANGUAGES.get(lang, lang)
+    return f"{name}.{lang}.html" if lang else f"{name}.html"
+
+
+def fixture_digest(fixture_dir: str) -> str:
+    """Hash of all fixtures, so results recorded against different snapshots are not compared"""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(fixture_dir)):
+        digest.update(name.encode())
+        with open(os.path.join(fixture_dir, name), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+# ---------------------------------------------------------------------------
+# Recording
+# ---------------------------------------------------------------------------
+
+
+def _save_snapshot(page: Page, fixture_dir: str, path: str, lang: str | None) -> None:
+    html = page.evaluate(SNAPSHOT_SCRIPT, [BASE_URL, ENTRY_PATH, lang or "en"])
+    with open(os.path.join(fixture_dir, fixture_name(path, lang)), "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+def _link_cards(scraper: HoyolabScraper, selector: str, lang: str) -> list[str]:
+    """Make every card a static link to its entry page and return the entry IDs"""
+    page = scraper._ensure_page()
+    cards = page.locator(selector).all()
+    if cards and cards[0].evaluate("el => !!el.closest('a[href]')"):
+        hrefs = [
+            card.evaluate("el => el.closest('a[href]').getAttribute('href')") for card in cards
+        ]
+    else:
+        hrefs = []
+        for card in cards:
+            try:
+                with page.context.expect_page() as new_page_info:
+                    card.click()
+                new_page = new_page_info.value
+                entry_id = extract_id_from_url(new_page.url)
+                new_page.close()
+                hrefs.append(f"{ENTRY_PATH}/{entry_id}?lang={lang}" if entry_id else "")
+            except Exception as e:
+                print(f"Could not resolve entry link for card: {e}")
+                hrefs.append("")
+        page.evaluate(LINK_CARDS_SCRIPT, [selector, hrefs])
+
+    return [entry_id for entry_id in (extract_id_from_url(h) for h in hrefs) if entry_id]
+
+
+def record(fixture_dir: str) -> None:
+    os.makedirs(fixture_dir, exist_ok=True)
+
+    with HoyolabScraper() as scraper:
+        page = scraper._ensure_page()
+        weapon_ids: set[str] = set()
+
+        for category, (path, card_selector, image_selector) in LIST_PAGES.items():
+            for lang in LANGUAGES:
+                print(f"Recording {category} ({lang})...")
+                scraper._navigate_with_language(f"{BASE_URL}{path}", lang)
+                scraper._scroll_until_all_loaded(card_selector)
+                scraper._wait_for_images_to_load(image_selector)
+                entry_ids = _link_cards(scraper, card_selector, lang)
+                if category == "weapons":
+                    weapon_ids.update(entry_ids)
+                _save_snapshot(page, fixture_dir, path, lang)
+
+        for entry_id in sorted(weapon_ids):
+            for lang in LANGUAGES:
+                print(f"Recording weapon detail {entry_id} ({lang})...")
+                scraper._navigate_with_language(f"{BASE_URL}{ENTRY_PATH}/{entry_id}", lang)
+                try:
+                    page.wait_for_selector("div.base-info-content", timeout=10000)
+                except Exception as e:
+                    print(f"Detail content did not load for {entry_id}: {e}")
+                _save_snapshot(page, fixture_dir, f"{ENTRY_PATH}/{entry_id}", lang)
+
+    print("Recording Fandom character list...")
+    response = requests.get(
+        fandom.CHARACTERS_URL,
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+        timeout=30,
+    )
+    response.raise_for_status()
+    with open(
+        os.path.join(fixture_dir, fixture_name(FANDOM_LIST_PATH, None)), "w", encoding="utf-8"
+    ) as f:
+        f.write(response.text)
+
+    print(f"Recorded {len(os.listdir(fixture_dir))} fixtures to {fixture_dir}")
+
+
+# ---------------------------------------------------------------------------
+# Replay
+# ---------------------------------------------------------------------------
+
+
+class FixtureServer(ThreadingHTTPServer):
+    def __init__(self, fixture_dir: str):
+        super().__init__(("127.0.0.1", 0), FixtureHandler)
+        self.fixture_dir = fixture_dir
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        server = cast(FixtureServer, self.server)
+        parsed = urlparse(self.path)
+        lang = parse_qs(parsed.query).get("lang", [None])[0]
+        fixture_path = os.path.join(server.fixture_dir, fixture_name(parsed.path, lang))
+
+        # Only weapon entry pages are recorded, other entries get an empty page
+        body = STUB_PAGE
+        if os.path.exists(fixture_path):
+            with open(fixture_path, "rb") as f:
+                body = f.read()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@contextmanager
+def serve_fixtures(fixture_dir: str) -> Iterator[str]:
+    server = FixtureServer(fixture_dir)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _scrape_offline(base_url: str, scrape: Callable[[HoyolabScraper, str], Iterable[Any]]) -> int:
+    with HoyolabScraper(base_url=base_url) as scraper:
+
+        def block_external(route: Route) -> None:
+            # Snapshots still reference CDN images; keep the run fully offline
+            if route.request.url.startswith(base_url):
+                route.continue_()
+            else:
+                route.abort()
+
+        scraper.route("**/*", block_external)
+        return sum(1 for lang in LANGUAGES for _ in scrape(scraper, lang))
+
+
+BENCHMARKS: dict[str, Callable[[str], int]] = {
+    "hoyolab.scrape_characters": lambda base_url: _scrape_offline(
+        base_url, HoyolabScraper.scrape_characters
+    ),
+    "hoyolab.scrape_artifacts": lambda base_url: _scrape_offline(
+        base_url, HoyolabScraper.scrape_artifacts
+    ),
+    "hoyolab.scrape_weapons": lambda base_url: _scrape_offline(
+        base_url, HoyolabScraper.scrape_weapons
+    ),
+    "fandom.get_character_data": lambda base_url: len(
+        fandom.get_character_data(f"{base_url}{FANDOM_LIST_PATH}")
+    ),
+    "fandom.get_character_data_browser": lambda base_url: len(
+        fandom.get_character_data_browser(f"{base_url}{FANDOM_LIST_PATH}")
+    ),
+}
+
+
+def _measure(benchmark: Callable[[str], int], base_url: str) -> RunResult:
+    tracemalloc.start()
+    start = time.perf_counter()
+    items = benchmark(base_url)
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "wall_s": round(wall, 3),
+        "items": items,
+        "items_per_s": round(items / wall, 2) if wall else 0.0,
+        "peak_mb": round(peak / 1024 / 1024, 2),
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=SCRIPT_DIR,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def run(fixture_dir: str, repeat: int, only: list[str] | None, output: str | None) -> str:
+    if not os.path.isdir(fixture_dir) or not os.listdir(fixture_dir):
+        sys.exit(f"No fixtures in {fixture_dir}; run 'benchmark.py record' first")
+
+    selected = {name: fn for name, fn in BENCHMARKS.items() if not only or name in only}
+    results: dict[str, BenchmarkResult] = {}
+
+    with serve_fixtures(fixture_dir) as base_url:
+        for name, benchmark in selected.items():
+            # Warm-up run so browser startup caches do not skew the first measurement
+            benchmark(base_url)
+            runs = [_measure(benchmark, base_url) for _ in range(repeat)]
+            results[name] = {
+                "runs": runs,
+                "median_wall_s": round(statistics.median(r["wall_s"] for r in runs), 3),
+                "median_items_per_s": round(statistics.median(r["items_per_s"] for r in runs), 2),
+                "max_peak_mb": max(r["peak_mb"] for r in runs),
+            }
+
+    revision = _git_revision()
+    report = {
+        "revision": revision,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "fixtures": fixture_digest(fixture_dir),
+        "repeat": repeat,
+        "results": results,
+    }
+
+    output = output or os.path.join(RESULT_DIR, f"{revision}.json")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"\n{'Benchmark':<30} {'Items':>7} {'Median s':>10} {'Items/s':>10} {'Peak MB':>9}")
+    print("-" * 70)
+    for name, result in results.items():
+        print(
+            f"{name:<30} {result['runs'][0]['items']:>7} {result['median_wall_s']:>10.3f} "
+            f"{result['median_items_per_s']:>10.2f} {result['max_peak_mb']:>9.2f}"
+        )
+    print(f"\nWritten results to {output}")
+    return output
+
+
+def compare(old_path: str, new_path: str) -> None:
+    with open(old_path, encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, encoding="utf-8") as f:
+        new = json.load(f)
+
+    if old["fixtures"] != new["fixtures"]:
+        print("WARNING: results were recorded against different fixtures")
+
+    print(f"{'Benchmark':<30} {old['revision']:>10} {new['revision']:>10} {'Change':>9}")
+    print("-" * 62)
+    for name, new_result in new["results"].items():
+        old_result = old["results"].get(name)
+        if not old_result:
+            print(f"{name:<30} {'-':>10} {new_result['median_wall_s']:>10.3f}")
+            continue
+        before = old_result["median_wall_s"]
+        after = new_result["median_wall_s"]
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{name:<30} {before:>10.3f} {after:>10.3f} {change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline scraper benchmark")
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="Snapshot directory")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("record", help="Record snapshots from the live wikis")
+
+    run_parser = subparsers.add_parser("run", help="Run benchmarks against the snapshots")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Measured runs per benchmark")
+    run_parser.add_argument("--only", nargs="*", choices=list(BENCHMARKS), help="Subset to run")
+    run_parser.add_argument("--output", default=None, help="Result file (default: by revision)")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.fixtures)
+    elif args.command == "run":
+        run(args.fixtures, args.repeat, args.only, args.output)
+    elif args.command == "compare":
+        compare(args.old, args.new)
+
+
+if __name__ == "__main__":
+    main()
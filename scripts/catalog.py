@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Versioned SQLite catalog of every scrape.
+resources.ts and i18n-game.ts only hold the latest data, so each pipeline run also records its
+characters, weapons, artifacts, half sets and resources here as a new version. An item gets a
+new revision only when its content hash changes, which keeps the full history small and makes
+"when did this change" and "what was added in this version" single queries.
+codedump.py --from-catalog regenerates the TS files from the latest version without scraping.
+
+Usage:
+    python catalog.py import [--label 5.3]       # record the current TS files as a version
+    python catalog.py runs
+    python catalog.py history weapons <id>
+    python catalog.py added <version>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+from pydantic import BaseModel
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+CATALOG_PATH = os.path.join(SCRIPT_DIR, ".cache", "catalog.sqlite")
+
+# Category -> i18nGameData key of its i18n records (None: no i18n)
+CATEGORIES: dict[str, str | None] = {
+    "characters": "characters",
+    "artifacts": "artifacts",
+    "weapons": "weapons",
+    "half_sets": "artifactHalfSets",
+    "elements": None,
+    "weapon_types": None,
+}
+
+# Category -> resources.ts export of its output list
+RESOURCE_EXPORTS: dict[str, str] = {
+    "characters": "characters",
+    "artifacts": "artifacts",
+    "weapons": "weapons",
+    "half_sets": "artifactHalfSets",
+    "elements": "elementResources",
+    "weapon_types": "weaponTypeResources",
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    version INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT,
+    started_at TEXT NOT NULL,
+    categories TEXT NOT NULL
+);
+-- Latest revision of every item ever seen
+CREATE TABLE IF NOT EXISTS items (
+    category TEXT NOT NULL,
+    id TEXT NOT NULL,
+    entry_id TEXT,
+    position INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    output TEXT NOT NULL,
+    i18n TEXT,
+    first_version INTEGER NOT NULL,
+    changed_version INTEGER NOT NULL,
+    last_version INTEGER NOT NULL,
+    -- Set when a run of the category no longer had the item
+    removed_version INTEGER,
+    scraped_at TEXT NOT NULL,
+    PRIMARY KEY (category, id)
+);
+-- One row per content change
+CREATE TABLE IF NOT EXISTS revisions (
+    category TEXT NOT NULL,
+    id TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    output TEXT NOT NULL,
+    i18n TEXT,
+    scraped_at TEXT NOT NULL,
+    PRIMARY KEY (category, id, version)
+);
+CREATE INDEX IF NOT EXISTS items_entry_id ON items (entry_id);
+CREATE INDEX IF NOT EXISTS items_first_version ON items (first_version);
+CREATE INDEX IF NOT EXISTS revisions_version ON revisions (version);
+"""
+
+
+class CatalogRecord(NamedTuple):
+    id: str
+    # Hoyolab entry ID, None for items that are not scraped one by one (half sets)
+    entry_id: str | None
+    output: dict[str, Any]
+    i18n: Any
+
+
+class Generation(NamedTuple):
+    """The latest data in the catalog, in the argument shape of codedump.write_data"""
+
+    characters: list[dict[str, Any]]
+    artifacts: list[dict[str, Any]]
+    weapons: list[dict[str, Any]]
+    half_sets: list[dict[str, Any]]
+    elements: list[dict[str, Any]]
+    weapon_types: list[dict[str, Any]]
+    i18n: dict[str, dict[str, Any]]
+
+
+def to_json_data(value: Any) -> Any:
+    """Output models and i18n records as plain JSON data"""
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True)
+    if isinstance(value, dict):
+        return {key: to_json_data(v) for key, v in value.items()}
+    if isinstance(value, list):
+        return [to_json_data(v) for v in value]
+    return value
+
+
+def canonical_json(value: Any) -> str:
+    return json.dumps(
+        to_json_data(value), sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def content_hash(output: Any, i18n: Any = None) -> str:
+    """Stable hash of an item's output and i18n record, independent of key order"""
+    return hashlib.sha256(canonical_json([output, i18n]).encode()).hexdigest()
+
+
+def build_records(
+    category: str,
+    outputs: Iterable[Any],
+    i18n: Mapping[str, Any] | None = None,
+    entry_ids: Mapping[str, str] | None = None,
+) -> list[CatalogRecord]:
+    """Catalog records for a category's output list (models or dicts, as write_data takes)"""
+    records: list[CatalogRecord] = []
+    for output in outputs:
+        data = to_json_data(output)
+        # Half sets have integer IDs, elements and weapon types only a name
+        item_id = str(data["id"] if "id" in data else data["name"])
+        records.append(
+            CatalogRecord(
+                id=item_id,
+                entry_id=(entry_ids or {}).get(item_id),
+                output=data,
+                i18n=to_json_data((i18n or {}).get(item_id)),
+            )
+        )
+    return records
+
+
+class Catalog:
+    """Connection to the catalog database, one version per begin_run()"""
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def begin_run(self, categories: Iterable[str], label: str | None = None) -> int:
+        """Start a new version and return its number"""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (label, started_at, categories) VALUES (?, ?, ?)",
+                (label, now(), ",".join(categories)),
+            )
+        assert cursor.lastrowid is not None
+        return cursor.lastrowid
+
+    def latest_version(self) -> int | None:
+        return self.connection.execute("SELECT MAX(version) FROM runs").fetchone()[0]
+
+    def upsert_category(
+        self, version: int, category: str, records: list[CatalogRecord]
+    ) -> dict[str, int]:
+        """
+        Record the full item list of a category for a version. Unchanged items only get their
+        last_version bumped; items missing from the list are marked removed.
+        Returns counts of added, changed, unchanged and removed items.
+        """
+        if category not in CATEGORIES:
+            raise ValueError(f"Unknown catalog category: {category}")
+
+        scraped_at = now()
+        previous_hashes: dict[str, tuple[str, int | None]] = {
+            item_id: (item_hash, removed)
+            for item_id, item_hash, removed in self.connection.execute(
+                "SELECT id, content_hash, removed_version FROM items WHERE category = ?",
+                (category,),
+            )
+        }
+        counts = {"added": 0, "changed": 0, "unchanged": 0, "removed": 0}
+
+        with self.connection:
+            for position, record in enumerate(records):
+                # Stored in output key order, only the hash is order independent
+                output_json = json.dumps(record.output, ensure_ascii=False)
+                i18n_json = (
+                    None if record.i18n is None else json.dumps(record.i18n, ensure_ascii=False)
+                )
+                item_hash = content_hash(record.output, record.i18n)
+                previous = previous_hashes.get(record.id)
+
+                if previous is None:
+                    counts["added"] += 1
+                elif previous[0] != item_hash or previous[1] is not None:
+                    counts["changed"] += 1
+                else:
+                    counts["unchanged"] += 1
+
+                # The position keeps the output order of write_data, which the TS data indexes
+                self.connection.execute(
+                    """
+                    INSERT INTO items (
+                        category, id, entry_id, position, content_hash, output, i18n,
+                        first_version, changed_version, last_version, removed_version, scraped_at
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)
+                    ON CONFLICT (category, id) DO UPDATE SET
+                        entry_id = COALESCE(excluded.entry_id, items.entry_id),
+                        position = excluded.position,
+                        changed_version = CASE
+                            WHEN items.content_hash = excluded.content_hash
+                                AND items.removed_version IS NULL
+                            THEN items.changed_version ELSE excluded.changed_version END,
+                        content_hash = excluded.content_hash,
+                        output = excluded.output,
+                        i18n = excluded.i18n,
+                        last_version = excluded.last_version,
+                        removed_version = NULL,
+                        scraped_at = excluded.scraped_at
+                    """,
+                    (
+                        category,
+                        record.id,
+                        record.entry_id,
+                        position,
+                        item_hash,
+                        output_json,
+                        i18n_json,
+                        version,
+                        version,
+                        version,
+                        scraped_at,
+                    ),
+                )
+                if previous is None or previous[0] != item_hash:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO revisions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            category,
+                            record.id,
+                            version,
+                            item_hash,
+                            output_json,
+                            i18n_json,
+                            scraped_at,
+                        ),
+                    )
+
+            cursor = self.connection.execute(
+                """
+                UPDATE items SET removed_version = ?
+                WHERE category = ? AND last_version < ? AND removed_version IS NULL
+                """,
+                (version, category, version),
+            )
+            counts["removed"] = cursor.rowcount
+
+        return counts
+
+    def recorded_categories(self) -> set[str]:
+        """Categories with at least one revision, the others come back empty from the catalog"""
+        return {
+            category
+            for (category,) in self.connection.execute("SELECT DISTINCT category FROM revisions")
+        }
+
+    def load_generation(self) -> Generation:
+        """Current (not removed) items of every category, in output order"""
+
+        def current(category: str) -> list[tuple[str, Any, Any]]:
+            return [
+                (item_id, json.loads(output), None if i18n is None else json.loads(i18n))
+                for item_id, output, i18n in self.connection.execute(
+                    """
+                    SELECT id, output, i18n FROM items
+                    WHERE category = ? AND removed_version IS NULL
+                    ORDER BY position
+                    """,
+                    (category,),
+                )
+            ]
+
+        rows = {category: current(category) for category in CATEGORIES}
+        i18n = {
+            i18n_key: {item_id: record for item_id, _, record in rows[category]}
+            for category, i18n_key in CATEGORIES.items()
+            if i18n_key is not None
+        }
+        # Half sets are listed by size, but their i18n records by ID
+        i18n["artifactHalfSets"] = dict(
+            sorted(i18n["artifactHalfSets"].items(), key=lambda r: int(r[0]))
+        )
+        outputs = {category: [output for _, output, _ in items] for category, items in rows.items()}
+        return Generation(
+            characters=outputs["characters"],
+            artifacts=outputs["artifacts"],
+            weapons=outputs["weapons"],
+            half_sets=outputs["half_sets"],
+            elements=outputs["elements"],
+            weapon_types=outputs["weapon_types"],
+            i18n=i18n,
+        )
+
+    def entry_ids(self, category: str) -> dict[str, str]:
+        """Generated ID -> Hoyolab entry ID of the current items of a category"""
+        return dict(
+            self.connection.execute(
+                """
+                SELECT id, entry_id FROM items
+                WHERE category = ? AND entry_id != '' AND removed_version IS NULL
+                """,
+                (category,),
+            ).fetchall()
+        )
+
+    def history(self, category: str, item_id: str) -> list[tuple[int, str, str]]:
+        """(version, scraped_at, content_hash) of every revision of an item"""
+        return self.connection.execute(
+            """
+            SELECT version, scraped_at, content_hash FROM revisions
+            WHERE category = ? AND id = ? ORDER BY version
+            """,
+            (category, item_id),
+        ).fetchall()
+
+    def added_in(self, version: int) -> list[tuple[str, str]]:
+        """(category, id) of the items first seen in a version"""
+        return self.connection.execute(
+            "SELECT category, id FROM items WHERE first_version = ? ORDER BY category, position",
+            (version,),
+        ).fetchall()
+
+    def runs(self) -> list[tuple[int, str | None, str, str]]:
+        return self.connection.execute(
+            "SELECT version, label, started_at, categories FROM runs ORDER BY version"
+        ).fetchall()
+
+
+def now() -> str:
+    return datetime.now(UTC).isoformat(timespec="seconds")
+
+
+def record_generation(
+    catalog: Catalog,
+    records: Mapping[str, list[CatalogRecord]],
+    label: str | None = None,
+) -> int:
+    """Record the given categories as a new version and print what changed"""
+    version = catalog.begin_run(records, label)
+    for category, category_records in records.items():
+        counts = catalog.upsert_category(version, category, category_records)
+        summary = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count)
+        print(f"Catalog v{version} {category}: {summary or 'empty'}")
+    return version
+
+
+def generation_records(
+    resources: Mapping[str, Any], i18n: Mapping[str, Any]
+) -> dict[str, list[CatalogRecord]]:
+    """Records of every category, from data in the shape of resources.ts and i18n-game.ts"""
+    return {
+        category: build_records(
+            category,
+            resources.get(RESOURCE_EXPORTS[category]) or [],
+            i18n.get(i18n_key) if i18n_key else None,
+        )
+        for category, i18n_key in CATEGORIES.items()
+    }
+
+
+def import_ts_files(catalog: Catalog, label: str | None = None) -> int:
+    """Record the current resources.ts and i18n-game.ts as a version"""
+    # Imported here, codedump imports this module
+    from codedump import load_existing_data
+
+    resources, i18n = load_existing_data(PROJECT_ROOT)
+    return record_generation(catalog, generation_records(resources, i18n), label)
+
+
+@dataclass
+class ItemChanges:
+    """IDs of the items of one category that differ from the previous generation"""
+
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    # Changed items whose image URL changed too, their files have to be downloaded again
+    images: list[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def updated(self) -> set[str]:
+        return {*self.added, *self.changed}
+
+
+def image_urls(output: Mapping[str, Any]) -> list[str]:
+    return [url for key, url in sorted(output.items()) if key.startswith("imageUrl")]
+
+
+def diff_records(previous: list[CatalogRecord], current: list[CatalogRecord]) -> ItemChanges:
+    """Compare two generations of a category by content hash"""
+    previous_by_id = {record.id: record for record in previous}
+    current_ids = {record.id for record in current}
+    changes = ItemChanges(
+        removed=[record.id for record in previous if record.id not in current_ids]
+    )
+    for record in current:
+        old = previous_by_id.get(record.id)
+        if old is None:
+            changes.added.append(record.id)
+        elif content_hash(old.output, old.i18n) != content_hash(record.output, record.i18n):
+            changes.changed.append(record.id)
+            if image_urls(old.output) != image_urls(record.output):
+                changes.images.append(record.id)
+    return changes
+
+
+# IDs listed per line of the change report, the rest are counted
+REPORT_LIMIT = 8
+
+
+def print_change_report(changes: Mapping[str, ItemChanges]) -> None:
+    print("=== Changes ===")
+    if not any(changes.values()):
+        print("No changes")
+        return
+    for category, category_changes in changes.items():
+        if not category_changes:
+            continue
+        parts = []
+        for sign, ids in (
+            ("+", category_changes.added),
+            ("~", category_changes.changed),
+            ("-", category_changes.removed),
+        ):
+            if ids:
+                listed = ", ".join(ids[:REPORT_LIMIT])
+                more = f" (+{len(ids) - REPORT_LIMIT} more)" if len(ids) > REPORT_LIMIT else ""
+                parts.append(f"{sign}{len(ids)} [{listed}{more}]")
+        print(f"{category}: {' '.join(parts)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query the versioned scrape catalog")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog database path")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="Record the current TS data as a version")
+    import_parser.add_argument("--label", default=None, help="Version label (e.g. game version)")
+
+    commands.add_parser("runs", help="List versions")
+
+    history_parser = commands.add_parser("history", help="Revisions of one item")
+    history_parser.add_argument("category", choices=list(CATEGORIES))
+    history_parser.add_argument("id")
+
+    added_parser = commands.add_parser("added", help="Items first seen in a version")
+    added_parser.add_argument("version", type=int)
+
+    args = parser.parse_args()
+
+    with Catalog(args.catalog) as catalog:
+        if args.command == "import":
+            import_ts_files(catalog, args.label)
+        elif args.command == "runs":
+            for version, label, started_at, categories in catalog.runs():
+                print(f"v{version}  {started_at}  {label or '-'}  {categories}")
+        elif args.command == "history":
+            for version, scraped_at, item_hash in catalog.history(args.category, args.id):
+                print(f"v{version}  {scraped_at}  {item_hash[:12]}")
+        elif args.command == "added":
+            for category, item_id in catalog.added_in(args.version):
+                print(f"{category}: {item_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Generates src/data/chanceTables.ts, the substat draw probabilities behind
+src/lib/artifactChance.ts.
+
+An artifact draws 4 distinct substats by weight without replacement, from the substat pool
+minus its main stat. The chance of any slot filter only depends on which 4 substats were
+drawn, so for every main stat we store the probability of each of the C(10, 4) draws and the
+app sums the draws that pass the filter.
+Weights are read from statPoolWithWeights in src/data/constants.ts, so rerun this after
+changing them.
+"""
+
+import itertools
+import os
+import re
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+CONSTANTS_PATH = os.path.join(PROJECT_ROOT, "src", "data", "constants.ts")
+OUTPUT_PATH = os.path.join(PROJECT_ROOT, "src", "data", "chanceTables.ts")
+
+SUBSTAT_DRAW_COUNT = 4
+
+# Key for main stats that are not in the substat pool (elemental%, phys%, heal%)
+NO_MAIN_STAT_KEY = ""
+
+
+def load_substat_weights(path: str = CONSTANTS_PATH) -> dict[str, float]:
+    """Read statPoolWithWeights.substat from constants.ts (object literal, not JSON)"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    match = re.search(r"statPoolWithWeights = \{.*?\bsubstat: \{(.*?)\}", content, re.DOTALL)
+    if not match:
+        raise ValueError(f"statPoolWithWeights.substat not found in {path}")
+
+    return {
+        key.strip('"'): float(value)
+        for key, value in re.findall(r'("[^"]+"|\w+):\s*([\d.]+)', match.group(1))
+    }
+
+
+def draw_probabilities(
+    weights: npt.NDArray[np.float64], draws: npt.NDArray[np.int64]
+) -> npt.NDArray[np.float64]:
+    """
+    Probability of drawing exactly each set of indices (one row of draws) in any order.
+    Sums over every draw order the product of weight / remaining weight, vectorized over
+    all sets and orders at once.
+    """
+    orders = np.array(list(itertools.permutations(range(draws.shape[1]))))
+    # (sets, orders, picks) weights in draw order
+    ordered = weights[draws[:, orders]]
+    drawn_before = np.cumsum(ordered, axis=2) - ordered
+    remaining = weights.sum() - drawn_before
+    return np.prod(ordered / remaining, axis=2).sum(axis=1)
+
+
+def build_tables(
+    substat_weights: dict[str, float],
+) -> tuple[list[str], list[int], dict[str, list[float]]]:
+    """
+    Returns the substat bit order, every draw as a bitmask, and per main stat the
+    probability of each draw (0 for draws containing the main stat).
+    """
+    stats = list(substat_weights)
+    all_weights = np.array([substat_weights[stat] for stat in stats], dtype=np.float64)
+
+    draws = np.array(list(itertools.combinations(range(len(stats)), SUBSTAT_DRAW_COUNT)))
+    masks = (1 << draws).sum(axis=1)
+
+    tables: dict[str, list[float]] = {}
+    for main_stat in [NO_MAIN_STAT_KEY, *stats]:
+        # The main stat can not roll as a substat, so it is removed from the pool
+        weights = all_weights.copy()
+        if main_stat != NO_MAIN_STAT_KEY:
+            weights[stats.index(main_stat)] = 0
+
+        # Draws containing the main stat come out as 0 through its zero weight
+        tables[main_stat] = draw_probabilities(weights, draws).tolist()
+
+    return stats, masks.tolist(), tables
+
+
+def write_tables(
+    stats: list[str],
+    masks: list[int],
+    tables: dict[str, list[float]],
+    path: str = OUTPUT_PATH,
+) -> None:
+    def number_list(values: Sequence[float]) -> str:
+        return "[" + ", ".join(f"{value:.10g}" for value in values) + "]"
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("// This file is auto-generated by scripts/chance_tables.py\n")
+        f.write("// Do not edit this file directly\n\n")
+        f.write("import type { SubStat } from './types';\n\n")
+
+        f.write("// Bit i of a draw mask is substatBitOrder[i]\n")
+        f.write("export const substatBitOrder: SubStat[] = ")
+        f.write("[" + ", ".join(f'"{stat}"' for stat in stats) + "];\n\n")
+
+        f.write(
+            f"// Every set of {SUBSTAT_DRAW_COUNT} substats an artifact can roll, as a bitmask\n"
+        )
+        f.write(f"export const substatDrawMasks: number[] = {number_list(masks)};\n\n")
+
+        f.write("// Probability of each draw in substatDrawMasks, keyed by main stat\n")
+        f.write(f'// ("{NO_MAIN_STAT_KEY}" for main stats that are not substats)\n')
+        f.write("export const substatDrawProbabilities: Record<string, number[]> = {\n")
+        for main_stat, probabilities in tables.items():
+            f.write(f'  "{main_stat}": {number_list(probabilities)},\n')
+        f.write("};\n")
+
+    print(f"Written chance tables to {path}")
+
+
+def main() -> None:
+    substat_weights = load_substat_weights()
+    stats, masks, tables = build_tables(substat_weights)
+    for main_stat, probabilities in tables.items():
+        total = sum(probabilities)
+        if not np.isclose(total, 1):
+            raise ValueError(f"Draw probabilities for '{main_stat}' sum to {total}")
+    write_tables(stats, masks, tables)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Character detail stage: talents, constellations and base info per character and language.
+This is too much text for the eagerly imported i18n-game.ts, so every (character, language)
+is written as its own JSON chunk under public/character-detail/, which the app fetches when
+a character's details are shown (src/lib/characterDetails.ts).
+
+Entry pages are read through the wiki's entry_page API (the payload the entry page renders)
+with a bounded thread pool. Raw responses are cached in scripts/.cache/character_details/
+for DETAIL_CACHE_DAYS, so re-runs only fetch characters that are new or whose cached page
+expired, and corrected wiki text is picked up within that time.
+
+Usage:
+    python character_details.py [--workers 4] [--max-age 7] [--refresh]  # IDs from the catalog
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+
+from hoyolab import BASE_URL, ENTRY_LANGUAGE_CODES
+from models import LANGUAGES, CharacterConstellation, CharacterDetail, CharacterTalent
+from network import POLICY
+from profiling import count, traced
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".cache", "character_details")
+OUTPUT_DIR = os.path.join(PROJECT_ROOT, "public", "character-detail")
+
+ENTRY_API_URL = "https://sg-wiki-api-static.hoyolab.com/hoyowiki/genshin/wapi/entry_page"
+DETAIL_WORKERS = 4
+DETAIL_CACHE_DAYS = 7.0
+DAY_SECONDS = 24 * 60 * 60
+
+BLANK_LINES = re.compile(r"\n\s*\n+")
+
+
+def html_to_text(html: str) -> str:
+    """Plain text of a rich text field, keeping paragraph breaks"""
+    text = BeautifulSoup(html, "html.parser").get_text("\n")
+    return BLANK_LINES.sub("\n", text).strip()
+
+
+def cache_path(entry_id: str, language: str, directory: str = CACHE_DIR) -> str:
+    return os.path.join(directory, f"{entry_id}_{language}.json")
+
+
+@traced("character_details.fetch_entry_page", "network")
+def fetch_entry_page(session: requests.Session, entry_id: str, language: str) -> dict[str, Any]:
+    response = POLICY.get(
+        ENTRY_API_URL,
+        session=session,
+        params={"entry_page_id": entry_id},
+        headers={
+            "x-rpc-language": ENTRY_LANGUAGE_CODES.get(language, language),
+            "x-rpc-wiki_app": "genshin",
+            "Referer": f"{BASE_URL}/",
+        },
+    )
+    payload = response.json()
+    if payload.get("retcode") != 0:
+        raise ValueError(f"Entry {entry_id} ({language}): {payload.get('message')}")
+    return payload["data"]["page"]
+
+
+def load_entry_page(
+    session: requests.Session,
+    entry_id: str,
+    language: str,
+    refresh: bool = False,
+    max_age: float = DETAIL_CACHE_DAYS * DAY_SECONDS,
+) -> dict[str, Any]:
+    """Entry page payload from the cache, fetched and cached on a miss or when older than max_age"""
+    path = cache_path(entry_id, language)
+    if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < max_age:
+        count("character_details.cache_hits")
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    count("character_details.fetched")
+    page = fetch_entry_page(session, entry_id, language)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(page, f, ensure_ascii=False)
+    # Rename last so a crash mid-write never leaves a truncated cache entry behind
+    os.replace(tmp_path, path)
+    return page
+
+
+def parse_entry_page(page: Mapping[str, Any], character_id: str, language: str) -> CharacterDetail:
+    """
+    Pick the base info, talent and constellation components out of the page modules.
+    Components are matched by component_id, so unknown or reordered modules are skipped.
+    """
+    detail = CharacterDetail(id=character_id, language=language)
+
+    for module in page.get("modules") or []:
+        for component in module.get("components") or []:
+            try:
+                data = json.loads(component.get("data") or "{}")
+            except json.JSONDecodeError:
+                continue
+            items = (data.get("list") or []) if isinstance(data, dict) else []
+
+            match component.get("component_id"):
+                case "baseInfo":
+                    for item in items:
+                        values = [html_to_text(value) for value in item.get("value") or []]
+                        if item.get("key") and any(values):
+                            detail.baseInfo[item["key"]] = ", ".join(v for v in values if v)
+                case "talent":
+                    detail.talents.extend(
+                        CharacterTalent(
+                            name=item.get("title", ""),
+                            description=html_to_text(item.get("desc", "")),
+                        )
+                        for item in items
+                    )
+                case "summaryList":
+                    detail.constellations.extend(
+                        CharacterConstellation(
+                            name=item.get("name", ""),
+                            description=html_to_text(item.get("desc", "")),
+                        )
+                        for item in items
+                    )
+
+    return detail
+
+
+def write_detail(detail: CharacterDetail, directory: str = OUTPUT_DIR) -> bool:
+    """Write a detail chunk, returns False if the file already had this content"""
+    path = os.path.join(directory, detail.language, f"{detail.id}.json")
+    content = json.dumps(detail.model_dump(), ensure_ascii=False, separators=(",", ":"))
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+@traced("character_details.scrape_character_details")
+def scrape_character_details(
+    entry_ids: Mapping[str, str],
+    languages: list[str] = LANGUAGES,
+    workers: int = DETAIL_WORKERS,
+    refresh: bool = False,
+    max_age: float = DETAIL_CACHE_DAYS * DAY_SECONDS,
+) -> dict[str, int]:
+    """
+    Fetch and write the detail chunk of every (character, language), with at most `workers`
+    requests in flight. entry_ids maps character IDs to Hoyolab entry IDs; cached entry pages
+    older than max_age seconds (or all with refresh) are fetched again.
+    Returns counts of written, unchanged and failed chunks.
+    """
+    print("=== Character Details ===")
+    counts = {"written": 0, "unchanged": 0, "failed": 0}
+    jobs = [
+        (character_id, entry_id, language)
+        for character_id, entry_id in entry_ids.items()
+        if entry_id
+        for language in languages
+    ]
+
+    with requests.Session() as session:
+        # One pooled connection per worker
+        session.mount("https://", HTTPAdapter(pool_maxsize=workers))
+
+        def run(character_id: str, entry_id: str, language: str) -> bool:
+            page = load_entry_page(session, entry_id, language, refresh, max_age)
+            return write_detail(parse_entry_page(page, character_id, language))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, *job): job for job in jobs}
+            for future in tqdm(
+                as_completed(futures),
+                total=len(futures),
+                desc="Character Details",
+                unit="page",
+                bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
+            ):
+                character_id, entry_id, language = futures[future]
+                try:
+                    counts["written" if future.result() else "unchanged"] += 1
+                except Exception as e:
+                    counts["failed"] += 1
+                    tqdm.write(f"Failed details for {character_id} ({entry_id}, {language}): {e}")
+
+    print(
+        f"Character details: {counts['written']} written, {counts['unchanged']} unchanged, "
+        f"{counts['failed']} failed"
+    )
+    return counts
+
+
+def main() -> None:
+    # Imported here, the catalog is only needed when run on its own
+    from catalog import CATALOG_PATH, Catalog
+
+    parser = argparse.ArgumentParser(description="Scrape character detail chunks")
+    parser.add_argument("--catalog", default=CATALOG_PATH, help="Catalog with the entry IDs")
+    parser.add_argument("--languages", nargs="+", default=LANGUAGES)
+    parser.add_argument("--workers", type=int, default=DETAIL_WORKERS)
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=DETAIL_CACHE_DAYS,
+        help=f"Refetch cached entry pages older than this many days (default: {DETAIL_CACHE_DAYS})",
+    )
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached entry pages")
+    args = parser.parse_args()
+
+    with Catalog(args.catalog) as catalog:
+        entry_ids = catalog.entry_ids("characters")
+    if not entry_ids:
+        print("No character entry IDs in the catalog, run codedump.py --character first")
+        return
+    scrape_character_details(
+        entry_ids, args.languages, args.workers, args.refresh, args.max_age * DAY_SECONDS
+    )
+
+
+if __name__ == "__main__":
+    main()
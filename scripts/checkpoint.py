@@ -0,0 +1,76 @@
+"""
+Checkpoint storage for long scrape runs.
+Each pipeline stage writes its output to the checkpoint directory as soon as it finishes,
+so a run that fails halfway can be resumed with --resume instead of starting from zero.
+"""
+
+import os
+import shutil
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import TypeAdapter
+from tqdm import tqdm
+
+from profiling import count
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+CHECKPOINT_DIR = os.path.join(SCRIPT_DIR, ".cache", "checkpoint")
+
+
+class Checkpoint:
+    """Stage-level persistence keyed by stage name"""
+
+    def __init__(self, resume: bool = False, directory: str = CHECKPOINT_DIR):
+        self.resume = resume
+        self.directory = directory
+        # Stages completed during this run, served without re-reading the file
+        self._completed: dict[str, Any] = {}
+
+    def _path(self, stage: str) -> str:
+        return os.path.join(self.directory, f"{stage}.json")
+
+    def has(self, stage: str) -> bool:
+        return stage in self._completed or (self.resume and os.path.exists(self._path(stage)))
+
+    def load(self, stage: str, data_type: Any) -> Any | None:
+        """Load a completed stage, or None if it has to be (re)computed"""
+        if stage in self._completed:
+            return self._completed[stage]
+        if not self.has(stage):
+            return None
+
+        with open(self._path(stage), "rb") as f:
+            data = TypeAdapter(data_type).validate_json(f.read())
+        count("checkpoint.resumed")
+        tqdm.write(f"Resumed '{stage}' from checkpoint")
+        return data
+
+    def save(self, stage: str, data_type: Any, data: Any) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._path(stage) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(TypeAdapter(data_type).dump_json(data, by_alias=True))
+        # Rename last so a crash mid-write never leaves a truncated stage behind
+        os.replace(tmp_path, self._path(stage))
+        self._completed[stage] = data
+
+    def run[T](self, stage: str, data_type: Any, compute: Callable[[], T]) -> T:
+        """
+        Return the checkpointed stage output, computing and saving it if missing.
+        data_type is the shape pydantic validates against, which may be wider than T
+        (e.g. a union of a source model and its enriched subclass).
+        Empty results are not saved, so a stage that silently failed is retried on resume.
+        """
+        data: T | None = self.load(stage, data_type)
+        if data is None:
+            count("checkpoint.computed")
+            data = compute()
+            if data:
+                self.save(stage, data_type, data)
+        return data
+
+    def clear(self) -> None:
+        self._completed.clear()
+        if os.path.exists(self.directory):
+            shutil.rmtree(self.directory)
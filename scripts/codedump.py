@@ -5,11 +5,14 @@ Combines data from Fandom and Hoyolab wikis.
 """
 
 import argparse
+import io
 import json
 import os
 import re
 import sys
-from collections.abc import Sequence
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any, Literal, cast
 
@@ -21,14 +24,44 @@ import fandom
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from hoyolab import HoyolabAssetManager, HoyolabScraper, generate_id
+from catalog import (
+    CATALOG_PATH,
+    CATEGORIES,
+    RESOURCE_EXPORTS,
+    Catalog,
+    CatalogRecord,
+    ItemChanges,
+    build_records,
+    diff_records,
+    generation_records,
+    print_change_report,
+    record_generation,
+)
+from character_details import (
+    DAY_SECONDS,
+    DETAIL_CACHE_DAYS,
+    DETAIL_WORKERS,
+    scrape_character_details,
+)
+from checkpoint import Checkpoint
+from hoyolab import (
+    BASE_URL,
+    BROWSER_PROFILE_DIR,
+    STORAGE_STATE_PATH,
+    HoyolabAssetManager,
+    HoyolabScraper,
+    generate_id,
+)
+from image_queue import IMAGE_WORKERS, ImageQueue
+from metrics import METRICS, METRICS_PATH
 from models import (
+    LANGUAGES,
+    PRIMARY_LANGUAGE,
     ArtifactOutput,
     ArtifactSource,
     BaseItemSource,
     CharacterOutput,
     CharacterSource,
-    EffectData,
     EnrichedCharacterSource,
     HalfSet,
     I18nArtifactData,
@@ -37,7 +70,11 @@ from models import (
     WeaponOutput,
     WeaponSource,
 )
-from preprocess import ARTIFACT_SKIP_LIST, process_artifact_effects
+from overrides import OverrideResolver, load_overrides
+from preprocess import ARTIFACT_SKIP_LIST, build_half_set_lookup, process_artifact_effects
+from profiling import PROFILER, count, instrument_playwright, span, traced
+from search_index import write_search_index
+from snapshots import SNAPSHOT_DIR
 
 SKIP_EXISTING_IMAGES = True
 RARITY_4_ARTIFACTS = ["Instructor"]
@@ -84,27 +121,46 @@ def load_existing_data(project_root: str) -> tuple[dict[str, Any], dict[str, Any
     return resources, i18n
 
 
+def make_placeholder[T: BaseItemSource](item: T, name: str) -> T:
+    """Stand-in for a language the item is missing in, copied from a language that has it"""
+    update: dict[str, Any] = {"name": name}
+    if isinstance(item, ArtifactSource):
+        update["effects"] = ["???", "???"]
+    if isinstance(item, WeaponSource):
+        update["effect"] = "???"
+    # Shallow copy: the shared image URLs and stats are never mutated per language
+    return item.model_copy(update=update)
+
+
+@traced("match_items")
 def match_items[T: BaseItemSource](
-    items_en: Sequence[T],
-    items_zh: Sequence[T],
+    items_by_language: Mapping[str, Sequence[T]],
     item_type: Literal["character", "artifact", "weapon"] = "character",
     scraper: HoyolabScraper | None = None,
 ) -> list[MatchedItem[T]]:
-    """Match items across languages using entry ID and validate consistency"""
-    matched_items: list[MatchedItem[T]] = []
-
-    # Build lookup maps
-    en_map_by_id = {item.entry_id: item for item in items_en if item.entry_id}
-    zh_map_by_id = {item.entry_id: item for item in items_zh if item.entry_id}
-
-    all_entry_ids = set(en_map_by_id.keys()) | set(zh_map_by_id.keys())
+    """
+    Match items across languages using entry ID and validate consistency.
+    Every language is scanned once into a single entry_id -> {language: item} hash join.
+    """
+    languages = list(items_by_language)
+    joined: dict[str, MatchedItem[T]] = {}
+    no_entry_id = 0
+    for language, items in items_by_language.items():
+        for item in items:
+            if item.entry_id:
+                joined.setdefault(item.entry_id, {})[language] = item
+            else:
+                no_entry_id += 1
 
     # Sort IDs numerically (Newest -> Oldest) to ensure stable processing order
     # preprocess.py uses reversed() (Oldest -> Newest) to assign sequential IDs
     def get_sort_key(eid: str) -> int:
         return int(eid) if eid.isdigit() else 999999999
 
-    ordered_ids = sorted(all_entry_ids, key=get_sort_key, reverse=True)
+    ordered_ids = sorted(joined, key=get_sort_key, reverse=True)
+
+    matched_items: list[MatchedItem[T]] = []
+    missing_language = 0
 
     # Wrap the iterator with tqdm for progress
     for eid in tqdm(
@@ -113,65 +169,51 @@ def match_items[T: BaseItemSource](
         unit="item",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ):
-        item_en = en_map_by_id.get(eid)
-        item_zh = zh_map_by_id.get(eid)
-
-        if item_en and item_zh:
-            if item_type == "character":
-                # Check consistency
-                char_en = cast(CharacterSource, item_en)
-                char_zh = cast(CharacterSource, item_zh)
-                if char_en.element != char_zh.element or char_en.rarity != char_zh.rarity:
+        found = joined[eid]
+        source_language = PRIMARY_LANGUAGE if PRIMARY_LANGUAGE in found else next(iter(found))
+        source = found[source_language]
+
+        if item_type == "character":
+            # Check consistency
+            source_char = cast(CharacterSource, source)
+            for language, item in found.items():
+                char = cast(CharacterSource, item)
+                if char.element != source_char.element or char.rarity != source_char.rarity:
                     print(
                         f"ERROR: {item_type} {eid} - element/rarity mismatch: "
-                        f"EN={char_en.element} {char_en.rarity}*, "
-                        f"ZH={char_zh.element} {char_zh.rarity}*"
+                        f"{source_language.upper()}={source_char.element} {source_char.rarity}*, "
+                        f"{language.upper()}={char.element} {char.rarity}*"
                     )
-            # Match found
-            matched_items.append(MatchedItem(en=item_en, zh=item_zh))
-        elif item_en:
-            tqdm.write(
-                f"{item_type.capitalize()} '{item_en.name}' (ID: {eid}) "
-                "only exists in EN. Attempting to fetch ZH name..."
-            )
-            dummy_zh = item_en.model_copy(deep=True)
 
-            zh_name = None
-            if scraper:
-                zh_name = scraper.fetch_entry_name(item_en.entry_id, "zh-cn")
-
-            dummy_zh.name = zh_name if zh_name else "???"
-
-            if hasattr(dummy_zh, "effects"):
-                dummy_zh.effects = ["???", "???"]  # type: ignore
-            if hasattr(dummy_zh, "effect"):
-                dummy_zh.effect = "???"  # type: ignore
-            matched_items.append(MatchedItem(en=item_en, zh=dummy_zh))
-        elif item_zh:
+        for language in languages:
+            if language in found:
+                continue
             tqdm.write(
-                f"{item_type.capitalize()} '{item_zh.name}' (ID: {eid}) "
-                "only exists in ZH. Attempting to fetch EN name..."
+                f"{item_type.capitalize()} '{source.name}' (ID: {eid}) is missing in "
+                f"{language.upper()}. Attempting to fetch {language.upper()} name..."
             )
-            dummy_en = item_zh.model_copy(deep=True)
-
-            en_name = None
-            if scraper:
-                en_name = scraper.fetch_entry_name(item_zh.entry_id, "en-us")
-
-            dummy_en.name = en_name if en_name else "???"
-
-            if hasattr(dummy_en, "effects"):
-                dummy_en.effects = ["???", "???"]  # type: ignore
-            if hasattr(dummy_en, "effect"):
-                dummy_en.effect = "???"  # type: ignore
-            matched_items.append(MatchedItem(en=dummy_en, zh=item_zh))
-
+            name = scraper.fetch_entry_name(eid, language) if scraper else None
+            found[language] = make_placeholder(source, name or "???")
+            missing_language += 1
+
+        matched_items.append({language: found[language] for language in languages})
+
+    for reason, unmatched in (("no_entry_id", no_entry_id), ("missing_language", missing_language)):
+        METRICS.set(
+            "items_unmatched",
+            unmatched,
+            "Items match_items could not match across languages",
+            category=item_type,
+            reason=reason,
+        )
     return matched_items
 
 
+@traced("enrich_character_data_with_fandom")
 def enrich_character_data_with_fandom(
     characters_en: list[CharacterSource],
     fandom_data: dict[tuple[str, int, str], fandom.CharacterData],
+    resolver: OverrideResolver,
 ) -> list[EnrichedCharacterSource]:
     """Enrich character data with weapon, region, and release date from Fandom data"""
     enriched_characters: list[EnrichedCharacterSource] = []
@@ -203,18 +245,14 @@ def enrich_character_data_with_fandom(
             matched_count += 1
         else:
             tqdm.write(f"Character {char.name} not found in Fandom data.")
+            weapon = resolver.resolve_weapon_type(char, weapon)
 
-            valid_weapons = ["Sword", "Claymore", "Polearm", "Bow", "Catalyst"]
-            while True:
-                val = input(
-                    f"Please enter weapon type for {char.name} ({'/'.join(valid_weapons)}): "
-                ).strip()
-                # Case-insensitive matching
-                matched_weapon = next((w for w in valid_weapons if w.lower() == val.lower()), None)
-                if matched_weapon:
-                    weapon = matched_weapon
-                    break
-                print(f"Invalid weapon type. Please choose from: {', '.join(valid_weapons)}")
+        # Overrides win over Fandom so wrong wiki data can be corrected
+        override = resolver.character_override(char)
+        if override:
+            weapon = override.weapon or weapon
+            region = override.region or region
+            release_date = override.release_date or release_date
 
         # Construct enriched object
         enriched_char = EnrichedCharacterSource(
@@ -232,15 +270,12 @@ def enrich_character_data_with_fandom(
     return enriched_characters
 
 
+@traced("process_characters")
 def process_characters(
-    characters_en: list[CharacterSource],
-    characters_zh: list[CharacterSource],
-    fandom_data: dict[tuple[str, int, str], fandom.CharacterData],
-    scraper: HoyolabScraper | None = None,
-) -> tuple[list[CharacterOutput], dict[str, dict[str, str]], list[MatchedItem[CharacterSource]]]:
-    enriched_characters_en = enrich_character_data_with_fandom(characters_en, fandom_data)
-
-    matched_characters = match_items(enriched_characters_en, characters_zh, "character", scraper)
+    matched_characters: list[MatchedItem[CharacterSource]],
+    resolver: OverrideResolver | None = None,
+) -> tuple[list[CharacterOutput], dict[str, dict[str, str]]]:
+    resolver = resolver or OverrideResolver()
 
     final_characters: list[CharacterOutput] = []
     i18n_chars: dict[str, dict[str, str]] = {}
@@ -251,25 +286,12 @@ def process_characters(
         unit="item",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ):
-        en = m["en"]
-        zh = m["zh"]
-
-        # Interactive Rarity Check
-        if en.rarity == 0:
-            print(f"\nWARNING: Rarity 0 detected for Character: {en.name} / {zh.name}")
-            while True:
-                try:
-                    val = input(f"Please enter actual rarity (4/5) for {en.name}: ").strip()
-                    rarity_int = int(val)
-                    if rarity_int in [4, 5]:
-                        en.rarity = rarity_int
-                        # Also update matched zh item if it was 0 or incorrect (keep in sync)
-                        zh.rarity = rarity_int
-                        break
-                    else:
-                        print("Invalid rarity. Please enter 4 or 5.")
-                except ValueError:
-                    print("Invalid number.")
+        en = m[PRIMARY_LANGUAGE]
+
+        # Rarity 0 is resolved from overrides or the user; keep other languages in sync
+        en.rarity = resolver.resolve_rarity("character", en, en.rarity, [4, 5])
+        for item in m.values():
+            item.rarity = en.rarity
 
         # Check if 'en' is EnrichedCharacterSource to access extra fields
         # If it came from match_items(enriched...), it should be.
@@ -292,21 +314,15 @@ def process_characters(
         )
         final_characters.append(output)
 
-        i18n_chars[character_id] = {
-            "en": en.name,
-            "zh": zh.name,
-        }
+        i18n_chars[character_id] = {language: item.name for language, item in m.items()}
 
-    return final_characters, i18n_chars, matched_characters
+    return final_characters, i18n_chars
 
 
+@traced("process_artifacts")
 def process_artifacts(
-    artifacts_en: list[ArtifactSource],
-    artifacts_zh: list[ArtifactSource],
-    scraper: HoyolabScraper | None = None,
-) -> tuple[list[ArtifactOutput], dict[str, I18nArtifactData], list[MatchedItem[ArtifactSource]]]:
-    matched_artifacts = match_items(artifacts_en, artifacts_zh, "artifact", scraper)
-
+    matched_artifacts: list[MatchedItem[ArtifactSource]],
+) -> tuple[list[ArtifactOutput], dict[str, I18nArtifactData]]:
     final_artifacts: list[ArtifactOutput] = []
     i18n_artifacts: dict[str, I18nArtifactData] = {}
 
@@ -316,8 +332,7 @@ def process_artifacts(
         unit="item",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ):
-        en = m["en"]
-        zh = m["zh"]
+        en = m[PRIMARY_LANGUAGE]
         artifact_id = generate_id(en.name)
         if artifact_id in ARTIFACT_SKIP_LIST:
             continue
@@ -339,19 +354,19 @@ def process_artifacts(
         final_artifacts.append(output)
 
         i18n_artifacts[artifact_id] = I18nArtifactData(
-            name={"en": en.name, "zh": zh.name},
-            effects=EffectData(en=en.effects, zh=zh.effects),
+            name={language: item.name for language, item in m.items()},
+            effects={language: item.effects for language, item in m.items()},
         )
 
-    return final_artifacts, i18n_artifacts, matched_artifacts
+    return final_artifacts, i18n_artifacts
 
 
+@traced("process_weapons")
 def process_weapons(
-    weapons_en: list[WeaponSource],
-    weapons_zh: list[WeaponSource],
-    scraper: HoyolabScraper | None = None,
-) -> tuple[list[WeaponOutput], dict[str, dict[str, Any]], list[MatchedItem[WeaponSource]]]:
-    matched_weapons = match_items(weapons_en, weapons_zh, "weapon", scraper)
+    matched_weapons: list[MatchedItem[WeaponSource]],
+    resolver: OverrideResolver | None = None,
+) -> tuple[list[WeaponOutput], dict[str, dict[str, Any]]]:
+    resolver = resolver or OverrideResolver()
 
     final_weapons: list[WeaponOutput] = []
     i18n_weapons: dict[str, dict[str, Any]] = {}
@@ -362,24 +377,11 @@ def process_weapons(
         unit="item",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ):
-        en = m["en"]
-        zh = m["zh"]
-
-        # Interactive Rarity Check
-        if en.rarity == 0:
-            print(f"\nWARNING: Rarity 0 detected for Weapon: {en.name} / {zh.name}")
-            while True:
-                try:
-                    val = input(f"Please enter actual rarity (1-5) for {en.name}: ").strip()
-                    rarity_int = int(val)
-                    if 1 <= rarity_int <= 5:
-                        en.rarity = rarity_int
-                        zh.rarity = rarity_int
-                        break
-                    else:
-                        print("Invalid rarity. Please enter 1-5.")
-                except ValueError:
-                    print("Invalid number.")
+        en = m[PRIMARY_LANGUAGE]
+
+        en.rarity = resolver.resolve_rarity("weapon", en, en.rarity, [1, 2, 3, 4, 5])
+        for item in m.values():
+            item.rarity = en.rarity
 
         weapon_id = generate_id(en.name)
         output = WeaponOutput(
@@ -395,13 +397,26 @@ def process_weapons(
         final_weapons.append(output)
 
         i18n_weapons[weapon_id] = {
-            "name": {"en": en.name, "zh": zh.name},
-            "effect": {"en": en.effect, "zh": zh.effect},
+            "name": {language: item.name for language, item in m.items()},
+            "effect": {language: item.effect for language, item in m.items()},
         }
 
-    return final_weapons, i18n_weapons, matched_weapons
+    return final_weapons, i18n_weapons
+
 
+def write_if_changed(path: str, content: str) -> bool:
+    """Write a generated file, returns False if it already had this content"""
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
 
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+@traced("write_data", "io")
 def write_data(
     character_data: list[CharacterOutput],
     artifact_data: list[ArtifactOutput],
@@ -411,12 +426,12 @@ def write_data(
     weapon_types: list[ResourceOutput],
     i18n_data: dict[str, dict[str, Any]],
 ) -> None:
-    """Write processed data to TypeScript files"""
+    """Write processed data to TypeScript files, leaving files that would not change untouched"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
     resources_path = os.path.join(project_root, "src", "data", "resources.ts")
-    with open(resources_path, "w", encoding="utf-8") as f:
+    with io.StringIO() as f:
         f.write("// This file is auto-generated by scripts/codedump.py\n")
         f.write("// Do not edit this file directly\n\n")
         f.write(
@@ -487,6 +502,23 @@ def write_data(
 
         f.write(";\n\n")
 
+        set_to_half_set, half_set_members = build_half_set_lookup(
+            [a.id if isinstance(a, BaseModel) else a["id"] for a in artifact_data],
+            [HalfSet.model_validate(hs) for hs in half_sets],
+        )
+        f.write("export const artifactSetToHalfSet: Record<string, number> = ")
+        f.write(json.dumps(set_to_half_set, indent=2, ensure_ascii=False))
+        f.write(";\n\n")
+
+        f.write("// Sorted indices into `artifacts` of each half set's members\n")
+        f.write("export const artifactHalfSetMembers: Record<number, number[]> = ")
+        f.write(
+            "{\n"
+            + ",\n".join(f'  "{hs_id}": {json.dumps(m)}' for hs_id, m in half_set_members.items())
+            + "\n}"
+        )
+        f.write(";\n\n")
+
         f.write("export const weapons: Weapon[] = ")
         f.write(
             json.dumps(
@@ -499,11 +531,15 @@ def write_data(
             )
         )
         f.write(";\n")
+        resources = f.getvalue()
 
-    print(f"Written resources to {resources_path}")
+    if write_if_changed(resources_path, resources):
+        print(f"Written resources to {resources_path}")
+    else:
+        print(f"Resources unchanged: {resources_path}")
 
     i18n_path = os.path.join(project_root, "src", "data", "i18n-game.ts")
-    with open(i18n_path, "w", encoding="utf-8") as f:
+    with io.StringIO() as f:
         f.write("// This file is auto-generated by scripts/codedump.py\n")
         f.write("// Do not edit this file directly\n\n")
         f.write("export const i18nGameData = ")
@@ -525,29 +561,58 @@ def write_data(
 
         f.write(json.dumps(serializable_i18n_data, indent=2, ensure_ascii=False))
         f.write(";\n")
-    print(f"Written i18n data to {i18n_path}")
+        i18n = f.getvalue()
+
+    if write_if_changed(i18n_path, i18n):
+        print(f"Written i18n data to {i18n_path}")
+    else:
+        print(f"i18n data unchanged: {i18n_path}")
 
+    write_search_index(serializable_i18n_data)
 
+
+@traced("download_all_images")
 def download_all_images(
     characters: list[MatchedItem[CharacterSource]],
     artifacts: list[MatchedItem[ArtifactSource]],
     weapons: list[MatchedItem[WeaponSource]],
     elements: list[ResourceOutput] | None = None,
     weapon_types: list[ResourceOutput] | None = None,
+    changes: Mapping[str, ItemChanges] | None = None,
 ) -> None:
-    """Download all character, artifact, element, and weapon images"""
+    """
+    Download character, artifact, element, and weapon images.
+    With changes, only added and changed items are visited, and changed image URLs replace the
+    existing files; without, every item is visited and existing files are kept.
+    """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
     print("=== [4/4] Assets ===")
 
+    def select[T](category: str, items: Sequence[T], item_id: Callable[[T], str]) -> list[T]:
+        if changes is None:
+            return list(items)
+        updated = changes[category].updated if category in changes else set()
+        return [item for item in items if item_id(item) in updated]
+
+    def skip_existing(category: str, item_id: str) -> bool:
+        return changes is None or category not in changes or item_id not in changes[category].images
+
+    def matched_id(match: MatchedItem[Any]) -> str:
+        return generate_id(match[PRIMARY_LANGUAGE].name)
+
+    characters = select("characters", characters, matched_id)
     with tqdm(characters, desc="Downloading Characters", unit="img") as pbar:
         for match in pbar:
-            char = match["en"]
-            HoyolabAssetManager.download_character_assets(char, project_root)
+            char = match[PRIMARY_LANGUAGE]
+            HoyolabAssetManager.download_character_assets(
+                char, project_root, skip_existing("characters", matched_id(match))
+            )
 
     print("Downloading artifact images...")
 
+    artifacts = select("artifacts", artifacts, matched_id)
     with tqdm(
         artifacts,
         desc="Downloading Artifacts",
@@ -555,9 +620,12 @@ def download_all_images(
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ) as pbar:
         for match in pbar:
-            art = match["en"]
-            HoyolabAssetManager.download_artifact_assets(art, project_root)
+            art = match[PRIMARY_LANGUAGE]
+            HoyolabAssetManager.download_artifact_assets(
+                art, project_root, skip_existing("artifacts", matched_id(match))
+            )
 
+    weapons = select("weapons", weapons, matched_id)
     with tqdm(
         weapons,
         desc="Downloading Weapons",
@@ -565,18 +633,253 @@ def download_all_images(
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
     ) as pbar:
         for match in pbar:
-            weap = match["en"]
-            HoyolabAssetManager.download_weapon_assets(weap, project_root)
+            weap = match[PRIMARY_LANGUAGE]
+            HoyolabAssetManager.download_weapon_assets(
+                weap, project_root, skip_existing("weapons", matched_id(match))
+            )
 
+    elements = select("elements", elements or [], lambda e: e.name)
     if elements:
         print("Downloading element images...")
         for element in elements:
-            HoyolabAssetManager.download_element_asset(element, project_root)
+            HoyolabAssetManager.download_element_asset(
+                element, project_root, skip_existing("elements", element.name)
+            )
 
+    weapon_types = select("weapon_types", weapon_types or [], lambda wt: wt.name)
     if weapon_types:
         print("Downloading weapon type images...")
         for weapon_type in weapon_types:
-            HoyolabAssetManager.download_weapon_type_asset(weapon_type, project_root)
+            HoyolabAssetManager.download_weapon_type_asset(
+                weapon_type, project_root, skip_existing("weapon_types", weapon_type.name)
+            )
+
+
+def entry_ids_by_id(matched: Sequence[MatchedItem[Any]]) -> dict[str, str]:
+    """Generated ID -> Hoyolab entry ID of matched items"""
+    return {generate_id(m[PRIMARY_LANGUAGE].name): m[PRIMARY_LANGUAGE].entry_id for m in matched}
+
+
+def write_from_catalog(catalog_path: str) -> None:
+    """
+    Regenerate resources.ts and i18n-game.ts from the latest catalog data.
+    Categories the catalog never recorded (e.g. after a --character only run) are kept from
+    the current TS files; if those do not have them either, nothing is written.
+    """
+    with Catalog(catalog_path) as catalog:
+        version = catalog.latest_version()
+        generation = catalog.load_generation()
+        recorded = catalog.recorded_categories()
+    if version is None:
+        print(f"Catalog {catalog_path} is empty, run a scrape or `catalog.py import` first")
+        return
+
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.abspath(os.path.join(script_dir, ".."))
+    existing_resources, existing_i18n = load_existing_data(project_root)
+
+    outputs: dict[str, list[dict[str, Any]]] = {
+        category: getattr(generation, category) for category in CATEGORIES
+    }
+    i18n = dict(generation.i18n)
+    kept: list[str] = []
+    missing: list[str] = []
+    for category, i18n_key in CATEGORIES.items():
+        if category in recorded:
+            continue
+        existing = existing_resources.get(RESOURCE_EXPORTS[category])
+        if not existing:
+            missing.append(category)
+            continue
+        kept.append(category)
+        outputs[category] = existing
+        if i18n_key is not None:
+            i18n[i18n_key] = existing_i18n.get(i18n_key, {})
+
+    if missing:
+        print(
+            f"Catalog v{version} has no data for {', '.join(missing)} and the current TS files "
+            "do not have it either; nothing written. Run a scrape of these categories or "
+            "`catalog.py import` first."
+        )
+        return
+
+    print(f"=== Writing data from catalog v{version} ===")
+    if kept:
+        print(f"Not in the catalog, kept from the current TS files: {', '.join(kept)}")
+    write_data(
+        [CharacterOutput.model_validate(c) for c in outputs["characters"]],
+        [ArtifactOutput.model_validate(a) for a in outputs["artifacts"]],
+        [WeaponOutput.model_validate(w) for w in outputs["weapons"]],
+        [HalfSet.model_validate(hs) for hs in outputs["half_sets"]],
+        [ResourceOutput.model_validate(e) for e in outputs["elements"]],
+        [ResourceOutput.model_validate(wt) for wt in outputs["weapon_types"]],
+        i18n,
+    )
+
+
+# Category -> (scrape method, checkpointed shape) for process sharding
+SHARD_SCRAPERS: dict[str, tuple[Callable[[HoyolabScraper, str], Iterable[Any]], Any]] = {
+    "characters": (HoyolabScraper.scrape_characters, list[CharacterSource]),
+    "artifacts": (HoyolabScraper.scrape_artifacts, list[ArtifactSource]),
+    "weapons": (HoyolabScraper.scrape_weapons, list[WeaponSource]),
+}
+
+
+def scrape_shard(
+    category: str,
+    language: str,
+    base_url: str,
+    snapshot_dir: str | None = None,
+    use_list_api: bool = False,
+    storage_state: str | None = None,
+    profile: bool = False,
+) -> tuple[list[BaseItemSource], dict[str, int]]:
+    """
+    Process pool worker: scrape one (category, language) pair with its own browser.
+    Also returns the profiler counters the shard added, which the parent merges into its own
+    since they are only recorded in this process.
+    """
+    if profile and not PROFILER.enabled:
+        PROFILER.enable()
+    # A forked or reused worker already holds counters that are not this shard's
+    before = PROFILER.counters()
+    scrape, _ = SHARD_SCRAPERS[category]
+    with HoyolabScraper(
+        base_url=base_url,
+        snapshot_dir=snapshot_dir,
+        use_list_api=use_list_api,
+        storage_state=storage_state,
+    ) as scraper:
+        items = list(scrape(scraper, language))
+    counters = {
+        name: value - before.get(name, 0)
+        for name, value in PROFILER.counters().items()
+        if value != before.get(name, 0)
+    }
+    return items, counters
+
+
+def scrape_sharded(
+    categories: list[str],
+    languages: list[str],
+    checkpoint: Checkpoint,
+    processes: int,
+    base_url: str,
+    snapshot_dir: str | None = None,
+    use_list_api: bool = False,
+    storage_state: str | None = None,
+) -> None:
+    """
+    Scrape every (category, language) pair in a process pool and checkpoint the results.
+    The Playwright sync API ties each scraper to one thread, so separate processes are the
+    only way to spread browser driving and card parsing across cores. Matching and output
+    stay in the parent, which picks the shards up through the checkpoint.
+    """
+    shards = [
+        (category, language)
+        for category in categories
+        for language in languages
+        if not checkpoint.has(f"{category}_{language}")
+    ]
+    if not shards:
+        return
+
+    print(f"Scraping {len(shards)} shards across {min(processes, len(shards))} processes")
+    with ProcessPoolExecutor(max_workers=min(processes, len(shards))) as executor:
+        futures = {
+            executor.submit(
+                scrape_shard,
+                category,
+                language,
+                base_url,
+                snapshot_dir,
+                use_list_api,
+                storage_state,
+                PROFILER.enabled,
+            ): (
+                category,
+                language,
+            )
+            for category, language in shards
+        }
+        for future in as_completed(futures):
+            category, language = futures[future]
+            try:
+                items, counters = future.result()
+            except Exception as e:
+                # The parent scrapes this shard again sequentially
+                print(f"Shard {category}/{language} failed: {e}")
+                continue
+            for name, value in counters.items():
+                count(name, value)
+            if items:
+                checkpoint.save(f"{category}_{language}", SHARD_SCRAPERS[category][1], items)
+            print(f"Shard {category}/{language} done: {len(items)} items")
+
+
+def scrape_languages[T: BaseItemSource](
+    stage: str,
+    data_type: Any,
+    scrape: Callable[[HoyolabScraper, str], Iterable[T]],
+    languages: list[str],
+    scraper: HoyolabScraper,
+    checkpoint: Checkpoint,
+    parallel: bool = False,
+    on_item: Callable[[T], None] | None = None,
+) -> dict[str, list[T]]:
+    """
+    Scrape one category for every language, each checkpointed on its own.
+    In parallel mode every language gets its own thread and browser, since Playwright's
+    sync API can only be used from the thread that started it.
+    on_item is called with every primary language item as soon as it is extracted (or loaded
+    from the checkpoint), e.g. to queue its images while the scrape continues.
+    """
+
+    def scrape_one(language: str, language_scraper: HoyolabScraper) -> list[T]:
+        stream = on_item if language == PRIMARY_LANGUAGE else None
+        streamed = False
+
+        def run() -> list[T]:
+            nonlocal streamed
+            streamed = True
+            items: list[T] = []
+            for item in scrape(language_scraper, language):
+                items.append(item)
+                if stream:
+                    stream(item)
+            return items
+
+        items = checkpoint.run(f"{stage}_{language}", data_type, run)
+        if stream and not streamed:
+            for item in items:
+                stream(item)
+        METRICS.set(
+            "items_scraped",
+            len(items),
+            "Items scraped per category and language",
+            category=stage,
+            language=language,
+        )
+        return items
+
+    if not parallel:
+        return {language: scrape_one(language, scraper) for language in languages}
+
+    def scrape_in_thread(language: str) -> list[T]:
+        if checkpoint.has(f"{stage}_{language}"):
+            return scrape_one(language, scraper)
+        with HoyolabScraper(
+            base_url=scraper.base_url,
+            snapshot_dir=scraper.snapshot_dir,
+            use_list_api=scraper.use_list_api,
+            # A persistent profile can only be opened by one browser at a time
+            storage_state=scraper.storage_state,
+        ) as thread_scraper:
+            return scrape_one(language, thread_scraper)
+
+    with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+        return dict(zip(languages, executor.map(scrape_in_thread, languages), strict=True))
 
 
 def main():
@@ -586,10 +889,151 @@ def main():
     parser.add_argument("--artifact", action="store_true", help="Update artifact data")
     parser.add_argument("--half-set", action="store_true", help="Recompute half sets only")
     parser.add_argument("--enka", action="store_true", help="Generate Enka ID maps")
+    parser.add_argument(
+        "--character-details",
+        action="store_true",
+        help="Write per-character talent/constellation chunks to public/character-detail",
+    )
+    parser.add_argument(
+        "--detail-workers",
+        type=int,
+        default=DETAIL_WORKERS,
+        help=f"Concurrent character detail requests (default: {DETAIL_WORKERS})",
+    )
+    parser.add_argument(
+        "--detail-max-age",
+        type=float,
+        default=DETAIL_CACHE_DAYS,
+        help=f"Refetch cached entry pages older than this many days (default: {DETAIL_CACHE_DAYS})",
+    )
+    parser.add_argument(
+        "--refresh-details", action="store_true", help="Refetch every cached entry page"
+    )
+    parser.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Never prompt; queue unresolved items into a report instead",
+    )
+    parser.add_argument(
+        "--overrides",
+        default=None,
+        help="Path to the overrides file (default: scripts/overrides.json)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip stages already saved in the checkpoint of a failed run",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Record stage/function timings to scripts/.cache/profile (Chrome trace + summary)",
+    )
+    parser.add_argument(
+        "--languages",
+        nargs="+",
+        default=LANGUAGES,
+        help=f"Languages to scrape (default: {' '.join(LANGUAGES)})",
+    )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Scrape each language in its own thread and browser",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="Shard scraping by (category, language) across N processes (0 = off)",
+    )
+    parser.add_argument(
+        "--renumber-half-sets",
+        action="store_true",
+        help="Recompute half sets from scratch instead of keeping the existing IDs",
+    )
+    parser.add_argument(
+        "--catalog",
+        default=CATALOG_PATH,
+        help="SQLite catalog that every run is recorded into (default: scripts/.cache)",
+    )
+    parser.add_argument(
+        "--no-catalog", action="store_true", help="Do not record this run in the catalog"
+    )
+    parser.add_argument(
+        "--catalog-label", default=None, help="Label of this run's catalog version (e.g. 5.3)"
+    )
+    parser.add_argument(
+        "--from-catalog",
+        action="store_true",
+        help="Regenerate the TS data from the latest catalog version without scraping",
+    )
+    parser.add_argument(
+        "--all-images",
+        action="store_true",
+        help="Visit the images of every scraped item, not only added and changed ones",
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Save each loaded list page to scripts/.cache/snapshots for snapshots.py",
+    )
+    parser.add_argument(
+        "--list-api",
+        action="store_true",
+        help="Read list items from the wiki's list API instead of the scrolled list page cards",
+    )
+    parser.add_argument(
+        "--browser-profile",
+        action="store_true",
+        help="Keep the browser's cache and cookies in scripts/.cache/browser between runs",
+    )
+    parser.add_argument(
+        "--storage-state",
+        action="store_true",
+        help="Reuse cookies/localStorage saved in scripts/.cache/storage_state.json",
+    )
+    parser.add_argument(
+        "--image-workers",
+        type=int,
+        default=IMAGE_WORKERS,
+        help="Threads downloading images while scraping (0 = only after scraping)",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="?",
+        const=METRICS_PATH,
+        default=None,
+        help="Write an OpenMetrics textfile at the end of the run "
+        "(default path: scripts/.cache/metrics/ggartifact_data.prom)",
+    )
     args = parser.parse_args()
+    started = time.time()
+
+    if args.from_catalog:
+        write_from_catalog(args.catalog)
+        return
+
+    # IDs are generated from primary language names, so it is always scraped first
+    languages: list[str] = [PRIMARY_LANGUAGE] + [
+        language for language in args.languages if language != PRIMARY_LANGUAGE
+    ]
+
+    # Metrics are built from the profiler's spans and counters, so it also runs for them
+    if args.profile or args.metrics:
+        PROFILER.enable()
+    if args.profile:
+        instrument_playwright()
 
     # Default to all if no flags provided
-    if not (args.character or args.weapon or args.artifact or args.half_set or args.enka):
+    if not (
+        args.character
+        or args.weapon
+        or args.artifact
+        or args.half_set
+        or args.enka
+        or args.character_details
+    ):
+        # Character details are opt-in, nothing in the app reads the chunks yet
         args.character = True
         args.weapon = True
         args.artifact = True
@@ -598,12 +1042,25 @@ def main():
     print("=== Genshin Impact Data Scraper ===")
     print(
         f"Modes: Character={args.character}, Weapon={args.weapon}, Artifact={args.artifact}, "
-        f"Enka={args.enka}"
+        f"Enka={args.enka}, Details={args.character_details}, Languages={','.join(languages)}"
     )
 
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.abspath(os.path.join(script_dir, ".."))
 
+    resolver = OverrideResolver(
+        load_overrides(args.overrides) if args.overrides else load_overrides(),
+        interactive=not args.non_interactive,
+    )
+
+    checkpoint = Checkpoint(resume=args.resume)
+    snapshot_dir = SNAPSHOT_DIR if args.snapshot else None
+    # Snapshots need the scrolled cards, so they always read the page
+    use_list_api = args.list_api and not args.snapshot
+    profile_dir = BROWSER_PROFILE_DIR if args.browser_profile else None
+    storage_state = STORAGE_STATE_PATH if args.storage_state else None
+    scrape_failed = False
+
     # Load existing data
     existing_resources, existing_i18n = load_existing_data(project_root)
 
@@ -631,107 +1088,294 @@ def main():
     matched_weaps = []
     new_elements = None
     new_weapon_types = None
+    # Categories processed by this run, diffed against the loaded data and recorded in the catalog
+    catalog_records: dict[str, list[CatalogRecord]] = {}
+    previous_records = generation_records(existing_resources, existing_i18n)
+
+    if (args.character or args.artifact or args.weapon) and not args.resume:
+        checkpoint.clear()
 
     # 1. Scrape Fandom (only if needed)
     fandom_data = {}
-    if args.character:
-        fandom_data = fandom.get_character_data()
+    if args.character and not checkpoint.has("characters_matched"):
+        fandom_data = fandom.build_character_lookup(
+            checkpoint.run(
+                "fandom",
+                list[fandom.CharacterData],
+                lambda: list(fandom.get_character_data().values()),
+            )
+        )
+
+    # Images of primary language items are downloaded while the remaining stages run
+    images = ImageQueue(args.image_workers)
+    if args.character or args.artifact or args.weapon:
+        images.start()
 
     print("=== [2/4] Hoyolab Data ===")
     if args.character or args.artifact or args.weapon:
-        with HoyolabScraper() as scraper:
+        if args.processes > 0:
+            with span("stage.sharded_scrape"):
+                categories = [
+                    category
+                    for category, enabled in (
+                        ("characters", args.character),
+                        ("artifacts", args.artifact),
+                        ("weapons", args.weapon),
+                    )
+                    if enabled and not checkpoint.has(f"{category}_matched")
+                ]
+                scrape_sharded(
+                    categories,
+                    languages,
+                    checkpoint,
+                    args.processes,
+                    BASE_URL,
+                    snapshot_dir,
+                    use_list_api,
+                    storage_state,
+                )
+
+        with HoyolabScraper(
+            snapshot_dir=snapshot_dir,
+            use_list_api=use_list_api,
+            profile_dir=profile_dir,
+            storage_state=storage_state,
+        ) as scraper:
+
+            def match_characters() -> list[MatchedItem[CharacterSource]]:
+                chars: dict[str, Sequence[CharacterSource]] = dict(
+                    scrape_languages(
+                        "characters",
+                        list[CharacterSource],
+                        HoyolabScraper.scrape_characters,
+                        languages,
+                        scraper,
+                        checkpoint,
+                        args.parallel,
+                        lambda char: images.put(
+                            HoyolabAssetManager.character_images(char, project_root)
+                        ),
+                    )
+                )
+                print("=== [3/4] Processing & Matching (Characters) ===")
+                chars[PRIMARY_LANGUAGE] = enrich_character_data_with_fandom(
+                    list(chars[PRIMARY_LANGUAGE]), fandom_data, resolver
+                )
+                return match_items(chars, "character", scraper)
+
+            def match_artifacts() -> list[MatchedItem[ArtifactSource]]:
+                arts = scrape_languages(
+                    "artifacts",
+                    list[ArtifactSource],
+                    HoyolabScraper.scrape_artifacts,
+                    languages,
+                    scraper,
+                    checkpoint,
+                    args.parallel,
+                    lambda art: images.put(HoyolabAssetManager.artifact_images(art, project_root)),
+                )
+                return match_items(arts, "artifact", scraper)
+
+            def match_weapons() -> list[MatchedItem[WeaponSource]]:
+                weaps = scrape_languages(
+                    "weapons",
+                    list[WeaponSource],
+                    HoyolabScraper.scrape_weapons,
+                    languages,
+                    scraper,
+                    checkpoint,
+                    args.parallel,
+                    lambda weap: images.put(HoyolabAssetManager.weapon_images(weap, project_root)),
+                )
+                return match_items(weaps, "weapon", scraper)
+
             try:
                 if args.character:
-                    chars_en = scraper.scrape_characters("en")
-                    new_elements, new_weapon_types = scraper.scrape_elements_and_weapons("en")
-                    chars_zh = scraper.scrape_characters("zh")
-
-                    print("=== [3/4] Processing & Matching (Characters) ===")
-                    c_data, c_i18n, matched_chars = process_characters(
-                        chars_en, chars_zh, fandom_data, scraper
-                    )
-                    character_data = c_data
-                    i18n_data["characters"] = c_i18n
-                    elements = new_elements
-                    weapon_types = new_weapon_types
+                    with span("stage.characters"):
+                        new_elements, new_weapon_types = checkpoint.run(
+                            "resources_en",
+                            tuple[list[ResourceOutput], list[ResourceOutput]],
+                            lambda: scraper.scrape_elements_and_weapons(PRIMARY_LANGUAGE),
+                        )
+                        # The primary language is enriched unless match_items had to fill in a
+                        # placeholder for it
+                        matched_chars = checkpoint.run(
+                            "characters_matched",
+                            list[MatchedItem[EnrichedCharacterSource | CharacterSource]],
+                            match_characters,
+                        )
+
+                        c_data, c_i18n = process_characters(matched_chars, resolver)
+                        character_data = c_data
+                        i18n_data["characters"] = c_i18n
+                        elements = new_elements
+                        weapon_types = new_weapon_types
+                        catalog_records["characters"] = build_records(
+                            "characters", c_data, c_i18n, entry_ids_by_id(matched_chars)
+                        )
+                        catalog_records["elements"] = build_records("elements", elements)
+                        catalog_records["weapon_types"] = build_records(
+                            "weapon_types", weapon_types
+                        )
 
                 if args.artifact:
-                    arts_en = scraper.scrape_artifacts("en")
-                    arts_zh = scraper.scrape_artifacts("zh")
-
-                    a_data, a_i18n, matched_arts = process_artifacts(arts_en, arts_zh, scraper)
-                    artifact_data = a_data
-                    i18n_data["artifacts"] = a_i18n
+                    with span("stage.artifacts"):
+                        matched_arts = checkpoint.run(
+                            "artifacts_matched", list[MatchedItem[ArtifactSource]], match_artifacts
+                        )
+
+                        a_data, a_i18n = process_artifacts(matched_arts)
+                        artifact_data = a_data
+                        i18n_data["artifacts"] = a_i18n
+                        catalog_records["artifacts"] = build_records(
+                            "artifacts", a_data, a_i18n, entry_ids_by_id(matched_arts)
+                        )
 
                 if args.weapon:
-                    weaps_en = scraper.scrape_weapons("en")
-                    weaps_zh = scraper.scrape_weapons("zh")
-
-                    w_data, w_i18n, matched_weaps = process_weapons(weaps_en, weaps_zh, scraper)
-                    weapon_data = w_data
-                    i18n_data["weapons"] = w_i18n
+                    with span("stage.weapons"):
+                        matched_weaps = checkpoint.run(
+                            "weapons_matched", list[MatchedItem[WeaponSource]], match_weapons
+                        )
+
+                        w_data, w_i18n = process_weapons(matched_weaps, resolver)
+                        weapon_data = w_data
+                        i18n_data["weapons"] = w_i18n
+                        catalog_records["weapons"] = build_records(
+                            "weapons", w_data, w_i18n, entry_ids_by_id(matched_weaps)
+                        )
 
             except Exception as e:
+                scrape_failed = True
                 print(f"Error during scraping: {e}")
+                print("Completed stages are saved; re-run with --resume to continue.")
                 import traceback
 
                 traceback.print_exc()
 
-    # 2.5 Recompute Half Sets (if requested or if artifacts were updated)
-    if args.half_set or args.artifact:
-        print("=== Computing Half Sets ===")
-
-        # Prepare artifact_ids
-        # If args.artifact was True, artifact_data contains Pydantic models
-        # If from file, it contains dicts
-        artifact_ids = []
-        if artifact_data:
-            if isinstance(artifact_data[0], BaseModel):
-                artifact_ids = [a.id for a in artifact_data]
+    changes: dict[str, ItemChanges] = {
+        category: diff_records(previous_records[category], records)
+        for category, records in catalog_records.items()
+    }
+
+    # 2.5 Recompute Half Sets (if requested or if artifact effects may have changed)
+    if args.artifact and "artifacts" in changes and not changes["artifacts"]:
+        print("Artifacts unchanged, keeping half sets")
+    if args.half_set or args.renumber_half_sets or changes.get("artifacts"):
+        with span("stage.half_sets"):
+            print("=== Computing Half Sets ===")
+
+            # Prepare artifact_ids
+            # If args.artifact was True, artifact_data contains Pydantic models
+            # If from file, it contains dicts
+            artifact_ids = []
+            if artifact_data:
+                if isinstance(artifact_data[0], BaseModel):
+                    artifact_ids = [a.id for a in artifact_data]
+                else:
+                    artifact_ids = [a["id"] for a in artifact_data]  # type: ignore
+
+            # Prepare i18n data (needs to be Pydantic models for preprocess.py)
+            current_i18n_artifacts = i18n_data.get("artifacts", {})
+            model_i18n_artifacts: dict[str, I18nArtifactData] = {}
+
+            for aid, data in current_i18n_artifacts.items():
+                if isinstance(data, I18nArtifactData):
+                    model_i18n_artifacts[aid] = data
+                elif isinstance(data, dict):
+                    # Hydrate from dict
+                    model_i18n_artifacts[aid] = I18nArtifactData(**data)
+
+            # Keep previous IDs unless renumbering was requested, saved builds reference them
+            previous_half_sets: list[HalfSet] | None = None
+            previous_half_sets_i18n: dict[str, dict[str, str]] | None = None
+            if half_sets and not args.renumber_half_sets:
+                previous_half_sets = [HalfSet.model_validate(hs) for hs in half_sets]
+                previous_half_sets_i18n = i18n_data.get("artifactHalfSets", {})
+
+            if artifact_ids and model_i18n_artifacts:
+                half_sets, half_sets_i18n = process_artifact_effects(
+                    artifact_ids,
+                    model_i18n_artifacts,
+                    previous_half_sets,
+                    previous_half_sets_i18n,
+                )
+                i18n_data["artifactHalfSets"] = half_sets_i18n
+                catalog_records["half_sets"] = build_records("half_sets", half_sets, half_sets_i18n)
+                changes["half_sets"] = diff_records(
+                    previous_records["half_sets"], catalog_records["half_sets"]
+                )
             else:
-                artifact_ids = [a["id"] for a in artifact_data]  # type: ignore
-
-        # Prepare i18n data (needs to be Pydantic models for preprocess.py)
-        current_i18n_artifacts = i18n_data.get("artifacts", {})
-        model_i18n_artifacts: dict[str, I18nArtifactData] = {}
-
-        for aid, data in current_i18n_artifacts.items():
-            if isinstance(data, I18nArtifactData):
-                model_i18n_artifacts[aid] = data
-            elif isinstance(data, dict):
-                # Hydrate from dict
-                model_i18n_artifacts[aid] = I18nArtifactData(**data)
-
-        if artifact_ids and model_i18n_artifacts:
-            half_sets, half_sets_i18n = process_artifact_effects(
-                artifact_ids,
-                model_i18n_artifacts,
-            )
-            i18n_data["artifactHalfSets"] = half_sets_i18n
-        else:
-            print("Warning: Skipping half set computation due to missing artifact data")
+                print("Warning: Skipping half set computation due to missing artifact data")
 
     # 3. Save Data
-    if args.character or args.weapon or args.artifact or args.half_set:
-        write_data(
-            character_data,
-            artifact_data,
-            weapon_data,
-            half_sets,
-            elements,
-            weapon_types,
-            i18n_data,
-        )
+    if catalog_records and not args.no_catalog:
+        with span("stage.catalog"), Catalog(args.catalog) as catalog:
+            record_generation(catalog, catalog_records, args.catalog_label)
+
+    # Always regenerated, since derived outputs (half set lookups, search index) can change with
+    # the generators even when no item did; files with the same content are left untouched
+    write_data(
+        character_data,
+        artifact_data,
+        weapon_data,
+        half_sets,
+        elements,
+        weapon_types,
+        i18n_data,
+    )
 
-        # 4. Download Images (only for updated items)
-        download_all_images(
-            matched_chars, matched_arts, matched_weaps, new_elements, new_weapon_types
-        )
+    # 4. Download Images (only for added and changed items)
+    if args.character or args.weapon or args.artifact:
+        with span("stage.images"):
+            images.close()
+            download_all_images(
+                matched_chars,
+                matched_arts,
+                matched_weaps,
+                new_elements,
+                new_weapon_types,
+                None if args.all_images else changes,
+            )
+
+    resolver.write_report()
+    if not scrape_failed:
+        checkpoint.clear()
+
+    # 4.5 Character Details (entry IDs from this run, or the catalog when characters were skipped)
+    if args.character_details:
+        with span("stage.character_details"):
+            entry_ids = entry_ids_by_id(matched_chars)
+            if not entry_ids and os.path.exists(args.catalog):
+                with Catalog(args.catalog) as catalog:
+                    entry_ids = catalog.entry_ids("characters")
+            if entry_ids:
+                scrape_character_details(
+                    entry_ids,
+                    languages,
+                    args.detail_workers,
+                    args.refresh_details,
+                    args.detail_max_age * DAY_SECONDS,
+                )
+            else:
+                print("No character entry IDs yet, run with --character first")
 
     # 5. Enka Map Generation
     if args.enka:
-        print("=== [5/5] Enka Map Generation ===")
-        enka.run()
+        with span("stage.enka"):
+            print("=== [5/5] Enka Map Generation ===")
+            enka.run()
+
+    if changes:
+        print_change_report(changes)
+
+    if args.profile:
+        PROFILER.write()
+
+    if args.metrics:
+        METRICS.collect_profile(PROFILER)
+        METRICS.set("scrape_failed", int(scrape_failed), "1 if a scrape stage failed")
+        METRICS.set("run_duration_seconds", time.time() - started, "Wall time of the run")
+        METRICS.write(args.metrics)
 
 
 if __name__ == "__main__":
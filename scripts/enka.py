@@ -2,7 +2,8 @@ import json
 import os
 from typing import Any
 
-import requests
+from network import POLICY
+from profiling import count, traced
 
 # Stat Key Mapping (Internal/GOOD keys)
 PROP_TYPE_MAP = {
@@ -28,10 +29,11 @@ PROP_TYPE_MAP = {
 }
 
 
+@traced("enka.fetch_json", "network")
 def fetch_json(url: str) -> Any:
     print(f"Fetching {url}...")
-    resp = requests.get(url)
-    resp.raise_for_status()
+    resp = POLICY.get(url)
+    count("bytes.enka", len(resp.content))
     return resp.json()
 
 
@@ -1,9 +1,14 @@
 import re
 from typing import TypedDict
 
+import requests
+from bs4 import BeautifulSoup, Tag
 from playwright.sync_api import Route, sync_playwright
 from tqdm import tqdm
 
+from network import POLICY, NetworkError
+from profiling import traced
+
 
 class CharacterData(TypedDict):
     name: str
@@ -23,6 +28,11 @@ MAX_NAME_LENGTH = 30
 VALID_RARITIES = [4, 5]
 CHARACTER_BLOCKLIST = {"Manekina", "Manekin"}
 
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
 
 def clean_release_date(date_string: str) -> str:
     """Clean release date to YYYY-MM-DD format"""
@@ -34,8 +44,136 @@ def clean_image_url(image_url: str) -> str:
     return re.sub(r"\.(png|jpg|jpeg).*$", r".\1", image_url)
 
 
-def get_character_data() -> dict[tuple[str, int, str], CharacterData]:
-    """Get character data from Fandom wiki and return a dict keyed by (element, rarity, name)."""
+def create_session() -> requests.Session:
+    """Pooled session, reused across requests to the same host"""
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+
+def last_link_text(cell: Tag) -> str | None:
+    links = cell.find_all("a")
+    return links[-1].get_text().strip() if links else None
+
+
+def parse_character_row(row: Tag) -> CharacterData | None:
+    """One row of the character table, None for rows that are not a playable character"""
+    cells = row.find_all(["td", "th"])
+    if len(cells) < 9:
+        return None
+
+    # 1. Name (Cell 1)
+    name_link = cells[1].find("a")
+    if name_link is None:
+        return None
+    name = name_link.get_text().strip()
+    if not name or len(name) < MIN_NAME_LENGTH or len(name) > MAX_NAME_LENGTH:
+        return None
+    if name in CHARACTER_BLOCKLIST:
+        return None
+
+    # 2. Rarity (Cell 2)
+    rarity_img = cells[2].find("img")
+    if rarity_img is None:
+        return None
+    alt_text = str(rarity_img.get("alt") or "")
+    if "4 Stars" in alt_text:
+        rarity = 4
+    elif "5 Stars" in alt_text:
+        rarity = 5
+    else:
+        return None
+    if rarity not in VALID_RARITIES:
+        return None
+
+    # 3. Element (Cell 3) and 4. Weapon (Cell 4) - Last link
+    element = last_link_text(cells[3])
+    weapon_type = last_link_text(cells[4])
+    if not element or not weapon_type:
+        return None
+
+    # 5. Region (Cell 5)
+    region = last_link_text(cells[5])
+    if region is None:
+        region = cells[5].get_text().strip()
+
+    # 6. Release Date (Cell 7)
+    release_date = cells[7].get("data-release")
+    if not release_date:
+        return None
+
+    # 7. Image (Cell 0)
+    icon_img = cells[0].find("img")
+    if icon_img is None:
+        return None
+    image_url = icon_img.get("data-src") or icon_img.get("src")
+    if not image_url:
+        return None
+
+    return {
+        "name": name,
+        "element": element,
+        "imageUrl": clean_image_url(str(image_url)),
+        "rarity": rarity,
+        "weaponType": weapon_type,
+        "region": region,
+        "releaseDate": clean_release_date(str(release_date)),
+    }
+
+
+def parse_character_list(html: str) -> list[CharacterData]:
+    """Playable characters from the Character/List page HTML"""
+    soup = BeautifulSoup(html, "html.parser")
+
+    target_table = next(
+        (table for table in soup.find_all("table") if table.select_one("[data-release]")),
+        None,
+    )
+    if target_table is None:
+        tqdm.write("Could not find the Playable Characters table")
+        return []
+
+    characters: list[CharacterData] = []
+    # Skip header
+    for row in target_table.find_all("tr")[1:]:
+        try:
+            character = parse_character_row(row)
+        except Exception as e:
+            tqdm.write(f"Error processing row: {e}")
+            continue
+        if character:
+            characters.append(character)
+    return characters
+
+
+@traced("fandom.get_character_data", "network")
+def get_character_data(
+    url: str = CHARACTERS_URL,
+    session: requests.Session | None = None,
+) -> dict[tuple[str, int, str], CharacterData]:
+    """
+    Get character data from Fandom wiki and return a dict keyed by (element, rarity, name).
+    The list is a static table, so it is fetched over plain HTTP and parsed in-process.
+    """
+    print("=== [1/4] Fandom Wiki Data ===")
+
+    try:
+        response = POLICY.get(url, session=session or create_session())
+    except (requests.RequestException, NetworkError) as e:
+        tqdm.write(f"Error scraping Fandom: {e}")
+        return {}
+
+    characters = parse_character_list(response.text)
+    tqdm.write(f"Successfully scraped {len(characters)} characters from Fandom")
+
+    return build_character_lookup(characters)
+
+
+@traced("fandom.get_character_data_browser", "playwright")
+def get_character_data_browser(
+    url: str = CHARACTERS_URL,
+) -> dict[tuple[str, int, str], CharacterData]:
+    """Browser-driven version of get_character_data, kept for comparison benchmarks"""
     print("=== [1/4] Fandom Wiki Data ===")
 
     characters: list[CharacterData] = []
@@ -45,7 +183,7 @@ def get_character_data() -> dict[tuple[str, int, str], CharacterData]:
 
         context = browser.new_context(
             java_script_enabled=False,
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",  # noqa: E501
+            user_agent=USER_AGENT,
         )
         page = context.new_page()
 
@@ -66,8 +204,8 @@ def get_character_data() -> dict[tuple[str, int, str], CharacterData]:
 
         try:
             with tqdm(total=1, desc="Navigating", bar_format="{desc}", leave=False) as pbar:
-                pbar.set_description(f"Navigating to {CHARACTERS_URL}...")
-                page.goto(CHARACTERS_URL, timeout=30000, wait_until="domcontentloaded")
+                pbar.set_description(f"Navigating to {url}...")
+                page.goto(url, timeout=30000, wait_until="domcontentloaded")
                 pbar.set_description("Table Found")
 
             tables = page.locator("table").all()
@@ -202,6 +340,13 @@ def get_character_data() -> dict[tuple[str, int, str], CharacterData]:
 
     tqdm.write(f"Successfully scraped {len(characters)} characters from Fandom")
 
+    return build_character_lookup(characters)
+
+
+def build_character_lookup(
+    characters: list[CharacterData],
+) -> dict[tuple[str, int, str], CharacterData]:
+    """Key characters by (element, rarity, name) for matching against Hoyolab data."""
     character_lookup: dict[tuple[str, int, str], CharacterData] = {}
     for char in characters:
         key = (char["element"], char["rarity"], char["name"])
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Streaming loader for GOOD exports (docs/GOOD.md).
+Exports can hold tens of thousands of artifacts, and merged multi-account files (a JSON array of
+GOOD objects) much more, so entries are decoded one at a time from a fixed-size read buffer and
+validated in batches. Memory stays bounded by the chunk and batch sizes, not the file size.
+
+Keys are cross-checked against the generated i18nGameData (what the app can import) and the Enka
+maps (what exists in the game), with the same normalization and skip rules as goodConversion.ts.
+
+Usage:
+    python good.py export.json [more.json ...] [--batch-size 1000]
+"""
+
+import argparse
+import functools
+import json
+import os
+import re
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, Literal, NamedTuple, TextIO, TypedDict
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from models import GoodArtifact, GoodCharacter, GoodHeader, GoodWeapon
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+I18N_GAME_PATH = os.path.join(PROJECT_ROOT, "src", "data", "i18n-game.ts")
+ENKA_ID_MAP_PATH = os.path.join(PROJECT_ROOT, "src", "data", "enkaIdMap.ts")
+
+CHUNK_SIZE = 1 << 16
+BATCH_SIZE = 1000
+
+type Section = Literal["characters", "weapons", "artifacts"]
+type GoodItem = GoodCharacter | GoodWeapon | GoodArtifact
+
+SECTION_MODELS: dict[Section, type[BaseModel]] = {
+    "characters": GoodCharacter,
+    "weapons": GoodWeapon,
+    "artifacts": GoodArtifact,
+}
+SECTION_ADAPTERS: dict[Section, TypeAdapter[list[Any]]] = {
+    "characters": TypeAdapter(list[GoodCharacter]),
+    "weapons": TypeAdapter(list[GoodWeapon]),
+    "artifacts": TypeAdapter(list[GoodArtifact]),
+}
+HEADER_ADAPTER = TypeAdapter(GoodHeader)
+
+# Mirrors the skip lists in goodConversion.ts (normalized keys)
+CHARACTER_SKIP_SET = {"manekina", "manekin"}
+ARTIFACT_SKIP_SET = {
+    "adventurer",
+    "braveheart",
+    "luckydog",
+    "travelingdoctor",
+    "resolutionofsojourner",
+    "tinymiracle",
+    "berserker",
+    "theexile",
+    "defenderswill",
+    "martialartist",
+    "gambler",
+    "scholar",
+}
+
+NON_ALPHANUMERIC = re.compile(r"[^a-zA-Z0-9]")
+WHITESPACE = re.compile(r"\s*")
+DECODER = json.JSONDecoder()
+
+
+# Set and character keys repeat across thousands of artifacts, so normalization is cached
+@functools.cache
+def normalize(key: str) -> str:
+    return NON_ALPHANUMERIC.sub("", key).lower()
+
+
+def character_key(key: str) -> str:
+    """GOOD has a single Traveler key, the app imports it as the Anemo Traveler"""
+    return "Traveler (Anemo)" if key == "Traveler" else key
+
+
+def load_i18n_game(path: str = I18N_GAME_PATH) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    match = re.search(r"export const i18nGameData = (.*);\s*$", content, re.DOTALL)
+    if not match:
+        raise ValueError(f"i18nGameData not found in {path}")
+    return json.loads(match.group(1))
+
+
+def load_enka_names(path: str = ENKA_ID_MAP_PATH) -> dict[str, set[str]]:
+    """Names per enkaIdMap.ts export (characterIdMap, weaponIdMap, ...)"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    return {
+        name: {
+            json.loads(value)
+            for value in re.findall(r'^\s*"[^"]+": ("(?:[^"\\]|\\.)*"),', body, re.M)
+        }
+        for name, body in re.findall(
+            r"export const (\w+): Record<string, string> = \{(.*?)^\};", content, re.DOTALL | re.M
+        )
+    }
+
+
+class JsonStream:
+    """
+    Incremental JSON reader: values are decoded one at a time with raw_decode, and text is read in
+    chunks and dropped once consumed, so only the current value and one chunk are held in memory.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._file = f
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, "" at the end of the input"""
+        while True:
+            match = WHITESPACE.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def consume(self, char: str) -> bool:
+        if self.peek() != char:
+            return False
+        self._pos += 1
+        return True
+
+    def expect(self, char: str) -> None:
+        if not self.consume(char):
+            found = self.peek() or "end of input"
+            raise ValueError(f"Expected '{char}' in GOOD file, found '{found}'")
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Value continues in the next chunk
+                if not self._fill():
+                    raise
+                continue
+            # A number ending exactly at the buffer end may also continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def next_item(self, close: str) -> bool:
+        """After an element: True if another one follows, False at the closing bracket"""
+        if self.consume(","):
+            return True
+        self.expect(close)
+        return False
+
+
+class RawEntry(NamedTuple):
+    account: int
+    # Section name, or None for the account's other top-level fields
+    section: Section | None
+    value: Any
+
+
+def _iter_account(stream: JsonStream, account: int) -> Iterator[RawEntry]:
+    stream.expect("{")
+    # Marks the account start, so empty accounts still get a header check
+    yield RawEntry(account, None, {})
+    if stream.consume("}"):
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key in SECTION_MODELS and stream.consume("["):
+            if not stream.consume("]"):
+                while True:
+                    yield RawEntry(account, key, stream.value())
+                    if not stream.next_item("]"):
+                        break
+        else:
+            # Header fields, and sections the app does not read (materials) are small
+            yield RawEntry(account, None, {key: stream.value()})
+        if not stream.next_item("}"):
+            return
+
+
+def iter_entries(f: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[RawEntry]:
+    """Raw section entries of a GOOD object, or of every account in an array of them"""
+    stream = JsonStream(f, chunk_size)
+    if not stream.consume("["):
+        yield from _iter_account(stream, 0)
+        return
+
+    if stream.consume("]"):
+        return
+    account = 0
+    while True:
+        yield from _iter_account(stream, account)
+        account += 1
+        if not stream.next_item("]"):
+            return
+
+
+class GoodIssue(TypedDict):
+    account: int
+    section: str
+    # Position in the section list, -1 for the header
+    index: int
+    message: str
+
+
+class GoodBatch(NamedTuple):
+    account: int
+    section: Section
+    # Position of the first raw entry in the section list
+    start: int
+    items: list[GoodItem]
+    issues: list[GoodIssue]
+
+
+def validate_batch(account: int, section: Section, start: int, raw: list[Any]) -> GoodBatch:
+    """Validate a batch in one call, dropping (and reporting) only the invalid entries"""
+    adapter = SECTION_ADAPTERS[section]
+    try:
+        return GoodBatch(account, section, start, adapter.validate_python(raw), [])
+    except ValidationError as e:
+        errors = e.errors()
+
+    # One issue per invalid entry, listing every failed field
+    messages: dict[int, list[str]] = {}
+    for error in errors:
+        field = ".".join(str(part) for part in error["loc"][1:])
+        message = f"{field}: {error['msg']}" if field else error["msg"]
+        messages.setdefault(int(error["loc"][0]), []).append(message)
+
+    issues: list[GoodIssue] = [
+        {
+            "account": account,
+            "section": section,
+            "index": start + index,
+            "message": "; ".join(lines),
+        }
+        for index, lines in messages.items()
+    ]
+    valid = adapter.validate_python([entry for i, entry in enumerate(raw) if i not in messages])
+    return GoodBatch(account, section, start, valid, issues)
+
+
+def stream_good(
+    f: TextIO, batch_size: int = BATCH_SIZE, chunk_size: int = CHUNK_SIZE
+) -> Iterator[GoodBatch | GoodHeader | GoodIssue]:
+    """
+    Validated batches of each section, in file order. Each account's header (or an issue if it
+    is missing or not GOOD) is yielded once the account has been read.
+    """
+    pending: list[Any] = []
+    pending_key: tuple[int, Section] | None = None
+    # Entries seen so far per (account, section)
+    counts: Counter[tuple[int, Section]] = Counter()
+    header: dict[str, Any] = {}
+    current_account: int | None = None
+
+    def flush() -> Iterator[GoodBatch]:
+        nonlocal pending, pending_key
+        if pending_key is not None and pending:
+            account, section = pending_key
+            start = counts[pending_key] - len(pending)
+            yield validate_batch(account, section, start, pending)
+        pending = []
+        pending_key = None
+
+    def finish_account() -> Iterator[GoodHeader | GoodIssue]:
+        if current_account is None:
+            return
+        try:
+            yield HEADER_ADAPTER.validate_python(header)
+        except ValidationError as e:
+            error = e.errors()[0]
+            message = f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+            yield {"account": current_account, "section": "header", "index": -1, "message": message}
+
+    for entry in iter_entries(f, chunk_size):
+        if entry.account != current_account:
+            yield from flush()
+            yield from finish_account()
+            header = {}
+            current_account = entry.account
+
+        if entry.section is None:
+            header.update(entry.value)
+            continue
+
+        key = (entry.account, entry.section)
+        if key != pending_key or len(pending) >= batch_size:
+            yield from flush()
+            pending_key = key
+        pending.append(entry.value)
+        counts[key] += 1
+
+    yield from flush()
+    yield from finish_account()
+
+
+type KeyStatus = Literal["known", "skipped", "game-only", "unknown"]
+
+
+class KeyChecker:
+    """
+    Classifies GOOD keys: known to the app (i18nGameData), intentionally skipped, present in the
+    game (Enka maps) but missing from the app data, or unknown (typos, unsupported exporters).
+    """
+
+    def __init__(
+        self, i18n: dict[str, Any] | None = None, enka_names: dict[str, set[str]] | None = None
+    ):
+        i18n = load_i18n_game() if i18n is None else i18n
+        enka_names = load_enka_names() if enka_names is None else enka_names
+
+        self.known: dict[str, set[str]] = {
+            "characters": {normalize(names["en"]) for names in i18n["characters"].values()},
+            "weapons": {normalize(data["name"]["en"]) for data in i18n["weapons"].values()},
+            "artifacts": {normalize(data["name"]["en"]) for data in i18n["artifacts"].values()},
+        }
+        self.skipped: dict[str, set[str]] = {
+            "characters": CHARACTER_SKIP_SET,
+            "weapons": set(),
+            "artifacts": ARTIFACT_SKIP_SET,
+        }
+        self.game: dict[str, set[str]] = {
+            section: {normalize(name) for name in enka_names.get(export, set())}
+            for section, export in [
+                ("characters", "characterIdMap"),
+                ("weapons", "weaponIdMap"),
+                ("artifacts", "artifactIdMap"),
+            ]
+        }
+
+    def status(self, section: Section, key: str) -> KeyStatus:
+        # The Enka maps name every Traveler "Traveler", the app has one entry per element
+        game_key = normalize(key)
+        if section == "characters":
+            key = character_key(key)
+        normalized = normalize(key)
+
+        if normalized in self.known[section]:
+            return "known"
+        if normalized in self.skipped[section]:
+            return "skipped"
+        if game_key in self.game[section]:
+            return "game-only"
+        return "unknown"
+
+
+class GoodReport(TypedDict):
+    accounts: int
+    counts: dict[str, int]
+    issues: list[GoodIssue]
+    # Section -> status -> key -> occurrences, known keys are only counted
+    keys: dict[str, dict[str, dict[str, int]]]
+
+
+# Issue messages kept per file, the rest are only counted
+MAX_ISSUES = 100
+
+
+def check_good(
+    f: TextIO, checker: KeyChecker | None = None, batch_size: int = BATCH_SIZE
+) -> GoodReport:
+    """Validate a GOOD file and cross-check its keys, without keeping its entries"""
+    checker = checker or KeyChecker()
+    counts: Counter[str] = Counter()
+    issues: list[GoodIssue] = []
+    keys: dict[str, dict[str, Counter[str]]] = {
+        section: {"skipped": Counter(), "game-only": Counter(), "unknown": Counter()}
+        for section in SECTION_MODELS
+    }
+    accounts = 0
+
+    def add_issue(issue: GoodIssue) -> None:
+        counts["invalid"] += 1
+        if len(issues) < MAX_ISSUES:
+            issues.append(issue)
+
+    def check_key(section: Section, key: str) -> None:
+        status = checker.status(section, key)
+        if status == "known":
+            counts[f"{section}.known"] += 1
+        else:
+            keys[section][status][key] += 1
+
+    for result in stream_good(f, batch_size):
+        if isinstance(result, GoodHeader):
+            accounts += 1
+        elif isinstance(result, GoodBatch):
+            counts[result.section] += len(result.items)
+            for issue in result.issues:
+                add_issue(issue)
+            for item in result.items:
+                if isinstance(item, GoodArtifact):
+                    check_key("artifacts", item.setKey)
+                else:
+                    check_key(result.section, item.key)
+                # Equipped items point at characters too
+                if not isinstance(item, GoodCharacter) and item.location:
+                    check_key("characters", item.location)
+        else:
+            accounts += 1
+            add_issue(result)
+
+    return {
+        "accounts": accounts,
+        "counts": dict(counts),
+        "issues": issues,
+        "keys": {
+            section: {status: dict(counter) for status, counter in by_status.items() if counter}
+            for section, by_status in keys.items()
+        },
+    }
+
+
+def print_report(path: str, report: GoodReport) -> None:
+    counts = report["counts"]
+    print(
+        f"{path}: {report['accounts']} account(s), {counts.get('characters', 0)} characters, "
+        f"{counts.get('weapons', 0)} weapons, {counts.get('artifacts', 0)} artifacts"
+    )
+    if counts.get("invalid"):
+        print(f"  Invalid entries ({counts['invalid']}):")
+        for issue in report["issues"]:
+            print(
+                f"    [{issue['account']}] {issue['section']}[{issue['index']}] {issue['message']}"
+            )
+    for section, by_status in report["keys"].items():
+        for status, keys in by_status.items():
+            listed = ", ".join(f"{key} ({count})" for key, count in sorted(keys.items()))
+            print(f"  {section} {status}: {listed}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate GOOD exports and cross-check keys")
+    parser.add_argument("inventories", nargs="+", help="GOOD JSON files")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    checker = KeyChecker()
+    failed = False
+    for path in args.inventories:
+        with open(path, encoding="utf-8") as f:
+            report = check_good(f, checker, args.batch_size)
+        print_report(path, report)
+        failed = failed or bool(report["counts"].get("invalid"))
+
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,67 @@
+import html
+import json
 import os
 import re
 import time
-from typing import Self
-
-import requests
-from playwright.sync_api import Browser, BrowserContext, Locator, Page, sync_playwright
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, Self
+
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Locator,
+    Page,
+    Response,
+    Route,
+    sync_playwright,
+)
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from tqdm import tqdm
 
 from models import (
     ArtifactSource,
     CharacterSource,
+    EntryListItem,
+    EntryListPage,
     ResourceOutput,
     WeaponSource,
 )
+from network import POLICY, NetworkError, raise_for_retry
+from profiling import PROFILER, count, sleep, traced
 
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 SKIP_EXISTING_IMAGES = True
+BASE_URL = "https://wiki.hoyolab.com"
+CHARACTER_LIST_PATH = "/pc/genshin/aggregate/2"
+WEAPON_LIST_PATH = "/pc/genshin/aggregate/4"
+ARTIFACT_LIST_PATH = "/pc/genshin/aggregate/5"
+ENTRY_PATH = "/pc/genshin/entry"
+# XHR the list pages load their entries from, one page of entries per request
+LIST_API_PATH = "/hoyowiki/genshin/wapi/get_entry_page_list"
+LIST_API_TIMEOUT = 10000  # ms to wait for the first list response after navigating
+# Cards are resolved and extracted this many at a time
+CARD_BATCH_SIZE = 50
+# Entry pages opened per browser context before it is replaced, keeping Chromium's memory flat
+DETAIL_PAGES_PER_CONTEXT = 40
+BROWSER_PROFILE_DIR = os.path.join(SCRIPT_DIR, ".cache", "browser")
+STORAGE_STATE_PATH = os.path.join(SCRIPT_DIR, ".cache", "storage_state.json")
+CONTEXT_OPTIONS: dict[str, Any] = {
+    "viewport": {"width": 1920, "height": 1080},
+    "user_agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+}
+# Entry pages expect full locale codes
+ENTRY_LANGUAGE_CODES: dict[str, str] = {
+    "en": "en-us",
+    "zh": "zh-cn",
+    "ja": "ja-jp",
+    "ko": "ko-kr",
+}
 VALID_ELEMENTS: set[str] = {
     "Pyro",
     "Hydro",
@@ -24,6 +71,16 @@ VALID_ELEMENTS: set[str] = {
     "Geo",
     "Dendro",
 }
+# Element filter values of the list API in other languages
+ELEMENT_NAMES: dict[str, str] = {
+    "火": "Pyro",
+    "水": "Hydro",
+    "雷": "Electro",
+    "冰": "Cryo",
+    "风": "Anemo",
+    "岩": "Geo",
+    "草": "Dendro",
+}
 VALID_WEAPONS: set[str] = {"Sword", "Claymore", "Polearm", "Catalyst", "Bow"}
 WEAPON_TYPE_MAP = {
     "Sword": "Sword",
@@ -63,6 +120,16 @@ ARTIFACT_SUFFIX: dict[str, str] = {
     "circlet": "5",
 }
 
+# List API display fields holding the artifact slot icons
+ARTIFACT_ICON_FIELDS: dict[str, str] = {
+    "flower": "flower_of_life_icon_url",
+    "plume": "plume_of_death_icon_url",
+    "sands": "sands_of_eon_icon_url",
+    "goblet": "goblet_of_eonothem_icon_url",
+    "circlet": "circlet_of_logos_icon_url",
+}
+RARITY_NUMERALS: dict[str, int] = {"一": 1, "二": 2, "三": 3, "四": 4, "五": 5}
+
 IGNORE_KEYS = {
     "Name",
     "Region",
@@ -84,26 +151,106 @@ PLACEHOLDER_PATTERNS: list[str] = [
 ]
 CHARACTER_BLOCKLIST: set[str] = {"Manekina", "Manekin", "Traveler", "旅行者"}
 
+# Counts the images still showing a placeholder in one round-trip. Lazy loaders keep the real
+# URL in a data attribute, which is swapped in directly; the rest are made eager, and the page
+# is scrolled through every remaining placeholder in viewport steps, a frame apart, so
+# IntersectionObserver based loaders see all of them in the same poll.
+PENDING_IMAGES_SCRIPT = """
+async ([selector, patterns]) => {
+  const isPlaceholder = (src) => !!src && patterns.some((pattern) => src.includes(pattern));
+  const pending = [...document.querySelectorAll(selector)].filter((img) =>
+    isPlaceholder(img.getAttribute('src'))
+  );
+  for (const img of pending) {
+    const real = img.dataset.src || img.dataset.original || img.getAttribute('lazy');
+    if (real && !isPlaceholder(real)) {
+      img.setAttribute('src', real);
+    } else {
+      img.loading = 'eager';
+    }
+  }
+  const remaining = pending.filter((img) => isPlaceholder(img.getAttribute('src')));
+  const nextFrame = () =>
+    new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+  const step = window.innerHeight;
+  const tops = remaining
+    .map((img) => img.getBoundingClientRect().top + window.scrollY)
+    .sort((a, b) => a - b);
+  let covered = -Infinity;
+  for (const top of tops) {
+    if (top < covered) continue;
+    window.scrollTo(0, Math.max(0, top - step / 4));
+    covered = top - step / 4 + step;
+    await nextFrame();
+  }
+  return remaining.length;
+}
+"""
+
+# Last resort for one card whose image is still a placeholder after the bulk wait: scroll it
+# into view and wait up to `timeout` ms for its src to change. Returns whether it loaded.
+CARD_IMAGE_SCRIPT = """
+async (card, [patterns, timeout]) => {
+  const isPlaceholder = (src) => !src || patterns.some((pattern) => src.includes(pattern));
+  const img = card.querySelector('img.d-img-show');
+  if (!img || !isPlaceholder(img.getAttribute('src'))) return true;
+  card.scrollIntoView({ block: 'center' });
+  const deadline = performance.now() + timeout;
+  while (performance.now() < deadline) {
+    await new Promise((resolve) => setTimeout(resolve, 100));
+    if (!isPlaceholder(img.getAttribute('src'))) return true;
+  }
+  return false;
+}
+"""
+CARD_IMAGE_TIMEOUT = 2000  # ms per card, only used when the bulk wait timed out
+
+# Link a card is wrapped in or contains, so its entry ID is known without opening it
+CARD_LINK_SCRIPT = """
+(card) => {
+  const link = card.closest('a[href]') || card.querySelector('a[href]');
+  return (link && link.getAttribute('href')) || card.dataset.href || card.dataset.url || '';
+}
+"""
+
+
+@dataclass
+class ImageWait:
+    """Outcome of HoyolabScraper._wait_for_images_to_load"""
+
+    loaded: bool
+    polls: int
+    waited: float  # seconds
+    pending: int  # images still showing a placeholder
+
 
 def generate_id(name: str) -> str:
     """Generate a consistent ID from character name"""
     return re.sub(r"[^a-z0-9_]", "", name.lower().replace(" ", "_"))
 
 
+# (image URL, destination file)
+type ImageJob = tuple[str, str]
+
+
+@traced("download_image", "network")
 def download_image(url: str, filepath: str, skip_existing: bool = SKIP_EXISTING_IMAGES) -> bool:
     """Download an image from URL to filepath"""
     if skip_existing and os.path.exists(filepath):
+        count("images.skipped")
         return True
 
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        response = POLICY.get(url)
+        count("images.downloaded")
+        count("bytes.images", len(response.content))
 
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, "wb") as f:
             f.write(response.content)
         return True
     except Exception as e:
+        count("images.failed")
         tqdm.write(f"Failed to download image {url}: {e}")
         return False
 
@@ -112,42 +259,67 @@ class HoyolabAssetManager:
     """Helper class to manage asset downloading logic"""
 
     @staticmethod
-    def download_character_assets(character: CharacterSource, project_root: str) -> bool:
-        """Download character image"""
+    def character_images(character: CharacterSource, project_root: str) -> list[ImageJob]:
         id = generate_id(character.name)
         filename = os.path.join(project_root, "public", "character", f"{id}.png")
-        return download_image(character.image_url, filename)
+        return [(character.image_url, filename)]
 
     @staticmethod
-    def download_artifact_assets(artifact: ArtifactSource, project_root: str) -> None:
-        """Download all artifact slot images"""
+    def artifact_images(artifact: ArtifactSource, project_root: str) -> list[ImageJob]:
         id = generate_id(artifact.name)
-        for slot, suffix in ARTIFACT_SUFFIX.items():
-            url = artifact.image_urls.get(slot)
-            if url:
-                filename = os.path.join(project_root, "public", "artifact", f"{id}{suffix}.png")
-                download_image(url, filename)
+        return [
+            (url, os.path.join(project_root, "public", "artifact", f"{id}{suffix}.png"))
+            for slot, suffix in ARTIFACT_SUFFIX.items()
+            if (url := artifact.image_urls.get(slot))
+        ]
 
     @staticmethod
-    def download_weapon_assets(weapon: WeaponSource, project_root: str) -> bool:
-        """Download weapon image"""
+    def weapon_images(weapon: WeaponSource, project_root: str) -> list[ImageJob]:
         id = generate_id(weapon.name)
         filename = os.path.join(project_root, "public", "weapon", f"{id}.png")
-        return download_image(weapon.image_url, filename)
+        return [(weapon.image_url, filename)]
+
+    @staticmethod
+    def download_character_assets(
+        character: CharacterSource, project_root: str, skip_existing: bool = SKIP_EXISTING_IMAGES
+    ) -> bool:
+        """Download character image"""
+        [(url, filename)] = HoyolabAssetManager.character_images(character, project_root)
+        return download_image(url, filename, skip_existing)
+
+    @staticmethod
+    def download_artifact_assets(
+        artifact: ArtifactSource, project_root: str, skip_existing: bool = SKIP_EXISTING_IMAGES
+    ) -> None:
+        """Download all artifact slot images"""
+        for url, filename in HoyolabAssetManager.artifact_images(artifact, project_root):
+            download_image(url, filename, skip_existing)
 
     @staticmethod
-    def download_element_asset(element: ResourceOutput, project_root: str) -> bool:
+    def download_weapon_assets(
+        weapon: WeaponSource, project_root: str, skip_existing: bool = SKIP_EXISTING_IMAGES
+    ) -> bool:
+        """Download weapon image"""
+        [(url, filename)] = HoyolabAssetManager.weapon_images(weapon, project_root)
+        return download_image(url, filename, skip_existing)
+
+    @staticmethod
+    def download_element_asset(
+        element: ResourceOutput, project_root: str, skip_existing: bool = SKIP_EXISTING_IMAGES
+    ) -> bool:
         """Download element image"""
         id = generate_id(element.name)
         filename = os.path.join(project_root, "public", "element", f"{id}.png")
-        return download_image(element.imageUrl, filename)
+        return download_image(element.imageUrl, filename, skip_existing)
 
     @staticmethod
-    def download_weapon_type_asset(weapon_type: ResourceOutput, project_root: str) -> bool:
+    def download_weapon_type_asset(
+        weapon_type: ResourceOutput, project_root: str, skip_existing: bool = SKIP_EXISTING_IMAGES
+    ) -> bool:
         """Download weapon type image"""
         id = generate_id(weapon_type.name)
         filename = os.path.join(project_root, "public", "weapontype", f"{id}.png")
-        return download_image(weapon_type.imageUrl, filename)
+        return download_image(weapon_type.imageUrl, filename, skip_existing)
 
 
 def extract_id_from_url(url: str) -> str:
@@ -165,7 +337,7 @@ def clean_image_url(url: str) -> str:
 
     # Handle relative URLs (e.g., /_ipx/...)
     if url.startswith("/"):
-        url = f"https://wiki.hoyolab.com{url}"
+        url = f"{BASE_URL}{url}"
 
     if "?" in url:
         return url.split("?")[0]
@@ -214,29 +386,174 @@ def extract_rarity_from_star_class(class_str: str) -> int | None:
     return None
 
 
+def extract_element_from_name(name: str) -> str | None:
+    """Element of a list API filter value, e.g. "Pyro" or "火" """
+    for element in VALID_ELEMENTS:
+        if element.lower() in name.lower():
+            return element
+    return next((element for key, element in ELEMENT_NAMES.items() if key in name), None)
+
+
+def extract_rarity_from_text(text: str) -> int | None:
+    """Rarity of a list API filter value, e.g. "5-Star", "★★★★" or "五星" """
+    match = re.search(r"\d", text)
+    if match:
+        return int(match.group())
+    if "★" in text:
+        return text.count("★")
+    return next((rarity for key, rarity in RARITY_NUMERALS.items() if key in text), None)
+
+
+def strip_html(text: str) -> str:
+    return html.unescape(re.sub(r"<[^>]+>", "", text)).strip()
+
+
+def is_list_api_response(response: Response) -> bool:
+    return LIST_API_PATH in response.url and response.request.method == "POST"
+
+
+def parse_entry_list(payload: Any) -> EntryListPage:
+    """Validate a list API payload, raises ValueError if it is not the expected shape"""
+    if not isinstance(payload, dict) or payload.get("retcode") != 0:
+        raise ValueError(f"Unexpected list API payload: {str(payload)[:200]}")
+    return EntryListPage.model_validate(payload.get("data"))
+
+
+def character_from_entry(entry: EntryListItem) -> CharacterSource | None:
+    name = entry.name.strip()
+    if not name or name in CHARACTER_BLOCKLIST:
+        return None
+
+    element = extract_element_from_name(entry.filter_value("character_vision"))
+    rarity = extract_rarity_from_text(entry.filter_value("character_rarity"))
+    if element is None or rarity is None:
+        tqdm.write(f"SKIP ({name}): No element/rarity in list entry")
+        return None
+    if not entry.icon_url or is_placeholder_image(entry.icon_url):
+        tqdm.write(f"SKIP ({name}): No icon in list entry")
+        return None
+
+    return CharacterSource(
+        entry_id=entry.entry_page_id,
+        name=name,
+        element=element,
+        rarity=rarity,
+        image_url=clean_image_url(entry.icon_url),
+    )
+
+
+def artifact_from_entry(entry: EntryListItem) -> ArtifactSource | None:
+    name = entry.name.strip()
+    image_urls = {
+        slot: clean_image_url(url)
+        for slot, field in ARTIFACT_ICON_FIELDS.items()
+        if isinstance(url := entry.display_field.get(field), str) and url
+    }
+    if "flower" not in image_urls and entry.icon_url:
+        image_urls["flower"] = clean_image_url(entry.icon_url)
+
+    effects = [
+        strip_html(str(entry.display_field.get(field) or ""))
+        for field in ("two_set_effect", "four_set_effect")
+    ]
+    if "flower" not in image_urls or not all(effects):
+        # Same rule as the cards: sets without a flower or without both effects are skipped
+        tqdm.write(f"SKIP ({name}): Incomplete list entry")
+        return None
+
+    return ArtifactSource(
+        entry_id=entry.entry_page_id,
+        name=name,
+        image_urls=image_urls,
+        effects=effects,
+    )
+
+
+def weapon_from_entry(entry: EntryListItem) -> WeaponSource | None:
+    """Weapon from a list entry; effect, base ATK and stat value still need the detail page"""
+    name = entry.name.strip()
+    rarity = extract_rarity_from_text(entry.filter_value("weapon_rarity"))
+    if rarity is None:
+        tqdm.write(f"SKIP ({name}): No rarity in list entry")
+        return None
+    if rarity in (1, 2):
+        return None
+    if not entry.icon_url or is_placeholder_image(entry.icon_url):
+        tqdm.write(f"SKIP ({name}): No icon in list entry")
+        return None
+
+    secondary_stat = entry.filter_value("weapon_property")
+    return WeaponSource(
+        entry_id=entry.entry_page_id,
+        name=name,
+        rarity=rarity,
+        image_url=clean_image_url(entry.icon_url),
+        type=WEAPON_TYPE_MAP.get(entry.filter_value("weapon_type"), ""),
+        secondary_stat=STAT_MAP.get(secondary_stat, secondary_stat),
+        effect="",
+        base_atk=0,
+        secondary_stat_value="",
+    )
+
+
 class HoyolabScraper:
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        base_url: str = BASE_URL,
+        snapshot_dir: str | None = None,
+        use_list_api: bool = False,
+        batch_size: int = CARD_BATCH_SIZE,
+        recycle_every: int = DETAIL_PAGES_PER_CONTEXT,
+        profile_dir: str | None = None,
+        storage_state: str | None = None,
+    ):
         self._headless = headless
+        self.base_url = base_url
+        # Where to save each loaded list page for offline parsing (snapshots.py), None to skip
+        self.snapshot_dir = snapshot_dir
+        # Build items from the list API responses instead of scrolling and reading cards
+        self.use_list_api = use_list_api
+        self.batch_size = batch_size
+        self.recycle_every = recycle_every
         self._playwright = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self.page: Page | None = None
+        # Entry pages get their own context, replaced every `recycle_every` pages
+        self._detail_context: BrowserContext | None = None
+        self._detail: Page | None = None
+        self._detail_visits = 0
+        self._routes: list[tuple[str, Callable[[Route], None]]] = []
+        # Warm start: a persistent user-data directory keeps the HTTP cache and cookies between
+        # runs; a storage_state file only keeps cookies/localStorage but works with recycling
+        self.profile_dir = profile_dir
+        self.storage_state = storage_state
+        self._persistent: BrowserContext | None = None
+        self.first_navigation: float | None = None
 
     def __enter__(self) -> Self:
         self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(headless=self._headless)
-        self._context = self._browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            user_agent=(
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/131.0.0.0 Safari/537.36"
-            ),
-        )
-        self.page = self._context.new_page()
+        if self.profile_dir:
+            self._persistent = self._playwright.chromium.launch_persistent_context(
+                self.profile_dir, headless=self._headless, **CONTEXT_OPTIONS
+            )
+            self._setup_context(self._persistent)
+            self._context = self._persistent
+            pages = self._persistent.pages
+            self.page = pages[0] if pages else self._persistent.new_page()
+        else:
+            self._browser = self._playwright.chromium.launch(headless=self._headless)
+            self._context = self._new_context()
+            self.page = self._context.new_page()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.storage_state and self._context and not self._persistent:
+            os.makedirs(os.path.dirname(os.path.abspath(self.storage_state)), exist_ok=True)
+            self._context.storage_state(path=self.storage_state)
+        if self._detail_context and self._detail_context is not self._persistent:
+            self._detail_context.close()
         if self._context:
             self._context.close()
         if self._browser:
@@ -249,19 +566,230 @@ class HoyolabScraper:
             raise RuntimeError("Scraper not initialized. Use 'with HoyolabScraper() as scraper:'")
         return self.page
 
+    def _new_context(self) -> BrowserContext:
+        """A fresh context, or the shared one when running on a persistent profile"""
+        if self._persistent:
+            return self._persistent
+        if not self._browser:
+            raise RuntimeError("Scraper not initialized. Use 'with HoyolabScraper() as scraper:'")
+        state = self.storage_state
+        context = self._browser.new_context(
+            storage_state=state if state and os.path.exists(state) else None, **CONTEXT_OPTIONS
+        )
+        self._setup_context(context)
+        return context
+
+    def _close_context(self, context: BrowserContext, page: Page | None) -> None:
+        """Close a recycled context; on a persistent profile only its page is closed"""
+        if context is not self._persistent:
+            context.close()
+        elif page:
+            page.close()
+
+    def _setup_context(self, context: BrowserContext) -> None:
+        if PROFILER.enabled:
+            # Content-Length only; chunked responses without it are not counted
+            context.on(
+                "response",
+                lambda response: count(
+                    "bytes.playwright", int(response.headers.get("content-length", 0))
+                ),
+            )
+        for url, handler in self._routes:
+            context.route(url, handler)
+
+    def route(self, url: str, handler: Callable[[Route], None]) -> None:
+        """Route requests of every context this scraper opens, including recycled ones"""
+        self._routes.append((url, handler))
+        if self._context:
+            self._context.route(url, handler)
+        if self._detail_context and self._detail_context is not self._context:
+            self._detail_context.route(url, handler)
+
+    def _recycle_context(self) -> None:
+        """Start a list on a fresh context, so nothing the previous list loaded is kept alive"""
+        page = self._ensure_page()
+        if page.url == "about:blank":
+            return
+        previous = self._context
+        # Open the new page first, a persistent profile must always keep one page open
+        self._context = self._new_context()
+        self.page = self._context.new_page()
+        if previous:
+            self._close_context(previous, page)
+        count("hoyolab.contexts_recycled")
+
+    def _detail_page(self) -> Page:
+        """Page for the next entry page, on a context replaced every `recycle_every` pages"""
+        if self._detail_context and self._detail_visits >= self.recycle_every:
+            self._close_context(self._detail_context, self._detail)
+            self._detail_context = None
+            count("hoyolab.contexts_recycled")
+        if not self._detail_context or not self._detail:
+            self._detail_context = self._new_context()
+            self._detail = self._detail_context.new_page()
+            self._detail_visits = 0
+        self._detail_visits += 1
+        count("hoyolab.detail_pages")
+        return self._detail
+
+    def _iter_cards(self, selector: str, language: str) -> Iterator[tuple[int, Locator]]:
+        """Cards of the loaded list page with their index, resolved one batch at a time"""
+        cards = self._ensure_page().locator(selector)
+        total = cards.count()
+        with tqdm(
+            total=total,
+            desc=f"Extracting {language.upper()}",
+            unit="item",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
+        ) as pbar:
+            for start in range(0, total, self.batch_size):
+                batch = [cards.nth(i) for i in range(start, min(start + self.batch_size, total))]
+                for index, card in enumerate(batch, start):
+                    yield index, card
+                    pbar.update()
+
+    def _card_link_id(self, card: Locator) -> str:
+        """Entry ID from the card's link, empty for cards that open their entry from JS"""
+        return extract_id_from_url(card.evaluate(CARD_LINK_SCRIPT))
+
+    def _card_entry_id(self, card: Locator) -> str:
+        """Entry ID behind a card; without a link, the tab its click opens is closed as soon as
+        it has a URL"""
+        if entry_id := self._card_link_id(card):
+            return entry_id
+        page = self._ensure_page()
+        with page.context.expect_page() as new_page_info:
+            card.click()
+        new_page = new_page_info.value
+        try:
+            return extract_id_from_url(new_page.url)
+        finally:
+            new_page.close()
+
+    def _goto(self, page: Page, url: str) -> None:
+        """page.goto under the network policy: rate limited per host, retried on 429/5xx"""
+
+        def goto() -> None:
+            response = page.goto(url)
+            if response:
+                raise_for_retry(url, response.status, response.headers)
+
+        start = time.perf_counter()
+        POLICY.run(url, goto, transient=(PlaywrightError,))
+        if self.first_navigation is None:
+            # The navigation that pays for a cold cache; compare across --browser-profile runs
+            self.first_navigation = time.perf_counter() - start
+            count("hoyolab.first_navigation_ms", round(self.first_navigation * 1000))
+            start_mode = (
+                "persistent profile"
+                if self.profile_dir
+                else "storage state"
+                if self.storage_state and os.path.exists(self.storage_state)
+                else "cold"
+            )
+            tqdm.write(f"First navigation: {self.first_navigation:.2f}s ({start_mode} start)")
+
+    @traced("hoyolab._navigate_with_language", "playwright")
     def _navigate_with_language(self, base_url: str, language: str = "en") -> bool:
         page = self._ensure_page()
         try:
             clean_url = base_url.split("?")[0]
             url_with_lang = f"{clean_url}?lang={language}"
             # print(f"Navigating to: {url_with_lang}")
-            page.goto(url_with_lang)
-            time.sleep(3)  # Wait for initial load
+            self._goto(page, url_with_lang)
+            sleep(3)  # Wait for initial load
             return True
         except Exception as e:
             tqdm.write(f"Could not navigate to {base_url} with language {language}: {e}")
             return False
 
+    def _navigate_to_list(
+        self, list_url: str, language: str
+    ) -> tuple[bool, list[EntryListItem] | None]:
+        """
+        Navigate to a list page. In list API mode its list responses are captured and paged
+        through, returning the entries; None means the DOM has to be scraped instead.
+        """
+        page = self._ensure_page()
+        if not self.use_list_api:
+            return self._navigate_with_language(list_url, language), None
+
+        responses: list[Response] = []
+
+        def on_response(response: Response) -> None:
+            if is_list_api_response(response):
+                responses.append(response)
+
+        page.on("response", on_response)
+        try:
+            if not self._navigate_with_language(list_url, language):
+                return False, None
+            if not responses:
+                try:
+                    page.wait_for_event(
+                        "response", predicate=is_list_api_response, timeout=LIST_API_TIMEOUT
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+        finally:
+            page.remove_listener("response", on_response)
+
+        if not responses:
+            tqdm.write("No list API response captured, falling back to the page")
+            return True, None
+        try:
+            return True, self._read_list_api(responses[0])
+        except (PlaywrightError, NetworkError, ValueError) as e:
+            tqdm.write(f"List API not recognized, falling back to the page: {e}")
+            return True, None
+
+    def _read_list_api(self, first: Response) -> list[EntryListItem]:
+        """All entries of a list, fetching the pages after the captured first one"""
+        listing = parse_entry_list(first.json())
+        entries = list(listing.entries)
+        pages = 1
+
+        body = first.request.post_data_json
+        if len(entries) < listing.total:
+            if not isinstance(body, dict) or "page_num" not in body:
+                raise ValueError("List request has no page_num to page through")
+            # Same headers as the page's own request (language, wiki app, cookies)
+            headers = {
+                key: value
+                for key, value in first.request.headers.items()
+                if key.lower() != "content-length"
+            }
+            page_num = int(body["page_num"])
+            while len(entries) < listing.total:
+                page_num += 1
+                listing = self._fetch_list_page(first.url, headers, {**body, "page_num": page_num})
+                if not listing.entries:
+                    break
+                entries.extend(listing.entries)
+                pages += 1
+
+        # Pages can overlap if entries are added while paging
+        unique = {entry.entry_page_id: entry for entry in entries}
+        tqdm.write(f"List API: {len(unique)} entries in {pages} page(s)")
+        return list(unique.values())
+
+    @traced("hoyolab._fetch_list_page", "network")
+    def _fetch_list_page(
+        self, url: str, headers: dict[str, str], body: dict[str, Any]
+    ) -> EntryListPage:
+        count("hoyolab.list_api_pages")
+
+        def post() -> EntryListPage:
+            response = self._ensure_page().request.post(url, headers=headers, data=json.dumps(body))
+            raise_for_retry(url, response.status, response.headers)
+            if not response.ok:
+                raise ValueError(f"List API page {body.get('page_num')}: HTTP {response.status}")
+            return parse_entry_list(response.json())
+
+        return POLICY.run(url, post, transient=(PlaywrightError,))
+
+    @traced("hoyolab._scroll_until_all_loaded", "playwright")
     def _scroll_until_all_loaded(self, card_selector: str, max_scrolls: int = 20) -> int:
         page = self._ensure_page()
 
@@ -291,18 +819,33 @@ class HoyolabScraper:
                         break
 
                 page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(2)
+                sleep(2)
                 scroll_count += 1
 
-        time.sleep(2)  # Wait for final images/cards to settle
+        sleep(2)  # Wait for final images/cards to settle
         final_count = page.locator(card_selector).count()
         # print(f"Final card count: {final_count}")
         return final_count
 
-    def _wait_for_images_to_load(self, selector: str, max_wait: int = 30) -> bool:
+    def _save_snapshot(self, category: str, language: str) -> None:
+        if self.snapshot_dir is None:
+            return
+        # Imported here, snapshots imports this module for the shared parsing helpers
+        from snapshots import save_snapshot
+
+        path = save_snapshot(self._ensure_page().content(), category, language, self.snapshot_dir)
+        tqdm.write(f"Saved snapshot to {path}")
+
+    @traced("hoyolab._wait_for_images_to_load", "playwright")
+    def _wait_for_images_to_load(
+        self, selector: str, max_wait: int = 30, poll_interval: float = 0.5
+    ) -> ImageWait:
+        """Poll until no image matching selector shows a placeholder, one evaluate per poll"""
         page = self._ensure_page()
-        # print("Waiting for images to load...")
         start_time = time.time()
+        polls = 0
+        pending = 0
+        waited = 0.0
 
         with tqdm(
             total=max_wait,
@@ -311,33 +854,32 @@ class HoyolabScraper:
             leave=False,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
         ) as pbar:
-            while time.time() - start_time < max_wait:
-                images = page.locator(selector).all()
-                placeholder_found = False
-                placeholder_count = 0
-
-                for img in images:
-                    src = img.get_attribute("src")
-                    if src and is_placeholder_image(src):
-                        placeholder_found = True
-                        placeholder_count += 1
-                        # Scroll element into view to trigger load
-                        img.scroll_into_view_if_needed()
-
-                if not placeholder_found:
-                    # print("All images loaded successfully!")
-                    return True
-
-                pbar.set_description(f"Loading Images (Approx {placeholder_count} pending)")
-                pbar.update(2)  # Approximate update
-
-                page.evaluate("window.scrollBy(0, 500)")
-                time.sleep(1)
-                page.evaluate("window.scrollBy(0, -200)")
-                time.sleep(1)
-
-        tqdm.write(f"Warning: Some images may not have loaded after {max_wait} seconds")
-        return False
+            while True:
+                pending = page.evaluate(PENDING_IMAGES_SCRIPT, [selector, PLACEHOLDER_PATTERNS])
+                polls += 1
+                waited = time.time() - start_time
+                if not pending or waited >= max_wait:
+                    break
+
+                pbar.set_description(f"Loading Images ({pending} pending)")
+                pbar.n = min(int(waited), max_wait)
+                pbar.refresh()
+                sleep(poll_interval)
+
+        count("images.wait_polls", polls)
+        if pending:
+            tqdm.write(f"Warning: {pending} images still loading after {max_wait} seconds")
+        return ImageWait(loaded=not pending, polls=polls, waited=waited, pending=pending)
+
+    def _load_card_image(self, card: Locator, wait: ImageWait) -> None:
+        """After a timed out bulk wait, give a card still showing a placeholder one more chance"""
+        if wait.loaded:
+            return
+        try:
+            if not card.evaluate(CARD_IMAGE_SCRIPT, [PLACEHOLDER_PATTERNS, CARD_IMAGE_TIMEOUT]):
+                count("images.card_placeholders")
+        except PlaywrightError as e:
+            tqdm.write(f"Could not load card image: {e}")
 
     def _extract_character_from_card(self, card: Locator, index: int) -> CharacterSource | None:
         try:
@@ -406,43 +948,40 @@ class HoyolabScraper:
             image_url=cleaned_image_url,
         )
 
-    def scrape_characters(self, language: str = "en") -> list[CharacterSource]:
-        page = self._ensure_page()
+    @traced("hoyolab.scrape_characters", "playwright")
+    def scrape_characters(self, language: str = "en") -> Iterator[CharacterSource]:
+        """Yield characters as they are extracted"""
         print(f"--- Character ({language.upper()}) ---")  # Keep distinct header
-        character_url = "https://wiki.hoyolab.com/pc/genshin/aggregate/2"
-
-        if not self._navigate_with_language(character_url, language):
-            return []
+        character_url = f"{self.base_url}{CHARACTER_LIST_PATH}"
+        self._recycle_context()
+
+        navigated, entries = self._navigate_to_list(character_url, language)
+        if not navigated:
+            return
+        if entries is not None:
+            found = False
+            for char_data in map(character_from_entry, entries):
+                if char_data:
+                    found = True
+                    yield char_data
+            if found:
+                return
+            tqdm.write("No characters in the list API entries, falling back to the page")
 
         self._scroll_until_all_loaded("article.character-card")
-        self._wait_for_images_to_load("article.character-card img.d-img-show")
+        wait = self._wait_for_images_to_load("article.character-card img.d-img-show")
+        self._save_snapshot("characters", language)
 
-        character_cards = page.locator("article.character-card").all()
-        # print(f"Found {len(character_cards)} character cards")
-
-        characters: list[CharacterSource] = []
-        for i, card in tqdm(
-            enumerate(character_cards),
-            total=len(character_cards),
-            desc=f"Extracting {language.upper()}",
-            unit="item",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
-        ):
+        for i, card in self._iter_cards("article.character-card", language):
+            self._load_card_image(card, wait)
             char_data = self._extract_character_from_card(card, i)
             if char_data:
                 try:
-                    with page.context.expect_page() as new_page_info:
-                        card.click()
-                    new_page = new_page_info.value
-                    char_data.entry_id = extract_id_from_url(new_page.url)
-                    new_page.close()
+                    char_data.entry_id = self._card_entry_id(card)
                 except Exception as e:
                     tqdm.write(f"Error getting ID for {char_data.name}: {e}")
 
-                characters.append(char_data)
-                # Removed detailed print
-
-        return characters
+                yield char_data
 
     def _extract_artifact_from_card(self, card: Locator, index: int) -> ArtifactSource | None:
         name: str = ""
@@ -513,43 +1052,40 @@ class HoyolabScraper:
             tqdm.write(f"SKIP ({name}): Exception extracting details: {e}")
             return None
 
-    def scrape_artifacts(self, language: str = "en") -> list[ArtifactSource]:
-        page = self._ensure_page()
+    @traced("hoyolab.scrape_artifacts", "playwright")
+    def scrape_artifacts(self, language: str = "en") -> Iterator[ArtifactSource]:
+        """Yield artifact sets as they are extracted"""
         print(f"--- Artifact ({language.upper()}) ---")
-        artifact_url = "https://wiki.hoyolab.com/pc/genshin/aggregate/5"
-
-        if not self._navigate_with_language(artifact_url, language):
-            return []
+        artifact_url = f"{self.base_url}{ARTIFACT_LIST_PATH}"
+        self._recycle_context()
+
+        navigated, entries = self._navigate_to_list(artifact_url, language)
+        if not navigated:
+            return
+        if entries is not None:
+            found = False
+            for art_data in map(artifact_from_entry, entries):
+                if art_data:
+                    found = True
+                    yield art_data
+            if found:
+                return
+            tqdm.write("No artifacts in the list API entries, falling back to the page")
 
         self._scroll_until_all_loaded("div.artifact-card")
-        self._wait_for_images_to_load("div.artifact-card img.d-img-show")
-
-        artifact_cards = page.locator("div.artifact-card").all()
-        # print(f"Found {len(artifact_cards)} artifact cards")
+        wait = self._wait_for_images_to_load("div.artifact-card img.d-img-show")
+        self._save_snapshot("artifacts", language)
 
-        artifacts: list[ArtifactSource] = []
-        for i, card in tqdm(
-            enumerate(artifact_cards),
-            total=len(artifact_cards),
-            desc=f"Extracting {language.upper()}",
-            unit="item",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
-        ):
+        for i, card in self._iter_cards("div.artifact-card", language):
+            self._load_card_image(card, wait)
             art_data = self._extract_artifact_from_card(card, i)
             if art_data:
                 try:
-                    with page.context.expect_page() as new_page_info:
-                        card.click()
-                    new_page = new_page_info.value
-                    art_data.entry_id = extract_id_from_url(new_page.url)
-                    new_page.close()
+                    art_data.entry_id = self._card_entry_id(card)
                 except Exception as e:
                     tqdm.write(f"Error getting ID for {art_data.name}: {e}")
 
-                artifacts.append(art_data)
-                # Removed detailed print
-
-        return artifacts
+                yield art_data
 
     def _extract_weapon_from_card(self, card: Locator, index: int) -> WeaponSource | None:
         name: str = ""
@@ -608,6 +1144,7 @@ class HoyolabScraper:
             secondary_stat_value="",
         )
 
+    @traced("hoyolab._scrape_weapon_detail_page", "playwright")
     def _scrape_weapon_detail_page(self, detail_page: Page) -> dict[str, str | int]:
         try:
             detail_page.wait_for_selector("div.base-info-content", timeout=5000)
@@ -674,65 +1211,93 @@ class HoyolabScraper:
 
         return data
 
-    def scrape_weapons(self, language: str = "en") -> list[WeaponSource]:
+    def _apply_weapon_details(self, weapon_data: WeaponSource, detail_page: Page) -> None:
+        for k, v in self._scrape_weapon_detail_page(detail_page).items():
+            # Type and stat from the list entry are kept if the page has none
+            if v or not getattr(weapon_data, k):
+                setattr(weapon_data, k, v)
+
+    def _fill_weapon_details(self, weapon_data: WeaponSource, language: str) -> None:
+        """Fill in the detail fields of a weapon from its entry page"""
+        page = self._detail_page()
+        locale = ENTRY_LANGUAGE_CODES.get(language, language)
+        try:
+            self._goto(page, f"{self.base_url}{ENTRY_PATH}/{weapon_data.entry_id}?lang={locale}")
+            self._apply_weapon_details(weapon_data, page)
+        except Exception as e:
+            tqdm.write(f"Error scraping details for {weapon_data.name}: {e}")
+
+    def _fill_weapon_details_from_tab(self, weapon_data: WeaponSource, card: Locator) -> None:
+        """Entry ID and detail fields of a card without a link, read in the tab its click opens
+        so the entry page is only loaded once"""
         page = self._ensure_page()
-        print(f"--- Weapon ({language.upper()}) ---")
-        weapon_url = "https://wiki.hoyolab.com/pc/genshin/aggregate/4"
+        try:
+            with page.context.expect_page() as new_page_info:
+                card.click()
+            tab = new_page_info.value
+            try:
+                self._apply_weapon_details(weapon_data, tab)
+                weapon_data.entry_id = extract_id_from_url(tab.url)
+            finally:
+                tab.close()
+            count("hoyolab.detail_tabs")
+        except Exception as e:
+            tqdm.write(f"Error scraping details for {weapon_data.name}: {e}")
 
-        if not self._navigate_with_language(weapon_url, language):
-            return []
+    @traced("hoyolab.scrape_weapons", "playwright")
+    def scrape_weapons(self, language: str = "en") -> Iterator[WeaponSource]:
+        """Yield weapons as their detail pages are scraped"""
+        print(f"--- Weapon ({language.upper()}) ---")
+        weapon_url = f"{self.base_url}{WEAPON_LIST_PATH}"
+        self._recycle_context()
+
+        navigated, entries = self._navigate_to_list(weapon_url, language)
+        if not navigated:
+            return
+        if entries is not None:
+            weapons = [w for w in map(weapon_from_entry, entries) if w]
+            if weapons:
+                for weapon_data in tqdm(
+                    weapons,
+                    desc=f"Weapon Details {language.upper()}",
+                    unit="item",
+                    bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
+                ):
+                    self._fill_weapon_details(weapon_data, language)
+                    yield weapon_data
+                return
+            tqdm.write("No weapons in the list API entries, falling back to the page")
 
         self._scroll_until_all_loaded(".genshin-show-weapon-item")
-        self._wait_for_images_to_load(".genshin-show-weapon-item img.d-img-show")
-
-        weapon_cards = page.locator(".genshin-show-weapon-item").all()
-        # print(f"Found {len(weapon_cards)} weapon cards")
+        wait = self._wait_for_images_to_load(".genshin-show-weapon-item img.d-img-show")
+        self._save_snapshot("weapons", language)
 
-        weapons: list[WeaponSource] = []
-        for i, card in tqdm(
-            enumerate(weapon_cards),
-            total=len(weapon_cards),
-            desc=f"Extracting {language.upper()}",
-            unit="item",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}]",
-        ):
+        for i, card in self._iter_cards(".genshin-show-weapon-item", language):
+            self._load_card_image(card, wait)
             weapon_data = self._extract_weapon_from_card(card, i)
             if not weapon_data:
                 continue
 
-            # print(f"Scraping details for Weapon {i + 1}: {weapon_data.name}")
-
             try:
-                # Click to open detail in new tab
-                with page.context.expect_page() as new_page_info:
-                    card.click()
-
-                detail_page = new_page_info.value
-                detail_page.wait_for_load_state()
-
-                weapon_data.entry_id = extract_id_from_url(detail_page.url)
-
-                detail_data = self._scrape_weapon_detail_page(detail_page)
-
-                if detail_data:
-                    for k, v in detail_data.items():
-                        setattr(weapon_data, k, v)
-
-                detail_page.close()
-
-            except Exception as e:
-                tqdm.write(f"Error scraping details for {weapon_data.name}: {e}")
-
-            weapons.append(weapon_data)
-
-        return weapons
-
+                weapon_data.entry_id = self._card_link_id(card)
+            except PlaywrightError as e:
+                tqdm.write(f"Error getting ID for {weapon_data.name}: {e}")
+            # A linked card is read on the recycled detail context; one that only opens its
+            # entry from JS is read in that tab, which is closed right after
+            if weapon_data.entry_id:
+                self._fill_weapon_details(weapon_data, language)
+            else:
+                self._fill_weapon_details_from_tab(weapon_data, card)
+
+            yield weapon_data
+
+    @traced("hoyolab.scrape_elements_and_weapons", "playwright")
     def scrape_elements_and_weapons(
         self, language: str = "en"
     ) -> tuple[list[ResourceOutput], list[ResourceOutput]]:
         page = self._ensure_page()
         # print(f"Scraping elements and weapons in {language}...")
-        character_url = "https://wiki.hoyolab.com/pc/genshin/aggregate/2"
+        character_url = f"{self.base_url}{CHARACTER_LIST_PATH}"
 
         if not self._navigate_with_language(character_url, language):
             return [], []
@@ -772,14 +1337,16 @@ class HoyolabScraper:
 
         return elements, weapon_types
 
+    @traced("hoyolab.fetch_entry_name", "playwright")
     def fetch_entry_name(self, entry_id: str, language: str) -> str | None:
         """Fetch the name of an entry from its detail page in a specific language"""
-        page = self._ensure_page()
-        url = f"https://wiki.hoyolab.com/pc/genshin/entry/{entry_id}?lang={language}"
+        page = self._detail_page()
+        locale = ENTRY_LANGUAGE_CODES.get(language, language)
+        url = f"{self.base_url}{ENTRY_PATH}/{entry_id}?lang={locale}"
         # print(f"Fetching name from {url}...")
 
         try:
-            page.goto(url)
+            self._goto(page, url)
             page.wait_for_load_state("networkidle")
 
             name_locator = page.locator(".detail-header-common-name.genshin span")
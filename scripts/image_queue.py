@@ -0,0 +1,80 @@
+"""
+Image downloads overlapped with scraping. The scrape stages put an item's image jobs on a
+bounded queue as soon as the item is extracted, a pool of worker threads downloads them while
+scraping, matching and writing continue, and close() is the barrier before the final image pass.
+Files that already exist are skipped, so that pass only fetches what the stream could not know
+about yet (replaced image URLs, placeholders, elements and weapon types).
+
+Usage:
+    images = ImageQueue(workers=4).start()
+    images.put(HoyolabAssetManager.character_images(character, project_root))
+    images.close()  # waits for every queued download
+"""
+
+import queue
+import threading
+import time
+from collections.abc import Iterable
+
+from tqdm import tqdm
+
+from hoyolab import ImageJob, download_image
+from profiling import count, span
+
+IMAGE_WORKERS = 4
+# Queued jobs before put() blocks, so a slow image host holds back scraping instead of memory
+QUEUE_SIZE = 64
+
+
+class ImageQueue:
+    def __init__(self, workers: int = IMAGE_WORKERS, maxsize: int = QUEUE_SIZE):
+        self.workers = workers
+        self._queue: queue.Queue[ImageJob | None] = queue.Queue(maxsize)
+        self._threads: list[threading.Thread] = []
+        self._queued: set[str] = set()
+        self._lock = threading.Lock()
+        self._started_at = 0.0
+
+    def start(self) -> "ImageQueue":
+        self._started_at = time.perf_counter()
+        self._threads = [
+            threading.Thread(target=self._work, name=f"images-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def _work(self) -> None:
+        while (job := self._queue.get()) is not None:
+            url, filepath = job
+            download_image(url, filepath)
+
+    def put(self, jobs: Iterable[ImageJob]) -> None:
+        """Queue downloads, blocking while the queue is full; files already queued are dropped"""
+        if not self._threads:
+            return
+        for url, filepath in jobs:
+            if not url:
+                continue
+            with self._lock:
+                if filepath in self._queued:
+                    continue
+                self._queued.add(filepath)
+            count("images.streamed")
+            self._queue.put((url, filepath))
+
+    def close(self) -> None:
+        """Barrier: wait until every queued download has finished and stop the workers"""
+        if not self._threads:
+            return
+        with span("images.barrier"):
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+        tqdm.write(
+            f"Streamed {len(self._queued)} images in "
+            f"{time.perf_counter() - self._started_at:.1f}s alongside scraping"
+        )
+        self._threads = []
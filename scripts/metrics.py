@@ -0,0 +1,137 @@
+"""
+Run metrics in the Prometheus/OpenMetrics text format, written at the end of a
+codedump.py --metrics run for a node-exporter textfile collector (--collector.textfile.directory).
+Every sample is a gauge describing the last run, which is what batch jobs are expected to export.
+
+Stage durations and the I/O counters (images, bytes, cache hits) come from the profiler's spans
+and counters; values that need labels (items per category/language, unmatched items) are set
+directly on METRICS by the pipeline.
+"""
+
+import os
+import re
+import threading
+import time
+
+from profiling import Profiler
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+METRICS_PATH = os.path.join(SCRIPT_DIR, ".cache", "metrics", "ggartifact_data.prom")
+PREFIX = "ggartifact_data"
+
+type Labels = tuple[tuple[str, str], ...]
+
+# Profiler counter -> (metric, labels, help)
+COUNTER_METRICS: dict[str, tuple[str, dict[str, str], str]] = {
+    "images.downloaded": ("images", {"result": "downloaded"}, "Images by download result"),
+    "images.skipped": ("images", {"result": "skipped"}, "Images by download result"),
+    "images.failed": ("images", {"result": "failed"}, "Images by download result"),
+    "bytes.images": ("image_bytes", {}, "Bytes of downloaded images"),
+    "images.streamed": ("images_streamed", {}, "Images queued for download during scraping"),
+    "hoyolab.detail_pages": (
+        "detail_pages",
+        {"source": "hoyolab"},
+        "Entry detail pages visited",
+    ),
+    "character_details.fetched": (
+        "detail_pages",
+        {"source": "character_details"},
+        "Entry detail pages visited",
+    ),
+    "network.requests": ("network_requests", {}, "Requests made under the network policy"),
+    "network.retries": ("network_retries", {}, "Retried requests"),
+    "network.throttled": ("network_throttled", {}, "Requests answered with 429"),
+}
+
+# Cache -> (hit counter, miss counter)
+CACHE_COUNTERS: dict[str, tuple[str, str]] = {
+    "images": ("images.skipped", "images.downloaded"),
+    "character_details": ("character_details.cache_hits", "character_details.fetched"),
+    "checkpoint": ("checkpoint.resumed", "checkpoint.computed"),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metrics:
+    """Gauges keyed by name and labels; set() overwrites, so a metric holds one value per run"""
+
+    def __init__(self):
+        self._help: dict[str, str] = {}
+        self._samples: dict[str, dict[Labels, float]] = {}
+        self._lock = threading.Lock()
+
+    def set(self, name: str, value: float, help: str = "", **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            if help:
+                self._help.setdefault(name, help)
+            self._samples.setdefault(name, {})[key] = value
+
+    def add(self, name: str, value: float, help: str = "", **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            if help:
+                self._help.setdefault(name, help)
+            samples = self._samples.setdefault(name, {})
+            samples[key] = samples.get(key, 0) + value
+
+    def collect_profile(self, profiler: Profiler) -> None:
+        """Stage durations, I/O counters and cache hit ratios from the profiler"""
+        for span_name, durations in profiler.durations().items():
+            if span_name.startswith("stage."):
+                self.set(
+                    "stage_duration_seconds",
+                    sum(durations),
+                    "Wall time of each pipeline stage",
+                    stage=span_name.removeprefix("stage."),
+                )
+
+        counters = profiler.counters()
+        for counter, (name, labels, help) in COUNTER_METRICS.items():
+            self.add(name, counters.get(counter, 0), help, **labels)
+
+        for cache, (hit_counter, miss_counter) in CACHE_COUNTERS.items():
+            hits, misses = counters.get(hit_counter, 0), counters.get(miss_counter, 0)
+            if hits + misses:
+                self.set(
+                    "cache_hit_ratio",
+                    hits / (hits + misses),
+                    "Share of lookups served from a cache",
+                    cache=cache,
+                )
+
+    def render(self) -> str:
+        lines: list[str] = []
+        with self._lock:
+            for name, samples in sorted(self._samples.items()):
+                metric = f"{PREFIX}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+                if name in self._help:
+                    lines.append(f"# HELP {metric} {self._help[name]}")
+                lines.append(f"# TYPE {metric} gauge")
+                for labels, value in sorted(samples.items()):
+                    label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                    # Enough digits for epoch timestamps, which :g would round to minutes
+                    value_text = f"{value:.15g}"
+                    lines.append(
+                        f"{metric}{{{label_text}}} {value_text}"
+                        if labels
+                        else f"{metric} {value_text}"
+                    )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str = METRICS_PATH) -> None:
+        """Write the textfile; renamed into place so the collector never reads a partial file"""
+        self.set("last_run_timestamp_seconds", time.time(), "End of the last pipeline run")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+        print(f"Written metrics to {path}")
+
+
+METRICS = Metrics()
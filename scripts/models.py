@@ -1,6 +1,6 @@
-from typing import TypedDict
+from typing import Any, Literal, get_args
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class BaseItemSource(BaseModel):
@@ -47,6 +47,44 @@ class WeaponSource(BaseItemSource):
     secondary_stat_value: str
 
 
+type WeaponType = Literal["Sword", "Claymore", "Polearm", "Bow", "Catalyst"]
+WEAPON_TYPES: list[str] = list(get_args(WeaponType.__value__))
+
+
+class CharacterOverride(BaseModel):
+    """Manual values for a character, keyed by entry ID or English name"""
+
+    weapon: WeaponType | None = None
+    rarity: int | None = None
+    region: str | None = None
+    release_date: str | None = Field(default=None, alias="releaseDate")
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True)
+
+    @field_validator("weapon", mode="before")
+    @classmethod
+    def match_weapon_case(cls, value: Any) -> Any:
+        """Case-insensitive like the interactive prompt, anything else fails the Literal"""
+        if isinstance(value, str):
+            return next((w for w in WEAPON_TYPES if w.lower() == value.strip().lower()), value)
+        return value
+
+
+class WeaponOverride(BaseModel):
+    """Manual values for a weapon, keyed by entry ID or English name"""
+
+    rarity: int | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class Overrides(BaseModel):
+    """Declarative replacement for the interactive prompts in codedump.py"""
+
+    characters: dict[str, CharacterOverride] = Field(default_factory=dict)
+    weapons: dict[str, WeaponOverride] = Field(default_factory=dict)
+
+
 class ResourceOutput(BaseModel):
     """Output format for element/weapon-type resources"""
 
@@ -55,22 +93,49 @@ class ResourceOutput(BaseModel):
     imagePath: str
 
 
-class MatchedItem[T: BaseItemSource](TypedDict):
-    """Container for matched items across languages"""
+# Hoyolab wiki list API (get_entry_page_list) payloads, captured by HoyolabScraper
+class EntryFilterValue(BaseModel):
+    values: list[str] = Field(default_factory=list)
 
-    en: T
-    zh: T
+    model_config = ConfigDict(extra="ignore")
 
 
-# I18n models for preprocess.py
-class EffectData(BaseModel):
-    en: list[str] = Field(default_factory=list)
-    zh: list[str] = Field(default_factory=list)
+class EntryListItem(BaseModel):
+    """One entry of a list page as returned by the wiki API"""
+
+    entry_page_id: str
+    name: str
+    icon_url: str = ""
+    display_field: dict[str, Any] = Field(default_factory=dict)
+    filter_values: dict[str, EntryFilterValue] = Field(default_factory=dict)
+
+    model_config = ConfigDict(extra="ignore")
+
+    def filter_value(self, key: str) -> str:
+        """First value of a filter (e.g. character_vision), empty if not set"""
+        entry_filter = self.filter_values.get(key)
+        return entry_filter.values[0] if entry_filter and entry_filter.values else ""
+
+
+class EntryListPage(BaseModel):
+    entries: list[EntryListItem] = Field(alias="list")
+    total: int
+
+    model_config = ConfigDict(extra="ignore")
+
+
+# Language codes scraped by default; "en" is the primary language that IDs are generated from
+LANGUAGES: list[str] = ["en", "zh"]
+PRIMARY_LANGUAGE = "en"
 
+# Container for one item matched across languages, keyed by language code
+type MatchedItem[T: BaseItemSource] = dict[str, T]
 
+
+# I18n models for preprocess.py
 class I18nArtifactData(BaseModel):
     name: dict[str, str] = Field(default_factory=dict)
-    effects: EffectData
+    effects: dict[str, list[str]] = Field(default_factory=dict)
 
 
 class HalfSet(BaseModel):
@@ -106,3 +171,99 @@ class WeaponOutput(BaseModel):
     secondaryStatValue: str
     imageUrl: str
     imagePath: str
+
+
+# Character detail chunks (public/character-detail/<language>/<id>.json), loaded on demand
+class CharacterTalent(BaseModel):
+    name: str
+    description: str
+
+
+class CharacterConstellation(BaseModel):
+    name: str
+    description: str
+
+
+class CharacterDetail(BaseModel):
+    id: str
+    language: str
+    baseInfo: dict[str, str] = Field(default_factory=dict)
+    talents: list[CharacterTalent] = Field(default_factory=list)
+    constellations: list[CharacterConstellation] = Field(default_factory=list)
+
+
+# GOOD export models (docs/GOOD.md), read by good.py
+type GoodStatKey = Literal[
+    "hp",
+    "hp_",
+    "atk",
+    "atk_",
+    "def",
+    "def_",
+    "eleMas",
+    "enerRech_",
+    "heal_",
+    "critRate_",
+    "critDMG_",
+    "physical_dmg_",
+    "anemo_dmg_",
+    "geo_dmg_",
+    "electro_dmg_",
+    "hydro_dmg_",
+    "pyro_dmg_",
+    "cryo_dmg_",
+    "dendro_dmg_",
+]
+type GoodSlotKey = Literal["flower", "plume", "sands", "goblet", "circlet"]
+
+
+class GoodHeader(BaseModel):
+    format: Literal["GOOD"]
+    version: int
+    source: str = ""
+
+
+class GoodSubstat(BaseModel):
+    # Some exporters write {"key": "", "value": 0} for missing lines
+    key: GoodStatKey | Literal[""]
+    value: float
+    initialValue: float | None = None
+
+
+class GoodArtifact(BaseModel):
+    setKey: str
+    slotKey: GoodSlotKey
+    level: int = Field(ge=0, le=20)
+    rarity: int = Field(ge=1, le=5)
+    mainStatKey: GoodStatKey
+    location: str = ""
+    lock: bool = False
+    substats: list[GoodSubstat] = Field(default_factory=list)
+    # GOOD v3
+    totalRolls: int | None = None
+    astralMark: bool | None = None
+    elixirCrafted: bool | None = None
+    unactivatedSubstats: list[GoodSubstat] | None = None
+
+
+class GoodWeapon(BaseModel):
+    key: str
+    level: int = Field(ge=1, le=90)
+    ascension: int = Field(default=0, ge=0, le=6)
+    refinement: int = Field(ge=1, le=5)
+    location: str = ""
+    lock: bool = False
+
+
+class GoodTalent(BaseModel):
+    auto: int = Field(ge=1, le=15)
+    skill: int = Field(ge=1, le=15)
+    burst: int = Field(ge=1, le=15)
+
+
+class GoodCharacter(BaseModel):
+    key: str
+    level: int = Field(default=1, ge=1, le=100)
+    constellation: int = Field(ge=0, le=6)
+    ascension: int = Field(default=0, ge=0, le=6)
+    talent: GoodTalent | None = None
@@ -0,0 +1,240 @@
+"""
+Shared network policy for every request the pipeline makes (images, wiki pages, APIs).
+Each host gets a token bucket that halves its rate on 429 and creeps back up on success,
+retries with exponential backoff and full jitter (honouring Retry-After), and a circuit
+breaker that fails fast once a host keeps failing, instead of every caller timing out on it.
+
+Usage:
+    response = POLICY.get(url)                                   # requests
+    POLICY.run(url, operation, transient=(PlaywrightError,))     # any other client
+"""
+
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from tqdm import tqdm
+
+from profiling import count, sleep
+
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5  # seconds, doubled per attempt
+BACKOFF_MAX = 30.0
+RETRY_AFTER_MAX = 120.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# Consecutive failures that open a host's breaker, and how long it stays open
+BREAKER_THRESHOLD = 5
+BREAKER_COOLDOWN = 60.0
+
+# Host -> (requests per second, burst); None is unlimited
+DEFAULT_RATE: tuple[float, int] = (4.0, 4)
+HOST_RATES: dict[str, tuple[float, int] | None] = {
+    "wiki.hoyolab.com": (2.0, 2),
+    "sg-wiki-api.hoyolab.com": (4.0, 4),
+    "sg-wiki-api-static.hoyolab.com": (4.0, 4),
+    "genshin-impact.fandom.com": (1.0, 1),
+    "raw.githubusercontent.com": (2.0, 2),
+    "gitlab.com": (1.0, 1),
+    # Local fixture server of benchmark.py
+    "127.0.0.1": None,
+}
+
+
+class NetworkError(Exception):
+    """Base class of the errors raised by the policy itself"""
+
+
+class RetryableStatus(NetworkError):
+    def __init__(self, url: str, status: int, retry_after: float | None = None):
+        super().__init__(f"HTTP {status} from {url}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(NetworkError):
+    pass
+
+
+def retry_after_seconds(value: str | None) -> float | None:
+    """Retry-After header as seconds, either delay-seconds or an HTTP date"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(UTC)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def raise_for_retry(url: str, status: int, headers: Mapping[str, str]) -> None:
+    """Raise RetryableStatus for throttling and server errors; other statuses are left alone"""
+    if status in RETRY_STATUSES:
+        retry_after = headers.get("retry-after") or headers.get("Retry-After")
+        raise RetryableStatus(url, status, retry_after_seconds(retry_after))
+
+
+class TokenBucket:
+    """Token bucket whose rate is lowered on throttling and recovered on success (AIMD)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            sleep(wait)
+
+    def slow_down(self) -> None:
+        with self._lock:
+            self.rate = max(self.max_rate / 16, self.rate / 2)
+
+    def speed_up(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures, then lets one trial through per cooldown"""
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD, cooldown: float = BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def check(self, host: str) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if time.monotonic() - self._opened_at < self.cooldown:
+                raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+            # Half-open: let this request through, the next failure re-opens immediately
+            self._opened_at = None
+            self._failures = self.threshold - 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold and self._opened_at is None:
+                self._opened_at = time.monotonic()
+                count("network.circuit_opened")
+                tqdm.write(f"Circuit opened for {host} after {self._failures} failures")
+
+
+class HostPolicy:
+    def __init__(self, rate: tuple[float, int] | None):
+        self.bucket = TokenBucket(*rate) if rate else None
+        self.breaker = CircuitBreaker()
+
+
+class NetworkPolicy:
+    def __init__(
+        self,
+        rates: Mapping[str, tuple[float, int] | None] = HOST_RATES,
+        max_retries: int = MAX_RETRIES,
+    ):
+        self.rates = rates
+        self.max_retries = max_retries
+        self._hosts: dict[str, HostPolicy] = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> tuple[str, HostPolicy]:
+        name = urlparse(url).hostname or ""
+        with self._lock:
+            if name not in self._hosts:
+                self._hosts[name] = HostPolicy(self.rates.get(name, DEFAULT_RATE))
+            return name, self._hosts[name]
+
+    def run[T](
+        self,
+        url: str,
+        operation: Callable[[], T],
+        transient: tuple[type[Exception], ...] = (),
+    ) -> T:
+        """
+        Run one request under the host's policy. RetryableStatus, connection errors, timeouts
+        and any `transient` exception types are retried; everything else propagates at once.
+        """
+        name, host = self.host(url)
+        retryable = (RetryableStatus, requests.ConnectionError, requests.Timeout, *transient)
+
+        for attempt in range(self.max_retries + 1):
+            host.breaker.check(name)
+            if host.bucket:
+                host.bucket.acquire()
+            count("network.requests")
+
+            try:
+                result = operation()
+            except retryable as e:
+                host.breaker.record_failure(name)
+                retry_after = None
+                if isinstance(e, RetryableStatus):
+                    retry_after = e.retry_after
+                    if e.status == 429 and host.bucket:
+                        count("network.throttled")
+                        host.bucket.slow_down()
+                if attempt == self.max_retries:
+                    raise
+
+                if retry_after is not None:
+                    delay = min(retry_after, RETRY_AFTER_MAX)
+                else:
+                    # Full jitter keeps parallel workers from retrying in lockstep
+                    delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt))
+                count("network.retries")
+                tqdm.write(f"Retrying {url} in {delay:.1f}s ({e})")
+                sleep(delay)
+                continue
+
+            host.breaker.record_success()
+            if host.bucket:
+                host.bucket.speed_up()
+            return result
+
+        raise AssertionError("unreachable")
+
+    def get(
+        self, url: str, session: requests.Session | None = None, **kwargs: Any
+    ) -> requests.Response:
+        """requests GET under the policy; raises HTTPError for non-retryable error statuses"""
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+
+        def attempt() -> requests.Response:
+            response = (session or requests).get(url, **kwargs)
+            raise_for_retry(url, response.status_code, response.headers)
+            response.raise_for_status()
+            return response
+
+        return self.run(url, attempt)
+
+
+POLICY = NetworkPolicy()
@@ -0,0 +1,139 @@
+"""
+Manual overrides for values the scrapers cannot resolve on their own.
+Entries in overrides.json take precedence over scraped data. Anything still missing
+is either prompted for (interactive mode) or queued into a report (non-interactive mode).
+"""
+
+import json
+import os
+from typing import Literal, TypedDict
+
+from tqdm import tqdm
+
+from models import WEAPON_TYPES, BaseItemSource, CharacterOverride, Overrides, WeaponOverride
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+OVERRIDES_PATH = os.path.join(SCRIPT_DIR, "overrides.json")
+REPORT_PATH = os.path.join(SCRIPT_DIR, ".cache", "unresolved.json")
+
+VALID_WEAPON_TYPES = WEAPON_TYPES
+
+
+class UnresolvedItem(TypedDict):
+    category: Literal["character", "weapon"]
+    field: Literal["weapon", "rarity"]
+    entry_id: str
+    name: str
+    fallback: str | int
+
+
+def load_overrides(path: str = OVERRIDES_PATH) -> Overrides:
+    """Load the overrides file, returning empty overrides if it does not exist"""
+    if not os.path.exists(path):
+        return Overrides()
+
+    with open(path, encoding="utf-8") as f:
+        return Overrides.model_validate(json.load(f))
+
+
+class OverrideResolver:
+    """Resolves missing values from overrides, then from the user or the unresolved report"""
+
+    def __init__(self, overrides: Overrides | None = None, interactive: bool = True):
+        self.overrides = overrides or Overrides()
+        self.interactive = interactive
+        self.unresolved: list[UnresolvedItem] = []
+
+    def character_override(self, item: BaseItemSource) -> CharacterOverride | None:
+        return self.overrides.characters.get(item.entry_id) or self.overrides.characters.get(
+            item.name
+        )
+
+    def weapon_override(self, item: BaseItemSource) -> WeaponOverride | None:
+        return self.overrides.weapons.get(item.entry_id) or self.overrides.weapons.get(item.name)
+
+    def resolve_weapon_type(self, item: BaseItemSource, fallback: str) -> str:
+        """Weapon type for a character that Fandom did not know about"""
+        override = self.character_override(item)
+        if override and override.weapon:
+            return override.weapon
+
+        if not self.interactive:
+            self._queue("character", "weapon", item, fallback)
+            return fallback
+
+        while True:
+            val = input(
+                f"Please enter weapon type for {item.name} ({'/'.join(VALID_WEAPON_TYPES)}): "
+            ).strip()
+            # Case-insensitive matching
+            matched_weapon = next((w for w in VALID_WEAPON_TYPES if w.lower() == val.lower()), None)
+            if matched_weapon:
+                return matched_weapon
+            print(f"Invalid weapon type. Please choose from: {', '.join(VALID_WEAPON_TYPES)}")
+
+    def resolve_rarity(
+        self,
+        category: Literal["character", "weapon"],
+        item: BaseItemSource,
+        rarity: int,
+        valid: list[int],
+    ) -> int:
+        """Rarity for an item, replacing the scraped value when it is overridden or 0"""
+        override = (
+            self.character_override(item) if category == "character" else self.weapon_override(item)
+        )
+        if override and override.rarity:
+            return override.rarity
+        if rarity != 0:
+            return rarity
+
+        if not self.interactive:
+            self._queue(category, "rarity", item, rarity)
+            return rarity
+
+        print(f"\nWARNING: Rarity 0 detected for {category.capitalize()}: {item.name}")
+        while True:
+            try:
+                val = input(
+                    f"Please enter actual rarity ({valid[0]}-{valid[-1]}) for {item.name}: "
+                ).strip()
+                rarity_int = int(val)
+                if rarity_int in valid:
+                    return rarity_int
+                print(f"Invalid rarity. Please enter {valid[0]}-{valid[-1]}.")
+            except ValueError:
+                print("Invalid number.")
+
+    def _queue(
+        self,
+        category: Literal["character", "weapon"],
+        field: Literal["weapon", "rarity"],
+        item: BaseItemSource,
+        fallback: str | int,
+    ) -> None:
+        tqdm.write(
+            f"UNRESOLVED: {category} '{item.name}' (ID: {item.entry_id}) has no {field}, "
+            f"using {fallback!r}"
+        )
+        self.unresolved.append(
+            {
+                "category": category,
+                "field": field,
+                "entry_id": item.entry_id,
+                "name": item.name,
+                "fallback": fallback,
+            }
+        )
+
+    def write_report(self, path: str = REPORT_PATH) -> None:
+        """Write queued items so they can be added to overrides.json before the next run"""
+        if not self.unresolved:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.unresolved, f, indent=2, ensure_ascii=False)
+        print(f"{len(self.unresolved)} unresolved items written to {path}")
@@ -1,12 +1,14 @@
 #!/usr/bin/env python3
 """
 Preprocessing module for Genshin Impact artifact half sets computation.
-Replicates the TypeScript preprocessing logic from src/data/preprocess.ts
+Groups artifacts by their normalized 2pc effect into half sets, keeping the IDs of the
+previous run, and builds the lookup tables written next to artifactHalfSets.
 """
 
 import re
+from typing import NamedTuple
 
-from models import HalfSet, I18nArtifactData
+from models import PRIMARY_LANGUAGE, HalfSet, I18nArtifactData
 
 ARTIFACT_SKIP_LIST: list[str] = [
     "adventurer",
@@ -23,108 +25,332 @@ ARTIFACT_SKIP_LIST: list[str] = [
     "scholar",
 ]
 
+# Trailing punctuation and wording differences removed from display texts
+TEXT_RULES: dict[str, list[tuple[re.Pattern[str], str]]] = {
+    "en": [
+        (re.compile(r"\.$"), ""),
+        (re.compile(r"increase by ", re.IGNORECASE), "+"),
+    ],
+    "zh": [(re.compile(r"。$"), "")],
+    "ja": [(re.compile(r"。$"), "")],
+}
+DEFAULT_TEXT_RULES: list[tuple[re.Pattern[str], str]] = [(re.compile(r"[.。]$"), "")]
+
+ELEMENTS: dict[str, str] = {
+    "pyro": "火",
+    "hydro": "水",
+    "electro": "雷",
+    "cryo": "冰",
+    "anemo": "风",
+    "geo": "岩",
+    "dendro": "草",
+}
+
+# Stat keys follow src/data/types.ts ("atk%", "em", "pyro%", ...). Flat atk/hp/def get a "%"
+# suffix when the value is a percentage. Specific patterns come before generic ones.
+STAT_PATTERNS: dict[str, list[tuple[re.Pattern[str], str]]] = {
+    "en": [
+        (re.compile(rf"\b({'|'.join(ELEMENTS)}) dmg bonus\b"), "{0}%"),
+        (re.compile(rf"\b({'|'.join(ELEMENTS)}) res\b"), "{0}_res%"),
+        (re.compile(r"\bphysical dmg\b"), "phys%"),
+        (re.compile(r"\bplunging attack dmg\b"), "plunging%"),
+        (re.compile(r"\bnormal and charged attack dmg\b"), "normal_charged%"),
+        (re.compile(r"\belemental skill dmg\b"), "skill%"),
+        (re.compile(r"\belemental burst dmg\b"), "burst%"),
+        (re.compile(r"\bshield strength\b"), "shield%"),
+        (re.compile(r"\belemental mastery\b"), "em"),
+        (re.compile(r"\benergy recharge\b"), "er"),
+        (re.compile(r"\bhealing (?:bonus|effectiveness)\b"), "heal%"),
+        (re.compile(r"\benergy\b"), "energy"),
+        (re.compile(r"\batk\b"), "atk"),
+        (re.compile(r"\bhp\b"), "hp"),
+        (re.compile(r"\bdef\b"), "def"),
+        (re.compile(r"\bdmg\b"), "dmg%"),
+    ],
+    "zh": [
+        *((re.compile(f"{zh}元素伤害加成"), f"{element}%") for element, zh in ELEMENTS.items()),
+        *((re.compile(f"{zh}元素抗性"), f"{element}_res%") for element, zh in ELEMENTS.items()),
+        (re.compile(r"物理伤害"), "phys%"),
+        (re.compile(r"下落攻击"), "plunging%"),
+        (re.compile(r"普通攻击与重击"), "normal_charged%"),
+        (re.compile(r"元素战技"), "skill%"),
+        (re.compile(r"元素爆发"), "burst%"),
+        (re.compile(r"护盾强效"), "shield%"),
+        (re.compile(r"元素精通"), "em"),
+        (re.compile(r"元素充能效率"), "er"),
+        (re.compile(r"治疗(?:加成|效果)"), "heal%"),
+        (re.compile(r"元素能量"), "energy"),
+        (re.compile(r"攻击力"), "atk"),
+        (re.compile(r"生命值"), "hp"),
+        (re.compile(r"防御力"), "def"),
+        (re.compile(r"伤害"), "dmg%"),
+    ],
+}
+CONDITION_PATTERNS: dict[str, re.Pattern[str]] = {
+    "en": re.compile(r"^(?:while|when|after|if) (.+?), "),
+    "zh": re.compile(r"^(.+)时，"),
+}
+VALUE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(%?)")
+
+
+class EffectSignature(NamedTuple):
+    """
+    Canonical form of a 2pc effect, e.g. ("atk%", 18.0, None).
+    Texts that cannot be parsed keep their normalized text as the condition and no stat.
+    """
+
+    stat: str | None
+    value: float | None
+    condition: str | None
+
+
+class NormalizedEffect(NamedTuple):
+    texts: dict[str, str]
+    # One signature per language, deduplicated, primary language first
+    signatures: list[EffectSignature]
+
 
 def normalize_effect_text(text: str, language: str) -> str:
     """Normalize effect text based on language"""
     normalized: str = text.strip()
 
-    if language == "en":
-        normalized = re.sub(r"\.$", "", normalized)
-        normalized = re.sub(r"increase by ", "+", normalized, flags=re.IGNORECASE)
-    elif language == "zh":
-        normalized = re.sub(r"。$", "", normalized)
+    for pattern, replacement in TEXT_RULES.get(language, DEFAULT_TEXT_RULES):
+        normalized = pattern.sub(replacement, normalized)
 
     return normalized
 
 
+def effect_signature(text: str, language: str) -> EffectSignature:
+    """Reduce a normalized 2pc text to its (stat, value, condition) signature"""
+    lowered = text.lower()
+    condition: str | None = None
+
+    condition_pattern = CONDITION_PATTERNS.get(language)
+    if condition_pattern and (match := condition_pattern.match(lowered)):
+        condition = match.group(1)
+        lowered = lowered[match.end() :]
+
+    value_match = VALUE_PATTERN.search(lowered)
+    stat = next(
+        (
+            key.format(*match.groups())
+            for pattern, key in STAT_PATTERNS.get(language, [])
+            if (match := pattern.search(lowered))
+        ),
+        None,
+    )
+    if stat is None or value_match is None:
+        return EffectSignature(None, None, text)
+
+    if value_match.group(2) and stat in ("atk", "hp", "def"):
+        stat += "%"
+    return EffectSignature(stat, float(value_match.group(1)), condition)
+
+
+def extract_effect_signatures(
+    artifact_data: dict[str, I18nArtifactData],
+) -> dict[str, NormalizedEffect]:
+    """
+    Normalize the 2pc effect of every artifact in one pass.
+    Artifacts with a missing language or a placeholder text are left out.
+    """
+    effects: dict[str, NormalizedEffect] = {}
+
+    for artifact_id, data in artifact_data.items():
+        if PRIMARY_LANGUAGE not in data.effects:
+            continue
+
+        # Every language needs its 2pc text
+        if any(len(texts) == 0 for texts in data.effects.values()):
+            continue
+
+        normalized: dict[str, str] = {
+            language: normalize_effect_text(texts[0], language)
+            for language, texts in data.effects.items()
+        }
+
+        # Skip if any effect is a placeholder
+        if any("???" in text for text in normalized.values()):
+            continue
+
+        effects[artifact_id] = NormalizedEffect(normalized, text_signatures(normalized))
+
+    return effects
+
+
+def text_signatures(texts: dict[str, str]) -> list[EffectSignature]:
+    """Signatures of a text per language, primary language first"""
+    languages = sorted(texts, key=lambda language: language != PRIMARY_LANGUAGE)
+    return list(
+        dict.fromkeys(effect_signature(texts[language], language) for language in languages)
+    )
+
+
 def extract_unique_2pc_effects(
-    artifact_ids: list[str], artifact_data: dict[str, I18nArtifactData]
+    artifact_ids: list[str],
+    artifact_data: dict[str, I18nArtifactData],
+    previous_half_sets: list[HalfSet] | None = None,
+    previous_i18n: dict[str, dict[str, str]] | None = None,
 ) -> tuple[list[HalfSet], dict[str, dict[str, str]]]:
     """
     Extract unique 2pc effects from i18n data.
-    Replicates the TypeScript extractUnique2pcEffects function.
     Processes artifacts in reverse order (oldest first) for stable ID assignment.
+    Effects are grouped by their signature, so "ATK +18%" and "Increases ATK by 18%" share
+    a half set; an effect joins a half set when any of its per-language signatures match.
+
+    When previous half sets are given, their IDs are kept: previous members stay in their
+    half set even when its signature now equals another one's, new artifacts are matched
+    against the previous texts and members, and only effects that match nothing get a new ID
+    after the highest previous one. Builds store half set IDs, so merging or renumbering
+    would silently point saved builds at a missing or different bonus; only
+    --renumber-half-sets (no previous half sets) regroups from scratch.
     """
-    half_sets: list[HalfSet] = []
+    half_sets_by_id: dict[int, HalfSet] = {}
     half_sets_i18n: dict[str, dict[str, str]] = {}
-    effect_text_map: dict[str, int] = {}
+    signature_map: dict[EffectSignature, int] = {}
+    previous_members: dict[str, int] = {}
     next_id: int = 1
 
     filtered_artifact_ids: list[str] = [a for a in artifact_ids if a not in ARTIFACT_SKIP_LIST]
+    effects = extract_effect_signatures(artifact_data)
 
-    for artifact_id in reversed(filtered_artifact_ids):
-        data: I18nArtifactData | None = artifact_data.get(artifact_id)
+    if previous_half_sets:
+        previous_i18n = previous_i18n or {}
+        for previous in previous_half_sets:
+            for signature in text_signatures(previous_i18n.get(str(previous.id), {})):
+                signature_map.setdefault(signature, previous.id)
+            for artifact_id in previous.setIds:
+                previous_members.setdefault(artifact_id, previous.id)
+                if artifact_id in effects:
+                    for signature in effects[artifact_id].signatures:
+                        signature_map.setdefault(signature, previous.id)
+        next_id = max(hs.id for hs in previous_half_sets) + 1
 
-        if not data or not data.effects.en or not data.effects.zh:
+    for artifact_id in reversed(filtered_artifact_ids):
+        if artifact_id not in effects:
             continue
+        normalized, signatures = effects[artifact_id]
 
-        effects_en: list[str] = data.effects.en
-        effects_zh: list[str] = data.effects.zh
+        existing_id: int | None = previous_members.get(artifact_id)
+        if existing_id is None:
+            existing_id = next(
+                (signature_map[sig] for sig in signatures if sig in signature_map),
+                None,
+            )
 
-        if len(effects_en) == 0 or len(effects_zh) == 0:
-            continue
+        if existing_id is not None and existing_id in half_sets_by_id:
+            half_sets_by_id[existing_id].setIds.append(artifact_id)
 
-        normalized_en: str = normalize_effect_text(effects_en[0], "en")
-        normalized_zh: str = normalize_effect_text(effects_zh[0], "zh")
+            # Update shortest text (heuristic for "best" description)
+            current_i18n = half_sets_i18n[str(existing_id)]
+            for language, text in normalized.items():
+                if language not in current_i18n or len(text) < len(current_i18n[language]):
+                    current_i18n[language] = text
+        else:
+            # Either a new effect or the first current member of a previous half set
+            half_set_id = existing_id if existing_id is not None else next_id
+            if existing_id is None:
+                next_id += 1
 
-        # Skip if either effect is a placeholder
-        if "???" in normalized_en or "???" in normalized_zh:
-            continue
+            half_sets_by_id[half_set_id] = HalfSet(id=half_set_id, setIds=[artifact_id])
+            half_sets_i18n[str(half_set_id)] = dict(normalized)
 
-        existing_id: int | None = effect_text_map.get(normalized_en) or effect_text_map.get(
-            normalized_zh
-        )
+            for signature in signatures:
+                signature_map.setdefault(signature, half_set_id)
 
-        if existing_id is not None:
-            existing_half_set: HalfSet | None = next(
-                (hs for hs in half_sets if hs.id == existing_id), None
-            )
-            if existing_half_set:
-                existing_half_set.setIds.append(artifact_id)
-
-                # Update shortest text (heuristic for "best" description)
-                current_i18n = half_sets_i18n[str(existing_id)]
-                if len(normalized_en) < len(current_i18n["en"]):
-                    current_i18n["en"] = normalized_en
-                if len(normalized_zh) < len(current_i18n["zh"]):
-                    current_i18n["zh"] = normalized_zh
-        else:
-            new_half_set = HalfSet(
-                id=next_id,
-                setIds=[artifact_id],
-            )
+    half_sets = sorted(half_sets_by_id.values(), key=lambda hs: (-len(hs.setIds), -hs.id))
+
+    return half_sets, half_sets_i18n
 
-            half_sets.append(new_half_set)
 
-            half_sets_i18n[str(next_id)] = {
-                "en": normalized_en,
-                "zh": normalized_zh,
-            }
+def diff_half_sets(
+    old_half_sets: list[HalfSet],
+    old_i18n: dict[str, dict[str, str]],
+    new_half_sets: list[HalfSet],
+    new_i18n: dict[str, dict[str, str]],
+) -> list[str]:
+    """Human readable list of added/removed half sets, membership and text changes"""
+    old_by_id = {hs.id: hs for hs in old_half_sets}
+    new_by_id = {hs.id: hs for hs in new_half_sets}
+    lines: list[str] = []
 
-            effect_text_map[normalized_en] = new_half_set.id
-            effect_text_map[normalized_zh] = new_half_set.id
-            next_id += 1
+    for hs_id in sorted(old_by_id.keys() | new_by_id.keys()):
+        old, new = old_by_id.get(hs_id), new_by_id.get(hs_id)
+        new_texts = new_i18n.get(str(hs_id), {})
+        old_texts = old_i18n.get(str(hs_id), {})
 
-    half_sets.sort(key=lambda hs: (-len(hs.setIds), -hs.id))
+        if old is None and new is not None:
+            text = new_texts.get(PRIMARY_LANGUAGE, "")
+            lines.append(f"  + ID {hs_id}: {', '.join(new.setIds)} - {text}")
+            continue
+        if new is None and old is not None:
+            text = old_texts.get(PRIMARY_LANGUAGE, "")
+            lines.append(f"  - ID {hs_id}: {', '.join(old.setIds)} - {text}")
+            continue
+        assert old is not None and new is not None
 
-    return half_sets, half_sets_i18n
+        added = [s for s in new.setIds if s not in old.setIds]
+        removed = [s for s in old.setIds if s not in new.setIds]
+        if added:
+            lines.append(f"  ~ ID {hs_id}: added {', '.join(added)}")
+        if removed:
+            lines.append(f"  ~ ID {hs_id}: removed {', '.join(removed)}")
+        for language in sorted(old_texts.keys() | new_texts.keys()):
+            before, after = old_texts.get(language), new_texts.get(language)
+            if before != after:
+                lines.append(f"  ~ ID {hs_id} [{language}]: {before!r} -> {after!r}")
+
+    return lines
+
+
+def build_half_set_lookup(
+    artifact_ids: list[str], half_sets: list[HalfSet]
+) -> tuple[dict[str, int], dict[str, list[int]]]:
+    """
+    Lookup tables emitted next to artifactHalfSets, so the app does not rebuild them per build.
+    Returns set id -> half set id, and half set id -> sorted indices into the artifacts list.
+    """
+    artifact_index = {artifact_id: i for i, artifact_id in enumerate(artifact_ids)}
+    set_to_half_set: dict[str, int] = {}
+    half_set_members: dict[str, list[int]] = {}
+
+    for hs in half_sets:
+        for set_id in hs.setIds:
+            set_to_half_set[set_id] = hs.id
+        half_set_members[str(hs.id)] = sorted(
+            artifact_index[set_id] for set_id in hs.setIds if set_id in artifact_index
+        )
+
+    return set_to_half_set, half_set_members
 
 
 def process_artifact_effects(
     artifact_ids: list[str],
     artifact_i18n_data: dict[str, I18nArtifactData],
+    previous_half_sets: list[HalfSet] | None = None,
+    previous_i18n: dict[str, dict[str, str]] | None = None,
 ) -> tuple[list[HalfSet], dict[str, dict[str, str]]]:
     """
     Process scraped data to compute half sets.
     This function is called by scrape_hoyolab.py after scraping is complete.
+    Pass the previous half sets to keep their IDs (incremental mode).
     """
-    print(f"Computing half sets from {len(artifact_ids)} artifacts...")
+    mode = "incrementally " if previous_half_sets else ""
+    print(f"Computing half sets {mode}from {len(artifact_ids)} artifacts...")
 
-    half_sets, half_sets_i18n = extract_unique_2pc_effects(artifact_ids, artifact_i18n_data)
+    half_sets, half_sets_i18n = extract_unique_2pc_effects(
+        artifact_ids, artifact_i18n_data, previous_half_sets, previous_i18n
+    )
 
     print(f"Generated {len(half_sets)} unique half sets:")
     for hs in half_sets:
-        zh_text = half_sets_i18n[str(hs.id)]["zh"]
-        print(f"  ID {hs.id}: {len(hs.setIds)} sets - {zh_text}")
+        texts = half_sets_i18n[str(hs.id)]
+        print(f"  ID {hs.id}: {len(hs.setIds)} sets - {texts.get('zh', texts[PRIMARY_LANGUAGE])}")
+
+    if previous_half_sets is not None:
+        changes = diff_half_sets(previous_half_sets, previous_i18n or {}, half_sets, half_sets_i18n)
+        print(f"Half set changes ({len(changes) or 'none'}):")
+        for line in changes:
+            print(line)
 
     return half_sets, half_sets_i18n
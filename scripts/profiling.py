@@ -0,0 +1,213 @@
+"""
+Lightweight span profiler for the data pipeline (enabled with codedump.py --profile).
+Records timed spans and counters, then exports a Chrome trace-event JSON
+(open in chrome://tracing or https://ui.perfetto.dev) and a plain text summary table.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypedDict, cast
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROFILE_DIR = os.path.join(SCRIPT_DIR, ".cache", "profile")
+
+
+class TraceEvent(TypedDict):
+    name: str
+    cat: str
+    ph: str
+    ts: float
+    dur: float
+    pid: int
+    tid: int
+    args: dict[str, Any]
+
+
+class Profiler:
+    """Collects spans and counters; every call is a no-op until enable() is called"""
+
+    def __init__(self):
+        self.enabled = False
+        self._origin = time.perf_counter()
+        self._events: list[TraceEvent] = []
+        self._counters: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def span(self, name: str, category: str = "pipeline", **args: Any) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+
+        counters_before = dict(self._counters)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            # Attribute counter increments (Playwright calls, bytes) to the span
+            for key, value in self._counters.items():
+                delta = value - counters_before.get(key, 0)
+                if delta:
+                    args[key] = delta
+            event: TraceEvent = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+            with self._lock:
+                self._events.append(event)
+
+    def count(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += value
+
+    def durations(self) -> dict[str, list[float]]:
+        """Durations in seconds of every recorded span, by span name"""
+        totals: dict[str, list[float]] = defaultdict(list)
+        with self._lock:
+            for event in self._events:
+                totals[event["name"]].append(event["dur"] / 1e6)
+        return totals
+
+    def counters(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def summary(self) -> str:
+        """Per-span totals sorted by total time, followed by the counters"""
+        totals = self.durations()
+
+        wall = time.perf_counter() - self._origin
+        lines = [
+            f"{'Span':<44} {'Count':>7} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9} {'% wall':>7}",
+            "-" * 90,
+        ]
+        for name, durations in sorted(totals.items(), key=lambda x: -sum(x[1])):
+            total = sum(durations)
+            lines.append(
+                f"{name[:44]:<44} {len(durations):>7} {total:>9.2f} "
+                f"{total / len(durations) * 1000:>9.1f} {max(durations) * 1000:>9.1f} "
+                f"{total / wall * 100 if wall else 0:>6.1f}%"
+            )
+        lines.append("-" * 90)
+        lines.append(f"{'Wall time':<44} {'':>7} {wall:>9.2f}")
+
+        if self._counters:
+            lines.append("")
+            lines.append(f"{'Counter':<44} {'Value':>16}")
+            lines.append("-" * 61)
+            for name, value in sorted(self._counters.items()):
+                lines.append(f"{name:<44} {value:>16,}")
+
+        return "\n".join(lines)
+
+    def write(self, directory: str = PROFILE_DIR) -> None:
+        """Write trace.json and summary.txt, and print the summary"""
+        os.makedirs(directory, exist_ok=True)
+
+        trace_path = os.path.join(directory, "trace.json")
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "traceEvents": self._events,
+                    "displayTimeUnit": "ms",
+                    "otherData": dict(self._counters),
+                },
+                f,
+            )
+
+        summary = self.summary()
+        summary_path = os.path.join(directory, "summary.txt")
+        with open(summary_path, "w", encoding="utf-8") as f:
+            f.write(summary + "\n")
+
+        print("=== Profile ===")
+        print(summary)
+        print(f"Written trace to {trace_path}")
+
+
+PROFILER = Profiler()
+
+
+def span(name: str, category: str = "pipeline", **args: Any):
+    """Time a block of code as a named span"""
+    return PROFILER.span(name, category, **args)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Increment a counter, e.g. bytes transferred"""
+    PROFILER.count(name, value)
+
+
+def traced[**P, R](
+    name: str, category: str = "pipeline"
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator that records every call of the function as a span.
+    Generator functions are timed from the first to the last item, not just the call.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if inspect.isgeneratorfunction(func):
+
+            @functools.wraps(func)
+            def generator_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                if not PROFILER.enabled:
+                    return (yield from cast(Any, func(*args, **kwargs)))
+                with PROFILER.span(name, category):
+                    return (yield from cast(Any, func(*args, **kwargs)))
+
+            return cast(Callable[P, R], generator_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.span(name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def sleep(seconds: float) -> None:
+    """time.sleep that shows up in the profile, so fixed waits can be told apart from work"""
+    with PROFILER.span("sleep", "sleep"):
+        time.sleep(seconds)
+
+
+def instrument_playwright() -> None:
+    """
+    Count Playwright sync API round-trips.
+    Every blocking sync call goes through SyncBase._sync, so wrapping it counts IPC calls
+    to the driver. Locator construction is local and is not counted.
+    """
+    from playwright._impl._sync_base import SyncBase
+
+    original = SyncBase._sync
+
+    def _sync(self: SyncBase, coro: Any) -> Any:
+        PROFILER.count("playwright.calls")
+        return original(self, coro)
+
+    SyncBase._sync = _sync  # type: ignore[method-assign]
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+"""
+Batch artifact scoring for GOOD inventories.
+Computes the same scores as calculateArtifactScore in src/lib/artifactScore.ts (formulas in
+docs/ArtifactScore.md), but for every equipped artifact of every inventory at once: artifacts
+are loaded into column arrays and scored against a (character x stat) coefficient matrix.
+
+Usage:
+    python scoring.py inventory.json [more.json ...] [--output scores.json]
+"""
+
+import argparse
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+from good import (
+    ARTIFACT_SKIP_SET,
+    CHARACTER_SKIP_SET,
+    I18N_GAME_PATH,
+    character_key,
+    load_i18n_game,
+    normalize,
+)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+STAT_WEIGHTS_PATH = os.path.join(PROJECT_ROOT, "src", "data", "statWeights.ts")
+
+SLOTS: list[str] = ["flower", "plume", "sands", "goblet", "circlet"]
+SLOT_INDEX: dict[str, int] = {slot: i for i, slot in enumerate(SLOTS)}
+
+# Same order as potentialSubstats in artifactScore.ts
+STATS: list[str] = [
+    "cr",
+    "cd",
+    "em",
+    "er",
+    "atk%",
+    "hp%",
+    "def%",
+    "atk",
+    "hp",
+    "def",
+    "pyro%",
+    "hydro%",
+    "anemo%",
+    "electro%",
+    "dendro%",
+    "cryo%",
+    "geo%",
+    "phys%",
+    "heal%",
+]
+STAT_INDEX: dict[str, int] = {stat: i for i, stat in enumerate(STATS)}
+SUBSTATS: list[str] = ["hp", "atk", "def", "hp%", "atk%", "def%", "er", "em", "cr", "cd"]
+
+# Stat Key Mapping (GOOD -> Internal), as in goodConversion.ts
+GOOD_STAT_KEYS: dict[str, str] = {
+    "hp": "hp",
+    "hp_": "hp%",
+    "atk": "atk",
+    "atk_": "atk%",
+    "def": "def",
+    "def_": "def%",
+    "eleMas": "em",
+    "enerRech_": "er",
+    "heal_": "heal%",
+    "critRate_": "cr",
+    "critDMG_": "cd",
+    "physical_dmg_": "phys%",
+    "anemo_dmg_": "anemo%",
+    "geo_dmg_": "geo%",
+    "electro_dmg_": "electro%",
+    "hydro_dmg_": "hydro%",
+    "pyro_dmg_": "pyro%",
+    "cryo_dmg_": "cryo%",
+    "dendro_dmg_": "dendro%",
+}
+GOOD_STAT_INDEX: dict[str, int] = {key: STAT_INDEX[stat] for key, stat in GOOD_STAT_KEYS.items()}
+
+# Crit damage equivalent per point of each stat (calculateAttributeScore)
+COEFFICIENTS: dict[str, float] = {
+    "cr": 2,
+    "cd": 1,
+    "em": 0.3333,
+    "er": 1.1991,
+    "atk%": 1.3328,
+    "hp%": 1.3328,
+    "def%": 1.0658,
+    "atk": 0.3995,
+    "hp": 0.026,
+    "def": 0.3356,
+    **dict.fromkeys(["pyro%", "hydro%", "anemo%", "electro%", "dendro%", "cryo%", "geo%"], 1.3348),
+    "phys%": 1.0669,
+    "heal%": 1.7326,
+}
+FLAT_STATS: dict[str, str] = {"atk": "flatAtk", "hp": "flatHp", "def": "flatDef"}
+# Defaults of useArtifactScoreStore
+DEFAULT_GLOBAL_WEIGHTS: dict[str, float] = {"flatAtk": 30, "flatHp": 30, "flatDef": 30}
+
+# Max level main stat values, 5-star and 4-star
+MAIN_STAT_VALUES: dict[str, tuple[float, float]] = {
+    "hp": (4780, 3571),
+    "atk": (311, 232),
+    "hp%": (46.6, 34.8),
+    "atk%": (46.6, 34.8),
+    "def%": (58.3, 43.5),
+    "em": (186.5, 139.3),
+    "er": (51.8, 38.7),
+    **dict.fromkeys(
+        ["pyro%", "hydro%", "cryo%", "electro%", "anemo%", "geo%", "dendro%"], (46.6, 34.8)
+    ),
+    "phys%": (58.3, 43.5),
+    "cr": (31.1, 23.2),
+    "cd": (62.2, 46.4),
+    "heal%": (35.9, 26.8),
+}
+
+# Max potential sub-score: rolls on the top 4 weighted substats times the max CD roll
+MAX_SUB_ROLLS_5STAR = np.array([5, 1, 1, 1], dtype=np.float64)
+MAX_SUB_ROLLS_4STAR = np.array([3, 1, 1, 1], dtype=np.float64)
+MAX_CD_ROLL_5STAR = 7.77
+MAX_CD_ROLL_4STAR = 6.22
+
+
+def load_stat_weights(path: str = STAT_WEIGHTS_PATH) -> dict[str, dict[str, float]]:
+    """Read STAT_WEIGHTS from statWeights.ts (object literal, not JSON)"""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    body = content.split("STAT_WEIGHTS", 1)[1]
+    return {
+        character: {
+            key.strip('"'): float(value)
+            for key, value in re.findall(r'("[^"]+"|\w+):\s*([\d.]+)', weights)
+        }
+        for character, weights in re.findall(r"(\w+): \{([^}]*)\}", body)
+    }
+
+
+def load_name_maps(path: str = I18N_GAME_PATH) -> tuple[dict[str, str], set[str]]:
+    """Normalized English name -> character id, and the normalized artifact set names"""
+    i18n = load_i18n_game(path)
+    characters = {normalize(names["en"]): char_id for char_id, names in i18n["characters"].items()}
+    artifact_sets = {normalize(data["name"]["en"]) for data in i18n["artifacts"].values()}
+    return characters, artifact_sets
+
+
+@dataclass
+class ArtifactColumns:
+    """Equipped artifacts of all inventories, one row per artifact"""
+
+    inventory: npt.NDArray[np.int32]
+    # Index into the GOOD artifacts list of the inventory
+    source_index: npt.NDArray[np.int32]
+    character: npt.NDArray[np.int32]
+    slot: npt.NDArray[np.int8]
+    rarity: npt.NDArray[np.int8]
+    main_stat: npt.NDArray[np.int16]
+    # (artifacts, stats) substat values, 0 where absent
+    substats: npt.NDArray[np.float64]
+
+
+@dataclass
+class ScoreArrays:
+    """Per-artifact scores (rows of ArtifactColumns) and (inventory, character, slot) totals"""
+
+    main: npt.NDArray[np.float64]
+    sub: npt.NDArray[np.float64]
+    max_sub: npt.NDArray[np.float64]
+    slot_main: npt.NDArray[np.float64]
+    slot_sub: npt.NDArray[np.float64]
+    slot_max_sub: npt.NDArray[np.float64]
+    slot_count: npt.NDArray[np.int64]
+
+
+class CharacterScore(TypedDict):
+    mainScore: float
+    subScore: float
+    slotMainScores: dict[str, float]
+    slotSubScores: dict[str, float]
+    slotMaxSubScores: dict[str, float]
+    isComplete: bool
+
+
+class ArtifactScore(TypedDict):
+    index: int
+    character: str
+    slot: str
+    mainScore: float
+    subScore: float
+    maxSubScore: float
+
+
+class InventoryScores(TypedDict):
+    characters: dict[str, CharacterScore]
+    artifacts: list[ArtifactScore]
+
+
+class ScoringEngine:
+    """Scores GOOD inventories against per-character stat weights"""
+
+    def __init__(
+        self,
+        stat_weights: dict[str, dict[str, float]] | None = None,
+        global_weights: dict[str, float] | None = None,
+        name_maps: tuple[dict[str, str], set[str]] | None = None,
+    ):
+        stat_weights = load_stat_weights() if stat_weights is None else stat_weights
+        global_weights = {**DEFAULT_GLOBAL_WEIGHTS, **(global_weights or {})}
+        self.character_by_name, self.artifact_sets = name_maps or load_name_maps()
+
+        # Every known character gets a row, unweighted ones score 0
+        self.characters: list[str] = sorted(
+            set(self.character_by_name.values()) | stat_weights.keys()
+        )
+        self.character_index = {char_id: i for i, char_id in enumerate(self.characters)}
+
+        raw = np.zeros((len(self.characters), len(STATS)), dtype=np.float64)
+        for char_id, weights in stat_weights.items():
+            for stat, weight in weights.items():
+                if stat in STAT_INDEX:
+                    raw[self.character_index[char_id], STAT_INDEX[stat]] = weight / 100
+
+        flat_factor = np.array(
+            [global_weights[FLAT_STATS[stat]] / 100 if stat in FLAT_STATS else 1 for stat in STATS]
+        )
+        coefficients = np.array([COEFFICIENTS[stat] for stat in STATS])
+        # (characters, stats) score per point of each stat
+        self.score_matrix = raw * coefficients * flat_factor
+
+        # (rarity is 4, main stat) max level main stat value
+        self.main_values = np.array(
+            [
+                [MAIN_STAT_VALUES.get(stat, (0, 0))[four_star] for stat in STATS]
+                for four_star in (0, 1)
+            ]
+        )
+        self.max_sub_scores = self._max_sub_scores(raw)
+
+    @staticmethod
+    def _max_sub_scores(raw: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """(rarity 5/4, characters, main stat) potential sub-score, see calculateMaxSlotSubScore"""
+        substat_columns = [STAT_INDEX[stat] for stat in SUBSTATS]
+        # (characters, main stats, substats): pool weights with the main stat removed
+        pool = np.repeat(raw[:, None, substat_columns], len(STATS), axis=1)
+        for i, stat in enumerate(SUBSTATS):
+            pool[:, STAT_INDEX[stat], i] = 0
+        top = -np.sort(-pool, axis=2)[:, :, :4]
+
+        return np.stack(
+            [
+                top @ MAX_SUB_ROLLS_5STAR * MAX_CD_ROLL_5STAR,
+                top @ MAX_SUB_ROLLS_4STAR * MAX_CD_ROLL_4STAR,
+            ]
+        )
+
+    def to_columns(self, inventories: list[dict[str, Any]]) -> ArtifactColumns:
+        """Collect the equipped artifacts the app would score into column arrays"""
+        rows: list[tuple[int, int, int, int, int, int]] = []
+        # (row, stat, value) of every substat, scattered into the matrix at the end
+        substat_cells: list[tuple[int, int, float]] = []
+
+        for inv_index, data in enumerate(inventories):
+            owned: set[str] = set()
+            for char in data.get("characters") or []:
+                if char_id := self._character_id(char["key"]):
+                    owned.add(char_id)
+
+            # A later artifact in the same slot replaces the earlier one, as in the app
+            equipped: dict[tuple[int, int], tuple[int, dict[str, Any]]] = {}
+            for art_index, art in enumerate(data.get("artifacts") or []):
+                set_key = normalize(art["setKey"])
+                if set_key in ARTIFACT_SKIP_SET or set_key not in self.artifact_sets:
+                    continue
+                if art["mainStatKey"] not in GOOD_STAT_INDEX or art["slotKey"] not in SLOT_INDEX:
+                    continue
+                char_id = self._character_id(art.get("location") or "")
+                if char_id is None or char_id not in owned:
+                    continue
+
+                key = (self.character_index[char_id], SLOT_INDEX[art["slotKey"]])
+                equipped[key] = (art_index, art)
+
+            for (char_index, slot_index), (art_index, art) in equipped.items():
+                row = len(rows)
+                rows.append(
+                    (
+                        inv_index,
+                        art_index,
+                        char_index,
+                        slot_index,
+                        art["rarity"],
+                        GOOD_STAT_INDEX[art["mainStatKey"]],
+                    )
+                )
+                for sub in art.get("substats") or []:
+                    if (stat := GOOD_STAT_INDEX.get(sub["key"])) is not None:
+                        substat_cells.append((row, stat, sub["value"]))
+
+        table = np.array(rows, dtype=np.int32).reshape(-1, 6)
+        cells = np.array(substat_cells, dtype=np.float64).reshape(-1, 3)
+        substats = np.zeros((len(rows), len(STATS)), dtype=np.float64)
+        substats[cells[:, 0].astype(np.intp), cells[:, 1].astype(np.intp)] = cells[:, 2]
+
+        return ArtifactColumns(
+            inventory=table[:, 0],
+            source_index=table[:, 1],
+            character=table[:, 2],
+            slot=table[:, 3].astype(np.int8),
+            rarity=table[:, 4].astype(np.int8),
+            main_stat=table[:, 5].astype(np.int16),
+            substats=substats,
+        )
+
+    def _character_id(self, key: str) -> str | None:
+        key = character_key(key)
+        normalized = normalize(key)
+        if normalized in CHARACTER_SKIP_SET:
+            return None
+        return self.character_by_name.get(normalized)
+
+    def score_columns(self, columns: ArtifactColumns, inventory_count: int) -> ScoreArrays:
+        """Vectorized scoring of artifact columns, for callers that want arrays"""
+        character = columns.character
+        four_star = (columns.rarity == 4).astype(np.intp)
+
+        weights = self.score_matrix[character]
+        main_scores = (
+            self.main_values[four_star, columns.main_stat]
+            * weights[np.arange(len(character)), columns.main_stat]
+        )
+        sub_scores = np.einsum("ns,ns->n", columns.substats, weights)
+        max_sub_scores = np.where(
+            (columns.rarity == 4) | (columns.rarity == 5),
+            self.max_sub_scores[four_star, character, columns.main_stat],
+            0,
+        )
+
+        # Per (inventory, character, slot) totals through a flat group index
+        groups = (columns.inventory.astype(np.int64) * len(self.characters) + character) * len(
+            SLOTS
+        ) + columns.slot
+        shape = (inventory_count, len(self.characters), len(SLOTS))
+        size = int(np.prod(shape))
+
+        return ScoreArrays(
+            main=main_scores,
+            sub=sub_scores,
+            max_sub=max_sub_scores,
+            slot_main=np.bincount(groups, weights=main_scores, minlength=size).reshape(shape),
+            slot_sub=np.bincount(groups, weights=sub_scores, minlength=size).reshape(shape),
+            slot_max_sub=np.bincount(groups, weights=max_sub_scores, minlength=size).reshape(shape),
+            slot_count=np.bincount(groups, minlength=size).reshape(shape),
+        )
+
+    def score(self, inventories: list[dict[str, Any]]) -> list[InventoryScores]:
+        """Score every equipped artifact of every inventory in one vectorized pass"""
+        columns = self.to_columns(inventories)
+        scores = self.score_columns(columns, len(inventories))
+        slot_main, slot_sub = scores.slot_main, scores.slot_sub
+        slot_max, slot_count = scores.slot_max_sub, scores.slot_count
+
+        results: list[InventoryScores] = [{"characters": {}, "artifacts": []} for _ in inventories]
+        # Python scalars from tolist() are much faster to put into dicts than numpy indexing
+        for inv_index, art_index, char_index, slot, main, sub, max_sub in zip(
+            columns.inventory.tolist(),
+            columns.source_index.tolist(),
+            columns.character.tolist(),
+            columns.slot.tolist(),
+            scores.main.tolist(),
+            scores.sub.tolist(),
+            scores.max_sub.tolist(),
+            strict=True,
+        ):
+            results[inv_index]["artifacts"].append(
+                {
+                    "index": art_index,
+                    "character": self.characters[char_index],
+                    "slot": SLOTS[slot],
+                    "mainScore": main,
+                    "subScore": sub,
+                    "maxSubScore": max_sub,
+                }
+            )
+
+        inv_indices, char_indices = np.nonzero(slot_count.sum(axis=2))
+        for inv_index, char_index, mains, subs, max_subs, counts in zip(
+            inv_indices.tolist(),
+            char_indices.tolist(),
+            slot_main[inv_indices, char_indices].tolist(),
+            slot_sub[inv_indices, char_indices].tolist(),
+            slot_max[inv_indices, char_indices].tolist(),
+            slot_count[inv_indices, char_indices].tolist(),
+            strict=True,
+        ):
+            results[inv_index]["characters"][self.characters[char_index]] = {
+                "mainScore": sum(mains),
+                "subScore": sum(subs),
+                "slotMainScores": dict(zip(SLOTS, mains, strict=True)),
+                "slotSubScores": dict(zip(SLOTS, subs, strict=True)),
+                "slotMaxSubScores": {
+                    slot: value
+                    for slot, value, count in zip(SLOTS, max_subs, counts, strict=True)
+                    if count
+                },
+                "isComplete": all(counts),
+            }
+
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score GOOD inventories")
+    parser.add_argument("inventories", nargs="+", help="GOOD JSON exports")
+    parser.add_argument("--output", help="Write scores as JSON (default: print per character)")
+    for key, default in DEFAULT_GLOBAL_WEIGHTS.items():
+        parser.add_argument(f"--{key}", type=float, default=default, help=f"default: {default}")
+    args = parser.parse_args()
+
+    inventories: list[dict[str, Any]] = []
+    for path in args.inventories:
+        with open(path, encoding="utf-8") as f:
+            inventories.append(json.load(f))
+
+    engine = ScoringEngine(
+        global_weights={key: getattr(args, key) for key in DEFAULT_GLOBAL_WEIGHTS}
+    )
+    results = engine.score(inventories)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(dict(zip(args.inventories, results, strict=True)), f, indent=2)
+        print(f"Written scores to {args.output}")
+        return
+
+    for path, result in zip(args.inventories, results, strict=True):
+        print(f"=== {path} ===")
+        for char_id, score in sorted(
+            result["characters"].items(), key=lambda x: -(x[1]["mainScore"] + x[1]["subScore"])
+        ):
+            print(f"  {char_id:<24} main {score['mainScore']:8.1f}  sub {score['subScore']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Generates src/data/searchIndex.ts, the prebuilt name search behind src/lib/search.ts.
+
+Every EN and ZH name is broken into lookup tokens, each mapped to the items that contain it:
+- EN: the first letter of every word and the 2- and 3-grams of the name
+- ZH: single characters and 2-grams
+- Pinyin of ZH names: 2- and 3-grams of the full pinyin, and every substring of the initials
+A short query is a single key lookup ("hu", "胡", "ht"); a longer one intersects the items of its
+3-grams (2-grams for ZH), so "hutao" or "ward" still never scans the names.
+Queries are normalized by normalize() here and normalizeSearchText() in the app, keep the two
+in sync.
+
+write_data() writes the index with the rest of the data; run this to rebuild it from the
+current i18n-game.ts.
+"""
+
+import io
+import json
+import os
+import re
+import unicodedata
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from pypinyin import Style, lazy_pinyin
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+OUTPUT_PATH = os.path.join(PROJECT_ROOT, "src", "data", "searchIndex.ts")
+
+SEARCH_CATEGORIES = ("characters", "weapons", "artifacts")
+# Longest n-gram has to match the query split in src/lib/search.ts
+LATIN_NGRAM_SIZES = (2, 3)
+CJK_NGRAM_SIZES = (1, 2)
+
+CJK_PATTERN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff]")
+NON_SEARCHABLE = re.compile(r"[^a-z0-9\u3400-\u4dbf\u4e00-\u9fff]")
+WORD_SEPARATORS = re.compile(r"[\s\-]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, accents and full-width forms folded, everything but letters/digits/CJK removed"""
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.category(c).startswith("M"))
+    return NON_SEARCHABLE.sub("", text.lower())
+
+
+def ngrams(text: str, sizes: tuple[int, ...]) -> set[str]:
+    return {text[i : i + n] for n in sizes for i in range(len(text) - n + 1)}
+
+
+def substrings(text: str) -> set[str]:
+    return {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)}
+
+
+def name_tokens(name: str) -> set[str]:
+    """Lookup tokens of one name, in whichever language it is"""
+    if not CJK_PATTERN.search(name):
+        words = [word for word in map(normalize, WORD_SEPARATORS.split(name)) if word]
+        return {word[0] for word in words} | ngrams("".join(words), LATIN_NGRAM_SIZES)
+
+    # Non-CJK runs are passed through as they are, e.g. digits in a name
+    syllables = [s for s in map(normalize, lazy_pinyin(name, style=Style.NORMAL)) if s]
+    return (
+        ngrams(normalize(name), CJK_NGRAM_SIZES)
+        | ngrams("".join(syllables), LATIN_NGRAM_SIZES)
+        | substrings("".join(syllable[0] for syllable in syllables))
+    )
+
+
+def item_names(category: str, entry: Mapping[str, Any]) -> Iterable[str]:
+    """Names of an i18n entry, characters map languages to names and the others have name{}"""
+    names = entry if category == "characters" else entry.get("name", {})
+    return (name for name in names.values() if isinstance(name, str))
+
+
+def build_index(
+    category: str, entries: Mapping[str, Mapping[str, Any]]
+) -> tuple[list[str], dict[str, list[int]]]:
+    """IDs of the category and token -> positions in the IDs"""
+    ids = sorted(entries)
+    tokens: dict[str, list[int]] = {}
+    for position, item_id in enumerate(ids):
+        item_tokens: set[str] = set()
+        for name in item_names(category, entries[item_id]):
+            item_tokens |= name_tokens(name)
+        for token in item_tokens:
+            tokens.setdefault(token, []).append(position)
+    return ids, dict(sorted(tokens.items()))
+
+
+def write_search_index(
+    i18n_data: Mapping[str, Mapping[str, Mapping[str, Any]]], path: str = OUTPUT_PATH
+) -> bool:
+    """Write the index, returns False if the file already had this content"""
+    with io.StringIO() as f:
+        f.write("// This file is auto-generated by scripts/search_index.py\n")
+        f.write("// Do not edit this file directly\n\n")
+        f.write("import type { SearchCategory, SearchIndex } from './types';\n\n")
+        f.write("// Search token -> positions in ids, see src/lib/search.ts\n")
+        f.write("export const searchIndex: Record<SearchCategory, SearchIndex> = {\n")
+        for category in SEARCH_CATEGORIES:
+            ids, tokens = build_index(category, i18n_data.get(category, {}))
+            f.write(f'  "{category}": {{\n')
+            f.write(f"    ids: {json.dumps(ids)},\n")
+            f.write(
+                f"    tokens: {json.dumps(tokens, ensure_ascii=False, separators=(',', ':'))},\n"
+            )
+            f.write("  },\n")
+        f.write("};\n")
+        content = f.getvalue()
+
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                print(f"Search index unchanged: {path}")
+                return False
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    print(f"Written search index to {path}")
+    return True
+
+
+def main() -> None:
+    # Imported here, codedump imports this module
+    from codedump import load_existing_data
+
+    _, i18n_data = load_existing_data(PROJECT_ROOT)
+    write_search_index(i18n_data)
+
+
+if __name__ == "__main__":
+    main()
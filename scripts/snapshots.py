@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Offline parsing of Hoyolab list page snapshots.
+HoyolabScraper(snapshot_dir=...) (codedump.py --snapshot) saves each fully scrolled list page,
+one file per (category, language). The parsers here extract the same card fields as the
+scraper's _extract_*_from_card methods with BeautifulSoup, so selector changes can be tried on
+the snapshots in milliseconds instead of re-running the browser crawl.
+
+Entry IDs and weapon detail fields (type, stats, effect) come from clicking each card, which a
+snapshot can not replay, so they are left at their defaults.
+
+Usage:
+    python snapshots.py [--category characters] [--language en] [--output parsed.json]
+"""
+
+import argparse
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from bs4 import BeautifulSoup, Tag
+from tqdm import tqdm
+
+from hoyolab import (
+    CHARACTER_BLOCKLIST,
+    clean_image_url,
+    extract_element_from_src,
+    extract_id_from_url,
+    extract_rarity_from_class,
+    extract_rarity_from_star_class,
+    is_placeholder_image,
+)
+from models import ArtifactSource, BaseItemSource, CharacterSource, WeaponSource
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(SCRIPT_DIR, ".cache", "snapshots")
+
+# Category -> card selector of its list page, as used by the scraper
+CARD_SELECTORS: dict[str, str] = {
+    "characters": "article.character-card",
+    "artifacts": "div.artifact-card",
+    "weapons": ".genshin-show-weapon-item",
+}
+
+
+def snapshot_path(category: str, language: str, directory: str = SNAPSHOT_DIR) -> str:
+    return os.path.join(directory, f"{category}_{language}.html")
+
+
+def save_snapshot(html: str, category: str, language: str, directory: str = SNAPSHOT_DIR) -> str:
+    os.makedirs(directory, exist_ok=True)
+    path = snapshot_path(category, language, directory)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return path
+
+
+def _text(tag: Tag | None) -> str:
+    return tag.get_text().strip() if tag else ""
+
+
+def _attribute(tag: Tag | None, name: str) -> str | None:
+    """Attribute as get_attribute returns it (class lists joined)"""
+    if tag is None:
+        return None
+    value = tag.get(name)
+    if isinstance(value, list):
+        return " ".join(value)
+    return value
+
+
+def _entry_id(card: Tag) -> str:
+    # Cards open their entry through a click handler; a plain link is only used if present
+    link = card.select_one("a[href*='entry/']")
+    return extract_id_from_url(_attribute(link, "href") or "")
+
+
+def parse_character_card(card: Tag, index: int) -> CharacterSource | None:
+    name = _text(card.select_one("div.character-card-name span"))
+    if not name:
+        tqdm.write(f"SKIP (Char {index}): No name found")
+        return None
+    if name in CHARACTER_BLOCKLIST:
+        return None
+
+    element_src = _attribute(card.select_one("img.character-card-element"), "src")
+    element = extract_element_from_src(element_src) if element_src else None
+    if element is None:
+        tqdm.write(f"SKIP ({name}): Could not find element from src: {element_src}")
+        return None
+
+    rarity_classes = _attribute(card.select_one("div.character-card-icon"), "class")
+    rarity = extract_rarity_from_class(rarity_classes) if rarity_classes else None
+    if rarity is None:
+        tqdm.write(f"SKIP ({name}): Could not find rarity from classes: {rarity_classes}")
+        return None
+
+    image_url = _attribute(card.select_one("img.d-img-show"), "src")
+    if not image_url or is_placeholder_image(image_url):
+        tqdm.write(f"SKIP ({name}): Placeholder image found: {image_url}")
+        return None
+
+    return CharacterSource(
+        entry_id=_entry_id(card),
+        name=name,
+        element=element,
+        rarity=rarity,
+        image_url=clean_image_url(image_url),
+    )
+
+
+def parse_artifact_card(card: Tag, index: int) -> ArtifactSource | None:
+    name = _text(card.select_one("div.artifact-card-name"))
+    if not name:
+        tqdm.write(f"SKIP (Art {index}): Name text is empty")
+        return None
+
+    image_urls: dict[str, str] = {}
+    suit_items = card.select("div.artifact-card-suit div.artifact-card-suit-item")
+    if len(suit_items) >= 5:
+        # Order: circlet, flower, goblet, plume, sands
+        slots = ["circlet", "flower", "goblet", "plume", "sands"]
+        for slot, item in zip(slots, suit_items[:5], strict=False):
+            src = _attribute(item.select_one("img.d-img-show"), "src")
+            if src:
+                image_urls[slot] = clean_image_url(src)
+
+    if "flower" not in image_urls:
+        src = _attribute(card.select_one("div.artifact-card-main img.d-img-show"), "src")
+        if src and not is_placeholder_image(src):
+            image_urls["flower"] = clean_image_url(src)
+
+    if "flower" not in image_urls:
+        tqdm.write(f"SKIP ({name}): No flower image found")
+        return None
+
+    desc_items = card.select("div.artifact-card-desc-item")
+    if len(desc_items) < 2:
+        tqdm.write(f"SKIP ({name}): Less than 2 desc items found")
+        return None
+
+    return ArtifactSource(
+        entry_id=_entry_id(card),
+        name=name,
+        image_urls=image_urls,
+        effects=[
+            _text(item.select_one("div.artifact-card-desc-detail")) for item in desc_items[:2]
+        ],
+    )
+
+
+def parse_weapon_card(card: Tag, index: int) -> WeaponSource | None:
+    name = _text(card.select_one("div.weapon-card-name span"))
+    if not name:
+        tqdm.write(f"SKIP (Wep {index}): Name text is empty")
+        return None
+
+    icon_classes = _attribute(card.select_one("div.weapon-card-icon .drop-icon-with-star"), "class")
+    rarity = extract_rarity_from_star_class(icon_classes) if icon_classes else None
+    if rarity is None:  # Fallback
+        img_classes = _attribute(card.select_one("div.d-img"), "class") or ""
+        rarity = extract_rarity_from_class(img_classes) or 0
+    if rarity in (1, 2):
+        return None
+
+    image_url = _attribute(card.select_one("img.d-img-show"), "src")
+    if not image_url or is_placeholder_image(image_url):
+        tqdm.write(f"SKIP ({name}): Placeholder image found")
+        return None
+
+    return WeaponSource(
+        entry_id=_entry_id(card),
+        name=name,
+        rarity=rarity,
+        image_url=clean_image_url(image_url),
+        type="",
+        secondary_stat="",
+        effect="",
+        base_atk=0,
+        secondary_stat_value="",
+    )
+
+
+CARD_PARSERS: dict[str, Callable[[Tag, int], BaseItemSource | None]] = {
+    "characters": parse_character_card,
+    "artifacts": parse_artifact_card,
+    "weapons": parse_weapon_card,
+}
+
+
+def parse_list_page(html: str, category: str) -> list[BaseItemSource]:
+    """Items of one list page snapshot, in card order"""
+    soup = BeautifulSoup(html, "html.parser")
+    parse_card = CARD_PARSERS[category]
+    items: list[BaseItemSource] = []
+    for index, card in enumerate(soup.select(CARD_SELECTORS[category])):
+        item = parse_card(card, index)
+        if item:
+            items.append(item)
+    return items
+
+
+def parse_snapshot(
+    category: str, language: str, directory: str = SNAPSHOT_DIR
+) -> list[BaseItemSource]:
+    with open(snapshot_path(category, language, directory), encoding="utf-8") as f:
+        return parse_list_page(f.read(), category)
+
+
+def list_snapshots(directory: str = SNAPSHOT_DIR) -> list[tuple[str, str]]:
+    """(category, language) of every snapshot in the directory"""
+    if not os.path.isdir(directory):
+        return []
+    snapshots: list[tuple[str, str]] = []
+    for filename in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(filename)
+        category, _, language = stem.rpartition("_")
+        if extension == ".html" and category in CARD_PARSERS:
+            snapshots.append((category, language))
+    return snapshots
+
+
+def _parse_to_json(category: str, language: str, directory: str) -> list[dict[str, Any]]:
+    return [item.model_dump() for item in parse_snapshot(category, language, directory)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parse saved Hoyolab list page snapshots")
+    parser.add_argument("--directory", default=SNAPSHOT_DIR, help="Snapshot directory")
+    parser.add_argument("--category", choices=list(CARD_PARSERS), help="Only this category")
+    parser.add_argument("--language", help="Only this language")
+    parser.add_argument("--output", help="Write the parsed items as JSON")
+    args = parser.parse_args()
+
+    snapshots = [
+        (category, language)
+        for category, language in list_snapshots(args.directory)
+        if (args.category is None or category == args.category)
+        and (args.language is None or language == args.language)
+    ]
+    if not snapshots:
+        print(f"No snapshots found in {args.directory}, run codedump.py --snapshot first")
+        return
+
+    # Snapshots are independent, so they are parsed in parallel
+    with ProcessPoolExecutor(max_workers=min(len(snapshots), os.cpu_count() or 1)) as executor:
+        results = list(
+            executor.map(
+                _parse_to_json,
+                [category for category, _ in snapshots],
+                [language for _, language in snapshots],
+                [args.directory] * len(snapshots),
+            )
+        )
+
+    parsed: dict[str, list[dict[str, Any]]] = {}
+    for (category, language), items in zip(snapshots, results, strict=True):
+        print(f"{category} ({language}): {len(items)} items")
+        parsed[f"{category}_{language}"] = items
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(parsed, f, indent=2, ensure_ascii=False)
+        print(f"Written parsed items to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,7 @@ import { useLanguage } from "@/contexts/LanguageContext";
 import { elementResourcesByName, sortedCharacters } from "@/data/constants";
 import type { Character, Element } from "@/data/types";
 import { useMediaQuery } from "@/hooks/useMediaQuery";
+import { searchIds } from "@/lib/search";
 import { cn, getAssetUrl } from "@/lib/utils";
 import { useArtifactScoreStore } from "@/stores/useArtifactScoreStore";
 import {
@@ -356,11 +357,11 @@ export function StatWeightView() {
   const isDesktop = useMediaQuery("(min-width: 1024px)");
 
   const filteredCharacters = useMemo(() => {
-    return sortedCharacters.filter((c) => {
-      const name = t.character(c.id).toLowerCase();
-      return name.includes(search.toLowerCase());
-    });
-  }, [search, t]);
+    const matches = searchIds("characters", search);
+    return matches
+      ? sortedCharacters.filter((c) => matches.has(c.id))
+      : sortedCharacters;
+  }, [search]);
 
   // Helper to update merged stats
   const updateMergedWeight = useCallback(
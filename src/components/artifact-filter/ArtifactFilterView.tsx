@@ -3,6 +3,7 @@ import { useLanguage } from "@/contexts/LanguageContext";
 import { artifacts } from "@/data/resources";
 import type { Build, ComputeOptions } from "@/data/types";
 import { computeArtifactFilters } from "@/lib/computeFilters";
+import { searchIds } from "@/lib/search";
 import { useBuildsStore } from "@/stores/useBuildsStore";
 import { type RefObject, useCallback, useMemo, useRef, useState } from "react";
 import { ArtifactCard } from "./ArtifactCard";
@@ -52,17 +53,14 @@ export function ArtifactFilterView({
   }, [characterBuilds, computeOptions]);
 
   const filteredSets = useMemo(() => {
+    const matches = searchIds("artifacts", searchQuery);
     return artifacts.filter((set) => {
-      if (
-        searchQuery &&
-        !t.artifact(set.id).toLowerCase().includes(searchQuery.toLowerCase())
-      )
-        return false;
+      if (matches && !matches.has(set.id)) return false;
 
       // Only show sets that have computed filters
       return artifactFilters.some((filter) => filter.setId === set.id);
     });
-  }, [searchQuery, artifactFilters, t]);
+  }, [searchQuery, artifactFilters]);
 
   const handleComputeOptionChange = useCallback(
     <K extends keyof ComputeOptions>(key: K, value: ComputeOptions[K]) => {
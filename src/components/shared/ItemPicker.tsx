@@ -51,6 +51,7 @@ import type {
   Weapon,
 } from "@/data/types";
 import { useMediaQuery } from "@/hooks/useMediaQuery";
+import { searchIds } from "@/lib/search";
 import { cn, getAssetUrl } from "@/lib/utils";
 import { Ban, Check, Search, X } from "lucide-react";
 import { memo, useCallback, useMemo, useState } from "react";
@@ -472,20 +473,27 @@ function PickerContent({
       }
     }
 
-    // 2. Search
+    // 2. Search (prebuilt EN/ZH/pinyin index, half sets are not indexed)
     if (search) {
-      const q = search.toLowerCase();
-      result = result.filter((item) => {
-        let name = "";
-        if (type === "character") name = t.character(item.id as string);
-        else if (type === "weapon") name = t.weaponName(item.id as string);
-        else if (type === "artifact" && artifactTab === "4pc")
-          name = t.artifact(item.id as string);
-        else if (type === "artifact" && artifactTab === "2pc")
-          name = t.artifactHalfSet(item.id as number);
-
-        return name?.toLowerCase().includes(q);
-      });
+      const category =
+        type === "character"
+          ? "characters"
+          : type === "weapon"
+            ? "weapons"
+            : artifactTab === "4pc"
+              ? "artifacts"
+              : null;
+      if (category) {
+        const matches = searchIds(category, search);
+        if (matches) {
+          result = result.filter((item) => matches.has(item.id as string));
+        }
+      } else {
+        const q = search.toLowerCase();
+        result = result.filter((item) =>
+          t.artifactHalfSet(item.id as number)?.toLowerCase().includes(q)
+        );
+      }
     }
 
     // 3. Quick Filters
@@ -0,0 +1,26 @@
+// This file is auto-generated by scripts/chance_tables.py
+// Do not edit this file directly
+
+import type { SubStat } from './types';
+
+// Bit i of a draw mask is substatBitOrder[i]
+export const substatBitOrder: SubStat[] = ["cr", "cd", "atk%", "hp%", "def%", "em", "er", "atk", "hp", "def"];
+
+// Every set of 4 substats an artifact can roll, as a bitmask
+export const substatDrawMasks: number[] = [15, 23, 39, 71, 135, 263, 519, 27, 43, 75, 139, 267, 523, 51, 83, 147, 275, 531, 99, 163, 291, 547, 195, 323, 579, 387, 643, 771, 29, 45, 77, 141, 269, 525, 53, 85, 149, 277, 533, 101, 165, 293, 549, 197, 325, 581, 389, 645, 773, 57, 89, 153, 281, 537, 105, 169, 297, 553, 201, 329, 585, 393, 649, 777, 113, 177, 305, 561, 209, 337, 593, 401, 657, 785, 225, 353, 609, 417, 673, 801, 449, 705, 833, 897, 30, 46, 78, 142, 270, 526, 54, 86, 150, 278, 534, 102, 166, 294, 550, 198, 326, 582, 390, 646, 774, 58, 90, 154, 282, 538, 106, 170, 298, 554, 202, 330, 586, 394, 650, 778, 114, 178, 306, 562, 210, 338, 594, 402, 658, 786, 226, 354, 610, 418, 674, 802, 450, 706, 834, 898, 60, 92, 156, 284, 540, 108, 172, 300, 556, 204, 332, 588, 396, 652, 780, 116, 180, 308, 564, 212, 340, 596, 404, 660, 788, 228, 356, 612, 420, 676, 804, 452, 708, 836, 900, 120, 184, 312, 568, 216, 344, 600, 408, 664, 792, 232, 360, 616, 424, 680, 808, 456, 712, 840, 904, 240, 368, 624, 432, 688, 816, 464, 720, 848, 912, 480, 736, 864, 928, 960];
+
+// Probability of each draw in substatDrawMasks, keyed by main stat
+// ("" for main stats that are not substats)
+export const substatDrawProbabilities: Record<string, number[]> = {
+  "": [0.001566107924, 0.001566107924, 0.001566107924, 0.001566107924, 0.002571878437, 0.002571878437, 0.002571878437, 0.001566107924, 0.001566107924, 0.001566107924, 0.002571878437, 0.002571878437, 0.002571878437, 0.001566107924, 0.001566107924, 0.002571878437, 0.002571878437, 0.002571878437, 0.001566107924, 0.002571878437, 0.002571878437, 0.002571878437, 0.002571878437, 0.002571878437, 0.002571878437, 0.004231004819, 0.004231004819, 0.004231004819, 0.002178217575, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.009715031273, 0.002178217575, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.002178217575, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.002178217575, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.003579485434, 0.003579485434, 0.003579485434, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.005892252297, 0.009715031273, 0.00303030303, 0.00303030303, 0.004982878319, 0.004982878319, 0.004982878319, 0.00303030303, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.00303030303, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.01353766203, 0.00303030303, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.01353766203, 0.004982878319, 0.004982878319, 0.004982878319, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.008207014863, 0.01353766203, 0.008207014863, 0.008207014863, 0.008207014863, 0.01353766203, 0.01353766203],
+  "cr": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003029993597, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.01391136645, 0.004232078244, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.01946965434],
+  "cd": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003029993597, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.003029993597, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.003029993597, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.005025250033, 0.005025250033, 0.005025250033, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.008352480007, 0.01391136645, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004232078244, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.004232078244, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.007024426439, 0.007024426439, 0.007024426439, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.01168341801, 0.01168341801, 0.01168341801, 0.01946965434, 0.01946965434],
+  "atk%": [0, 0, 0, 0, 0, 0, 0, 0.002434402409, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.006747378986, 0.006747378986, 0.006747378986, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004761904762, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.02215431627],
+  "hp%": [0, 0.002434402409, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0, 0, 0, 0, 0, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.006747378986, 0.006747378986, 0.006747378986, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004761904762, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.02215431627],
+  "def%": [0.002434402409, 0, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0.002434402409, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0, 0, 0, 0, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.004047952435, 0.006747378986, 0.006747378986, 0.006747378986, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0.003404224309, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0, 0, 0, 0, 0.004761904762, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0.02215431627],
+  "em": [0.002434402409, 0.002434402409, 0, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0.002434402409, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0, 0, 0, 0.004047952435, 0.004047952435, 0.004047952435, 0.006747378986, 0.006747378986, 0.006747378986, 0.003404224309, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0.003404224309, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0.003404224309, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0.01580349775, 0, 0.004761904762, 0.007932018961, 0.007932018961, 0.007932018961, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0.02215431627, 0, 0, 0, 0, 0.02215431627],
+  "er": [0.002434402409, 0.002434402409, 0.002434402409, 0, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0.002434402409, 0, 0.004047952435, 0.004047952435, 0.004047952435, 0.002434402409, 0, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0.004047952435, 0.004047952435, 0.004047952435, 0, 0, 0, 0.006747378986, 0.006747378986, 0.006747378986, 0.003404224309, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0.01580349775, 0.003404224309, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0.003404224309, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0.005665686914, 0.005665686914, 0.005665686914, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0.009451771938, 0.009451771938, 0.009451771938, 0, 0, 0, 0.01580349775, 0.004761904762, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0.02215431627, 0, 0.007932018961, 0.007932018961, 0.007932018961, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0.02215431627, 0, 0, 0, 0.01324247648, 0.01324247648, 0.01324247648, 0, 0, 0, 0.02215431627, 0, 0, 0, 0.02215431627, 0],
+  "atk": [0.003096371542, 0.003096371542, 0.003096371542, 0.003096371542, 0, 0.005188059615, 0.005188059615, 0.003096371542, 0.003096371542, 0.003096371542, 0, 0.005188059615, 0.005188059615, 0.003096371542, 0.003096371542, 0, 0.005188059615, 0.005188059615, 0.003096371542, 0, 0.005188059615, 0.005188059615, 0, 0.005188059615, 0.005188059615, 0, 0, 0.008718132258, 0.004344047488, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0.004344047488, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0.004344047488, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0.004344047488, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0, 0.007286324234, 0.007286324234, 0, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0.006096689688, 0.006096689688, 0, 0.01023628075, 0.01023628075, 0.006096689688, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0.006096689688, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0.006096689688, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0.01023628075, 0.01023628075, 0, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0, 0.01723330849, 0, 0],
+  "hp": [0.003096371542, 0.003096371542, 0.003096371542, 0.003096371542, 0.005188059615, 0, 0.005188059615, 0.003096371542, 0.003096371542, 0.003096371542, 0.005188059615, 0, 0.005188059615, 0.003096371542, 0.003096371542, 0.005188059615, 0, 0.005188059615, 0.003096371542, 0.005188059615, 0, 0.005188059615, 0.005188059615, 0, 0.005188059615, 0, 0.008718132258, 0, 0.004344047488, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0, 0.004344047488, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.004344047488, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0.007286324234, 0, 0.007286324234, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0, 0.006096689688, 0.006096689688, 0.01023628075, 0, 0.01023628075, 0.006096689688, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0.006096689688, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0.006096689688, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0.01023628075, 0, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0, 0.01723330849, 0, 0, 0],
+  "def": [0.003096371542, 0.003096371542, 0.003096371542, 0.003096371542, 0.005188059615, 0.005188059615, 0, 0.003096371542, 0.003096371542, 0.003096371542, 0.005188059615, 0.005188059615, 0, 0.003096371542, 0.003096371542, 0.005188059615, 0.005188059615, 0, 0.003096371542, 0.005188059615, 0.005188059615, 0, 0.005188059615, 0.005188059615, 0, 0.008718132258, 0, 0, 0.004344047488, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0, 0, 0.004344047488, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.004344047488, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.004344047488, 0.007286324234, 0.007286324234, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.007286324234, 0.007286324234, 0, 0.01225614888, 0, 0, 0.01225614888, 0, 0, 0, 0.006096689688, 0.006096689688, 0.01023628075, 0.01023628075, 0, 0.006096689688, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.006096689688, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0, 0.006096689688, 0.01023628075, 0.01023628075, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0, 0.01023628075, 0.01023628075, 0, 0.01723330849, 0, 0, 0.01723330849, 0, 0, 0, 0.01723330849, 0, 0, 0, 0],
+};
@@ -1,5 +1,7 @@
 import {
+  artifactHalfSetMembers as artifactHalfSetMemberIndices,
   artifactHalfSets,
+  artifactSetToHalfSet,
   artifacts,
   characters,
   elementResources,
@@ -154,13 +156,12 @@ export const artifactHalfSetsById = freezeRecord(
   )
 );
 
-export const artifactIdToHalfSetId = freezeRecord(
-  artifactHalfSets.reduce<Record<string, number>>((acc, halfSet) => {
-    for (const setId of halfSet.setIds) {
-      acc[setId] = halfSet.id;
-    }
-    return acc;
-  }, {})
+// Both lookups are generated by scripts/codedump.py alongside artifactHalfSets
+export const artifactIdToHalfSetId = freezeRecord(artifactSetToHalfSet);
+
+// Sorted indices into `artifacts` of the sets sharing each half set's 2pc effect
+export const artifactHalfSetMembers = freezeRecord(
+  artifactHalfSetMemberIndices
 );
 
 export const elementResourcesByName = freezeRecord(
@@ -1917,6 +1917,80 @@ export const artifactHalfSets: ArtifactHalfSet[] = [
   }
 ];
 
+export const artifactSetToHalfSet: Record<string, number> = {
+  "echoes_of_an_offering": 9,
+  "gladiators_finale": 9,
+  "vermillion_hereafter": 9,
+  "shimenawas_reminiscence": 9,
+  "nighttime_whispers_in_the_echoing_woods": 9,
+  "fragment_of_harmonic_whimsy": 9,
+  "unfinished_reverie": 9,
+  "a_day_carved_from_rising_winds": 9,
+  "instructor": 7,
+  "wanderers_troupe": 7,
+  "gilded_dreams": 7,
+  "flower_of_paradise_lost": 7,
+  "night_of_the_skys_unveiling": 7,
+  "aubade_of_morningstar_and_moon": 7,
+  "viridescent_venerer": 16,
+  "desert_pavilion_chronicle": 16,
+  "emblem_of_severed_fate": 15,
+  "silken_moons_serenade": 15,
+  "oceanhued_clam": 12,
+  "song_of_days_past": 12,
+  "heart_of_depth": 11,
+  "nymphs_dream": 11,
+  "bloodstained_chivalry": 10,
+  "pale_flame": 10,
+  "tenacity_of_the_millelith": 2,
+  "vourukashas_glow": 2,
+  "blizzard_strayer": 1,
+  "finale_of_the_deep_galleries": 1,
+  "long_nights_oath": 24,
+  "obsidian_codex": 23,
+  "scroll_of_the_hero_of_cinder_city": 22,
+  "golden_troupe": 21,
+  "marechaussee_hunter": 20,
+  "deepwood_memories": 19,
+  "retracing_bolide": 18,
+  "maiden_beloved": 17,
+  "crimson_witch_of_flames": 14,
+  "lavawalker": 13,
+  "noblesse_oblige": 8,
+  "archaic_petra": 6,
+  "thundersoother": 5,
+  "thundering_fury": 4,
+  "husk_of_opulent_dreams": 3
+};
+
+// Sorted indices into `artifacts` of each half set's members
+export const artifactHalfSetMembers: Record<number, number[]> = {
+  "9": [0, 8, 9, 11, 21, 22, 23, 34],
+  "7": [1, 3, 17, 18, 31, 36],
+  "16": [16, 26],
+  "15": [2, 27],
+  "12": [10, 30],
+  "11": [15, 32],
+  "10": [25, 33],
+  "2": [14, 41],
+  "1": [4, 42],
+  "24": [5],
+  "23": [6],
+  "22": [7],
+  "21": [12],
+  "20": [13],
+  "19": [19],
+  "18": [20],
+  "17": [24],
+  "14": [28],
+  "13": [29],
+  "8": [35],
+  "6": [37],
+  "5": [38],
+  "4": [39],
+  "3": [40]
+};
+
 export const weapons: Weapon[] = [
   {
     "id": "nocturnes_curtain_call",
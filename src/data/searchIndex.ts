@@ -0,0 +1,20 @@
+// This file is auto-generated by scripts/search_index.py
+// Do not edit this file directly
+
+import type { SearchCategory, SearchIndex } from './types';
+
+// Search token -> positions in ids, see src/lib/search.ts
+export const searchIndex: Record<SearchCategory, SearchIndex> = {
+  "characters": {
+    ids: ["aino", "albedo", "alhaitham", "aloy", "amber", "arataki_itto", "arlecchino", "baizhu", "barbara", "beidou", "bennett", "candace", "charlotte", "chasca", "chevreuse", "chiori", "chongyun", "citlali", "clorinde", "collei", "columbina", "cyno", "dahlia", "dehya", "diluc", "diona", "dori", "durin", "emilie", "escoffier", "eula", "faruzan", "fischl", "flins", "freminet", "furina", "gaming", "ganyu", "gorou", "hu_tao", "iansan", "ifa", "illuga", "ineffa", "jahoda", "jean", "kachina", "kaedehara_kazuha", "kaeya", "kamisato_ayaka", "kamisato_ayato", "kaveh", "keqing", "kinich", "kirara", "klee", "kujou_sara", "kuki_shinobu", "lan_yan", "lauma", "layla", "lisa", "lynette", "lyney", "mavuika", "mika", "mona", "mualani", "nahida", "navia", "nefer", "neuvillette", "nilou", "ningguang", "noelle", "ororon", "qiqi", "raiden_shogun", "razor", "rosaria", "sangonomiya_kokomi", "sayu", "sethos", "shenhe", "shikanoin_heizou", "sigewinne", "skirk", "sucrose", "tartaglia", "thoma", "tighnari", "traveler_anemo", "traveler_dendro", "traveler_electro", "traveler_geo", "traveler_hydro", "traveler_pyro", "varesa", "venti", "wanderer", "wriothesley", "xiangling", "xianyun", "xiao", "xilonen", "xingqiu", "xinyan", "yae_miko", "yanfei", "yaoyao", "yelan", "yoimiya", "yumemizuki_mizuki", "yun_jin", "zhongli", "zibai"],
+    tokens: {"a":[0,1,2,3,4,5,6,25,28,29,40,49,50,74,91],"ab":[1,4,8],"aba":[8],"abd":[1],"abe":[1],"ac":[11,46],"ace":[11],"ach":[46],"ad":[88],"ada":[88],"ae":[2,47,48,74,107],"aed":[47],"aeh":[2],"aehs":[2],"aem":[107],"aey":[48],"ag":[88],"agl":[88],"ah":[22,44,68],"ahi":[68],"ahl":[22],"aho":[44],"ai":[0,2,3,4,7,19,21,28,29,48,60,70,71,74,77,80,82,100,115],"aid":[77],"aie":[2,74],"aif":[70],"aik":[29],"ail":[3],"aim":[28],"ain":[0,21],"aio":[100],"ais":[2,82],"ait":[2,71],"aiy":[48,60],"aiz":[7],"ak":[5,29,44,47,49,80],"aka":[47,49],"ake":[44],"akf":[29],"aki":[5],"ako":[80],"al":[1,2,3,6,8,12,17,22,31,56,67,79,88,90,97],"ala":[8,67],"alb":[1],"ale":[6,97],"alh":[2],"ali":[17,22,79,88,90],"alo":[3],"alq":[6],"alqn":[6],"alu":[12,31,56],"aly":[3],"am":[2,4,28,36,49,50],"amb":[4],"ami":[36,49,50],"aml":[28],"amla":[28],"an":[0,4,5,10,11,15,17,25,31,37,38,40,45,47,54,58,67,73,77,80,84,87,91,94,99,101,102,106,108,110,112],"anb":[4],"and":[11,99],"ane":[91],"anf":[108],"ang":[5,38,54,73,77,80,84,87,99,101],"anh":[80],"ani":[67],"anj":[77],"ann":[10],"ano":[84],"anp":[84],"ans":[40],"ant":[17],"anw":[47],"any":[37,47,58,102,112],"anz":[15],"ao":[25,39,56,81,92,103,109,111],"aog":[111],"aon":[25],"aos":[56],"aoy":[81,109],"aq":[46],"aqi":[46],"ar":[5,6,8,12,31,47,54,56,79,88,90,97],"ara":[5,8,47,54,56],"arb":[8],"are":[97],"ari":[79,90],"arl":[6,12],"art":[88],"aru":[31],"as":[13,40],"asc":[13],"asi":[13],"at":[5,49,50,87],"ata":[5,87],"ato":[49,50],"au":[59],"aum":[59],"av":[51,64,69,91,92,93,94,95,96],"ave":[51,91,92,93,94,95,96],"avi":[69],"avu":[64],"aw":[14,51,59,64,69,71],"awe":[51,64,69,71],"awo":[14],"awu":[59],"ax":[68],"axi":[68],"ay":[49,50,60,81],"aya":[49,50],"ayl":[60],"ayu":[81],"az":[47,78,107],"azh":[107],"azo":[78],"azu":[47],"b":[1,4,7,8,9,10,20,107,115],"ba":[4,7,8,10,107,115],"bab":[8],"bai":[4,7,115],"bal":[8],"ban":[10],"bar":[8],"baz":[107],"bb":[8],"bbl":[8],"bd":[1,9],"be":[1,4,9,10],"bed":[1],"bei":[1,9],"ben":[10],"ber":[4],"bi":[20],"bin":[20],"biy":[20],"bl":[8],"bn":[10],"bnt":[10],"bu":[57],"by":[20],"bz":[7,107],"bzs":[107],"bzsz":[107],"c":[11,12,13,14,15,16,17,18,19,20,21,84,92],"ca":[11,13,84,92],"can":[11,84],"cao":[92],"cc":[6],"cch":[6],"ce":[11],"ch":[6,12,13,14,15,16,32,46,53],"cha":[12,13],"che":[14],"chi":[6,15,46],"chl":[32],"cho":[16],"ci":[17],"cit":[17],"cl":[18],"clo":[18],"co":[19,20,29],"cof":[29],"col":[19,20],"cr":[87],"cro":[87],"ct":[93],"ctr":[93],"cy":[21],"cyn":[21],"d":[1,5,9,11,12,18,22,23,24,25,26,27,44,68,77,88,92,98],"da":[11,22,25,44,68,88],"dac":[11],"dad":[88],"dah":[22],"dal":[88],"dan":[25],"dd":[88],"ddl":[88],"ddly":[88],"de":[18,23,47,77,92,99],"deh":[23,47],"den":[77,92],"der":[99],"di":[11,12,23,24,25,77,98],"dia":[25,77],"dil":[24],"dio":[25],"dis":[11],"dix":[23],"dj":[77],"djj":[77],"dl":[24,26,27,88],"dlk":[24],"dly":[88],"do":[1,5,9,26],"dor":[26],"dou":[5,9],"dr":[92,95],"dro":[92,95],"ds":[11],"du":[1,26,27],"dul":[27],"duo":[1,26],"dur":[27],"dx":[23],"dxy":[23],"e":[2,28,29,30,32,70,74,93],"ea":[45],"ean":[45],"ec":[6,92,93],"eca":[92],"ecc":[6],"ect":[93],"ed":[1,44,47],"eda":[44],"ede":[47],"edo":[1],"ee":[32,55],"eer":[32],"ef":[29,43,70,91],"efe":[29,70,91],"eff":[43],"efu":[43],"eh":[2,23,47,51,96],"eha":[47],"ehs":[2],"ehu":[96],"ehy":[23],"ei":[1,6,9,14,19,28,29,32,33,34,51,64,69,71,77,78,84,93,97,108],"eid":[1,9,77],"eik":[64],"eil":[28,33,71],"eim":[34],"eiq":[6],"eis":[97],"eix":[32],"eiy":[69],"eiz":[78,84],"ek":[86],"eke":[86],"el":[17,18,19,20,42,55,74,91,92,93,94,95,96,110],"ela":[17,19,110],"ele":[91,92,93,94,95,96],"eli":[55],"ell":[74],"elu":[18,20,42],"em":[28,34,91,107,112],"emi":[28,34,107,112],"emo":[91],"en":[2,10,47,49,50,57,77,83,85,91,92,98,104,107,112],"end":[92,98],"eng":[47,91,112],"enh":[83],"enl":[49,50],"enn":[10],"ens":[77],"ent":[98],"enz":[107],"eo":[94],"eq":[52],"eqi":[52],"er":[2,4,29,32,70,74,91,92,93,94,95,96,99,112],"era":[91],"erd":[92],"ere":[93,99],"erg":[94],"erh":[2,95],"erp":[96],"eru":[112],"es":[29,95,97,100],"esa":[97],"esc":[29],"esh":[95],"esl":[100],"et":[10,34,62,71,82],"eth":[82],"ett":[10,62,71],"eu":[14,30,71],"eul":[30],"eus":[14],"euv":[71],"ev":[14],"evr":[14],"ew":[85],"ewe":[85],"ewi":[85],"ey":[48,63,84,94,100],"eya":[48,94],"eyu":[84],"f":[29,31,32,33,34,35,41,43,47,70,91,108],"fa":[31,41,43],"fal":[31],"far":[31],"fe":[29,32,33,34,47,70,91,108],"fei":[29,32,33,34,108],"fen":[47,91],"fer":[70],"ff":[29,43],"ffa":[43],"ffi":[29],"fi":[29,32],"fie":[29],"fis":[32],"fl":[31,33],"fli":[33],"fls":[31,33],"fm":[34],"fmn":[34],"fn":[35],"fnn":[35],"fr":[34],"fre":[34],"fu":[35,43,70],"fue":[70],"fun":[35],"fur":[35],"fx":[32],"fxe":[32],"fy":[47],"fyw":[47],"fywy":[47],"g":[20,36,37,38,73,80,85,94,111],"ga":[36,37,42],"gam":[36],"gan":[37],"gc":[84],"gca":[84],"ge":[20,85,94],"gel":[20],"geo":[94],"gew":[85],"gg":[73],"ggu":[73],"gh":[49,90],"ghn":[90],"ghu":[49],"gj":[77,112],"gji":[112],"gju":[77],"gl":[5,20,54,88,101,114],"glb":[20],"glby":[20],"gli":[54,88,101,114],"glo":[5],"gn":[35],"gna":[35],"go":[38,80,111],"gon":[80,111],"gor":[38],"gq":[105],"gqi":[105],"gr":[50],"gre":[50],"gs":[107],"gsh":[107],"gu":[73,77],"gua":[73],"gun":[77],"gw":[85],"gx":[80],"gxh":[80],"gxi":[80],"gy":[5,16,37,47],"gyi":[5],"gyu":[16,47],"gz":[91,92,93,94,95,96,99],"gzh":[91,92,93,94,95,96,99],"h":[2,5,39,49,80,83,84,95,96],"ha":[2,12,13,31,40,47,56,61,79,80,87,97],"hai":[2,80],"hal":[56,79],"ham":[2],"han":[31,40,80],"har":[12,47],"has":[13],"hat":[87],"he":[14,49,50,83,84,91,92,93,94,95,96,99,100,107],"hec":[92],"hef":[91],"heh":[96],"hei":[84],"hel":[93],"hen":[49,50,83,107],"hes":[95,100],"hev":[14],"hey":[94],"hg":[80],"hgx":[80],"hgxh":[80],"hi":[6,15,46,57,68,84],"hid":[68],"hik":[84],"hin":[6,46,57],"hio":[15],"hl":[5,22,32],"hli":[22],"hly":[5],"hlyd":[5],"hn":[90],"hna":[90],"ho":[16,44,77,82,89,107,114],"hod":[44],"hog":[77],"hom":[89],"hon":[16,107,114],"hos":[82],"hs":[2],"ht":[39],"hu":[5,7,39,49,80,95,96],"hua":[5,49],"hug":[80],"hui":[95],"huo":[96],"hut":[39],"hy":[23,95],"hya":[23],"hyd":[95],"i":[5,40,41,42,43],"ia":[12,13,14,15,17,22,25,28,36,40,54,56,69,77,79,88,101,102,103,111,112],"iai":[28],"ial":[12],"iam":[36],"ian":[15,17,40,54,77,101,102,112],"iao":[25,56,103,111],"ias":[13],"iaw":[14],"ib":[115],"iba":[115],"ic":[53],"ich":[53],"id":[1,5,9,68,77],"ida":[68],"ide":[77],"idi":[77],"ido":[5,9],"idu":[1],"ie":[2,28,29,32,43,74],"iee":[32],"ief":[43],"ier":[2,29,74],"if":[41,70],"ifa":[41],"ifu":[70],"ig":[85,90],"ige":[85],"igh":[90],"ii":[5],"iit":[5],"ik":[13,29,64,65,84,86,107],"ika":[13,64,65,84],"ike":[29,86],"iko":[107],"il":[3,24,28,33,42,49,50,54,60,71,72,100,104],"ila":[60,71],"ili":[28,33,49,50,54,100],"ill":[42,71],"ilo":[72,104],"ilu":[3,24,72],"im":[28,34,111,112],"ime":[28],"imi":[34,111,112],"in":[0,6,18,20,21,27,33,34,35,36,43,45,46,49,50,52,53,57,62,63,73,80,84,85,90,91,92,93,94,95,96,101,104,105,106,113],"ina":[20,35,46,90],"ind":[18],"ine":[34,43],"ing":[35,36,49,50,52,73,84,91,92,93,94,95,96,101,104,105],"inh":[80,84],"ini":[34,43,53],"inn":[62,63,85],"ino":[0,6,57],"ins":[33],"inu":[0,6,21,104],"iny":[106],"io":[15,25,100],"ion":[25],"ior":[15],"iot":[100],"iou":[100],"iq":[6,53,76],"iqi":[6,53,76],"ir":[54,57,86],"ira":[54],"ire":[57],"irk":[86],"is":[2,11,32,49,50,57,61,82,97],"isa":[49,50,61],"isc":[32],"ise":[2],"ish":[57,61,97],"isi":[11],"isu":[82],"it":[2,5,10,17,62,71],"ite":[10,62,71],"ith":[2],"itl":[17],"itt":[5],"iu":[56,57,99,105],"iul":[99],"iuq":[57],"iut":[56],"ix":[23,32,112],"ixi":[23,32,112],"iy":[20,22,23,48,60,69,79,80,88,111],"iya":[20,22,23,48,69,79,80,88,111],"iyi":[60],"iz":[7,78,84,112],"ize":[78],"izh":[7],"izo":[84],"izu":[112],"j":[36,44,45,53,56,57,77,112,113],"ja":[44],"jah":[44],"je":[45],"jea":[45],"ji":[36,53,56,57,77,112,113],"jia":[36,77,112],"jin":[53,113],"jiu":[56,57],"jj":[77],"jm":[36],"jn":[53],"jnq":[53],"jo":[56],"jou":[56],"jq":[57],"jqr":[57],"jt":[56],"jts":[56],"jtsl":[56],"ju":[77],"jun":[77],"jy":[112],"jyr":[112],"jyrx":[112],"k":[11,13,18,19,24,29,44,46,47,48,49,50,51,52,53,54,55,56,57,64,65,80,86],"ka":[11,13,46,47,48,49,50,51,64,65,84],"kac":[46],"kae":[47,48],"kai":[48],"kam":[49,50],"kan":[11,84],"kaq":[46],"kav":[51],"kaw":[51],"kaz":[47],"kd":[11,44],"kds":[11],"ke":[18,19,24,29,44,52,55,86],"ked":[44],"kef":[29],"kek":[86],"kel":[18,19,55],"keq":[52],"kf":[29],"ki":[5,53,54,57,86,112],"kii":[5],"kim":[112],"kin":[53],"kir":[54,86],"kis":[57],"kk":[86],"kl":[18,19,55],"kle":[55],"kll":[18],"klld":[18],"ko":[80,107],"kok":[80],"kom":[80],"kq":[46,52],"kqn":[46],"ku":[56,57],"kuj":[56],"kuk":[57],"kw":[51],"ky":[48],"l":[3,5,6,8,12,14,17,18,19,20,22,24,26,27,28,30,31,33,38,42,49,50,54,55,56,58,59,60,61,62,63,67,71,72,75,77,78,79,84,88,90,91,92,93,94,95,96,97,99,100,101,110,114],"la":[8,17,19,28,30,38,58,59,60,67,71,99,100,110],"lai":[19,60,71,100],"lal":[17],"lan":[38,58,67,99,110],"lau":[59],"law":[59],"lay":[60],"lb":[1,20],"lbe":[1],"lby":[20],"ld":[12,18,77],"ldj":[77],"ldjj":[77],"le":[6,14,19,55,71,74,77,78,91,92,93,94,95,96,97,100],"lec":[6,93],"lee":[55],"lei":[6,14,19,77,78,93,97],"ler":[91,92,93,94,95,96],"let":[71],"ley":[100],"lh":[2,49],"lha":[2],"li":[17,18,22,26,27,28,33,49,50,54,55,61,62,63,79,88,90,99,100,101,114],"lia":[22,28,54,88],"lie":[28],"lil":[49,50],"lin":[18,27,33,49,50,62,63,101],"lis":[61],"liu":[99],"liy":[22,79,88],"lk":[24],"ll":[17,18,19,42,49,50,54,71,74,75,99],"lld":[18],"lle":[19,71,74],"llh":[49],"llr":[50],"llu":[42],"llz":[99],"ln":[62,63,67],"lnt":[62],"lo":[3,5,12,18,72,100,104],"lon":[5,104],"lor":[18],"los":[100],"losl":[100],"lot":[12],"lou":[72],"loy":[3],"lq":[6],"lqn":[6],"lr":[50],"ls":[31,33,61,79,97],"lsl":[79],"lsly":[79],"lt":[71],"lu":[3,12,18,20,24,31,42,56,72,75,79,84],"luc":[24],"lug":[42],"luk":[24],"lum":[20],"lun":[20,75],"luo":[3,12,18,42,56,75,79],"lus":[31],"luy":[84],"lv":[91,92,93,94,95,96],"lvx":[91,92,93,94,95,96],"lw":[59],"lwm":[59],"lx":[91,92,93,94,95,96],"lxz":[91,92,93,94,95,96],"lxzc":[92],"lxzf":[91],"lxzh":[96],"lxzl":[93],"lxzs":[95],"lxzy":[94],"ly":[3,5,22,42,58,60,62,63,79,84,88],"lyd":[5],"lyl":[60],"lyn":[62,63],"lyy":[84],"lyyp":[84],"lyypc":[84],"lz":[78,99],"m":[28,34,36,59,64,65,66,67,89,107,112],"ma":[59,64,67,89],"mal":[67],"mav":[64],"maw":[64],"mb":[4,20],"mbe":[4],"mbi":[20],"me":[28,112],"mei":[28],"mem":[112],"men":[112],"mi":[28,34,36,49,50,65,80,107,111,112],"mik":[65,107],"mil":[28],"min":[34,36],"mis":[49,50],"miy":[80,111],"miz":[112],"mj":[112],"mjy":[112],"mjyr":[112],"mjyrx":[112],"mk":[65],"ml":[28,67],"mla":[28],"mln":[67],"mn":[34,66],"mo":[66,91],"mon":[66],"mu":[67],"mua":[67],"mw":[64],"mwk":[64],"n":[0,6,10,21,25,34,35,43,46,53,62,63,66,67,68,69,70,71,72,73,74,90,104],"na":[20,25,35,46,66,68,69,70,71,74,90],"nae":[74],"nah":[68],"nai":[70],"nal":[90],"nar":[90],"nav":[69],"naw":[69,71],"nax":[68],"nb":[4,20],"nba":[4],"nbi":[20],"nd":[11,18,92,98,99],"nda":[11],"nde":[18,99],"ndi":[11,98],"ndr":[92],"ne":[10,34,43,62,63,70,71,85,91,104],"nef":[43,70],"nem":[91],"nen":[104],"net":[10,34,62],"neu":[71],"ney":[63],"nf":[43,70,108],"nfe":[70,108],"ng":[5,16,35,36,38,47,49,50,52,54,73,77,80,84,87,91,92,93,94,95,96,99,101,104,105,107,111,112,114],"ngc":[84],"ngg":[73],"ngh":[49],"ngj":[77,112],"ngl":[5,54,101,114],"ngn":[35],"ngo":[80],"ngq":[105],"ngr":[50],"ngs":[107],"ngx":[80],"ngy":[5,16,47],"ngz":[91,92,93,94,95,96,99],"nh":[80,83,84],"nha":[80],"nhe":[83,84],"nhu":[80],"ni":[10,34,35,43,53,62,63,67,72,73,104],"nic":[53],"nie":[43],"nil":[72],"nin":[35,73,104],"niq":[53],"nit":[10,62],"nj":[77,113],"nji":[77,113],"nl":[49,50,72,90],"nli":[49,50],"nn":[10,35,62,63,85,104],"nne":[10,85],"nni":[10,62,63],"no":[0,6,21,57,74,80,84],"nob":[57],"noe":[74],"noi":[84],"nom":[80],"np":[84],"npi":[84],"nq":[53],"ns":[33,40,77],"nsa":[40],"nsh":[40,77],"nsi":[33],"nt":[10,17,62,98],"nte":[17],"nti":[98],"nu":[0,6,21,74,104],"nuo":[0,6,21,74,104],"nw":[47,69,71],"nwa":[47],"nwl":[71],"nwlt":[71],"nwy":[69],"nx":[68],"nxd":[68],"ny":[37,47,58,102,106,112],"nya":[58,106],"nye":[47],"nyu":[37,102,112],"nz":[15,107],"nzh":[15],"nzi":[107],"o":[75,100],"oa":[49,50,74],"oai":[74],"oay":[49,50],"ob":[57],"obu":[57],"od":[12,44],"oda":[44],"odi":[12],"oe":[74],"oel":[74],"of":[29],"off":[29],"og":[77,111],"ogo":[111],"ogu":[77],"oi":[84,111],"oim":[111],"oin":[84],"ok":[80],"oko":[80],"ol":[14,18,19,20,26,75],"ole":[14],"oli":[18,26],"oll":[19,75],"olu":[20,75],"om":[80,89],"oma":[89],"omi":[80],"on":[5,16,25,66,75,80,104,107,111,114],"ona":[25,66],"one":[104],"ong":[5,16,80,107,111,114],"oni":[104],"ono":[80],"or":[15,18,26,38,75,78],"ori":[15,18,26],"oro":[38,75],"os":[56,79,82,87,100],"osa":[79],"ose":[87],"osh":[56,79],"osi":[82],"osl":[100],"ot":[12,100],"oth":[100],"ott":[12],"ou":[5,9,30,38,56,72,75,81,84,100],"oul":[30,75],"ous":[56,100],"oy":[3,42,81,109],"oya":[42,109],"oyi":[3],"oyo":[81],"p":[84,96],"pc":[84],"pi":[84],"pin":[84],"py":[96],"pyr":[96],"q":[6,13,15,17,45,46,52,53,54,57,76,105],"qi":[6,13,15,17,45,46,52,53,54,57,76,105],"qia":[13,15,17],"qil":[54],"qin":[6,45,46,52],"qiq":[76],"qir":[57],"qiu":[105],"ql":[54],"qll":[54],"qn":[6,46],"qq":[76],"qr":[57],"qs":[13],"qsk":[13],"qt":[17],"qtl":[17],"qtll":[17],"qz":[15],"r":[50,57,77,78,79,112],"ra":[5,8,47,54,56,77,78,91,92,93,94,95,96],"rai":[77],"rak":[47],"ran":[91],"rar":[54],"rat":[5],"rav":[91,92,93,94,95,96],"raz":[78],"rb":[8],"rba":[8],"rd":[92],"rde":[92],"re":[14,34,50,57,93,97,99],"rel":[93],"rem":[34],"ren":[50,57],"rer":[99],"res":[97],"reu":[14],"rg":[94],"rge":[94],"rh":[2,95],"rha":[2],"rhy":[95],"ri":[15,18,26,27,35,79,90,100],"ria":[79],"rin":[18,27,35],"rio":[100],"rk":[86],"rl":[6,12],"rle":[6],"rlo":[12],"ro":[38,75,79,87,92,93,95,96],"ron":[75],"ror":[75],"ros":[79,87],"rou":[38],"rp":[96],"rpy":[96],"rt":[88],"rta":[88],"ru":[31,112],"rui":[112],"ruz":[31],"rx":[112],"s":[2,11,13,21,31,33,40,49,50,56,57,61,77,79,80,81,82,83,84,85,86,87,95,97,100,107],"sa":[21,40,49,50,56,61,79,80,81,82,97],"sai":[21,82],"san":[40,80],"sar":[56,79],"sat":[49,50],"say":[81],"sc":[13,29,32],"sca":[13],"sch":[32],"sco":[29],"se":[2,14,82,87],"sen":[2],"set":[82],"sh":[31,40,49,50,56,57,61,77,79,80,83,84,87,95,97,107],"sha":[31,40,56,61,79,80,87,97],"she":[49,50,83,107],"shg":[80],"shgx":[80],"shgxh":[80],"shi":[57,84],"sho":[77],"shu":[95],"si":[11,13,33,82,85,86,100],"sig":[85],"sik":[13,86],"sil":[100],"sk":[13,86],"ski":[86],"skk":[86],"sl":[49,50,56,79,100],"sle":[100],"sll":[49,50],"sllh":[49],"sllr":[50],"sly":[79],"sn":[21],"ss":[82],"sss":[82],"st":[87],"su":[82,87],"suc":[87],"suo":[82],"sz":[107],"t":[10,17,22,39,56,62,71,87,88,89,90,91,92,93,94,95,96],"ta":[5,22,39,87,88],"tag":[88],"tak":[5],"tal":[22],"tan":[87],"tao":[39],"tar":[88],"te":[10,12,17,62,71],"tel":[17],"th":[2,82,89,100],"tha":[2],"the":[100],"tho":[82,89],"ti":[56,90,98],"tia":[56],"tig":[90],"tin":[90],"tl":[17,22],"tla":[17],"tll":[17],"tly":[22],"tm":[89],"tn":[90],"tnl":[90],"to":[5,49,50],"toa":[49,50],"tr":[91,92,93,94,95,96],"tra":[91,92,93,94,95,96],"tro":[93],"ts":[56],"tsl":[56],"tt":[5,10,12,62,71],"tte":[12,62,71],"tto":[5],"tu":[89],"tuo":[89],"ua":[5,47,49,67,73,84],"ual":[67],"uan":[5,47,73,84],"uc":[24,87],"ucr":[87],"ue":[70,112],"uer":[70,112],"ug":[42,80],"uga":[42],"ugo":[80],"uh":[47],"uha":[47],"ui":[64,95,112],"uik":[64],"uix":[112],"uj":[56],"ujo":[56],"uk":[24,57,112],"uke":[24],"uki":[57,112],"ul":[27,30,38,75,99],"ula":[30,38,99],"uli":[27],"ulu":[75],"um":[20,59,112],"uma":[59],"umb":[20],"ume":[112],"un":[16,20,35,75,77,102,113],"unb":[20],"uni":[35],"unj":[113],"uo":[0,1,3,6,12,18,21,26,42,56,74,75,79,82,89,96,104],"uoa":[74],"uod":[12],"uol":[18,26,75],"uom":[89],"uon":[104],"uos":[79,82],"uoy":[3,42],"uq":[57],"uqi":[57],"ur":[27,35],"uri":[27,35],"us":[14,31,56,100],"usa":[56],"use":[14],"ush":[31],"usi":[100],"ut":[39,56],"uta":[39],"uti":[56],"uv":[71],"uvi":[71],"uy":[84],"uye":[84],"uz":[31],"uza":[31],"v":[97,98],"va":[97],"var":[97],"ve":[51,91,92,93,94,95,96,98],"veh":[51],"vel":[91,92,93,94,95,96],"ven":[98],"vi":[69,71],"via":[69],"vil":[71],"vr":[14],"vre":[14],"vu":[64],"vui":[64],"vx":[91,92,93,94,95,96],"vxi":[91,92,93,94,95,96],"w":[14,38,47,51,59,64,69,71,85,97,98,99,100],"wa":[47,97,99],"wal":[97],"wan":[47,99],"wd":[98],"we":[51,64,69,71,85,98],"wei":[51,64,69,71],"wen":[85,98],"wi":[85],"win":[85],"wk":[64],"wl":[14,38,71,97],"wls":[97],"wlt":[71],"wm":[59],"wo":[14],"wol":[14],"wr":[100],"wri":[100],"wu":[38,59],"wul":[38],"wum":[59],"wy":[47,69],"x":[12,14,23,32,68,80,85,91,92,93,94,95,96,101,102,103,104,105,106,111,112],"xd":[68],"xe":[32],"xg":[85,111],"xgw":[85],"xh":[80],"xi":[12,14,23,32,68,80,85,91,92,93,94,95,96,101,102,103,104,105,106,111,112],"xia":[12,14,101,102,103,111],"xid":[68],"xie":[32],"xig":[85],"xil":[104],"xin":[80,91,92,93,94,95,96,104,105,106],"xiy":[23],"xl":[12,101],"xld":[12],"xn":[104],"xnn":[104],"xq":[105],"xw":[14],"xwl":[14],"xy":[23,102,106],"xz":[91,92,93,94,95,96],"xzc":[92],"xzf":[91],"xzh":[96],"xzl":[93],"xzs":[95],"xzy":[94],"y":[3,5,16,20,22,23,30,37,40,41,42,43,44,47,48,58,60,69,79,81,84,88,94,102,106,107,108,109,110,111,112,113],"ya":[20,22,23,40,42,44,48,49,50,58,69,79,80,88,94,106,107,108,109,111],"yae":[107],"yak":[44,49,80],"yan":[58,94,106,108],"yao":[109],"yas":[40],"yat":[50],"yd":[5,95],"ydr":[95],"ye":[42,47,84,110],"yel":[42,110],"yey":[84],"yf":[41,108],"yi":[3,5,40,41,43,60],"yia":[40],"yid":[5],"yif":[41],"yil":[60],"yin":[43],"yj":[113],"yk":[44],"ykd":[44],"yl":[30,42,60,110],"yla":[60],"yly":[42],"yn":[21,43,62,63],"yne":[62,63],"ynf":[43],"yno":[21],"yo":[30,81,111],"yoi":[111],"you":[30,81],"yp":[84],"ypc":[84],"yr":[96,112],"yro":[96],"yrx":[112],"yu":[16,37,47,81,84,102,112,113],"yua":[47,84],"yue":[112],"yum":[112],"yun":[16,102,113],"yw":[47],"ywy":[47],"yy":[84,109],"yyp":[84],"yypc":[84],"z":[7,15,16,78,81,91,92,93,94,95,96,99,107,114,115],"za":[31,81],"zan":[31],"zao":[81],"zb":[115],"zc":[92],"ze":[78],"zf":[91],"zh":[7,15,16,91,92,93,94,95,96,99,107,114],"zhe":[91,92,93,94,95,96,99],"zhi":[15],"zho":[16,107,114],"zhu":[7],"zi":[107,115],"zib":[115],"zl":[93,114],"zo":[78,84],"zor":[78],"zou":[84],"zs":[95,107],"zsz":[107],"zu":[47,112],"zuh":[47],"zuk":[112],"zy":[16,81,94],"一":[5],"一斗":[5],"七":[76],"七七":[76],"万":[47],"万叶":[47],"丝":[11,86],"丝柯":[86],"丽":[61],"丽莎":[61],"久":[57],"久岐":[57],"乌":[59],"乌玛":[59],"九":[56],"九条":[56],"云":[16,102,113],"云堇":[113],"五":[38],"五郎":[38],"亚":[42,48,79,88],"人":[50],"伊":[3,40,41,43],"伊安":[40],"伊法":[41],"伊涅":[43],"优":[30],"优菈":[30],"伦":[20,75],"伦比":[20],"依":[60],"依拉":[60],"光":[73],"克":[18,24,86],"克洛":[18],"八":[107],"八重":[107],"兰":[110],"兹":[115],"兹白":[115],"军":[77],"凝":[73],"凝光":[73],"凯":[48],"凯亚":[48],"利":[22,88,100],"利亚":[88],"利雅":[22],"刻":[52],"刻晴":[52],"北":[9],"北斗":[9],"千":[15],"千织":[15],"华":[49],"卡":[13,46,51,64,65],"卡维":[51],"卡齐":[46],"卢":[24],"卢克":[24],"原":[47],"原万":[47],"可":[29,55],"可莉":[55],"可菲":[29],"叶":[42,47],"叶洛":[42],"哥":[20],"哥伦":[20],"嘉":[36],"嘉明":[36],"坎":[11],"坎蒂":[11],"埃":[3,28],"埃洛":[3],"基":[53],"基尼":[53],"堇":[113],"塔":[22],"塔利":[22],"夏":[12,14],"夏沃":[14],"夏洛":[12],"多":[1,26],"多莉":[26],"夜":[110],"夜兰":[110],"奇":[6,53],"奇诺":[6],"奈":[70],"奈芙":[70],"奥":[25],"奥娜":[25],"妮":[62,67,72],"妮特":[62],"妮露":[72],"妲":[68],"娅":[20,69],"娜":[25,35,46,66,69],"娜维":[69],"子":[107],"宁":[35,104],"宁娜":[35],"安":[4,40],"安柏":[4],"安珊":[40],"宫":[80,111],"宫心":[80],"宵":[111],"宵宫":[111],"将":[77],"将军":[77],"尔":[2,32,70,74],"尔海":[2],"尼":[10,34,53,63],"尼奇":[53],"尼特":[10],"岐":[57],"岐忍":[57],"岩":[94],"希":[23,85,104,112],"希格":[85],"希诺":[104],"希雅":[23],"平":[84],"平藏":[84],"德":[18],"心":[80],"心海":[80],"忍":[57],"恰":[13],"恰斯":[13],"托":[89],"托马":[89],"拉":[8,60,67],"拉妮":[67],"提":[90],"提纳":[90],"斗":[5,9],"斯":[13,33,82,100],"斯利":[100],"斯卡":[13],"旅":[91,92,93,94,95,96],"旅行":[91,92,93,94,95,96],"早":[81],"早柚":[81],"明":[36],"晴":[52],"月":[112],"月瑞":[112],"术":[7],"杜":[27],"杜林":[27],"条":[56],"条裟":[56],"林":[27,33,63],"林尼":[63],"林斯":[33],"枫":[47],"枫原":[47],"柏":[4],"柚":[81],"柯":[19,86],"柯克":[86],"柯莱":[19],"格":[85],"格雯":[85],"桃":[39],"梅":[28],"梅莉":[28],"梦":[112],"梦见":[112],"森":[2],"欧":[75,100],"欧斯":[100],"欧洛":[75],"比":[20],"比娅":[20],"水":[95],"沃":[14],"沃蕾":[14],"法":[41],"泷":[5],"泷一":[5],"泽":[78],"洛":[3,12,18,42,75],"洛亚":[42],"洛伊":[3],"洛伦":[75],"洛琳":[18],"洛蒂":[12],"流":[99],"流浪":[99],"浪":[99],"浪者":[99],"海":[2,80],"海森":[2],"涅":[43],"涅芙":[43],"温":[98],"温迪":[98],"火":[96],"烟":[108],"烟绯":[108],"焱":[106],"爱":[0,29],"爱可":[29],"爱诺":[0],"特":[10,17,62,71],"特菈":[17],"玛":[59,64,67],"玛拉":[67],"玛薇":[64],"珂":[44],"珂达":[44],"珊":[31,40,80],"珊瑚":[80],"珐":[31],"珐露":[31],"班":[10],"班尼":[10],"琳":[18,62],"琳妮":[62],"琳德":[18],"琴":[45],"瑚":[80],"瑚宫":[80],"瑞":[112],"瑞希":[112],"瑶":[109],"瑶瑶":[109],"瓦":[97],"瓦雷":[97],"甘":[37],"甘雨":[37],"申":[83],"申鹤":[83],"电":[77],"电将":[77],"白":[7,115],"白术":[7],"砂":[87],"砂糖":[87],"砚":[58],"神":[49,50,107],"神子":[107],"神里":[49,50],"离":[114],"秋":[105],"米":[34,65],"米卡":[65],"米尼":[34],"糖":[87],"索":[82],"索斯":[82],"纳":[68,90],"纳西":[68],"纳里":[90],"织":[15],"绫":[49,50],"绫人":[50],"绫华":[49],"绮":[54],"绮良":[54],"绯":[108],"维":[51,69,71],"维娅":[69],"维莱":[71],"罗":[56,79],"罗莎":[79],"者":[91,92,93,94,95,96,99],"者岩":[94],"者水":[95],"者火":[96],"者草":[92],"者雷":[93],"者风":[91],"胡":[39],"胡桃":[39],"良":[54],"良良":[54],"艾":[2,28,74],"艾尔":[2,74],"艾梅":[28],"芙":[35,43,70],"芙宁":[35],"芙尔":[70],"芭":[8],"芭拉":[8],"芭芭":[8],"茜":[17],"茜特":[17],"草":[92],"荒":[5],"荒泷":[5],"莉":[17,26,28,55,79],"莉亚":[79],"莉埃":[28],"莎":[61,79,97],"莎莉":[79],"莫":[66],"莫娜":[66],"莱":[19,60,71,100],"莱依":[60],"莱欧":[100],"莱特":[71],"菈":[17,30,59],"菈乌":[59],"菈莉":[17],"菱":[101],"菲":[29,32,33,34],"菲林":[33],"菲米":[34],"菲谢":[32],"蒂":[11,12],"蒂丝":[11],"蓝":[58],"蓝砚":[58],"蕾":[6,14],"蕾奇":[6],"薇":[64],"薇卡":[64],"藏":[84],"行":[91,92,93,94,95,96,105],"行秋":[105],"行者":[91,92,93,94,95,96],"裟":[56],"裟罗":[56],"西":[68],"西妲":[68],"见":[112],"见月":[112],"诺":[0,6,21,74,104],"诺宁":[104],"诺艾":[74],"谢":[32],"谢尔":[32],"贝":[1],"贝多":[1],"赛":[21,82],"赛索":[82],"赛诺":[21],"辛":[106],"辛焱":[106],"达":[44,88],"达利":[88],"达达":[88],"迪":[23,24,25,98],"迪卢":[24],"迪奥":[25],"迪希":[23],"那":[71],"那维":[71],"郎":[38],"里":[49,50,90],"里绫":[49,50],"重":[16,107],"重云":[16],"重神":[107],"野":[84],"野院":[84],"钟":[114],"钟离":[114],"闲":[102],"闲云":[102],"阿":[1,6],"阿蕾":[6],"阿贝":[1],"院":[84],"院平":[84],"雅":[22,23,44],"雅珂":[44],"雨":[37],"雯":[85],"雷":[77,78,93,97],"雷泽":[78],"雷电":[77],"雷莎":[97],"露":[31,72],"露珊":[31],"风":[91],"香":[101],"香菱":[101],"马":[89],"魈":[103],"鹤":[83],"鹿":[84],"鹿野":[84],"齐":[46],"齐娜":[46]},
+  },
+  "weapons": {
+    ids: ["a_thousand_blazing_suns", "a_thousand_floating_dreams", "absolution", "akuoumaru", "alley_hunter", "amenoma_kageuchi", "amos_bow", "aqua_simulacra", "aquila_favonia", "ashgraven_drinking_horn", "astral_vultures_crimson_plumage", "athame_artis", "azurelight", "ballad_of_the_boundless_blue", "ballad_of_the_fjords", "beacon_of_the_reed_sea", "black_tassel", "blackcliff_agate", "blackcliff_longsword", "blackcliff_pole", "blackcliff_slasher", "blackcliff_warbow", "blackmarrow_lantern", "bloodsoaked_ruins", "bloodtainted_greatsword", "calamity_of_eshu", "calamity_queller", "cashflow_supervision", "chain_breaker", "cinnabar_spindle", "cloudforged", "compound_bow", "cool_steel", "cranes_echoing_call", "crescent_pike", "crimson_moons_semblance", "dark_iron_sword", "dawning_frost", "deathmatch", "debate_club", "dialogues_of_the_desert_sages", "dodoco_tales", "dragons_bane", "dragonspine_spear", "earth_shaker", "elegy_for_the_end", "emerald_orb", "end_of_the_line", "engulfing_lightning", "etherlight_spindlelute", "everlasting_moonglow", "eye_of_perception", "fading_twilight", "fang_of_the_mountain_king", "favonius_codex", "favonius_greatsword", "favonius_lance", "favonius_sword", "favonius_warbow", "ferrous_shadow", "festering_desire", "fillet_blade", "finale_of_the_deep", "flameforged_insight", "fleuve_cendre_ferryman", "flowerwreathed_feathers", "flowing_purity", "flute_of_ezpitzal", "footprint_of_the_rainbow", "forest_regalia", "fractured_halo", "freedomsworn", "frostbearer", "fruit_of_fulfillment", "fruitful_hook", "hakushin_ring", "halberd", "hamayumi", "haran_geppaku_futsu", "harbinger_of_dawn", "hunters_path", "ibis_piercer", "iron_sting", "jadefalls_splendor", "kagotsurube_isshin", "kaguras_verity", "katsuragikiri_nagamasa", "key_of_khajnisut", "kings_squire", "kitain_cross_spear", "light_of_foliar_incision", "lions_roar", "lithic_blade", "lithic_spear", "lost_prayer_to_the_sacred_winds", "lumidouce_elegy", "luxurious_sealord", "magic_guide", "mailed_flower", "makhaira_aquamarine", "mappa_mare", "master_key", "memory_of_dust", "messenger", "missive_windspear", "mistsplitter_reforged", "mitternachts_waltz", "moonpiercer", "moonweavers_dawn", "mountainbracing_bolt", "mouuns_moon", "nightweavers_looking_glass", "nocturnes_curtain_call", "oathsworn_eye", "otherworldly_story", "peak_patrol_song", "polar_star", "portable_power_saw", "predator", "primordial_jade_cutter", "primordial_jade_wingedspear", "prospectors_drill", "prospectors_shovel", "prototype_amber", "prototype_archaic", "prototype_crescent", "prototype_rancour", "prototype_starglitter", "rainbow_serpents_rain_bow", "rainslasher", "range_gauge", "raven_bow", "recurve_bow", "redhorn_stonethresher", "reliquary_of_truth", "rightful_reward", "ring_of_yaxche", "royal_bow", "royal_greatsword", "royal_grimoire", "royal_longsword", "royal_spear", "rust", "sacrificers_staff", "sacrificial_bow", "sacrificial_fragments", "sacrificial_greatsword", "sacrificial_jade", "sacrificial_sword", "sapwood_blade", "scion_of_the_blazing_sun", "sequence_of_solitude", "serenitys_call", "serpent_spine", "sharpshooters_oath", "silvershower_heartstrings", "skyrider_greatsword", "skyrider_sword", "skyward_atlas", "skyward_blade", "skyward_harp", "skyward_pride", "skyward_spine", "slingshot", "snare_hook", "snowtombed_starsilver", "solar_pearl", "song_of_broken_pines", "song_of_stillness", "splendor_of_tranquil_waters", "staff_of_homa", "staff_of_the_scarlet_sands", "starcallers_watch", "sturdy_bone", "summit_shaper", "sunny_morning_sleepin", "surfs_up", "sword_of_descension", "sword_of_narzissenkreuz", "symphonist_of_scents", "talking_stick", "tamayuratei_no_ohanashi", "the_alley_flash", "the_bell", "the_black_sword", "the_catch", "the_daybreak_chronicles", "the_dockhands_assistant", "the_first_great_magic", "the_flute", "the_stringless", "the_unforged", "the_viridescent_hunt", "the_widsith", "thrilling_tales_of_dragon_slayers", "thundering_pulse", "tidal_shadow", "tome_of_the_eternal_flow", "toukabou_shigure", "travelers_handy_sword", "tulaytullahs_remembrance", "twin_nephrite", "ultimate_overlords_mega_magic_sword", "uraku_misugiri", "verdict", "vivid_notions", "vortex_vanquisher", "wandering_evenstar", "wavebreakers_fin", "waveriding_whirl", "white_iron_greatsword", "white_tassel", "whiteblind", "windblume_ode", "wine_and_song", "wolffang", "wolfs_gravestone", "xiphos_moonlight"],
+    tokens: {"a":[0,1,2,3,4,5,6,7,8,9,10,11,12,17,36,99,123,124,158,161,182,187,214],"aa":[99],"aaq":[99],"ab":[2,29,117,198],"aba":[29],"abl":[117],"abo":[198],"abs":[2],"ac":[7,15,16,17,18,19,20,21,22,70,94,106,109,143,144,145,146,147,148,184],"ach":[106],"aci":[109],"ack":[16,17,18,19,20,21,22,184],"aco":[15],"acr":[7,94,143,144,145,146,147,148],"act":[70],"ad":[5,13,14,52,59,61,83,92,99,119,120,147,149,159,196,197,200],"ada":[5],"ade":[61,83,92,99,119,120,147,149,159,200],"adi":[52,197],"ado":[13,14,59,196],"ae":[106],"aer":[106],"af":[8,143,170,171,198],"afa":[8,198],"aff":[143,170,171],"ag":[5,10,17,40,42,43,84,85,86,97,145,188,194,202],"aga":[17,86],"age":[5,10,40],"agi":[86,97,188,202],"agm":[145],"ago":[42,43,84,194],"agu":[85],"ah":[99,200],"aha":[99],"ahs":[200],"ai":[15,24,26,28,53,62,68,75,78,89,90,96,98,99,100,109,112,116,124,128,129,155,167,200,204,205,210,211,212],"aic":[75,124],"aid":[200,204],"aih":[96],"aij":[78],"ail":[98,99],"ain":[24,28,53,68,89,109,112,128,129],"air":[99],"ait":[100,210],"aix":[15,116,167,205],"aiy":[62,90,155,211,212],"aj":[55,87,88,138,146,201,210],"aji":[55,88,138,146,201,210],"ajn":[87],"ak":[3,5,23,28,44,75,78,99,115,186,203,208],"aka":[5],"akc":[186],"ake":[23,28,44,208],"akh":[99],"akp":[115],"aku":[3,75,78,203],"al":[4,10,13,14,25,26,33,40,41,42,46,62,67,69,70,76,83,91,96,106,112,119,120,137,138,139,140,141,144,145,146,147,148,152,166,172,180,182,194,196,197],"ala":[25,26],"alb":[76,137,144],"ald":[46],"ale":[41,62,194],"alf":[145,197],"alg":[138,139,146],"ali":[42,69,91,166],"alj":[119,120,147],"alk":[180],"all":[4,13,14,33,83,112,140,152,172,182],"alo":[40,70,96],"als":[141,148,196],"alt":[106],"alu":[139],"alv":[10],"am":[1,5,6,11,25,26,63,77,86,99,100,123,181,188,202],"ama":[77,86,99,100,181,202],"amb":[123],"ame":[5,11,63],"ami":[25,26],"amo":[6,188],"ams":[1,6],"amsz":[6],"amszg":[6],"an":[0,1,3,4,5,8,9,12,13,14,16,17,18,19,20,21,22,23,24,27,28,29,31,33,35,36,37,38,40,42,43,44,45,48,49,53,54,55,56,57,59,60,62,64,69,70,71,73,75,78,79,81,86,87,88,89,90,92,93,94,95,96,100,101,105,107,109,111,112,115,117,119,120,121,125,126,127,128,130,132,136,137,138,140,141,142,143,145,146,148,149,150,153,155,156,157,158,159,160,161,162,163,164,165,167,169,170,171,172,173,176,177,178,179,180,181,182,183,184,187,189,190,191,192,193,194,195,196,197,198,199,200,202,203,204,205,206,207,208,209,210,211,212,214,215,216,217],"ana":[181],"anc":[18,19,35,56,81,93,126,200],"and":[0,1,20,27,40,44,94,156,171,187,199,207,214],"ane":[33,42],"anf":[17,115],"ang":[0,3,4,9,12,14,16,18,19,21,23,29,31,37,38,43,48,49,53,56,69,70,71,78,86,88,90,92,93,95,96,100,105,111,130,137,140,141,142,143,145,150,163,164,165,167,170,171,172,173,176,177,179,180,182,187,192,193,196,198,202,207,208,209,211,214,215,216,217],"anh":[23,206],"anj":[111,119,121],"ank":[158,159,160,161,162],"anl":[208],"anm":[5,149],"ann":[101],"anq":[132,169,203,206],"ans":[89,178,197],"ant":[22,36,121,187],"anw":[53,187],"anx":[4,117,182,207,214],"any":[0,1,78,92,93,107,112,119,125,126,157],"anz":[13,14,20,21,45,62,73,81,86,87,96,109,121,136,145,195],"ao":[0,5,9,12,15,20,48,51,61,76,84,87,97,101,122,133,135,149,152,161,180,186,194,201,202],"aob":[9,180],"aog":[48],"aoj":[201,202],"aol":[180,194],"aop":[84],"aoq":[0],"aos":[101,133],"aox":[51,97],"aoz":[48,186],"ap":[100,149,174],"ape":[174],"app":[100],"apw":[149],"aq":[7,8,46,99],"aqi":[46],"aqu":[7,8,99],"ar":[3,11,21,22,29,36,43,44,58,72,78,79,89,90,91,93,99,100,104,116,120,124,127,134,135,141,154,155,158,159,160,161,162,164,165,166,171,172,178,207],"ara":[78],"arb":[21,58,79],"arc":[124,172],"ard":[135,158,159,160,161,162],"are":[72,100,164],"arg":[127],"ari":[90,99],"ark":[36],"arl":[166,171],"arp":[154,160,166],"arr":[22],"ars":[29,116,165],"art":[11,44,155],"aru":[3],"ary":[134],"arz":[178],"as":[7,9,10,16,20,27,50,85,86,101,111,129,158,181,182,187,211],"asa":[86],"ash":[9,20,27,129,181,182],"asi":[7],"ass":[16,111,187,211],"ast":[10,50,101],"asv":[85],"at":[0,1,11,17,24,36,38,39,55,65,80,86,113,115,118,138,146,154,156,158,169,172,181,185,188,202,210],"atc":[38,172,185],"ate":[17,39,169,181,202],"ath":[0,1,11,38,65,80,113,154],"ati":[1],"atj":[36],"atl":[158],"atm":[188],"ato":[118],"atr":[115],"ats":[24,55,86,138,146,156,210],"au":[130],"aug":[130],"av":[8,9,54,55,56,57,58,108,111,131,199,208,209,216],"ave":[9,108,111,131,199,208,209,216],"avo":[8,54,55,56,57,58],"aw":[14,37,79,108,117,202],"awa":[14,202],"awn":[37,79,108],"ax":[4,136,182,214],"axc":[136],"axd":[214],"axdj":[214],"axdjy":[214],"axdjys":[214],"axl":[4],"axls":[4],"axs":[182],"axsg":[182],"ay":[77,94,131,156,181,186,194,200],"ayb":[186],"aye":[94,194],"ayt":[200],"ayu":[77,131,156,181],"az":[0,12,29,40,65,150,171,213],"azh":[29,40,65,171,213],"azi":[0,150],"azu":[12],"b":[0,6,9,13,14,15,16,17,18,19,20,21,22,23,24,28,31,42,50,61,75,78,83,92,109,116,117,128,131,132,135,137,144,149,150,151,155,159,167,173,180,183,184,201,202,210,211,212],"ba":[13,14,29,39,42,75,78,116,135,155,180,201,202,210,211,212],"bai":[75,78,116,155,210,211,212],"bal":[13,14],"ban":[42,180],"bao":[135,201],"bar":[29],"bat":[39],"baw":[202],"bc":[75],"bcz":[75],"bczh":[75],"be":[9,15,72,76,84,123,151,165,183],"bea":[15,72],"bed":[165],"bei":[9,84],"bel":[183],"ben":[151],"ber":[76,123],"bi":[15,79,81,83,117],"bia":[15,117],"bil":[83],"bin":[79],"bis":[81],"bj":[78,201],"bjj":[78],"bl":[0,13,16,17,18,19,20,21,22,23,24,35,61,78,83,92,117,149,150,159,184,212,213],"bla":[0,16,17,18,19,20,21,22,35,61,92,149,150,159,184],"ble":[117],"bli":[212],"blo":[23,24],"blu":[13,213],"bly":[78],"blyb":[78],"blybj":[78],"blybjj":[78],"blz":[83],"blzl":[83],"bm":[50],"bmy":[50],"bmyh":[50],"bo":[6,13,21,31,58,68,78,109,128,131,132,137,144,173,198],"bol":[78,109],"bon":[173],"bou":[13,198],"bow":[6,21,31,58,68,128,131,132,137,144],"br":[28,109,167,186,200,208],"bra":[109,200],"bre":[28,186,208],"bro":[167],"bs":[2],"bso":[2],"bt":[210],"btd":[210],"btdj":[210],"bu":[50],"bum":[50],"bw":[202],"bwc":[202],"bwcj":[202],"bwcjm":[202],"bwcjmj":[202],"bx":[116,117],"bxd":[117],"bxdl":[117],"bxdlj":[117],"by":[151,155,211,212],"byj":[212],"byq":[211],"byx":[155],"byxx":[155],"c":[9,10,12,18,19,23,25,26,27,28,29,30,31,32,33,34,35,37,39,42,43,48,54,56,61,64,66,71,75,81,82,89,90,93,102,112,119,125,129,130,133,135,140,142,145,152,153,171,175,176,185,186,187,188,192,202,204,205,209],"ca":[9,12,25,26,27,33,48,71,90,112,129,142,145,152,171,172,185,192,204,205],"cai":[90,129,204,205],"cal":[25,26,33,112,152,172],"can":[9,12,71,142,145,192],"cao":[48],"car":[171],"cas":[27],"cat":[185],"cb":[92,135],"cbl":[92],"cc":[192],"ccl":[192],"cclg":[192],"cd":[188,204],"cdd":[188],"cddm":[188],"cddms":[188],"ce":[34,35,51,56,64,81,95,107,125,130,143,151,177,179,192,200],"cee":[95],"cej":[130],"cen":[34,64,125,177,179,192],"ceo":[151],"cep":[51],"cer":[81,107,143],"cg":[71,90,97,153],"cgj":[153],"cgu":[97],"cgz":[71],"cgzy":[71],"cgzyz":[71],"cgzyzs":[71],"ch":[5,10,18,23,28,29,33,35,37,38,42,43,56,61,66,75,81,93,102,106,124,133,135,136,140,152,153,171,172,175,176,185,186,187,188,202,209],"cha":[18,28,43,56,93,124,140,187,202],"che":[23,29,37,42,75,102,136,209],"chi":[5,10,35,61,133,153,171],"cho":[33,135,176],"chr":[186],"cht":[106],"chu":[29,66,81,133,152,175,187,188],"chy":[61],"chyd":[61],"ci":[19,29,82,90,109,144,145,146,147,148,150],"cia":[144,145,146,147,148],"cin":[29,109],"cio":[150],"ciq":[19],"cis":[90],"cj":[18,130,133,140,187,202],"cjg":[130],"cjm":[202],"cjmj":[202],"cjs":[133],"cjsk":[133],"cjskc":[133],"ck":[16,17,18,19,20,21,22,180,184,187],"ckc":[17,18,19,20,21],"ckh":[187],"ckm":[22],"cks":[184],"ckt":[16],"cl":[17,18,19,20,21,30,39,176,186,192,209],"cld":[209],"cldh":[209],"cldhx":[209],"cle":[186],"clg":[192],"cli":[17,18,19,20,21],"clo":[30],"cls":[176],"clsg":[176],"clu":[39],"co":[15,31,32,41,54,126],"cod":[54],"com":[31],"con":[15],"coo":[32],"cot":[41],"cou":[126],"cq":[19,43,56,93,175],"cr":[7,10,33,34,35,89,94,125,143,144,145,146,147,148],"cra":[7,33],"cre":[34,94,125],"cri":[10,35,143,144,145,146,147,148],"cro":[89],"cs":[29,66,93,102,152,171,202],"csl":[66],"cslh":[66],"csp":[93],"csw":[202],"csz":[29,102,171],"cszf":[29],"cszfc":[29],"cszs":[102],"cszz":[171],"ct":[70,112,121,122,204],"cto":[121,122],"ctu":[70,112],"cu":[90,112,119,132,192],"cui":[90,192],"cur":[112,132],"cut":[119],"cw":[9,187],"cwc":[187],"cwcj":[187],"cwj":[9],"cwjb":[9],"cx":[205],"cxn":[205],"cy":[10,12,35,90],"cyc":[90],"cycg":[90],"cyz":[35],"cyzx":[35],"cz":[48,75,81,145],"czd":[48],"czdg":[48],"czh":[75,81],"d":[1,5,9,20,22,24,27,36,37,38,39,40,41,42,43,44,48,49,54,55,60,61,62,64,67,68,72,79,84,89,94,95,97,99,102,108,109,116,117,121,125,128,135,138,143,146,149,156,163,165,177,181,186,187,188,189,194,197,198,200,204,207,208,209,210,214,216,217],"da":[5,20,36,37,40,48,55,61,79,97,108,118,125,138,146,149,156,158,163,186,188,196,197,210],"dad":[5,197],"daj":[55,138,146,210],"dal":[196],"dam":[188],"dan":[125,163],"dao":[5,20,48,61,97,149],"dar":[36],"dat":[118,158],"daw":[37,79,108],"day":[156,186],"db":[0,31,149,159,213],"dbl":[0,149,159,213],"dbo":[31],"dc":[135],"dcb":[135],"dd":[5,40,41,188,197],"ddd":[40],"ddk":[41],"ddkg":[41],"ddkgs":[41],"ddkgsj":[41],"ddm":[188],"ddms":[188],"de":[22,24,38,39,40,49,54,60,61,62,68,83,92,95,97,99,108,119,120,128,135,143,147,149,151,156,157,159,161,165,177,188,192,195,200,207,209,213,214,216,217],"dea":[38],"deb":[39],"dec":[119,135],"ded":[40,188],"dee":[62],"def":[49,83],"deh":[143,200,209],"dej":[24,214],"dem":[216],"den":[22,95],"der":[156,157,195,207],"des":[40,60,99,108,177,192],"dew":[120,207],"dex":[54,68,165],"dey":[128,217],"df":[1,30,49,65,98],"dfe":[65],"dfl":[1,98],"dfo":[30],"dfq":[49],"dg":[24,48,163],"dgr":[24],"dh":[70,133,143,160,198,200,209],"dha":[70,160],"dhf":[198],"dhfs":[198],"dhfsy":[198],"dho":[133],"dhx":[209],"dhy":[200],"dhz":[143],"di":[40,44,52,54,63,67,84,94,109,119,120,189,197,204,209],"dia":[40,54,84,94,119,120,197],"dic":[204],"dij":[189],"din":[52,63,109,209],"diz":[44],"dj":[24,55,116,138,146,189,210,214],"djb":[116],"djbx":[116],"djy":[214],"djys":[214],"dk":[41],"dkg":[41],"dkgs":[41],"dkgsj":[41],"dl":[13,29,49,114,117,200,208],"dld":[200],"dldh":[200],"dldhy":[200],"dle":[13,29,49],"dlj":[117],"dly":[114],"dlz":[208],"dlzq":[208],"dm":[188,216],"dml":[216],"dms":[188],"dn":[205],"dno":[205],"do":[13,14,38,41,46,47,59,71,72,83,95,116,117,169,177,178,187,196,198],"doc":[41,187],"dod":[41],"dof":[13,14,47,177,178],"dom":[71],"don":[72,116,117,198],"dor":[46,83,169],"dou":[38,95],"dow":[59,196],"dp":[84,161],"dpr":[161],"dpy":[84],"dpyx":[84],"dr":[1,9,23,42,43,64,121,194],"dra":[42,43,194],"dre":[1,64],"dri":[9,121],"dru":[23],"ds":[14,15,23,64,94,99,104,108,120,162,165,171,187,193,202,214],"dsa":[187],"dse":[15],"dsi":[193],"dsm":[202],"dso":[23,214],"dsp":[104,120,162],"dss":[99,108],"dst":[165],"dt":[24],"dta":[24],"du":[27,40,41,64,89,102,181,200,204,208],"dua":[204,208],"dud":[41],"dui":[40],"duk":[41],"dul":[200],"duo":[89,181],"dus":[64,102],"dw":[94,95,207],"dwg":[95],"dwi":[94],"dwx":[207],"dx":[68,97,165],"dxj":[68],"dxl":[97],"dxy":[165],"dy":[89,125,128,156,173,199,217],"dyb":[173],"dyg":[217],"dyj":[156],"dys":[89,199],"dysw":[89],"dyswz":[89],"dyx":[128],"dz":[38,44,72],"dzg":[72],"dzq":[38],"e":[3,25,33,44,45,46,47,48,49,50,51,67,95,106,113,197,207],"ea":[1,11,15,24,28,38,43,44,55,65,72,89,93,96,104,108,111,115,120,123,124,138,141,146,155,156,166,182,186,188,208,210,214],"eac":[15],"eak":[28,115,186,208],"eal":[96,182],"eam":[1,123],"ean":[214],"ear":[11,43,44,72,89,93,104,120,124,141,155,166],"eat":[24,38,55,65,138,146,156,188,210],"eav":[108,111],"eb":[13,39,78,132,150,183,184,208,212],"eba":[39,78],"ebe":[183],"ebl":[150,184,212],"ebo":[13,132],"ebr":[208],"ec":[33,39,42,64,90,119,121,122,125,132,135,175,185],"eca":[185],"ece":[64],"ech":[33,42,135,175],"ecl":[39],"ecr":[125],"ect":[121,122],"ecu":[90,119,132],"ed":[15,22,23,24,30,38,40,62,63,64,65,70,71,94,98,105,108,117,118,120,128,133,143,165,186,187,188,191,210],"eda":[118,186,188,210],"ede":[22,24,40,62,108,128,143],"edf":[65,98],"edg":[24],"edh":[70,133],"edi":[63],"edo":[38,71,117,187],"edr":[23],"eds":[15,120,165],"edu":[40,64],"edw":[94],"ee":[15,32,45,62,71,95,175,197],"eed":[15,71],"eel":[32,95],"een":[45],"eep":[62,175],"eet":[197],"ef":[1,14,49,63,64,82,83,105,188,189],"efa":[49,83],"efe":[64,82],"efi":[188],"efj":[14],"efl":[189],"efo":[63,105],"efu":[1],"eg":[41,45,58,69,95,130,192,202,217],"ega":[69,130,202],"ego":[58,192],"egu":[41,217],"egy":[45,95],"eh":[50,106,143,164,200,209],"eho":[164],"ehu":[50,106,143,200,209],"ei":[9,11,13,15,16,17,18,19,20,21,40,46,84,112,156,157,181,184,195,210],"eih":[15],"eij":[112,184],"eil":[13,195],"ein":[181],"eir":[210],"eis":[11,84],"eit":[156,157],"eix":[40],"eiy":[16,17,18,19,20,21,46],"eiz":[195],"ej":[24,36,122,130,214],"eji":[24,36,122,214],"eju":[130],"el":[12,16,26,32,45,47,49,95,119,122,134,183,199,211],"ele":[45,95,199],"eli":[12,47,134],"ell":[26,183],"elu":[49],"elv":[119],"em":[33,35,46,53,76,102,200,216],"ema":[76],"emb":[35,200],"eme":[46,200],"emi":[33],"emo":[53,102,216],"en":[0,1,5,8,9,22,23,29,32,34,37,39,42,45,47,48,54,55,56,57,58,64,69,72,73,75,79,80,82,83,85,86,87,89,94,95,101,102,103,104,109,110,113,115,125,128,131,134,143,145,151,152,153,154,159,164,167,169,174,175,177,178,179,192,195,207,209,213],"enb":[131],"enc":[151],"end":[9,45,47,64,72,83,169],"eng":[1,8,22,23,32,48,54,55,56,57,58,82,86,87,94,95,101,103,104,110,113,115,143,151,174,175,209,213],"eni":[152],"enj":[9,79],"enk":[178],"enl":[69,85],"eno":[5],"enp":[167],"ens":[29,102,109,154,177,207],"ent":[34,73,125,128,145,153,179,192],"eny":[0,85,134],"enz":[75,80,89],"eo":[51,62,67,151,197,202,213],"eod":[213],"eof":[51,62,67,151,197],"eov":[202],"ep":[51,62,78,117,120,175,201],"eph":[201],"epi":[175],"epo":[117],"epp":[78],"ept":[51],"epu":[120],"eq":[112,141,151],"eqi":[141],"equ":[112,151],"er":[4,15,20,22,23,26,27,28,40,44,46,49,50,51,59,60,64,65,68,72,76,79,80,81,85,94,98,101,103,105,106,107,108,111,114,117,119,123,126,127,128,129,133,143,152,153,154,155,156,157,165,169,172,174,194,195,197,199,202,204,206,207,208,209],"era":[23,46,68,126],"erc":[51,81,107],"erd":[76,204],"ere":[15,80,152],"erg":[156],"erh":[155],"eri":[60,85,195,207,209],"erk":[101],"erl":[49,50,202],"ern":[22,106,197],"ero":[79],"erp":[128,153],"err":[59,64,105],"ers":[65,80,108,111,117,143,154,155,157,169,172,194,199,208],"ert":[40,94],"erv":[27],"erw":[65,114],"erz":[106],"es":[4,10,13,25,33,34,40,41,43,60,69,94,99,103,107,108,112,118,125,127,133,154,167,168,171,177,186,190,192,194,216],"esa":[94],"esc":[10,34,112,125,171,177,192],"ese":[33,40],"esh":[4,25,99,107,108,118,133,154],"esi":[60],"eso":[40,194],"esp":[43],"ess":[13,103,168,190],"est":[60,69,127,190,216],"esz":[25],"eszh":[25],"et":[45,49,61,111,133,171,194,197,211],"eta":[45,194,211],"etb":[61],"ete":[197],"eth":[49,133],"eti":[111],"ets":[171],"eu":[5,64,178,191],"euc":[5],"eun":[191],"euv":[64],"euz":[178],"ev":[50,192,207],"eve":[50,207],"evi":[192],"ew":[3,104,120,135,193,207],"ewa":[3,135,207],"ewi":[104,120,193],"eww":[3],"ex":[54,68,114,165,190,206],"exi":[68,114,165,190],"exv":[206],"ey":[4,50,51,59,87,101,113,128,150,182,203,217],"eya":[150],"eye":[51,113],"eyf":[182],"eyh":[4],"eyi":[59],"eyo":[87],"eyu":[50,128,203,217],"ez":[2,34,35,47,67,85,98,105,106,108,165,172,181,193],"eza":[165],"eze":[47],"ezh":[34,35,85,98,105,108,172,181,193],"ezp":[67],"ezu":[2],"f":[0,1,8,14,17,29,37,39,45,46,49,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,78,82,90,94,98,104,111,115,132,139,145,156,157,174,182,188,189,195,197,198,208,213,215,217],"fa":[8,17,29,46,49,52,53,54,55,56,57,58,83,111,132,139,198,215],"fad":[52],"fag":[17],"fal":[83,139],"fan":[29,49,53,111,132,198,215],"faq":[46],"fav":[8,54,55,56,57,58],"fb":[167],"fbr":[167],"fc":[29,56,82],"fcq":[56],"fd":[55,79,102,177,194],"fda":[79],"fde":[177],"fdj":[55],"fdr":[194],"fdu":[102],"fe":[0,8,17,25,46,54,55,56,57,58,59,60,64,65,67,82,94,104,115,156,157,174,195,213],"fea":[65],"fei":[17,46,156,157,195],"fen":[0,8,54,55,56,57,58,82,94,104,115,174,213],"fer":[59,64],"fes":[25,60],"fez":[67],"ff":[17,18,19,20,21,73,90,143,170,171,215],"ffa":[17,215],"ffl":[18],"ffo":[90,170,171],"ffp":[19],"ffs":[20],"ffu":[73],"ffw":[21],"fh":[170,213],"fho":[170],"fhz":[213],"fhzs":[213],"fi":[48,61,62,73,143,144,145,146,147,148,188,208],"fic":[143,144,145,146,147,148],"fil":[61,73],"fin":[48,62,208],"fir":[188],"fj":[14,57],"fjo":[14],"fk":[87],"fkh":[87],"fl":[1,18,27,58,63,64,65,66,67,98,139,182,189,195,197],"fla":[63,182],"fle":[64],"flg":[58],"flo":[1,18,27,65,66,98,197],"flu":[67,189],"flz":[195],"flzx":[195],"flzxz":[195],"fm":[1,54],"fmd":[54],"fn":[178],"fna":[178],"fo":[30,45,63,68,69,90,105,170,171,191],"fof":[170,171],"fol":[90],"foo":[68],"for":[30,45,63,69,105,191],"fp":[19,51],"fpe":[51],"fpo":[19],"fq":[46,49,132],"fqg":[132],"fr":[37,39,70,71,72,73,74,145],"fra":[70,145],"fre":[71],"fro":[37,72],"fru":[73,74],"fs":[20,151,168,176,179,198,216,217],"fsc":[179],"fsd":[217],"fsdy":[217],"fsdyg":[217],"fsg":[216],"fsl":[20],"fso":[151],"fst":[168],"fsu":[176],"fsy":[198],"ft":[13,14,15,40,47,53,62,68,134,150,156,157,169,171,197],"ftd":[156],"ftdy":[156],"ftdyj":[156],"fth":[13,14,15,40,47,53,62,68,150,171,197],"ftr":[134,169],"fty":[157],"ftyj":[157],"fu":[1,39,60,73,74,78,135,217],"ful":[73,74,135],"fum":[1],"fur":[39],"fus":[217],"fut":[78],"fuz":[60],"fw":[21],"fwa":[21],"fx":[104,115],"fxg":[115],"fxz":[104],"fxzf":[104],"fy":[0,8,17,46,94,111,136],"fya":[136],"fyd":[94],"fyf":[46],"fyfq":[46],"fyj":[8],"fyq":[0],"fyqy":[0],"fyt":[111],"fytj":[111],"fz":[60,174],"fzr":[174],"fzz":[60],"fzzj":[60],"g":[6,9,13,14,21,24,31,41,48,49,55,58,70,71,72,74,77,78,86,90,92,95,97,100,105,107,111,115,124,130,131,132,135,137,138,139,142,144,146,153,156,163,164,173,176,182,188,191,192,206,210,216,217],"ga":[17,31,69,86,130,202],"gal":[69],"gam":[86,202],"gan":[31],"gat":[17],"gau":[130],"gb":[109],"gbo":[109],"gc":[23,29,33,37,56,82,142,192,202],"gca":[33,142],"gch":[23,29,37,56,202],"gci":[82],"gcu":[192],"gd":[1,5,49,55,60,68,84,165,197,207,209,214,216],"gda":[5,55,197],"gde":[49,60,68,165,207,209,214,216],"gdf":[49],"gdfq":[49],"gdi":[84],"gdr":[1],"ge":[5,10,13,14,30,40,63,78,79,95,103,105,115,120,130,191,207],"ged":[30,63,105,120,191],"geg":[130],"gep":[78],"ger":[79,103],"ges":[40],"geu":[5],"gev":[207],"gf":[37],"gfr":[37],"gg":[14,71,74,111,137,164],"gge":[14],"ggl":[111],"ggo":[137,164],"ggu":[71],"gh":[9,12,48,49,52,63,90,111,124,135,198,206,213,217],"gho":[9],"ght":[12,48,49,52,63,90,111,135,217],"ghu":[198,213],"ghz":[206],"ghzs":[206],"gi":[86,97,188,202,203],"gic":[97,188,202],"gik":[86],"gir":[203],"gj":[8,10,18,43,57,68,78,92,114,116,140,143,151,153,183,187,194,199,212],"gji":[8,10,18,43,57,68,78,114,116,140,143,151,183,187,194,199,212],"gk":[59,196],"gku":[59,196],"gl":[4,31,48,50,58,111,117,127,167,176,177,190,209],"gla":[111,167,176,209],"gle":[190],"glg":[31],"gli":[4,48,58,117,127,177],"glo":[50],"glu":[31],"gm":[45,50,54,73,86,145,168],"gma":[73],"gme":[145],"gmi":[54,168],"gmo":[45,50],"gmz":[86],"gmzz":[86],"gmzzz":[86],"go":[6,21,31,42,43,53,58,74,77,84,131,132,135,136,137,142,144,163,164,167,168,191,192,194],"gof":[53,136,167,168],"gon":[6,21,31,42,43,58,77,131,132,135,137,142,144,163,191,192,194],"got":[84],"gou":[74,164],"gp":[66,186,195],"gpo":[186],"gpu":[66,195],"gq":[16,43,49,56,62,69,93,167,208,211],"gqi":[16,43,49,56,69,93,167,208,211],"gqu":[62],"gr":[9,24,32,55,138,139,146,156,188,210,216],"gra":[9,216],"gre":[24,32,55,138,146,156,188,210],"gri":[139],"gs":[0,18,41,79,88,113,128,137,138,139,140,141,150,155,163,169,175,176,180,182,198],"gsh":[79,113,128,137,138,139,140,141,163,169,176,182,198],"gsj":[41],"gsl":[175],"gss":[88],"gst":[180],"gsu":[0,150],"gsw":[18,140],"gt":[52,113,194],"gta":[194],"gto":[113],"gtw":[52],"gu":[40,41,48,49,70,71,72,74,85,86,90,92,97,100,105,107,124,130,153,173,176,182,198,206,217],"gua":[48,49,70,90,105,107,176,182,206,217],"gue":[40],"guh":[124],"gui":[86,97,130],"guj":[92,153],"gul":[48],"guo":[72,74,100],"gur":[85,198],"gus":[41],"guz":[71],"gw":[3,9,40,95,209],"gwa":[3,95],"gwe":[9,40],"gwh":[209],"gx":[24,87,88,104,115],"gxi":[87,88,104],"gxu":[24,115],"gy":[8,12,33,45,53,84,91,94,95,101,107,110,111,135,151,165,175,179,181,193,194,196,215],"gya":[12,53,101,215],"gyd":[135],"gydc":[135],"gydcb":[135],"gye":[111],"gyf":[45],"gyi":[8,84,91,135,151,165,194,196],"gys":[107],"gyu":[33,94,110,175,179,181,193],"gz":[53,71,72,86,100,150,158,159,160,161,162,164,169,172,174,191,206,208],"gzh":[53,72,86,100,150,158,159,160,161,162,169,172,174,191,206,208],"gzht":[100],"gzhtp":[100],"gzj":[191],"gzy":[71],"gzyz":[71],"gzyzs":[71],"h":[4,9,11,15,16,17,18,19,20,21,23,25,33,44,50,61,62,63,64,65,66,68,70,74,75,76,77,78,79,80,81,96,98,99,100,105,106,120,124,128,136,143,155,160,164,169,170,184,185,192,198,199,200,206,209,213],"ha":[11,14,15,18,20,21,28,29,40,43,44,51,53,56,59,62,70,75,76,77,78,79,86,87,93,96,99,100,109,124,126,137,140,143,145,152,154,160,170,171,174,181,182,187,193,196,199,202,208],"had":[59,196],"hai":[15,28,62,96,99,100,124],"haj":[87],"hak":[44,75],"hal":[70,76],"ham":[11,77],"han":[14,18,20,21,43,44,53,56,86,93,109,126,137,140,143,145,170,171,181,182,187,193,199,208],"hao":[51,152,202],"hap":[174],"har":[78,79,154,160],"haz":[29,40,171],"hc":[23,81],"hcz":[81],"hczh":[81],"hd":[44,64,68],"hds":[64],"hdx":[68],"hdxj":[68],"hdz":[44],"he":[2,11,13,14,15,16,17,18,19,20,21,23,29,33,34,37,40,42,44,45,47,49,53,62,64,65,68,75,79,85,86,87,94,102,106,108,109,113,114,118,120,128,129,133,134,136,143,150,154,155,164,171,172,175,179,182,183,184,185,186,187,188,189,190,191,192,193,195,197,206,209],"hea":[155,182],"heb":[13,150,183,184],"hec":[185],"hed":[40,62,64,65,108,128,143,186,187],"hee":[45,197],"hef":[14,188,189],"hei":[11,16,17,18,19,20,21,184],"hel":[47],"hem":[33,53],"hen":[23,29,34,37,42,75,79,85,86,87,102,109,113,134,143,154,164,175,195,209],"hep":[120],"her":[15,20,49,65,68,114,129,133,206],"hes":[94,154,171,190],"heu":[191],"hev":[192],"hew":[193],"hez":[2,106,172],"hf":[27,198],"hfl":[27],"hfs":[198],"hfsy":[198],"hg":[9,105],"hgr":[9],"hh":[64,96],"hhd":[64],"hhds":[64],"hi":[5,6,10,11,13,25,29,35,38,41,45,48,60,61,63,65,67,70,71,72,73,75,77,80,81,83,84,85,87,88,89,92,93,98,101,102,103,104,105,107,108,109,110,113,114,118,122,123,124,125,126,127,133,136,137,138,139,140,141,150,153,154,158,159,160,161,162,167,168,169,170,171,172,174,176,177,178,181,186,191,195,197,198,206,209,210,211,212,213,214],"hia":[161],"hic":[92,93,140],"hid":[48,67,109,138],"hif":[29,104],"hig":[6,13,72,77,153,176,198],"hih":[25,61,63,75,81,98,105,136,169],"hij":[41,60,80,114,133,158,162,177,178,191],"hik":[133],"hil":[65,70,83,141,197],"him":[113,139],"hin":[75,84],"hiq":[38,122,168],"hir":[159,174,209],"his":[45,71,73,102,150,154,167,171,186,206,213],"hit":[98,210,211,212],"hiw":[89,172],"hix":[35,195],"hiy":[10,35,87,108,110,160,198],"hiz":[60,85,102,113,118,123,124,125,126,127,137,170,171,178],"hj":[184],"hl":[99],"hld":[99],"hlds":[99],"hldss":[99],"hm":[33,38,170],"hma":[38],"hmy":[33],"hmyy":[33],"hmz":[170],"hmzz":[170],"ho":[0,1,4,9,33,40,45,62,64,68,74,122,128,133,135,154,155,163,164,170,176,179,183,206,217],"hoi":[33],"hom":[170],"hon":[40,45,62,68,128,176,179,183,206],"hoo":[74,154,164],"hor":[9,133],"hos":[217],"hot":[163],"hou":[0,1,4,64,135,154],"hov":[122],"how":[155],"hp":[120],"hpy":[120],"hr":[133,186,194,201],"hre":[133],"hri":[194,201],"hro":[186],"hs":[11,44,113,128,200],"hsd":[128],"hsdy":[128],"hsdyx":[128],"hsh":[44],"hsr":[200],"hsw":[113],"ht":[12,48,49,52,63,90,100,106,111,135,217],"htf":[135],"htn":[48],"hto":[90],"htp":[100],"hts":[49,106],"htw":[111],"hu":[4,7,23,25,29,30,37,50,61,63,64,65,66,74,75,80,81,96,98,99,100,105,106,108,124,133,136,143,152,169,170,174,175,178,181,185,187,188,192,195,198,200,206,209,213],"hua":[23,37,50,65,66,75,81,96,98,106,124,136,187,198,213],"hud":[188],"huh":[96,100],"hui":[7,25,29,63,64,65,66,81,99,105,143,152,169,178,200,209],"hum":[170],"hun":[4,66,80,192,195],"huo":[25,74,174,185,206],"huq":[175],"hur":[63],"hus":[108],"hut":[181],"huy":[30,61],"hx":[15,209],"hxb":[15],"hy":[16,17,18,19,20,21,61,62,200],"hyc":[18,19],"hycj":[18],"hycq":[19],"hyd":[61],"hyf":[17],"hyfy":[17],"hyq":[16],"hyz":[20,21,62],"hyzd":[20],"hyzg":[21],"hyzq":[62],"hz":[63,65,143,206,213],"hzl":[65],"hzr":[63],"hzs":[206,213],"i":[36,63,81,82,84,90,175,210],"ia":[0,1,4,5,8,9,14,15,16,18,19,24,27,28,36,38,40,42,43,49,52,54,55,56,57,59,60,69,79,84,87,88,90,91,92,93,94,96,111,112,117,119,120,122,127,128,133,134,136,138,140,141,144,145,146,147,148,153,155,156,157,158,159,160,161,162,166,167,173,177,178,179,180,182,183,184,186,187,189,190,191,195,196,197,199,201,202,203,205,210,211,212,214],"iaj":[88,201],"ial":[40,42,91,119,120,144,145,146,147,148,166],"ian":[0,1,4,5,8,16,18,19,24,27,28,36,38,40,43,49,54,55,56,57,59,60,79,87,92,93,94,96,111,112,117,127,128,136,138,140,141,146,148,153,155,156,157,158,159,160,161,162,167,173,177,178,179,182,183,184,187,189,190,191,195,196,197,199,202,203,205,210,211,212,214],"iao":[9,15,84,122,133,161,180,186],"iar":[90],"iaw":[14],"ib":[81,116,151,201,202],"iba":[116,201,202],"ibe":[151],"ibi":[81],"ic":[43,48,75,92,93,97,124,133,140,143,144,145,146,147,148,180,186,188,202,204,205],"ica":[48,145,205],"icb":[92],"ice":[143],"icg":[97],"ich":[43,75,133,140,188],"ici":[144,145,146,147,148],"ick":[180],"icl":[186],"ics":[93,202],"ict":[204],"id":[40,48,54,67,89,95,97,109,135,138,146,156,157,161,192,193,196,200,204,205,209,217],"ida":[40,48,138,146,196],"ide":[97,135,156,157,161,192,217],"idi":[54,67,109,209],"idn":[205],"ido":[95],"ids":[193],"idu":[89,200,204],"ie":[4,22,36,42,45,47,50,58,59,80,81,82,98,105,107,114,117,119,141,150,181,192,194,203,210],"iec":[42],"ied":[22,117,210],"ief":[82],"ieg":[58,192],"iej":[36],"iel":[119],"ieq":[141],"ier":[80,81,107],"ies":[4],"iet":[45,194],"iex":[114],"iey":[50,59,150],"iez":[47,98,105,181],"if":[17,18,19,20,21,29,39,54,55,56,57,58,94,104,139,143,144,145,146,147,148,217],"ifa":[29,139],"ife":[54,55,56,57,58,94,104],"iff":[17,18,19,20,21],"ifi":[143,144,145,146,147,148],"ifu":[39,217],"ig":[6,12,13,48,49,52,63,72,77,90,105,111,135,144,153,176,198,217],"ige":[13],"igh":[12,48,49,52,63,90,111,135,217],"igo":[6,77,144],"igu":[72,90,105,153,176,198],"ih":[15,25,61,63,64,65,75,81,96,98,105,136,169],"iha":[15],"ihe":[64],"ihu":[25,61,63,65,75,81,96,98,105,136,169],"ij":[22,41,60,78,80,112,114,117,133,148,158,162,173,177,178,184,189,191],"iji":[22,41,60,78,80,112,114,133,148,162,173,177,178,184,189,191],"iju":[117,158],"ik":[34,86,133],"ike":[34],"iki":[86],"iku":[133],"il":[8,13,28,39,52,61,65,66,70,73,83,91,98,99,121,141,144,145,146,148,155,165,168,169,192,194,195,197],"ila":[8,13,99],"ile":[98,195],"ili":[28,39,52,65,66,70,141,144,145,146,148,169,192,197],"ill":[61,73,121,168,194],"ilo":[83,91],"ilu":[70,83],"ilv":[155,165],"ilw":[169],"im":[7,10,35,42,79,86,113,119,120,139,186,202],"ima":[202],"imi":[42,79,113,139,186],"imo":[119,120,139,202],"ims":[10,35],"imu":[7,86],"in":[0,1,5,8,9,10,13,15,16,23,24,27,28,29,33,35,37,43,47,48,49,50,51,52,53,59,60,62,63,65,66,68,69,73,75,78,79,80,82,84,86,88,89,90,91,94,99,103,104,109,111,112,113,114,116,120,122,123,127,128,129,136,150,151,152,153,155,162,163,165,167,168,169,172,175,177,180,181,186,190,194,195,196,199,201,205,207,208,209,211,212,213,214],"ina":[62,86],"inb":[15,28,68,109,128],"inc":[89,90,112,152],"ind":[29,49,94,104,212,213],"ine":[43,47,99,153,162,167,214],"ing":[0,1,5,8,9,10,16,33,35,37,48,50,52,53,59,60,65,66,68,73,75,78,79,80,82,84,88,109,111,113,114,116,120,127,136,150,155,163,165,168,169,172,175,180,181,186,190,194,195,196,199,207,209,211,212],"ink":[9,53],"inl":[27],"inn":[29,201,205],"ino":[181],"inp":[123],"inr":[75],"ins":[23,63,88,103,129],"int":[24,68],"inw":[13,69],"inx":[155],"inz":[104,122,175,177],"io":[2,27,51,90,91,96,150,177,205],"ion":[2,27,51,90,91,150,177,205],"iou":[96],"ip":[217],"iph":[217],"iq":[19,38,122,134,168],"iqi":[19,38,122],"iqu":[134,168],"ir":[36,60,82,86,88,99,139,159,166,174,188,192,203,209,210],"ira":[99],"ire":[60,88,139,159,174],"iri":[86,166,192,203],"irl":[209],"iro":[36,82,210],"irs":[188],"is":[11,27,45,67,71,73,81,84,87,90,99,102,104,105,114,147,150,152,154,167,171,178,179,186,187,203,206,213],"ise":[99],"ish":[11,45,71,73,114,152,154,167,171,186,206],"isi":[27,90,147,150],"iso":[213],"isp":[81],"iss":[84,104,178],"ist":[105,179,187],"isu":[67,87,102,203],"it":[25,26,66,67,73,74,85,89,92,93,98,100,105,106,127,151,152,156,157,174,193,201,210,211,212],"ita":[89],"ite":[201,210,211,212],"itf":[74],"ith":[92,93,193],"iti":[98,156,157,210],"ito":[73],"its":[174],"itt":[105,106,127],"itu":[100,151],"ity":[25,26,66,85,152],"itz":[67],"iu":[10,27,34,46,54,55,56,57,58,66,169,193,197,202,207,214],"iuc":[10],"iuh":[66],"iuj":[27,202],"iul":[193,207],"ius":[54,55,56,57,58],"iuy":[34,169,197,214],"iv":[104,205],"ive":[104],"ivi":[205],"iw":[89,172],"iwa":[172],"iwe":[89],"ix":[15,35,40,84,116,134,167,172,178,195,205,209],"ixi":[15,35,40,84,116,134,167,172,178,195,205],"ixu":[209],"iy":[10,16,17,18,19,20,21,35,46,62,71,87,90,108,110,147,152,155,160,166,198,200,211,212],"iya":[17,18,19,20,21,87],"iye":[90],"iyi":[16,152,160,200,211,212],"iyo":[71],"iyu":[10,17,35,46,62,108,110,147,155,166,198],"iz":[6,25,26,44,60,63,67,85,102,113,118,123,124,125,126,127,137,143,167,168,170,171,178,195],"iza":[26],"izh":[6,25,44,60,63,67,85,102,113,118,137,143,167,168,170,171,178,195],"izi":[178],"izu":[123,124,125,126,127],"j":[8,9,10,18,22,24,27,36,38,41,43,45,47,55,57,59,60,68,78,79,80,83,88,92,111,112,114,116,117,119,120,121,122,123,130,133,138,140,143,144,145,146,147,148,151,153,156,157,158,162,168,169,172,173,177,178,183,184,187,189,190,191,194,196,199,201,202,210,212,214],"ja":[83,119,120,147],"jad":[83,119,120,147],"jb":[9,116,151,201,202],"jbj":[201],"jbw":[202],"jbwc":[202],"jbwcj":[202],"jbwcjm":[202],"jbwcjmj":[202],"jbx":[116],"jby":[151],"jc":[10,43],"jcq":[43],"jcy":[10],"jd":[22,27,38],"jdz":[38],"jdzq":[38],"jg":[130,173],"ji":[8,9,10,18,22,24,27,36,41,43,45,47,55,57,59,60,68,78,79,80,88,92,111,112,114,116,119,121,122,123,133,138,140,143,144,145,146,148,151,153,156,157,162,168,169,172,173,177,178,183,184,187,189,191,194,196,199,201,202,210,212,214],"jia":[8,9,18,24,27,36,55,57,59,60,79,92,112,133,138,140,146,148,153,156,157,173,177,178,183,184,187,189,191,196,199,201,202,210,212],"jib":[116,151,201,202],"jic":[43],"jie":[22,45,47,114,119,194],"jil":[144,145,146,148],"jim":[202],"jin":[27,78,80,88,111,122,123,168,169],"jiu":[10,202,214],"jix":[172],"jiz":[143],"jj":[78,122,201,202],"jjb":[201,202],"jjbj":[201],"jjbw":[202],"jjbwc":[202],"jjbwcj":[202],"jjbwcjm":[202],"jjbwcjmj":[202],"jjz":[122],"jjzq":[122],"jl":[27,119,144,145,146,148,177],"jlc":[145],"jlcz":[145],"jld":[146],"jldj":[146],"jlg":[144],"jlj":[27,148],"jljd":[27],"jlz":[177],"jlzj":[177],"jm":[168,202],"jmj":[202],"jmz":[168],"jmzq":[168],"jn":[87],"jni":[87],"jo":[14],"jor":[14],"jp":[123],"js":[88,133,169],"jsk":[133],"jskc":[133],"jsl":[169],"jsly":[169],"jslyz":[169],"jslyzh":[169],"jt":[45,194],"jtz":[45],"jtzs":[45],"ju":[38,117,122,130,158,190,201],"jua":[158],"jue":[38,122,190,201],"jug":[130],"jx":[114,172,190],"jxj":[114],"jxz":[172],"jxzz":[172],"jxzzw":[172],"jy":[112,214],"jyq":[112],"jys":[214],"jz":[47,122,143],"jzd":[143],"jzdh":[143],"jzdhz":[143],"jzq":[122],"k":[5,41,53,59,84,85,86,87,88,89,101,121,133,158,159,160,161,162,196],"ka":[5,84,85,86,121,198],"kab":[198],"kag":[5,84,85],"kan":[121],"kat":[86],"kc":[17,18,19,20,21,133,186],"kch":[186],"kcl":[17,18,19,20,21],"ke":[23,28,34,41,44,87,101,167,208],"ked":[23],"keg":[41],"ken":[167],"ker":[28,44,208],"key":[87,101],"kg":[41],"kgs":[41],"kgsj":[41],"kh":[87,99,187],"kha":[87,99,187],"ki":[9,36,53,86,88,89,111,180],"kin":[9,53,88,111,180],"kir":[36,86],"kit":[89],"kj":[59,196],"km":[22],"kma":[22],"ko":[158,159,160,161,162],"kon":[158,159,160,161,162],"kp":[115],"kpa":[115],"kr":[178],"kre":[178],"ks":[184],"ksw":[184],"kt":[16,121],"kta":[16],"ktz":[121],"ktzj":[121],"ku":[3,59,75,78,133,196,203],"kuf":[78],"kui":[133],"kum":[203],"kuo":[3,59,196],"kus":[75],"ky":[156,157,158,159,160,161,162],"kyr":[156,157],"kyw":[158,159,160,161,162],"kz":[158,159,160,161,162],"kza":[161],"kzj":[158,162],"kzr":[159],"kzy":[160],"l":[4,13,18,22,24,27,28,31,32,34,39,42,43,47,48,52,56,58,65,66,69,70,78,79,80,83,84,85,90,91,92,93,94,95,96,97,99,111,117,118,119,127,139,140,141,144,145,146,147,148,150,151,164,166,167,169,176,177,180,186,192,193,194,195,196,197,199,200,203,207,208,209,215,216],"la":[0,7,8,13,14,16,17,18,19,20,21,22,25,26,35,50,56,61,63,92,99,111,116,129,149,150,158,159,166,167,176,182,184,193,194,196,200,207,208,209,215,216],"lac":[7,16,17,18,19,20,21,22,184],"lad":[13,14,61,92,99,149,159,200],"laf":[8],"lah":[200],"lai":[167,200],"lam":[25,26,63],"lan":[13,22,35,56,176,193,196,207,208,209,215,216],"lar":[116,166],"las":[20,50,111,129,158,182],"lay":[194,200],"laz":[0,150],"lb":[76,137,144,180],"lbe":[76],"lbo":[137,144],"lc":[145],"lcz":[145],"ld":[46,84,99,114,146,200,207,209,216],"ldh":[200,209],"ldhx":[209],"ldhy":[200],"ldj":[146],"ldl":[114,200],"ldld":[200],"ldldh":[200],"ldldhy":[200],"ldm":[216],"ldml":[216],"ldo":[46],"ldp":[84],"ldpy":[84],"ldpyx":[84],"lds":[99],"ldss":[99],"ldw":[207],"ldwx":[207],"le":[4,13,19,26,29,32,41,45,49,61,62,64,83,85,95,98,117,151,169,171,172,175,182,186,190,194,195,199,203],"led":[98],"lee":[175],"leg":[45,95],"lei":[195],"lel":[49],"len":[32,83,151,169],"leo":[62],"lep":[117],"ler":[26,172,199],"les":[13,41,186,190,194],"let":[61,171],"leu":[64],"ley":[4,182,203],"lez":[85],"lf":[39,48,73,145,197,215,216],"lff":[215],"lfi":[48,73],"lfl":[197],"lfr":[39,145],"lfs":[216],"lg":[31,58,70,138,139,144,146,192],"lgr":[138,139,146],"lh":[66,74],"lho":[74],"li":[4,12,17,18,19,20,21,27,28,34,39,42,47,48,49,52,58,65,66,69,70,79,80,90,91,92,93,105,117,127,134,141,144,145,146,148,150,151,163,166,169,177,180,186,192,193,194,197,203,207,212,217],"lia":[28,69,90,127,180,203],"lic":[145],"lid":[146],"lie":[4,58,80,141,150,192],"lif":[17,18,19,20,21,39],"lig":[12,48,49,52,90,144,217],"lij":[117,148],"lil":[70,91],"lim":[42,79,186],"lin":[47,65,69,163,177,194,212],"lio":[91],"liq":[134],"lir":[166],"lit":[92,93,105,127,151],"liu":[27,34,66,169,193,197,207],"lj":[27,43,117,119,120,147,148,151],"lja":[119,120,147],"ljb":[151],"ljby":[151],"ljc":[43],"ljcq":[43],"ljd":[27],"lk":[180],"lki":[180],"ll":[4,13,14,26,33,61,70,73,83,91,112,121,140,152,168,172,180,182,183,193,194,200,207],"lla":[13,14,200],"llb":[180],"lld":[207],"lldw":[207],"lldwx":[207],"lle":[4,26,61,172,182],"llg":[70],"lli":[194],"llm":[73],"lln":[168],"llo":[140],"lls":[83],"lly":[91,193],"llyz":[193],"lm":[42,73,79,186],"lmc":[42],"lme":[73],"lmp":[186],"lmpx":[186],"lmpxz":[186],"lmpxzs":[186],"lms":[79],"lmsj":[79],"ln":[168],"lne":[168],"lo":[1,18,23,24,27,30,40,43,50,65,66,70,83,84,91,94,96,98,111,140,147,194,197,202],"loa":[1],"log":[40],"lon":[18,24,43,83,84,91,140,147,194],"loo":[23,24,111],"lor":[96,202],"los":[94],"lou":[30],"low":[27,50,65,66,98,197],"lq":[141,203],"lr":[32,80,135,166],"lre":[135],"lry":[166],"lrz":[80],"lrzj":[80],"ls":[4,32,83,115,118,141,148,176,195,196],"lse":[195],"lsg":[176],"lsh":[196],"lso":[115],"lsp":[141],"lss":[83],"lst":[32],"lsw":[148],"lsz":[118],"lt":[10,106,109,202],"lti":[202],"ltu":[10],"ltz":[106],"lu":[2,10,13,31,39,49,52,67,70,78,83,95,96,97,139,164,189,213,216],"lua":[78],"lub":[39],"lue":[13],"lum":[10,95,213],"lun":[31,70,97],"luo":[52,83,164],"lut":[2,49,67,189],"lux":[96],"lv":[10,118,119,155,165,199],"lve":[118,155,165],"lvu":[10],"lvx":[199],"lw":[69,164,169],"lwa":[169],"lwg":[164],"lwgz":[164],"lwq":[69],"lx":[24,52,167,199],"lxd":[24],"lxdj":[24],"lxj":[199],"lxq":[167],"lxqz":[167],"lxqzs":[167],"ly":[34,78,91,114,150,169,193,194,196,197,203,215],"lyb":[78],"lybj":[78],"lybjj":[78],"lyd":[197],"lydd":[197],"lyj":[194],"lyjt":[194],"lyk":[196],"lykj":[196],"lyl":[203],"lylq":[203],"lys":[114],"lyz":[34,150,169,193],"lyzh":[169],"lyzs":[150],"lz":[13,83,85,177,195,208],"lzg":[13],"lzj":[177],"lzl":[83],"lzq":[208],"lzx":[195],"lzxz":[195],"lzz":[85],"lzzy":[85],"m":[1,5,6,24,33,35,42,45,50,53,54,73,76,77,79,86,97,98,99,100,101,102,103,104,105,106,107,108,109,110,113,134,136,139,149,152,168,170,173,175,186,188,202,203,216,217],"ma":[3,5,10,22,38,64,73,76,77,86,97,98,99,100,101,170,181,188,202],"mag":[10,97,188,202],"mah":[99],"mai":[98],"mak":[5,99],"man":[64,73],"mao":[76],"map":[100],"mar":[3,22,99,100],"mas":[86,101],"mat":[38,202],"may":[77,181],"mb":[35,123,165,200],"mbe":[123,165],"mbl":[35],"mbr":[200],"mc":[42],"md":[54,97,149],"mdx":[97],"mdxl":[97],"me":[1,5,11,46,63,73,102,103,110,145,197,200,202,213],"mea":[11],"mef":[63],"meg":[202],"mem":[102,200],"men":[1,5,73,110,145],"meo":[197,213],"mer":[46],"mes":[103],"mf":[139],"mfl":[139],"mh":[99],"mhl":[99],"mhld":[99],"mhlds":[99],"mhldss":[99],"mi":[25,26,33,42,50,54,77,79,95,104,105,106,113,134,136,139,152,168,173,174,186,203],"mia":[136],"mid":[54,95],"mie":[42,50],"mif":[139],"mij":[173],"min":[33,79,113,186],"mis":[104,105,203],"mit":[25,26,106,174],"mix":[134],"miy":[152],"miz":[168],"mj":[45,173,202],"mjg":[173],"mjt":[45],"mjtz":[45],"mjtzs":[45],"ml":[216],"mm":[136,174],"mmi":[174],"mmz":[136],"mmzh":[136],"mo":[6,35,45,50,53,77,97,102,107,108,109,110,119,120,139,170,175,188,202,216,217],"mod":[97],"moi":[139],"moj":[45,202],"mol":[216],"moo":[35,50,107,108,110,217],"mor":[102,119,120,175],"mos":[6,188],"mou":[53,109,110],"moz":[77,170],"mp":[31,179,186],"mph":[179],"mpo":[31],"mpx":[186],"mpxz":[186],"mpxzs":[186],"ms":[1,6,10,35,71,79,188],"msj":[79],"mso":[10,35],"msw":[71],"msz":[6],"mszg":[6],"mt":[113],"mu":[5,7,24,86,136,149],"mud":[149],"mul":[7],"mum":[136],"muy":[5,24],"muz":[86],"mx":[134],"my":[5,24,33,50,110,152],"myc":[152],"mycs":[152],"myd":[5],"mydd":[5],"myh":[50],"myl":[24],"mylx":[24],"mylxd":[24],"mylxdj":[24],"myy":[33],"myz":[110],"myzy":[110],"mz":[73,77,86,136,168,170],"mzg":[77],"mzh":[136],"mzq":[168],"mzs":[73],"mzz":[86,170],"mzzz":[86],"n":[86,87,101,111,112,178,181,201,205],"na":[29,62,86,106,164,178,181,197],"nab":[29],"nac":[106],"nag":[86],"nal":[62,197],"nar":[164,178],"nas":[181],"nb":[15,28,68,109,128,131],"nbi":[15],"nbo":[68,128,131],"nbr":[28,109],"nc":[18,19,35,56,81,89,90,93,112,126,151,152,200],"nca":[112],"nce":[35,56,151,200],"nch":[18,81,93,152],"nci":[19,90],"nco":[126],"ncr":[89],"nd":[0,1,9,13,20,27,29,31,40,44,45,47,49,64,72,83,94,104,156,169,171,187,195,199,207,212,213,214],"nda":[20,156],"ndb":[0,31,213],"nde":[40,195,207],"ndf":[1],"ndi":[44,94],"ndl":[13,29,49],"ndo":[47,72,83,169],"ndr":[9,64],"nds":[94,104,171,187,214],"ndu":[27],"ndy":[199],"ne":[33,42,43,47,99,101,112,113,133,153,162,167,168,173,201,214,216],"nea":[214],"nen":[101],"nep":[201],"nes":[33,43,112,167,168],"net":[133],"ney":[113],"nf":[17,115,191],"nfe":[17,115],"nfo":[191],"ng":[0,1,3,4,5,6,8,9,10,12,14,16,18,19,21,22,23,24,29,31,32,33,35,37,38,40,43,45,48,49,50,52,53,54,55,56,57,58,59,60,62,63,65,66,68,69,70,71,72,73,75,77,78,79,80,82,83,84,86,87,88,90,91,92,93,94,95,96,100,101,103,104,105,109,110,111,113,114,115,116,117,120,127,128,130,131,132,135,136,137,138,139,140,141,142,143,144,145,147,150,151,155,158,159,160,161,162,163,164,165,167,168,169,170,171,172,173,174,175,176,177,179,180,181,182,183,186,187,190,191,192,193,194,195,196,197,198,199,202,206,207,208,209,210,211,212,213,214,215,216,217],"ngb":[109],"ngc":[23,29,33,37,56,82,142,192,202],"ngd":[1,5,49,55,60,68,84,165,197,207,209,214,216],"nge":[78,79,95,103,115,120,130,207],"ngf":[37],"ngg":[14,71,111,137,164],"ngh":[9,198,213],"ngj":[8,10,18,43,57,68,78,114,116,140,143,151,183,187,194,199,212],"ngk":[59,196],"ngl":[4,31,48,50,58,117,127,167,176,177,190,209],"ngm":[45,50,54,73,168],"ngo":[21,31,53,136,163,167,168],"ngp":[66,186,195],"ngq":[16,43,49,56,62,69,93,167,208,211],"ngr":[32,210],"ngs":[0,18,79,88,113,128,137,138,139,140,141,150,155,163,169,175,176,180,182,198],"ngt":[52,113,194],"ngu":[48,49,70,92,100,173,182],"ngw":[3,9,40,95,209],"ngx":[24,87,88,104,115],"ngy":[8,12,33,53,84,91,94,101,110,111,135,151,165,175,179,181,193,194,196,215],"ngz":[53,72,86,150,158,159,160,161,162,169,172,174,191,206,208],"nh":[23,206],"nho":[206],"nhu":[23],"ni":[8,37,48,54,55,56,57,58,87,111,152,175,179,186,205],"nia":[8,205],"nic":[186],"nig":[111],"nin":[37,48,175],"nis":[87,179],"nit":[152],"niu":[54,55,56,57,58],"nj":[9,79,111,119,121],"nji":[9,79,111,119,121],"nk":[9,53,158,159,160,161,162,178],"nki":[9,53],"nko":[158,159,160,161,162],"nkr":[178],"nl":[27,69,85,208,217],"nla":[208],"nle":[85],"nli":[27,69,217],"nm":[5,35,149],"nmo":[35],"nmu":[5,149],"nn":[29,101,175,201,205],"nna":[29],"nne":[101,201],"nni":[205],"nny":[175],"no":[5,15,112,150,165,181,205],"noc":[112],"nof":[15,150],"nom":[5],"noo":[181],"not":[205],"now":[165],"np":[10,107,123,167],"npi":[107,167],"npl":[10],"npo":[123],"nq":[132,169,203,206],"nqi":[203],"nqu":[132,169,206],"nr":[75],"nri":[75],"ns":[0,23,29,35,36,42,43,63,66,82,88,89,91,102,103,109,110,129,133,154,177,178,194,197,205,207],"nsb":[42],"nsh":[29,66,88,89,102,103,109,154,178,197],"nsi":[63,177],"nsl":[129,194],"nsm":[110],"nsp":[43],"nsr":[91],"nss":[35],"nst":[82,133,207],"nsw":[36],"nt":[4,22,24,34,36,53,68,73,80,109,121,125,128,145,153,179,187,192],"nta":[53,109,121],"nte":[4,22,24,80],"nth":[192],"nti":[36],"nto":[68],"ntp":[34],"nts":[128,145,153,179],"nw":[13,53,69,108,187],"nwa":[53,69],"nwe":[13,108],"nwu":[187],"nx":[4,117,155,182,207,214],"nxi":[4,117,155,182,207,214],"ny":[0,1,78,85,92,93,101,107,112,119,125,126,134,157,175],"nya":[0,92,93,119,126],"nye":[1,112],"nyi":[85],"nym":[175],"nys":[101],"nyu":[78,107,125,134,157],"nz":[13,14,20,21,45,62,73,75,80,81,86,87,89,96,104,109,110,121,122,136,145,175,177,179,195],"nzh":[13,14,20,21,45,62,73,75,80,81,86,87,96,104,109,110,122,136,145,175,177,195],"nzi":[89],"nzo":[179],"nzu":[121],"o":[13,14,15,25,40,46,47,51,53,62,67,68,73,79,87,90,102,113,114,134,136,150,151,154,167,168,169,170,171,177,178,179,181,194,197,202,213],"oa":[1,23,91,113,154],"oak":[23],"oar":[91],"oat":[1,113,154],"ob":[9,180],"oba":[180],"obe":[9],"oc":[41,112,187],"ock":[187],"oco":[41],"oct":[112],"od":[23,24,41,54,97,125,149,213],"oda":[97,125],"odb":[149],"ode":[54,213],"odo":[41],"ods":[23],"odt":[24],"of":[13,14,15,25,40,47,51,53,62,67,68,73,79,87,90,102,134,136,150,151,167,168,169,170,171,174,177,178,179,194,197],"ofb":[167],"ofd":[79,102,177,194],"ofe":[25,67,174],"off":[73,90],"ofh":[170],"ofk":[87],"ofn":[178],"ofp":[51],"ofs":[151,168,179],"oft":[13,14,15,40,47,53,62,68,134,150,169,171,197],"ofy":[136],"og":[40,48,74,124],"ogo":[74],"ogu":[40,48,74,124],"oh":[181],"oha":[181],"oi":[33,139],"oin":[33],"oir":[139],"oj":[45,59,123,196,201,202],"oji":[45,59,123,196,202],"oju":[201],"ok":[74,111,164,167],"oke":[167],"oki":[111],"ol":[2,19,32,78,90,109,115,116,151,166,180,194,215,216],"ola":[116,166],"ole":[19],"olf":[215,216],"oli":[90,151,180],"olo":[194],"ols":[32,115],"olt":[109],"olu":[2,78,216],"om":[5,31,71,77,165,170,197],"oma":[5,170],"omb":[165],"ome":[197],"omo":[77],"omp":[31],"oms":[71],"on":[2,6,8,10,15,18,21,24,27,31,35,36,40,42,43,45,50,51,54,55,56,57,58,62,63,68,72,77,82,83,84,90,91,107,108,110,113,115,116,117,128,131,132,133,135,137,138,139,140,141,142,144,147,150,158,159,160,161,162,163,167,168,169,173,176,177,179,183,186,191,192,194,197,198,205,206,210,213,214,216,217],"one":[133,173,216],"ong":[6,18,21,24,31,40,43,45,50,58,62,63,68,72,77,83,84,91,113,115,116,117,128,131,132,135,137,138,139,140,141,142,144,147,158,159,160,161,162,163,167,168,169,176,183,191,192,194,197,198,206,210,213,214],"oni":[8,54,55,56,57,58,179,186],"onl":[217],"onm":[35],"ono":[15,150],"onp":[10,107],"ons":[35,36,42,43,82,91,194,205],"onw":[108],"oo":[23,24,32,35,50,68,74,107,108,110,111,149,154,164,181,217],"ood":[23,24,149],"ooh":[181],"ook":[74,111,164],"ool":[32],"oon":[35,50,107,108,110,217],"oot":[68,154],"op":[84],"opi":[84],"oq":[0],"oqi":[0],"or":[9,14,18,24,30,36,45,46,55,57,63,69,71,83,96,102,105,113,114,117,118,119,120,121,122,133,138,140,146,148,156,157,169,175,177,178,184,191,199,202,206,210],"orb":[46],"ord":[14,18,24,36,55,57,96,119,120,138,140,146,148,156,157,177,178,184,199,202,210],"ore":[69],"org":[30,63,105,191],"orl":[114],"orn":[9,71,113,133,175],"oro":[169],"ors":[121,122],"ort":[45,117,206],"ory":[102,114],"os":[6,7,37,72,89,94,101,121,122,133,188,217],"osb":[6],"osh":[7,101,133,188],"osi":[6],"osm":[217],"osp":[121,122],"oss":[89],"ost":[37,72,94],"ot":[41,68,84,94,114,123,124,125,126,127,154,163,205],"ota":[41],"ote":[154],"oth":[94,114],"oti":[205],"oto":[123,124,125,126,127],"otp":[68],"ots":[84],"oty":[123,124,125,126,127],"ou":[0,1,3,4,13,30,31,38,53,59,64,71,74,95,96,106,109,110,126,135,154,164,179,198,203],"oub":[135],"ouc":[95],"oud":[30,95],"ouk":[198],"oul":[203],"oum":[3],"oun":[13,31,53,109],"our":[126],"ous":[0,1,59,96,198],"ouu":[110],"ouy":[106],"ouz":[38,71,154,164,179],"ov":[122,202],"ove":[122,202],"ow":[6,21,22,27,31,50,58,59,65,66,68,98,117,128,131,132,137,144,155,164,165,196,197],"owa":[164],"owe":[65,98,117,155],"owi":[66],"owl":[22],"ows":[27,128],"owt":[165],"ox":[51,52,97,127,186],"oxi":[51,52,127,186],"oxu":[97],"oy":[89,137,138,139,140,141],"oya":[137,138,139,140,141],"oyu":[89],"oz":[48,77,83,100,126,170,186],"ozh":[48,77,83,100,126,170,186],"p":[10,19,34,51,66,77,80,81,84,94,100,115,116,117,118,119,120,121,122,123,124,125,126,127,161,166,167,186,195],"pa":[78,80,100,115,119],"pak":[78],"pam":[100],"pan":[119],"pat":[80,115],"pe":[27,43,51,89,93,104,115,120,121,122,123,124,125,126,127,128,141,153,166,174],"pea":[43,89,93,104,115,120,123,124,141,166],"pec":[121,122,125],"pen":[128,153],"per":[27,51,126,174],"pes":[127],"ph":[179,201,217],"pho":[179,217],"phr":[201],"pi":[29,34,43,49,67,81,84,107,153,162,167,175],"pie":[81,107],"pik":[34],"pin":[29,43,49,84,153,162,167,175],"pit":[67],"pl":[10,83,105,169],"ple":[83,169],"pli":[105],"plu":[10],"pm":[77],"pmz":[77],"pmzg":[77],"po":[19,31,77,116,117,123,186],"pol":[19,116],"pom":[77],"por":[117],"pou":[31],"pow":[117],"pox":[186],"pp":[78,100],"ppa":[78,100],"pr":[68,94,118,119,120,121,122,123,124,125,126,127,161],"pra":[94],"pre":[118],"pri":[68,119,120,161],"pro":[121,122,123,124,125,126,127],"ps":[154],"psh":[154],"pt":[51],"pti":[51],"pu":[66,100,120,195],"pul":[195],"pur":[66],"puy":[120],"pw":[149],"pwo":[149],"px":[186],"pxz":[186],"pxzs":[186],"py":[84,119,120],"pyj":[119],"pyjl":[119],"pyx":[84],"q":[0,1,16,19,26,38,43,46,49,56,62,69,92,93,105,112,122,132,141,167,168,175,181,203,208,211],"qg":[132],"qi":[0,1,16,19,38,43,46,49,56,69,92,93,105,122,141,167,175,181,203,208,211],"qia":[0,1,16,19,38,43,56,92,93,122,141,211],"qie":[105,181,203],"qin":[49,175],"qiu":[46],"qiz":[167],"qu":[7,8,26,62,88,99,112,132,134,151,168,169,206],"qua":[7,99,134],"que":[26,151],"qug":[132],"qui":[8,88,169,206],"qy":[0,1,92,93],"qyc":[93],"qycq":[93],"qyf":[1],"qyfm":[1],"qyg":[92],"qygj":[92],"qz":[105,167,175,181],"qzh":[105],"qzhg":[105],"qzs":[167],"qzt":[181],"qzty":[181],"qztyd":[181],"qzy":[175],"qzyc":[175],"qzycq":[175],"r":[7,15,23,32,39,63,68,69,72,75,80,91,95,105,126,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,159,166,174,200],"ra":[7,9,10,23,33,42,43,46,68,70,78,85,86,94,99,109,126,128,129,130,131,145,169,181,194,199,200,203,216],"raa":[99],"rac":[70,109],"rag":[42,43,86,145,194],"rai":[68,128,129],"rak":[203],"ral":[10,46],"ran":[23,33,78,126,130,169,200],"ras":[85],"rat":[181],"rav":[9,131,199,216],"ray":[94],"rb":[21,46,58,79],"rbi":[79],"rbo":[21,58],"rc":[51,81,107,124,172],"rca":[172],"rce":[51,81,107],"rch":[124],"rd":[14,18,24,36,55,57,72,76,95,96,119,120,135,138,140,146,148,156,157,158,159,160,161,162,173,177,178,184,199,202,204,210],"rda":[158],"rdb":[159],"rdh":[160],"rdi":[119,120,204],"rdo":[177,178],"rdp":[161],"rds":[14,162,202],"rdw":[95],"rdwg":[95],"rdy":[173],"rdz":[72],"rdzg":[72],"re":[1,10,12,15,24,28,32,34,39,55,60,64,65,69,70,71,72,80,88,94,100,105,118,125,132,133,134,135,138,139,146,152,156,159,164,174,178,186,188,198,200,208,210],"rea":[1,24,28,55,65,138,146,156,186,188,208,210],"rec":[132],"red":[70,94,118,133],"ree":[15,71],"ref":[64,105],"reg":[69],"reh":[164],"rel":[12,134],"rem":[200],"ren":[32,39,72,80,152,159,174],"rer":[72],"res":[10,34,69,125,133],"reu":[178],"rew":[135],"rf":[176],"rfs":[176],"rg":[30,63,105,127,156,191],"rge":[30,63,105,191],"rgl":[127],"rgr":[156],"rh":[23,155],"rhc":[23],"rhe":[155],"ri":[9,10,35,60,66,68,75,85,86,90,96,99,119,120,121,135,136,139,143,144,145,146,147,148,155,156,157,161,166,190,192,194,195,201,203,207,209],"rid":[156,157,161,192,209],"rif":[143,144,145,146,147,148],"rig":[135],"ril":[121,194],"rim":[10,35,119,120,139],"rin":[9,60,68,75,86,90,99,136,155,190,195,207],"rio":[96],"rit":[66,85,201],"riy":[166],"rk":[36,101],"rke":[101],"rki":[36],"rl":[49,50,114,166,171,202,209],"rla":[50],"rld":[114],"rle":[171],"rli":[49],"rlo":[202],"rn":[9,22,71,106,112,113,133,175,197],"rna":[106,197],"rne":[112,113],"rni":[175],"rns":[133],"ro":[22,36,37,59,63,72,79,82,89,91,95,115,121,122,123,124,125,126,127,137,138,139,140,141,167,169,186,210],"roa":[91],"rof":[79,169],"rok":[167],"rol":[115],"ron":[36,63,82,186,210],"ros":[37,72,89,121,122],"rot":[123,124,125,126,127],"rou":[59,95],"row":[22],"roy":[137,138,139,140,141],"rp":[128,153,154,160,166],"rpe":[128,153,166],"rps":[154],"rr":[22,59,64,105],"rre":[105],"rro":[22,59],"rry":[64],"rs":[7,29,65,80,108,111,116,117,121,122,143,154,155,157,165,169,172,188,194,199,208],"rsa":[117],"rsd":[108,121],"rsf":[208],"rsh":[155,199],"rsi":[165],"rsl":[111],"rso":[154],"rsp":[29,80],"rss":[122,143],"rst":[116,188],"rsw":[157,172],"rt":[11,40,44,45,94,112,117,155,206],"rta":[112,117],"rte":[206],"rth":[44,45],"rti":[11],"rto":[94],"rts":[40,155],"ru":[3,7,23,73,74,84,134,142],"rub":[84],"rui":[23,73,74],"ruo":[7],"rus":[142],"rut":[134],"rv":[27,132],"rve":[132],"rvi":[27],"rw":[65,114],"rwo":[114],"rwr":[65],"ry":[64,102,114,134,166],"rym":[64],"ryo":[102,134],"rz":[80,106,178],"rzi":[106,178],"rzj":[80],"s":[0,2,4,6,7,11,15,20,22,25,27,28,29,32,35,36,37,40,41,43,44,45,49,53,57,59,63,64,66,67,69,71,73,74,79,82,83,85,87,88,89,93,94,96,98,99,101,102,103,107,108,109,113,114,115,116,117,118,120,122,123,124,125,126,127,128,133,137,138,139,140,141,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,184,186,188,190,194,196,197,198,199,202,206,213,214,217],"sa":[0,1,40,86,94,117,143,144,145,146,147,148,149,171,187],"sac":[94,143,144,145,146,147,148],"sag":[40],"san":[0,1,171],"sap":[149],"sas":[187],"saw":[117],"sb":[6,13,42],"sba":[42],"sbl":[13],"sbo":[6],"sc":[10,34,37,54,112,125,140,150,152,171,177,179,192],"sca":[152,171],"sce":[34,125,177,179,192],"sci":[150],"scj":[140],"sco":[54],"scr":[10],"scu":[112],"sd":[108,121,128,138,217],"sda":[108],"sdj":[138],"sdr":[121],"sdy":[128,217],"sdyg":[217],"sdyx":[128],"se":[15,16,33,35,40,69,96,99,103,108,128,151,152,153,178,195,211],"sea":[15,96],"sec":[33],"sel":[16,211],"sem":[35],"sen":[69,103,178],"seq":[151],"ser":[40,128,152,153],"sf":[94,208],"sfi":[208],"sfy":[94],"sfyd":[94],"sg":[55,74,176,182,216],"sgg":[74],"sgr":[55,216],"sh":[2,4,7,9,11,20,25,27,29,37,40,41,44,45,53,59,63,64,66,71,73,74,75,79,84,85,87,88,89,98,99,101,102,103,107,108,109,113,114,118,122,123,124,125,126,127,128,129,133,137,138,139,140,141,143,152,154,155,163,167,169,171,174,176,178,181,182,186,188,196,197,198,199,206,214],"sha":[29,40,44,53,59,109,152,154,171,174,182,196,199],"she":[2,20,79,85,87,128,129,133,143,154,206],"shf":[27],"shg":[9],"shi":[11,41,45,63,71,73,75,84,88,89,98,101,102,103,107,113,114,118,123,124,125,126,127,133,137,138,139,140,141,154,167,176,178,181,186,197,198,214],"sho":[4,64,122,154,155,163],"shu":[7,25,37,66,74,99,108,169,178,188,206],"shz":[63],"shzr":[63],"si":[6,7,27,60,63,90,94,104,147,150,155,165,177,187,193,217],"sid":[217],"sif":[94],"sig":[63],"sil":[155,165],"sim":[7],"sio":[27,90,177],"sir":[60],"sis":[187],"sit":[193],"siv":[104],"siy":[147],"siz":[6],"sj":[22,41,79,114,143],"sjd":[22],"sjx":[114],"sjxj":[114],"sjz":[143],"sjzd":[143],"sjzdh":[143],"sjzdhz":[143],"sk":[133,156,157,158,159,160,161,162],"skc":[133],"sky":[156,157,158,159,160,161,162],"sl":[20,28,56,66,69,85,111,129,141,163,167,169,175,194,197],"sla":[20,56,129,194],"sle":[175],"slh":[66],"sli":[163],"slo":[111],"slq":[141],"slw":[69],"slwq":[69],"slx":[167],"slxq":[167],"slxqz":[167],"slxqzs":[167],"sly":[169,197],"slyd":[197],"slydd":[197],"slyz":[169],"slyzh":[169],"slz":[85],"slzz":[85],"slzzy":[85],"sm":[110,139,202,217],"sme":[202],"smf":[139],"smfl":[139],"smo":[110,217],"sn":[164,165],"sna":[164],"sno":[165],"so":[2,10,23,35,40,115,151,154,166,167,168,194,213,214],"soa":[23,154],"sof":[40,194],"sol":[2,151,166],"son":[10,35,115,167,168,213,214],"sp":[29,43,49,80,81,83,89,93,104,105,120,121,122,141,153,162,169],"spa":[80],"spe":[43,89,93,104,120,121,122,141],"spi":[29,43,49,81,153,162],"spl":[83,105,169],"sq":[88],"squ":[88],"sr":[91,128,200],"sra":[128],"sre":[200],"sro":[91],"ss":[13,16,35,57,59,83,84,88,89,96,99,103,104,108,111,122,143,154,168,178,187,190,211],"ssb":[13],"sse":[16,35,96,103,178,211],"ssh":[59,84,122],"ssi":[104,187],"ssp":[83,89],"ssq":[88],"sss":[89,154],"sssz":[154],"ssszs":[154],"sst":[143],"ssw":[57],"ssz":[154],"sszs":[154],"st":[10,32,37,50,60,69,72,82,94,98,101,102,105,114,116,127,133,142,143,155,165,168,170,171,172,173,179,180,187,188,190,207,216],"sta":[116,127,143,165,170,171,172,187,207],"stb":[72],"ste":[32,60,101],"stg":[188],"sti":[50,82,168,180],"sto":[114,133,179,216],"stp":[94],"str":[10,69,155,190],"sts":[105],"stu":[173],"stz":[98],"stzh":[98],"su":[0,22,27,28,67,78,84,86,87,102,150,174,175,176,203],"sug":[203],"sui":[22,28,67],"sum":[174],"sun":[0,150,175],"suo":[102],"sup":[27,176],"sur":[84,86,176],"sut":[87],"sv":[85],"sve":[85],"sw":[18,24,36,53,55,57,58,71,89,106,113,138,140,146,148,156,157,172,177,178,184,199,202,210],"swa":[58,106,172],"swo":[18,24,36,55,57,71,113,138,140,146,148,156,157,177,178,184,199,202,210],"swz":[53,89],"swzy":[53],"sx":[87,178],"sxs":[178],"sxsz":[178],"sxszz":[178],"sxszzj":[178],"sxz":[87],"sxzy":[87],"sy":[147,179,198],"syl":[147],"sym":[179],"sz":[2,6,25,29,40,67,102,109,113,118,123,124,125,126,127,137,154,171,178],"szd":[67,109,125],"szdy":[125],"szf":[29],"szfc":[29],"szg":[6,124,137],"szgh":[124],"szh":[25],"szj":[123],"szjp":[123],"szm":[113],"szmt":[113],"szs":[102,154],"szw":[40],"szwx":[40],"szwxd":[40],"szwxdd":[40],"szwxddd":[40],"szx":[127],"szxl":[127],"szz":[126,171,178],"szzj":[178],"szzy":[126],"t":[0,1,5,13,14,15,16,36,40,41,45,47,48,49,52,53,59,62,68,82,94,98,100,111,113,121,134,150,156,157,158,159,160,161,162,165,169,171,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,210,211],"ta":[16,24,41,45,53,89,109,112,116,117,121,127,143,165,170,171,172,180,181,187,194,207,211],"tab":[117],"taf":[143,170,171],"tai":[24,53,89,109,112],"tal":[41,180,194],"tam":[181],"tan":[45,121,187,194],"tao":[194],"tar":[116,127,165,172,207],"tas":[16,211],"tb":[61,72],"tbe":[72],"tbl":[61],"tc":[38,48,172,185],"tch":[38,172,185],"tcz":[48],"tczd":[48],"tczdg":[48],"td":[156,210],"tdj":[210],"tdy":[156],"tdyj":[156],"te":[4,17,22,24,32,39,49,60,67,80,101,105,106,119,127,154,169,181,189,197,201,202,206,210,211,212],"teb":[212],"tec":[39],"ted":[24],"tee":[32],"tei":[181,210],"teo":[67,202],"ter":[4,22,60,80,101,105,106,119,127,154,169,197],"tet":[211],"tex":[206],"tf":[74,82,135],"tfc":[82],"tfu":[74,135],"tg":[49,188],"tgd":[49],"tgdf":[49],"tgdfq":[49],"tgr":[188],"th":[0,1,11,13,14,15,38,40,44,45,47,49,53,62,65,68,80,92,93,94,113,114,133,134,150,154,171,182,183,184,185,186,187,188,189,190,191,192,193,194,195,197],"tha":[11],"the":[13,14,15,40,45,47,49,53,62,65,68,94,114,150,171,182,183,184,185,186,187,188,189,190,191,192,193,197],"thi":[92,93],"thm":[38],"tho":[0,1],"thr":[133,194],"ths":[44,113],"thu":[192,195],"ti":[1,2,5,11,36,48,49,50,51,59,82,98,111,156,157,158,159,160,161,162,168,180,181,196,202,205,210],"tia":[5,49,111,156,157,158,159,160,161,162],"tic":[48,180],"tid":[196],"tie":[36,59,82,98,210],"til":[168],"tim":[202],"tin":[1,50,82,181],"tio":[2,51,205],"tis":[11],"tj":[36,111],"tk":[158,159,160,161,162],"tkz":[158,159,160,161,162],"tkza":[161],"tkzj":[158,162],"tkzr":[159],"tkzy":[160],"tl":[158,194,200],"tla":[158],"tld":[200],"tldl":[200],"tldld":[200],"tldldh":[200],"tldldhy":[200],"tly":[194],"tlyj":[194],"tlyjt":[194],"tm":[5,188],"tma":[188],"tmy":[5],"tmyd":[5],"tmydd":[5],"tn":[48],"tni":[48],"to":[68,73,90,94,113,114,118,121,122,123,124,125,126,127,133,165,179,197,198,216],"tof":[68,73,90,179],"tom":[165,197],"ton":[113,133,216],"tor":[114,118,121,122],"tot":[94,123,124,125,126,127],"tou":[198],"tp":[34,68,94,100],"tpi":[34],"tpr":[68,94],"tr":[10,69,115,134,155,169,190,199],"tra":[10,169,199],"tre":[69],"tri":[155,190],"tro":[115],"tru":[134],"ts":[24,40,49,55,78,84,86,105,106,128,138,145,146,153,155,156,171,174,179,210],"tsa":[40,171],"tsh":[174],"tsp":[49,105,153],"tsr":[128],"tst":[155],"tsu":[78,84,86],"tsw":[24,55,106,138,146,156,210],"tt":[105,106,119,127],"tte":[105,106,119,127],"tu":[10,70,100,112,151,173,200],"tud":[151],"tul":[200],"tup":[100],"tur":[10,70,112,173],"tw":[52,111,201],"twe":[111],"twi":[52,201],"ty":[25,26,59,66,85,123,124,125,126,127,152,157,181],"tyd":[181],"tyj":[157],"tyk":[59],"tykj":[59],"tyo":[25],"typ":[123,124,125,126,127],"tyq":[26],"tys":[152],"tz":[45,67,98,106,121],"tza":[67],"tzh":[98],"tzj":[121],"tzs":[45],"u":[176,191,202,203],"ua":[7,23,37,48,49,50,62,65,66,70,75,78,81,89,90,94,96,98,99,105,106,107,120,121,124,134,136,149,158,176,182,187,198,204,206,208,209,213,217],"uae":[106],"uaf":[198],"uam":[99],"uan":[23,37,48,49,62,70,75,78,81,89,90,94,96,105,107,120,121,136,149,158,176,182,187,204,206,208,209,217],"uar":[134],"uas":[7],"uaz":[65,213],"ub":[39,84,135],"uba":[135],"ube":[84],"uc":[5,10,95,129,187],"uca":[129],"uce":[95],"uch":[5,10,187],"ud":[30,41,61,95,149,151,181,188],"uda":[61,149],"ude":[95,151,188],"udf":[30],"udu":[41,181],"ue":[13,23,24,26,34,35,38,40,50,76,78,107,108,110,122,125,151,165,166,175,190,193,201,217],"ueb":[78],"uec":[175],"ued":[24,38],"ueg":[217],"ueh":[50],"uej":[122],"uel":[26],"uem":[76],"uen":[151],"uer":[23],"ues":[40,107],"uex":[190],"uez":[34,35,108,165,193],"uf":[46,78],"ufa":[46],"ufu":[78],"ug":[130,131,132,191,203],"uge":[130],"ugi":[203],"ugo":[131,132,191],"ugu":[130],"uh":[66,96,100,124,185],"uha":[96,100],"uhu":[66,124,185],"ui":[2,7,8,22,23,25,28,29,40,63,64,65,66,67,73,74,81,86,88,90,97,99,105,130,133,143,152,169,178,188,192,200,206,209],"uic":[133,188],"uid":[40,97],"uig":[90,105],"uih":[64,65],"uij":[22],"uil":[8,28,66,169,192],"uim":[86],"uin":[23],"uir":[88],"uis":[99,152,206],"uit":[73,74],"uix":[178,209],"uiy":[200],"uiz":[25,63,67,143],"uj":[27,92,153,156,157,202],"uji":[27,92,153,156,157,202],"uk":[41,198],"uka":[198],"uke":[41],"ul":[7,10,24,48,73,74,97,135,147,193,195,200,202,203,207],"ula":[7,193,200,207],"ule":[203],"ulf":[48,73],"ulh":[74],"uli":[203],"ull":[200],"ulo":[24,147],"ulr":[135],"uls":[195],"ult":[10,202],"ulu":[97],"um":[1,3,10,50,77,95,134,136,170,174,203,213],"uma":[3,10],"ume":[1,213],"umi":[50,77,95,134,136,203],"umm":[174],"umo":[170],"un":[0,4,13,30,31,53,66,70,80,97,109,110,115,150,175,179,191,192,195],"und":[13,31,195],"unf":[191],"ung":[31,70,115],"unn":[175],"uns":[0,66,110],"unt":[4,53,80,109,192],"unz":[110,179],"uo":[3,7,25,52,59,72,74,83,89,100,102,123,124,125,126,127,164,174,181,185,196,206],"uod":[125],"uof":[174],"uog":[74,124],"uoj":[59,123,196],"uos":[7],"uou":[3],"uow":[164],"uox":[52,127],"uoy":[89],"uoz":[83,100,126],"up":[27,100,176],"upe":[27],"upu":[100],"uq":[105,175],"uqi":[105,175],"ur":[10,12,39,63,66,70,84,85,86,96,112,126,132,173,176,181,198,203],"ura":[85,86,181,203],"urd":[173],"ure":[10,12,39,70,198],"urf":[176],"uri":[66,96],"urn":[112],"uro":[63],"urt":[112],"uru":[84],"urv":[132],"us":[0,1,22,41,54,55,56,57,58,59,64,75,96,102,108,142,198,214,217],"usa":[0,1],"usc":[54],"use":[108],"usg":[55],"ush":[41,64,75,198,214],"usi":[217],"usl":[56],"uss":[57,59,96],"ust":[102,142],"usu":[22],"usw":[58],"ut":[2,49,67,78,87,119,134,181,189],"ute":[49,67,189],"uth":[134],"uti":[2,181],"uts":[78],"utt":[119],"uu":[110],"uun":[110],"uv":[64],"uve":[64],"ux":[96,128,155],"uxi":[128,155],"uxu":[96],"uy":[5,13,24,30,33,34,61,106,120,169,197,214],"uye":[106],"uyi":[5,13,33],"uyo":[169,197],"uyu":[24,30,34,61,120,214],"uz":[38,60,71,86,154,164,178,179],"uzh":[38,60,71,86,154,164,179],"uzi":[71],"v":[10,85,192,204,205,206],"va":[206],"van":[206],"ve":[9,50,64,85,104,108,111,118,122,131,132,155,165,199,202,204,207,208,209,216],"veb":[132,208],"vec":[64],"vel":[122,199],"ven":[9,131,207],"ver":[50,85,108,111,155,165,202,204,209],"ves":[118,216],"vew":[104],"vi":[27,192,205],"vid":[205],"vir":[192],"vis":[27],"viv":[205],"vo":[8,54,55,56,57,58,206],"von":[8,54,55,56,57,58],"vor":[206],"vu":[10],"vul":[10],"vx":[199],"vxi":[199],"w":[3,9,13,14,15,21,22,40,53,58,65,69,88,89,94,95,100,101,104,105,106,112,120,164,169,172,187,191,193,197,202,207,208,209,210,211,212,213,214,215,216],"wa":[3,14,21,53,58,69,88,95,100,101,106,135,158,159,160,161,162,164,169,172,197,202,207,208,209],"wal":[106],"wan":[3,14,53,69,88,95,100,101,164,172,197,202,207],"war":[21,58,135,158,159,160,161,162],"wat":[169,172],"wav":[208,209],"wc":[187,202],"wcj":[187,202],"wcjm":[202],"wcjmj":[202],"we":[9,13,15,40,65,89,98,108,111,112,117,155],"wea":[108,111],"wei":[13,15,40,112],"wen":[9,89],"wer":[65,98,117,155],"wg":[95,100,164,191],"wgz":[100,164,191],"wgzh":[100],"wgzht":[100],"wgzhtp":[100],"wgzj":[191],"wh":[15,209,210,211,212],"whi":[209,210,211,212],"whx":[15],"whxb":[15],"wi":[52,66,94,104,120,193,201,213,214],"wid":[193],"wil":[52],"win":[66,94,104,120,201,213,214],"wj":[9,112],"wjb":[9],"wjy":[112],"wjyq":[112],"wl":[13,22],"wla":[22],"wlz":[13],"wlzg":[13],"wn":[37,79,101,108],"wni":[37],"wny":[101],"wnys":[101],"wo":[18,24,36,55,57,71,113,114,138,140,146,148,149,156,157,177,178,184,199,202,210,215,216],"wol":[215,216],"woo":[149],"wor":[18,24,36,55,57,71,113,114,138,140,146,148,156,157,177,178,184,199,202,210],"wq":[69,105],"wqz":[105],"wqzh":[105],"wqzhg":[105],"wr":[65],"wre":[65],"ws":[22,27,128,197],"wse":[128],"wsj":[22],"wsjd":[22],"wsl":[197],"wsly":[197],"wslyd":[197],"wslydd":[197],"wsu":[27],"wt":[165],"wto":[165],"wu":[13,22,105,187,191],"wuc":[187],"wug":[191],"wuq":[105],"wus":[22],"wuy":[13],"ww":[3],"wx":[40,88,207],"wxd":[40],"wxdd":[40],"wxddd":[40],"wxj":[88],"wxjs":[88],"wy":[13],"wyw":[13],"wywl":[13],"wywlz":[13],"wywlzg":[13],"wz":[14,53,89],"wzg":[14],"wzy":[53],"x":[4,10,14,15,23,24,26,35,40,42,51,52,54,55,56,57,58,67,68,84,87,88,89,91,96,97,103,104,114,115,116,117,127,128,134,155,165,166,167,172,178,179,182,186,190,195,199,205,207,209,214,217],"xb":[15],"xc":[136],"xch":[136],"xd":[24,40,89,117,214],"xdd":[40],"xddd":[40],"xdj":[24,214],"xdjy":[214],"xdjys":[214],"xdl":[117],"xdlj":[117],"xdy":[89],"xdys":[89],"xdysw":[89],"xdyswz":[89],"xf":[54,55,56,57,58,217],"xfc":[56],"xfcq":[56],"xfd":[55],"xfdj":[55],"xfj":[57],"xfl":[58],"xflg":[58],"xfm":[54],"xfmd":[54],"xfs":[217],"xfsd":[217],"xfsdy":[217],"xfsdyg":[217],"xg":[115],"xi":[4,10,14,15,26,35,40,42,51,52,54,55,56,57,58,67,68,84,87,88,89,91,96,103,104,114,116,117,127,128,134,155,165,166,167,172,178,179,182,186,190,195,199,205,207,214,217],"xia":[4,14,40,42,52,87,88,91,96,128,134,155,166,167,178,179,182,186,190,195,214],"xid":[89],"xie":[117],"xif":[54,55,56,57,58,217],"xin":[10,15,35,51,68,84,103,104,114,116,127,155,165,172,199,205,207],"xip":[217],"xis":[67],"xiz":[26],"xj":[10,68,88,114,199],"xjc":[10],"xjcy":[10],"xjs":[88],"xl":[4,42,91,97,127,166],"xll":[91],"xlly":[91],"xlm":[42],"xlmc":[42],"xlr":[166],"xlry":[166],"xls":[4],"xn":[205],"xq":[167],"xqz":[167],"xqzs":[167],"xr":[23],"xrh":[23],"xrhc":[23],"xs":[67,103,178,182],"xsg":[182],"xsz":[67,178],"xszd":[67],"xszz":[178],"xszzj":[178],"xu":[23,24,96,97,115,165,209],"xua":[209],"xue":[23,24,165],"xul":[97],"xun":[115],"xur":[96],"xv":[206],"xva":[206],"xw":[14],"xwz":[14],"xwzg":[14],"xx":[155],"xy":[165,179],"xyz":[179],"xyzz":[179],"xz":[26,87,96,104,165,172,186,195],"xzd":[165],"xzdx":[165],"xzdxy":[165],"xzf":[104],"xzh":[96],"xzhh":[96],"xzs":[186],"xzy":[87],"xzz":[172],"xzzw":[172],"y":[0,1,5,8,10,12,13,16,17,18,19,20,21,24,30,33,34,35,39,46,50,53,59,61,62,71,73,76,78,84,85,87,89,90,91,92,93,94,101,106,107,108,110,111,112,114,115,119,120,125,126,128,129,131,134,135,136,147,149,150,151,152,155,156,157,160,165,166,169,175,179,181,185,193,194,196,197,198,200,203,205,211,212,214,215,217],"ya":[0,12,17,18,19,20,21,53,87,92,93,101,115,119,126,131,136,137,138,139,140,141,150,215],"yal":[137,138,139,140,141],"yan":[0,17,18,19,20,21,92,93,115,119,126,150],"yao":[0,12,87,101],"yax":[136],"yay":[131],"yb":[78,173,186],"ybj":[78],"ybjj":[78],"ybo":[173],"ybr":[186],"yc":[18,19,90,93,129,152,175,205],"ycg":[90],"ycj":[18],"ycq":[19,93,175],"ycs":[152],"ycx":[205],"ycxn":[205],"yd":[5,61,94,135,181,197],"ydc":[135],"ydcb":[135],"ydd":[5,197],"ye":[1,51,90,94,106,111,112,113,194],"yec":[90],"yef":[1],"yeh":[106],"yeo":[51],"yeq":[112],"yer":[94,194],"yet":[111],"yf":[1,17,45,46,115,182],"yfl":[182],"yfm":[1],"yfo":[45],"yfq":[46],"yfx":[115],"yfxg":[115],"yfy":[17],"yg":[92,131,217],"ygj":[92],"yh":[4,50,106,185],"yhe":[106],"yhez":[106],"yhu":[4],"yi":[5,8,13,16,33,39,59,73,84,85,91,114,135,147,151,152,160,165,194,196,200,205,211,212],"yic":[205],"yid":[135],"yil":[39],"yin":[5,8,13,16,33,59,73,91,151,152,165,194,196,211,212],"yis":[114,147],"yix":[84],"yj":[8,119,156,157,194,212],"yjl":[119],"yjt":[194],"yk":[59,196],"ykj":[59,196],"yl":[24,39,147,203],"ylf":[39],"ylfr":[39],"ylq":[203],"ylx":[24],"ylxd":[24],"ylxdj":[24],"yly":[203],"ylyl":[203],"ylylq":[203],"ym":[64,73,76,134,149,175,179],"yma":[64],"ymd":[149],"ymo":[175],"ymp":[179],"ymx":[134],"ymz":[73],"ymzs":[73],"yo":[25,71,87,102,106,134,169,197,203],"yof":[25,87,102,134],"yon":[169,197],"you":[71,106,203],"yp":[123,124,125,126,127],"ype":[123,124,125,126,127],"yq":[0,16,26,112,211],"yqu":[26],"yqy":[0],"yr":[156,157],"yri":[156,157],"ys":[89,101,107,114,147,152,199,214],"ysc":[152],"ysj":[114],"ysjx":[114],"ysjxj":[114],"yst":[114],"ysw":[89,199],"yswz":[89],"ysy":[147],"ysyl":[147],"yt":[111,200],"ytj":[111],"ytu":[200],"yu":[10,17,24,30,33,34,35,46,50,61,62,76,77,78,89,94,107,108,110,120,125,128,129,131,134,147,149,155,156,157,166,175,179,181,185,193,198,203,214,217],"yua":[62,89,94,120,149],"yuc":[129],"yud":[61,181],"yue":[34,35,50,76,78,107,108,110,125,166,175,193,217],"yuf":[46],"yug":[131],"yuh":[185],"yuj":[156,157],"yul":[24,147,203],"yum":[77,134],"yun":[30,110,179],"yur":[181],"yus":[214],"yux":[128,155],"yuy":[33],"yw":[13,158,159,160,161,162],"ywa":[158,159,160,161,162],"ywl":[13],"ywlz":[13],"ywlzg":[13],"yx":[84,128,155],"yxx":[155],"yy":[33,106,131],"yyg":[131],"yyh":[106],"yyhe":[106],"yyhez":[106],"yz":[20,21,34,35,62,71,108,110,150,169,179,193],"yzd":[20,108],"yzds":[108],"yzdss":[108],"yzg":[21],"yzh":[169],"yzq":[62],"yzs":[71,150],"yzx":[35],"yzy":[110],"yzz":[179],"z":[2,6,13,14,20,21,25,26,29,30,34,35,38,40,44,45,47,48,51,53,60,62,63,65,67,70,71,72,73,75,77,80,81,83,85,86,87,89,96,98,100,102,104,105,106,108,109,110,113,118,121,122,123,124,125,126,127,134,136,137,138,139,140,141,143,145,150,154,158,159,160,161,162,164,165,167,168,169,170,171,172,174,175,177,178,179,181,183,186,188,191,193,195,206,208,213],"za":[26,67,161,165],"zai":[26],"zal":[67],"zan":[165],"zc":[188],"zcd":[188],"zcdd":[188],"zcddm":[188],"zcddms":[188],"zd":[20,48,67,108,109,125,143,165],"zdg":[48],"zdh":[143],"zdhz":[143],"zds":[108],"zdss":[108],"zdx":[165],"zdxy":[165],"zdy":[125],"ze":[47],"zf":[29,104,174],"zfc":[29],"zfz":[174],"zfzr":[174],"zg":[6,13,14,21,72,77,124,137],"zgh":[124],"zh":[6,13,14,20,21,25,29,30,34,35,38,40,44,45,48,51,53,60,62,63,65,67,70,71,72,73,75,77,80,81,83,85,86,87,96,98,100,102,104,105,108,109,110,113,118,122,126,134,136,137,143,145,150,154,158,159,160,161,162,164,167,168,169,170,171,172,174,175,177,178,179,181,183,186,191,193,195,206,208,213],"zha":[14,20,21,51,53,86,126,137,143,145,170,171,193,208],"zhe":[34,44,85,86,108,109,113,118,134,143,164,172,175,179,195],"zhg":[105],"zhh":[96],"zhi":[6,13,25,29,35,38,45,48,60,65,67,70,71,72,73,75,77,80,81,83,85,87,98,102,104,105,108,109,110,113,122,136,150,154,158,159,160,161,162,167,168,169,170,171,172,174,177,178,186,191,195,206,213],"zho":[40,45,62,183],"zht":[100],"zhtp":[100],"zhu":[30,63,65,96,100,174,181],"zhz":[65],"zhzl":[65],"zi":[0,71,89,106,150,178],"zin":[0,150],"zis":[178],"ziy":[71],"ziz":[178],"zj":[60,80,121,123,158,162,177,178,183,191],"zjp":[123],"zl":[65,70,83],"zll":[70],"zllg":[70],"zm":[45,113],"zmj":[45],"zmjt":[45],"zmjtz":[45],"zmjtzs":[45],"zmt":[113],"zo":[137,138,139,140,141,179],"zon":[137,138,139,140,141],"zou":[179],"zp":[67],"zpi":[67],"zq":[38,62,122,168,208],"zr":[63,159,174],"zs":[45,71,73,102,109,113,137,138,139,140,141,150,154,167,186,206,213],"zsc":[140],"zscj":[140],"zsd":[138],"zsdj":[138],"zsl":[141],"zslq":[141],"zsm":[139],"zsmf":[139],"zsmfl":[139],"zsz":[109,113,137],"zszd":[109],"zszg":[137],"zszm":[113],"zszmt":[113],"zt":[181],"zty":[181],"ztyd":[181],"zu":[2,12,121,123,124,125,126,127,188],"zua":[121],"zui":[2,188],"zuo":[123,124,125,126,127],"zur":[12],"zw":[40,172],"zwx":[40],"zwxd":[40],"zwxdd":[40],"zwxddd":[40],"zx":[35,51,127,195],"zxl":[127],"zxz":[195],"zy":[30,53,71,85,87,108,110,126,134,160,175],"zyc":[175],"zycq":[175],"zym":[134],"zymx":[134],"zyz":[71,108],"zyzd":[108],"zyzds":[108],"zyzdss":[108],"zyzs":[71],"zz":[60,85,86,126,170,171,172,178,179],"zzj":[60,178],"zzw":[172],"zzy":[85,126],"zzz":[86],"一":[84],"一心":[84],"万":[100,101,197],"万世":[197],"万国":[100],"万能":[101],"下":[88],"下近":[88],"不":[50],"不灭":[50],"与":[214],"与诗":[214],"且":[181],"且住":[181],"世":[102,114,197],"世之":[102],"世流":[197],"世界":[114],"东":[198],"东花":[198],"中":[40],"中伟":[40],"临":[177],"临之":[177],"丸":[3],"义":[135],"义的":[135],"之":[6,13,25,29,35,38,45,48,60,65,67,71,72,73,75,77,80,81,83,85,87,98,102,104,105,109,110,113,122,136,150,154,158,159,160,161,162,167,168,169,170,171,172,174,177,178,186,191,195,206,213],"之傲":[161],"之刃":[159,174],"之剑":[60,177,178,191],"之卷":[158],"之史":[186],"之喙":[81],"之嗣":[150],"之回":[105],"之实":[73],"之弓":[6,77],"之弦":[195],"之形":[35],"之径":[80],"之时":[167],"之明":[113],"之曲":[168],"之月":[110],"之望":[172],"之杖":[170,171],"之果":[72],"之枪":[38],"之槊":[206],"之歌":[13],"之环":[75,136],"之珑":[83],"之真":[85],"之祸":[25],"之稻":[48],"之笛":[67],"之纺":[29],"之翎":[65],"之翼":[160],"之脊":[162],"之花":[98],"之誓":[71,154],"之诗":[45],"之辉":[169],"之钉":[109],"之钥":[87],"之锁":[102],"之锋":[104],"之锹":[122],"之颂":[213],"乌":[22],"乌髓":[22],"乐":[85,193,203],"乐之":[85],"乐御":[203],"乐章":[193],"乘":[209],"乘浪":[209],"乱":[78],"乱月":[78],"事":[41],"事集":[41],"云":[30,110],"云之":[110],"亭":[181],"亭御":[181],"人":[39,80],"人之":[80],"仙":[178],"仙十":[178],"以":[39],"以理":[39],"伟":[40],"伟贤":[40],"住":[181],"住亭":[181],"余":[33],"余音":[33],"作":[123,124,125,126,127],"作古":[124],"作斩":[126],"作星":[127],"作澹":[125],"作金":[123],"使":[103],"侍":[88],"便":[117],"便携":[117],"信":[15,103,104],"信之":[104],"信使":[103],"信标":[15],"傲":[161],"光":[48,49,70,90,105,176,182,217],"光的":[49],"公":[135],"公义":[135],"典":[54,94,197],"兹":[106],"冬":[72,116],"冬之":[72],"冬极":[116],"冲":[176],"冲浪":[176],"决":[38],"决斗":[38],"冷":[32,151],"冷刃":[32],"冷寂":[151],"刀":[5,20,61,149],"刃":[32,159,174],"切":[105,203],"切之":[105],"初":[175,188],"初晴":[175],"初的":[188],"刺":[19,82],"刺枪":[19],"剑":[8,18,24,36,55,57,59,60,79,92,138,140,146,148,153,156,157,177,178,183,184,187,189,191,196,199,202,210,212],"力":[117],"力锯":[117],"动":[117],"动力":[117],"勘":[121],"勘探":[121],"勾":[164],"勾针":[164],"匙":[101],"匣":[42,91,134,166],"匣里":[42,91,166],"十":[89,178],"十字":[178],"十文":[89],"千":[0,1,92,93],"千夜":[1],"千岩":[92,93],"千阳":[0],"华":[50,66,106,124],"华尔":[106],"卷":[158],"厄":[25],"厄水":[25],"原":[94,149],"原典":[94],"原木":[149],"反":[132],"反曲":[132],"古":[71,92,124],"古剑":[92],"古华":[124],"古自":[71],"可":[41],"可故":[41],"史":[186],"叶":[90],"叶萃":[90],"叹":[45],"叹之":[45],"吃":[61],"吃虎":[61],"吟":[91],"吹":[152],"吹哨":[152],"咄":[181],"和":[120],"和璞":[120],"响":[167],"响起":[167],"哨":[152],"喙":[81],"喜":[89],"喜多":[89],"嗟":[45],"嗟叹":[45],"嗣":[150],"嘟":[41],"嘟可":[41],"嘟嘟":[41],"器":[69],"四":[94],"四风":[94],"回":[105,200,209],"回光":[105],"回忆":[200],"回旋":[209],"国":[100],"国诸":[100],"图":[100,200],"图莱":[200],"图谱":[100],"圣":[87,143],"圣显":[87],"圣祭":[143],"地":[44],"地者":[44],"坊":[198],"坊时":[198],"坚":[173],"坚骨":[173],"坞":[187],"坞长":[187],"垠":[13],"垠蔚":[13],"城":[23],"多":[89],"多院":[89],"夜":[1,106,111,112],"夜华":[106],"夜天":[111],"夜曲":[112],"夜浮":[1],"大":[55,138,146,156,188,197,210],"大典":[197],"大剑":[55,138,146,210],"大御":[156],"大魔":[188],"天":[5,49,111,156,157,158,159,160,161,162],"天光":[49],"天大":[156],"天御":[157],"天目":[5],"天空":[158,159,160,161,162],"天镜":[111],"奏":[179],"奏者":[179],"孑":[22],"孑灯":[22],"字":[89,178],"字之":[178],"宗":[137,138,139,140,141],"宗室":[137,138,139,140,141],"宝":[201],"宝珏":[201],"实":[73],"室":[137,138,139,140,141],"室大":[138],"室猎":[141],"室秘":[139],"室长":[137,140],"寂":[151],"寂迸":[151],"寝":[175],"寝正":[175],"对":[40],"对答":[40],"导":[97],"导绪":[97],"射":[154],"射手":[154],"尔":[106],"尔兹":[106],"尘":[102],"尘世":[102],"山":[53,109],"山之":[109],"山王":[53],"岩":[17,18,19,20,21,92,93,115,119,126],"岩刺":[19],"岩古":[92],"岩峰":[115],"岩战":[21],"岩斩":[20],"岩结":[119],"岩绯":[17],"岩长":[18,93],"峡":[14],"峡湾":[14],"峰":[115,174],"峰之":[174],"峰巡":[115],"巡":[115],"巡歌":[115],"工":[191],"工之":[191],"巷":[4,182,214],"巷猎":[4],"巷的":[214],"巷闪":[182],"帷":[112],"帷间":[112],"幽":[106],"幽夜":[106],"异":[114],"异世":[114],"弓":[6,21,31,58,77,131,132,137,142,144,163,192],"弓藏":[142],"弥":[173],"弥坚":[173],"弦":[128,155,190,195],"弦振":[195],"弹":[163],"弹弓":[163],"录":[139],"形":[35],"彩":[205],"彩心":[205],"影":[5,59,196,212],"影剑":[212],"影打":[5],"影阔":[59,196],"径":[80],"御":[156,157,181,203],"御剑":[156,157],"御咄":[181],"御簾":[203],"心":[51,84,155,205],"心弦":[155],"心念":[205],"忆":[200],"忍":[72],"忍冬":[72],"念":[205],"息":[26,67],"息灾":[26],"息燧":[67],"恶":[3],"恶王":[3],"意":[85],"慧":[63],"慧铸":[63],"战":[21],"战弓":[21],"手":[4,64,154],"手之":[154],"打":[5],"打刀":[5],"护":[170],"护摩":[170],"报":[135],"拉":[200],"拉的":[200],"拾":[63],"拾慧":[63],"振":[195],"挽":[95],"挽歌":[95],"掘":[122],"掘金":[122],"掠":[118],"掠食":[118],"探":[121],"探钻":[121],"携":[117],"携动":[117],"摩":[170],"摩之":[170],"撼":[44],"撼地":[44],"支":[70],"支离":[70],"故":[41],"故事":[41],"文":[89],"文字":[89],"斗":[38],"斗之":[38],"斩":[20,86,126],"斩刀":[20],"斩岩":[126],"斩长":[86],"斫":[174],"斫峰":[174],"断":[204,208],"断浪":[208],"斯":[6,217],"斯之":[6],"斯的":[217],"旅":[199],"旅行":[199],"旋":[209],"无":[13,191],"无垠":[13],"无工":[191],"日":[166],"日月":[166],"时":[167,176,198],"时光":[176],"时雨":[198],"明":[79,113,186],"明瞳":[113],"明破":[186],"明神":[79],"星":[10,116,127,165,172,207],"星者":[172],"星银":[165],"星镰":[127],"星鹫":[10],"昭":[51],"昭心":[51],"显":[87],"显之":[87],"晓":[186],"晓之":[186],"晚":[207],"晚星":[207],"晴":[175],"暗":[4,36,182,214],"暗巷":[4,182,214],"暗铁":[36],"曙":[108],"曙色":[108],"曚":[110],"曚云":[110],"曜":[0],"曜千":[0],"曲":[62,112,132,168],"曲弓":[132],"最":[188],"最初":[188],"月":[34,35,50,78,107,108,110,125,166,175,217],"月之":[35],"月光":[217],"月初":[175],"月华":[50],"月白":[78],"月矢":[107],"月者":[108],"月针":[34],"有":[203],"有乐":[203],"服":[39],"服人":[39],"望":[172],"木":[86,136,149],"木刀":[149],"木斩":[86],"木棉":[136],"末":[45,216],"末嗟":[45],"末路":[216],"术":[188],"机":[121],"杖":[143,170,171],"杜":[200],"杜拉":[200],"杯":[9],"杰":[194],"杰谭":[194],"杵":[133],"松":[167],"松籁":[167],"极":[116,202],"极白":[116],"极霸":[202],"林":[69],"林王":[69],"果":[72,74],"果钩":[74],"枪":[16,19,38,43,56,93,141,211],"染":[23],"染荒":[23],"柔":[95],"柔灯":[95],"标":[15],"桂":[86],"桂木":[86],"梦":[1],"棉":[136],"棉之":[136],"棒":[180],"森":[69],"森林":[69],"槊":[206],"歌":[13,14,95,115],"正":[86,175],"正月":[175],"残":[145],"残章":[145],"殖":[60],"殖之":[60],"水":[7,25,66,99,169,178],"水之":[25],"水仙":[178],"水流":[66,169],"水色":[99],"沐":[24],"沐浴":[24],"沙":[40,171],"沙中":[40],"沙之":[171],"河":[64],"河渡":[64],"法":[46,139],"法录":[139],"法球":[46],"波":[78],"波乱":[78],"泽":[47],"津":[78],"流":[27,34,66,169,193,197,207],"流华":[66],"流月":[34],"流浪":[193,207],"流涌":[169,197],"流监":[27],"测":[130],"测距":[130],"浪":[176,193,196,207,208,209],"浪乐":[193],"浪影":[196],"浪时":[176],"浪的":[207,209],"浪长":[208],"浮":[1],"浮梦":[1],"浴":[24],"浴龙":[24],"海":[15,62,96,99,100],"海信":[15],"海图":[100],"海渊":[62],"海皇":[96],"海菈":[99],"涌":[169,197],"涌之":[169],"涌大":[197],"渊":[62],"渊终":[62],"渔":[185],"渔获":[185],"渡":[64],"渡手":[64],"湾":[14],"湾长":[14],"溃":[133],"溃杵":[133],"溢":[205],"溢彩":[205],"满":[73],"满之":[73],"澹":[125],"澹月":[125],"灭":[42,50],"灭月":[50],"灭辰":[42],"灯":[22,95],"灯挽":[95],"灰":[64],"灰河":[64],"灾":[26],"烈":[150],"烈阳":[150],"焚":[0],"焚曜":[0],"熔":[63],"燧":[67],"燧之":[67],"牙":[53,215],"狼":[215,216],"狼牙":[215],"狼的":[216],"猎":[4,58,80,141,192],"猎人":[80],"猎弓":[58,192],"猎手":[4],"猎枪":[141],"玉":[17,46,147],"玉法":[46],"玉珑":[147],"王":[3,53,69,88,202],"王下":[88],"王丸":[3],"王器":[69],"王超":[202],"王长":[53],"玛":[99],"玛海":[99],"环":[75,136],"珀":[123],"珏":[201],"珑":[83,147],"珠":[96],"珠海":[96],"球":[46],"理":[39],"理服":[39],"琴":[49],"璞":[120],"璞鸢":[120],"瓶":[84],"瓶一":[84],"由":[71],"由之":[71],"甲":[201],"甲级":[201],"界":[114],"界行":[114],"白":[75,78,116,155,210,211,212],"白影":[212],"白星":[116],"白经":[78],"白缨":[211],"白辰":[75],"白铁":[210],"白雨":[155],"的":[24,40,49,68,99,108,128,135,143,165,188,200,207,209,214,216,217],"的剑":[24],"的回":[200,209],"的大":[188],"的对":[40],"的星":[165],"的晚":[207],"的曙":[108],"的月":[217],"的末":[216],"的水":[99],"的纺":[49],"的行":[68],"的辉":[143],"的酒":[214],"的酬":[135],"的雨":[128],"皇":[96],"盈":[73],"盈满":[73],"监":[27],"监督":[27],"目":[5],"目影":[5],"真":[85,134],"真意":[85],"真语":[134],"督":[27],"瞳":[113],"矛":[76],"矢":[107],"石":[133],"石溃":[133],"砂":[29],"砂之":[29],"破":[77,186],"破晓":[186],"破魔":[77],"硕":[74],"硕果":[74],"碎":[28],"碎链":[28],"碧":[83],"碧落":[83],"磐":[119],"磐岩":[119],"礼":[144,145,146,148],"礼剑":[148],"礼大":[146],"礼弓":[144],"礼残":[145],"祀":[147],"祀玉":[147],"神":[79,85,154],"神乐":[85],"神剑":[79],"神射":[154],"祭":[143,144,145,146,148,172],"祭星":[172],"祭礼":[144,145,146,148],"祭者":[143],"祸":[25],"福":[217],"福斯":[217],"离":[70],"离轮":[70],"秘":[54,134,139],"秘典":[54],"秘匣":[134],"秘法":[139],"稻":[48],"稻光":[48],"究":[202],"究极":[202],"空":[158,159,160,161,162],"空之":[158,159,160,161,162],"穿":[81],"穿之":[81],"章":[145,193],"竭":[47],"竭泽":[47],"笛":[67,189],"笛剑":[189],"笼":[84],"笼钓":[84],"筑":[30],"筑云":[30],"答":[40],"簾":[203],"簾切":[203],"籁":[167],"籁响":[167],"级":[201,202],"级宝":[201],"级魔":[202],"纯":[66],"纯水":[66],"纹":[9],"纹角":[9],"纺":[29,49,111],"纺夜":[111],"纺琴":[49],"纺锤":[29],"织":[108],"织月":[108],"终":[45,62],"终曲":[62],"终末":[45],"经":[78],"经津":[78],"结":[119],"结绿":[119],"绝":[190],"绝弦":[190],"绪":[97],"绪论":[97],"绯":[17],"绯玉":[17],"绿":[119],"缀":[65],"缀花":[65],"缨":[16,211],"缨枪":[16,211],"网":[164],"网勾":[164],"罗":[164],"罗网":[164],"罪":[2],"羽":[10,131],"羽弓":[131],"翎":[65],"翠":[192],"翠猎":[192],"翡":[46],"翡玉":[46],"翼":[160],"耀":[12],"者":[44,108,118,143,172,179],"者之":[172],"者的":[108,143],"聊":[180],"聊棒":[180],"聊聊":[180],"能":[101],"能钥":[101],"脊":[43,162],"脊长":[43],"腐":[60],"腐殖":[60],"自":[71],"自由":[71],"船":[187],"船坞":[187],"色":[99,108],"花":[65,98,198,213],"花之":[65,213],"花坊":[198],"苇":[15],"苇海":[15],"苍":[9,12,71,192],"苍古":[71],"苍纹":[9],"苍翠":[192],"苍耀":[12],"若":[7],"若水":[7],"英":[194],"英杰":[194],"草":[48],"草之":[48],"荒":[23],"荒城":[23],"莫":[6],"莫斯":[6],"莱":[200],"莱杜":[200],"获":[185],"菈":[99],"菈的":[99],"萃":[90],"萃光":[90],"落":[52,83],"落之":[83],"落霞":[52],"葬":[165],"葬的":[165],"蓝":[13],"蓝之":[13],"蔚":[13],"蔚蓝":[13],"薙":[48],"薙草":[48],"藏":[142],"虎":[61],"虎鱼":[61],"虹":[68,128,206],"虹之":[206],"虹的":[68],"虹蛇":[128],"蚀":[11],"蛇":[128],"蛇的":[128],"蜂":[82],"蜂刺":[82],"螭":[153],"螭骨":[153],"血":[23,24],"血染":[23],"血的":[24],"行":[68,114,199],"行剑":[199],"行记":[114],"行迹":[68],"衔":[96],"衔珠":[96],"裁":[90,129,204],"裁叶":[90],"裁断":[204],"西":[54,55,56,57,58,217],"西福":[217],"西风":[54,55,56,57,58],"规":[130],"角":[9,133],"角杯":[9],"角石":[133],"誓":[71,113,154],"誓之":[113],"讨":[194],"讨龙":[194],"记":[114],"论":[97],"证":[113],"证誓":[113],"试":[123,124,125,126,127],"试作":[123,124,125,126,127],"诗":[45,214],"语":[134],"语秘":[134],"诸":[100],"诸海":[100],"谧":[152,168],"谧之":[168],"谧音":[152],"谭":[194],"谱":[100],"贤":[40],"贤的":[40],"贯":[107,206],"贯月":[107],"贯虹":[206],"赤":[10,35,133,171],"赤月":[35],"赤沙":[171],"赤羽":[10],"赤角":[133],"赦":[2],"赦罪":[2],"起":[167],"起之":[167],"超":[202],"超级":[202],"距":[130],"距规":[130],"路":[216],"轮":[31,70],"轮光":[70],"轮弓":[31],"辉":[143,169],"辉杖":[143],"辰":[29,37,42,75],"辰之":[75],"辰砂":[29],"近":[88],"近侍":[88],"迸":[151],"迸音":[151],"迹":[68],"遗":[147],"遗祀":[147],"酒":[214],"酒与":[214],"酬":[135],"酬报":[135],"里":[42,91,166],"里日":[166],"里灭":[42],"里龙":[91],"金":[27,122,123],"金之":[122],"金流":[27],"金珀":[123],"针":[34,164],"钉":[109],"钓":[84],"钓瓶":[84],"钟":[183],"钟剑":[183],"钢":[31],"钢轮":[31],"钥":[87,101],"钥匙":[101],"钩":[74],"钺":[76],"钺矛":[76],"钻":[121],"钻机":[121],"铁":[36,59,82,98,210],"铁之":[98],"铁剑":[36],"铁大":[210],"铁影":[59],"铁蜂":[82],"银":[165],"铸":[63],"铸熔":[63],"链":[28],"锁":[102],"锋":[104],"锤":[29],"锯":[117],"锹":[122],"镇":[109],"镇山":[109],"镜":[111],"镰":[127],"长":[14,18,43,53,56,86,93,137,140,187,208],"长剑":[18,140,187],"长弓":[137],"长枪":[43,56,93],"长歌":[14],"长正":[86],"长牙":[53],"长鳍":[208],"闪":[182],"闪光":[182],"间":[112],"间夜":[112],"阔":[59,196],"阔剑":[59,196],"阳":[0,150],"阳之":[150],"阿":[6],"阿莫":[6],"降":[177],"降临":[177],"院":[89],"院十":[89],"集":[41],"雨":[128,129,155,198],"雨弦":[128],"雨心":[155],"雨裁":[129],"雪":[165],"雪葬":[165],"雷":[195],"雷之":[195],"雾":[105],"雾切":[105],"霜":[37],"霜辰":[37],"霞":[52],"霸":[202],"霸王":[202],"静":[168,169],"静水":[169],"静谧":[168],"音":[33,151,152],"音吹":[152],"韵":[179],"韵奏":[179],"颂":[213],"风":[8,54,55,56,57,58,94,104,213],"风信":[104],"风剑":[57],"风原":[94],"风大":[55],"风猎":[58],"风秘":[54],"风花":[213],"风长":[56],"风鹰":[8],"飞":[156,157,195],"飞天":[156,157],"飞雷":[195],"食":[118],"食者":[118],"饰":[98],"饰铁":[98],"香":[179],"香韵":[179],"骨":[153,173],"骨剑":[153],"髓":[22],"髓孑":[22],"魔":[77,97,188,202],"魔之":[77],"魔剑":[202],"魔导":[97],"魔术":[188],"鱼":[61],"鱼刀":[61],"鳍":[208],"鸢":[120],"鸣":[33],"鸣余":[33],"鸦":[131],"鸦羽":[131],"鹤":[33],"鹤鸣":[33],"鹫":[10],"鹫赤":[10],"鹮":[81],"鹮穿":[81],"鹰":[8],"鹰剑":[8],"黎":[79,186],"黎明":[79,186],"黑":[11,16,17,18,19,20,21,184],"黑剑":[184],"黑岩":[17,18,19,20,21],"黑缨":[16],"黑蚀":[11],"龙":[24,43,91,194],"龙吟":[91],"龙脊":[43],"龙英":[194],"龙血":[24]},
+  },
+  "artifacts": {
+    ids: ["a_day_carved_from_rising_winds", "archaic_petra", "aubade_of_morningstar_and_moon", "blizzard_strayer", "bloodstained_chivalry", "crimson_witch_of_flames", "deepwood_memories", "desert_pavilion_chronicle", "echoes_of_an_offering", "emblem_of_severed_fate", "finale_of_the_deep_galleries", "flower_of_paradise_lost", "fragment_of_harmonic_whimsy", "gilded_dreams", "gladiators_finale", "golden_troupe", "heart_of_depth", "husk_of_opulent_dreams", "instructor", "lavawalker", "long_nights_oath", "maiden_beloved", "marechaussee_hunter", "night_of_the_skys_unveiling", "nighttime_whispers_in_the_echoing_woods", "noblesse_oblige", "nymphs_dream", "obsidian_codex", "oceanhued_clam", "pale_flame", "retracing_bolide", "scroll_of_the_hero_of_cinder_city", "shimenawas_reminiscence", "silken_moons_serenade", "song_of_days_past", "tenacity_of_the_millelith", "thundering_fury", "thundersoother", "unfinished_reverie", "vermillion_hereafter", "viridescent_venerer", "vourukashas_glow", "wanderers_troupe"],
+    tokens: {"a":[0,1,2,8,21],"ac":[30,35],"aci":[30,35],"ad":[0,2,11,14,21,33,42],"ada":[0],"ade":[2,33],"adi":[11,14,42],"ads":[21],"adsn":[21],"af":[39],"aft":[39],"ag":[12,17],"agm":[12],"agu":[17],"ah":[41],"aha":[41],"ai":[1,4,8,17,21,28,29,41],"aic":[1],"aid":[21],"aig":[41],"aij":[17],"ain":[4],"air":[28],"aix":[8],"aiz":[29],"al":[4,10,14,19,29],"ale":[10,14,29],"alk":[19],"all":[10],"alr":[4],"am":[5,13,17,26,28,29],"ame":[5,29],"ams":[13,17],"an":[1,2,4,5,7,8,9,10,11,12,15,17,18,19,20,21,23,26,27,28,29,31,32,33,35,39,41,42],"ana":[21],"anc":[27,28],"and":[2,42],"ang":[7,8,10,12,15,20,29,33,39,41,42],"anh":[28],"anl":[35,41],"anm":[17],"ano":[8],"anr":[19],"anx":[4],"any":[1,11,35],"anz":[5,9,12,23,26],"ao":[2,4,18,21,27,35],"aog":[2,18,35],"aom":[27],"aon":[21],"ar":[0,1,2,3,11,12,16,22],"ara":[2,11],"arc":[1],"ard":[3],"are":[22],"arm":[12],"art":[16],"arv":[0],"as":[7,32,34,38,41],"asg":[41],"ash":[7,41],"asi":[38],"asr":[32],"ast":[34],"at":[9,14,20],"ate":[9],"ath":[20],"ato":[14],"au":[2,22],"aub":[2],"aus":[22],"av":[7,19],"ava":[19],"avi":[7],"aw":[19,32,39],"awa":[19,32,39],"ay":[0,3,34],"ayc":[0],"aye":[3],"ays":[34],"b":[3,4,21,29,30],"ba":[2,29],"bad":[2],"bai":[29],"be":[21],"bei":[21],"bel":[21],"bf":[3],"bfm":[3],"bfmt":[3],"bfmtd":[3],"bfmtdy":[3],"bfmtdys":[3],"bi":[3],"bin":[3],"bl":[3,4,9,21,25],"bla":[21],"blad":[21],"blads":[21],"bladsn":[21],"ble":[9,25],"bli":[3,25],"blo":[4],"bo":[30],"bol":[30],"bs":[27],"bsi":[27],"bz":[29],"bzh":[29],"c":[0,2,4,5,7,16,20,27,28,29,31,39,40],"ca":[0,29],"can":[29],"car":[0],"cb":[29],"cbz":[29],"cbzh":[29],"ce":[28,32,40],"cea":[28],"cen":[32,40],"ch":[1,2,4,5,7,8,16,20,22,24,28,31,39],"cha":[1,20,22],"che":[2,16,28,31,39],"chi":[4,5],"cho":[5,8,24],"chr":[7],"ci":[30,31,35],"cin":[30,31],"cit":[31,35],"cl":[5,7,16,28,40],"cla":[28],"cld":[5],"cldy":[5],"cldyz":[5],"cldyzm":[5],"cldyzmn":[5],"cle":[7],"clz":[16,40],"clzx":[16],"clzy":[40],"co":[27],"cod":[27],"cp":[1],"cpe":[1],"cq":[28],"cr":[5,31],"cri":[5],"cro":[31],"cs":[39],"csw":[39],"csws":[39],"cswsl":[39],"ct":[18],"cto":[18],"cu":[40],"cui":[40],"cw":[12],"cwh":[12],"cx":[2],"cxy":[2],"cxyy":[2],"cxyyd":[2],"cxyydx":[2],"cxyydxg":[2],"cy":[20,31],"cyz":[20,31],"cyzh":[31],"cyzhj":[31],"cyzs":[20],"d":[0,1,2,3,4,5,6,7,10,12,13,14,16,17,19,21,26,27,30,33,34,36,37,38,42],"da":[0,4,34,42],"dad":[42],"dao":[4],"day":[0,34],"dc":[4,28],"dch":[4],"dcl":[28],"dd":[13,42],"ddd":[42],"dddy":[42],"dddyt":[42],"ddr":[13],"ddy":[42],"ddyt":[42],"de":[1,2,3,4,5,6,7,10,13,14,15,16,19,21,27,30,31,33,36,37,38,40,42],"ded":[13],"dee":[6,10],"dej":[6],"del":[30],"den":[15,21],"deo":[2],"dep":[1,16],"deq":[4],"der":[31,36,37,42],"des":[7,21,36,40],"dex":[2,19,27,38],"dey":[3,5,33,42],"dez":[14,37],"df":[0,9],"dfa":[9],"dfr":[0],"dg":[19],"dgl":[19],"dglh":[19],"dglhd":[19],"dglhdx":[19],"dglhdxr":[19],"di":[11,14,27,42],"dia":[14,27],"did":[42],"dis":[11],"dj":[6],"djy":[6],"dl":[30],"dlx":[30],"dm":[2,6],"dme":[6],"dmo":[2],"do":[14],"dou":[14],"dp":[1],"dpy":[1],"dq":[4],"dqs":[4],"dqsd":[4],"dr":[13,17,26,38],"dre":[13,17,26,38],"ds":[0,3,4,14,21,24,36],"dsd":[14],"dsdz":[14],"dsdzm":[14],"dsdzml":[14],"dsn":[21,36],"dst":[3,4],"du":[12,19],"dua":[12],"dug":[19],"dx":[2,19,38],"dxg":[2],"dxr":[19],"dxs":[38],"dy":[3,5,33,42],"dyg":[33],"dys":[3],"dyt":[42],"dyz":[5],"dyzm":[5],"dyzmn":[5],"dz":[12,14,37],"dzm":[14],"dzml":[14],"dzz":[37],"e":[8,9,24],"ea":[13,16,17,26,28,39],"eaf":[39],"eam":[13,17,26],"ean":[28],"ear":[16],"ec":[8,22,24],"ech":[8,22,24],"ed":[0,2,4,5,9,10,13,14,21,28,33,38],"edc":[4,28],"edd":[13],"ede":[2,4,5,10,33],"edf":[0,9],"edo":[14],"edr":[38],"ee":[6,10,22,24],"eec":[24],"eeh":[22],"eep":[6,10],"ef":[29],"efl":[29],"eg":[33],"ege":[33],"eh":[19,22,24,31],"ehe":[31],"ehu":[19,22,24,31],"ei":[21,23,27,30,36,37,38],"eid":[30,36,37],"eij":[38],"eil":[21,23],"eiy":[27],"ej":[6],"eji":[6],"el":[11,12,21,30,35],"eli":[30,35],"elo":[11,21],"elv":[12],"em":[6,9,32,35],"emb":[9],"emi":[32,35],"emo":[6,9],"en":[0,2,3,6,10,12,13,15,16,17,19,21,22,24,26,31,32,33,35,36,39,40],"ena":[32,33,35],"enb":[21],"enc":[32],"ene":[40],"eng":[0,3,13,17,24,26,31,36,39],"enl":[6,10,16],"enm":[33],"ens":[39],"ent":[12,15,17,40],"enx":[2],"eo":[2,10,25],"eob":[25],"eof":[2,10],"ep":[1,6,10,16],"epa":[1],"epg":[10],"ept":[16],"epw":[6],"eq":[4,28],"eqi":[4],"equ":[28],"er":[3,7,8,9,10,11,19,22,24,31,33,36,37,38,39,40,42],"erc":[31],"ere":[9,22,33,39,40,42],"eri":[8,10,36,38],"erm":[39],"ero":[11,31],"ers":[24,37,42],"ert":[7],"es":[5,6,7,8,10,21,23,25,36,40],"esc":[40],"ese":[7],"esh":[7,21,36],"esk":[23],"eso":[8],"ess":[25],"et":[1,30,42],"etr":[1,30],"etu":[42],"ev":[9,38],"eve":[9,38],"ew":[24],"ewh":[24],"ex":[2,19,27,38],"exi":[2,19,38],"ey":[3,5,9,11,33,42],"eya":[5],"eye":[33],"eyo":[3],"eyu":[9,11,42],"ez":[14,20,37],"ezh":[14,20],"ezu":[37],"f":[0,3,5,9,10,11,12,14,29,30,33,36],"fa":[8,9,33],"fan":[8,33],"fat":[9],"fc":[31],"fci":[31],"fd":[16,30,34],"fda":[34],"fde":[16],"fdl":[30],"fdlx":[30],"fe":[0,3,8,30],"fei":[30],"fen":[0,3],"fer":[8],"ff":[5,8],"ffe":[8],"ffl":[5],"fh":[12],"fha":[12],"fi":[10,14,38],"fin":[10,14,38],"fl":[5,11,29],"fla":[5,29],"flo":[11],"fm":[2,3],"fmo":[2],"fmt":[3],"fmtd":[3],"fmtdy":[3],"fmtdys":[3],"fo":[17],"fop":[17],"fp":[11],"fpa":[11],"fq":[0],"fqz":[0],"fqzr":[0],"fr":[0,12],"fra":[12],"fro":[0],"fs":[9],"fse":[9],"ft":[10,23,31,35,39],"fte":[39],"fth":[10,23,31,35],"fu":[36],"fur":[36],"fy":[33],"fyd":[33],"fydy":[33],"fydyg":[33],"g":[1,2,7,10,13,14,15,17,18,19,33,34,35,41],"ga":[10,41],"gal":[10],"gan":[41],"gb":[29,30],"gba":[29],"gbo":[30],"gd":[1,12,38,42],"gda":[42],"gde":[38],"gdp":[1],"gdpy":[1],"gdu":[12],"ge":[2,7,25,33,34],"ges":[7],"gf":[3,36],"gfe":[3],"gfu":[36],"gh":[17,20,23,24],"gha":[17],"ght":[20,23,24],"gi":[13],"gil":[13],"gj":[15,23],"gji":[15,23],"gl":[7,14,19,22,37,39,41],"gla":[14],"gle":[37],"glh":[19],"glhd":[19],"glhdx":[19],"glhdxr":[19],"gli":[22],"glo":[7,41],"glu":[39],"glz":[41],"glzg":[41],"gm":[3,12,14,17],"gme":[12],"gmi":[3],"gmu":[14],"gmx":[17],"gmxx":[17],"gmxxh":[17],"gmxxhj":[17],"gn":[20,36],"gni":[20],"gnu":[36],"go":[15,34],"gof":[34],"gol":[15],"gq":[0,10],"gqi":[0],"gqu":[10],"gs":[2,3,7,23,25,39],"gsh":[3,7,23,25,39],"gst":[2],"gu":[1,17,18,19,35,41],"gua":[17,18,41],"gud":[1],"guo":[19],"gw":[0,24],"gwi":[0],"gwo":[24],"gx":[17,37],"gxi":[17,37],"gy":[2,20,31,33],"gye":[20],"gyo":[31],"gyu":[2,33],"gz":[10,24,31],"gzh":[10,24,31],"h":[7,11,12,15,16,17,19,22,24,27,28,29,31,39,41],"ha":[1,7,12,17,20,21,22,28,39,41],"hai":[1,17,28,41],"han":[7,12,20],"hao":[21],"har":[12],"has":[7,41],"hau":[22],"haw":[39],"hd":[19],"hdx":[19],"hdxr":[19],"he":[2,6,10,16,23,24,27,28,31,35,36,37,38,39],"hea":[16],"hed":[10,38],"hee":[24],"heh":[31],"hei":[27],"hem":[35],"hen":[2,6,10,16,24,31,36,39],"heq":[28],"her":[31,37,39],"hes":[23],"hg":[17,41],"hgl":[41],"hglz":[41],"hglzg":[41],"hgm":[17],"hgmx":[17],"hgmxx":[17],"hgmxxh":[17],"hgmxxhj":[17],"hh":[41],"hhg":[41],"hhgl":[41],"hhglz":[41],"hhglzg":[41],"hi":[0,3,4,5,7,9,11,12,13,14,16,20,23,24,25,26,29,32,34,40,41],"hid":[4,14],"hig":[34,41],"hih":[7,11,29],"hij":[13],"hil":[5,24],"him":[5,12,13,26,32],"hiq":[9],"hir":[0],"his":[20,24],"hiv":[4],"hix":[16,23],"hiy":[23,25,40],"hiz":[25,32,34],"hj":[15,17,31],"hjj":[15],"hjjt":[15],"ho":[5,8,10,14,24],"hoe":[8],"hof":[5],"hoi":[24],"hon":[10,14],"hr":[7,28],"hrc":[28],"hrcq":[28],"hro":[7],"hs":[24,26],"hsd":[26],"hsz":[24],"hszl":[24],"hszly":[24],"hszlyh":[24],"ht":[20,23,24],"hto":[23],"hts":[20],"htt":[24],"hu":[7,11,15,17,19,22,24,26,28,29,31,32,36,37,41],"hua":[7,11,15,17,24,41],"hue":[28],"hui":[24,26,31,32],"hul":[32],"hun":[22,36,37],"huo":[19,29],"hus":[17],"huy":[22],"hy":[27],"hym":[27],"hymd":[27],"i":[18,24],"ia":[2,8,12,14,18,19,21,23,26,27,32,35,38],"ian":[8,12,19,21,23,26,27,32,35],"iao":[2,18],"ias":[38],"iat":[14],"ic":[1,7,12],"icl":[7],"icp":[1],"icw":[12],"id":[4,14,21,27,30,36,37,40,42],"ida":[4],"ide":[14,21,30,36,37,40,42],"idi":[27],"ie":[5,6,10,12,19,22,38],"ied":[5],"ieh":[19],"iel":[12],"ier":[22],"ies":[6,10],"if":[30],"ife":[30],"ig":[20,23,24,25,34,41],"iga":[41],"ige":[25,34],"igh":[20,23,24],"igu":[41],"ih":[7,11,29],"ihu":[7,11,29],"ij":[13,17,31,38],"iji":[13,17,38],"iju":[31],"il":[5,7,11,13,21,23,24,33,35,39,40],"ild":[13],"ili":[5,7,21,23,24],"ilk":[33],"ill":[35,39],"ilu":[11],"ilv":[40],"im":[5,12,13,24,26,32,37],"ime":[13,24,26,32],"imi":[37],"imo":[5],"ims":[5,12],"in":[0,2,3,4,6,8,9,10,13,14,15,16,17,18,22,23,24,30,31,32,36,37,38,40],"ina":[10,14],"inc":[31],"ind":[0,6,31],"ine":[4],"ing":[0,2,3,8,17,22,23,24,30,36,37,38,40],"ini":[32,38],"inj":[15],"ins":[18],"int":[24],"iny":[8,24],"inz":[13],"io":[7,23,39],"ion":[7,23,39],"iq":[9],"iqi":[9],"ir":[0,25,28,40],"ira":[28],"iri":[0,25,40],"is":[0,4,11,20,24,32,34,38],"isc":[32],"ise":[11],"ish":[4,20,24,34,38],"isi":[0],"isp":[24],"it":[3,5,31,35],"itc":[5],"ith":[35],"itu":[3],"ity":[31,35],"iu":[30,42],"iul":[42],"iux":[30],"iv":[4],"iva":[4],"ix":[8,12,16,23,26],"ixi":[8,12,16,23,26],"iy":[6,9,23,25,27,32,40],"iya":[27],"iye":[23],"iyi":[6,9,25,32,40],"iz":[0,3,25,29,32,34],"izh":[0,25,29,32,34],"izo":[25],"izz":[3],"j":[6,9,13,14,15,17,18,23,31,38],"jc":[31],"jcy":[31],"jcyz":[31],"jcyzh":[31],"jcyzhj":[31],"jd":[14,38],"jds":[14],"jdsd":[14],"jdsdz":[14],"jdsdzm":[14],"jdsdzml":[14],"jdx":[38],"jdxs":[38],"jg":[18],"ji":[6,13,15,17,18,23,31,38],"jia":[18],"jin":[13,15,23,31,38],"jiy":[6],"jj":[15],"jjt":[15],"js":[23],"jsx":[23],"jsxz":[23],"jsxzy":[23],"jt":[15],"ju":[9,14,15,31],"jua":[31],"jue":[9,14],"jut":[15],"jy":[6,9],"jyz":[9],"jyzq":[9],"jyzqy":[9],"jz":[13],"jzm":[13],"ka":[41],"kas":[41],"ke":[19,33],"ken":[33],"ker":[19],"ko":[17],"kof":[17],"ky":[23],"kys":[23],"l":[5,6,7,8,10,11,12,14,16,19,20,21,22,24,30,32,35,36,37,39,40,41,42],"la":[5,8,10,14,19,21,28,29,35,42],"lad":[14,21],"lads":[21],"ladsn":[21],"lai":[8],"lam":[5,28,29],"lan":[10,42],"lao":[35],"lav":[19],"ld":[5,6,13,15,36,37,42],"ldd":[42],"lddd":[42],"ldddy":[42],"ldddyt":[42],"lde":[13,15],"ldj":[6],"ldjy":[6],"lds":[36],"ldsn":[36],"ldy":[5],"ldyz":[5],"ldyzm":[5],"ldyzmn":[5],"ldz":[37],"ldzz":[37],"le":[7,9,10,11,14,17,25,29,35,36,37],"lef":[29],"lei":[36,37],"lel":[35],"lem":[9],"len":[17],"leo":[10],"ler":[10],"les":[25],"ley":[11],"lg":[7,35],"lgs":[7],"lgsh":[7],"lh":[19],"lhd":[19],"lhdx":[19],"lhdxr":[19],"li":[3,5,6,7,14,19,21,22,23,24,25,30,32,35,39,42],"lia":[21,32],"lid":[30],"lie":[5,19,22],"lig":[25],"lin":[6,23,24],"lio":[7,39],"lit":[35],"liu":[30,42],"liz":[3],"lk":[19,33],"lke":[19,33],"ll":[10,31,35,39,42],"lld":[42],"lldd":[42],"llddd":[42],"lldddy":[42],"lldddyt":[42],"lle":[10,35],"lli":[39],"llo":[31],"lo":[4,7,11,20,21,31,41],"lof":[31],"lon":[20],"loo":[4],"los":[11],"lou":[7],"lov":[21],"low":[11,41],"lr":[4,22],"lry":[4],"lu":[11,16,39,41],"lun":[16],"luo":[11],"luz":[41],"lv":[12,40],"lvy":[12],"lvz":[40],"lx":[8,30],"lxy":[8],"lxyx":[8],"ly":[11,12,24],"lyh":[24],"lyx":[12],"lyxd":[12],"lyxdz":[12],"lyy":[11],"lyyl":[11],"lyylz":[11],"lyylzh":[11],"lz":[10,11,16,40,41],"lzg":[41],"lzh":[11],"lzq":[10],"lzx":[16],"lzy":[40],"m":[2,3,5,6,13,14,17,21,22,26,27,33,35,37],"ma":[21,22],"mai":[21],"mar":[22],"mb":[9],"mbl":[9],"md":[27],"me":[5,6,12,13,17,24,26,29,32],"mem":[6],"men":[12,13,17,26,32],"mes":[5],"mew":[24],"mi":[3,27,32,35,37,39],"mid":[27],"mil":[35,39],"min":[32,37],"mit":[3],"ml":[14,37],"mld":[37],"mldz":[37],"mldzz":[37],"mn":[5],"mo":[2,5,6,9,12,33],"mof":[9],"mon":[5,12],"moo":[2,33],"mor":[2,6],"mp":[26],"mph":[26],"mr":[0],"mri":[0],"ms":[5,12,13,17],"mso":[5],"msy":[12],"mt":[3],"mtd":[3],"mtdy":[3],"mtdys":[3],"mu":[14],"mul":[14],"mx":[17],"mxx":[17],"mxxh":[17],"mxxhj":[17],"n":[5,20,21,23,24,25,26,30,36],"na":[10,14,21,32,33,35],"nac":[35],"nad":[33],"nai":[21],"nal":[10,14],"naw":[32],"nb":[21],"nbe":[21],"nc":[7,27,28,31,32],"nce":[32],"nch":[7,28,31],"nco":[27],"nd":[0,2,6,31,36,37,42],"nde":[6,31,36,37,42],"ndm":[2],"nds":[0],"ne":[4,40],"ned":[4],"ner":[40],"nf":[30,38],"nfd":[30],"nfdl":[30],"nfdlx":[30],"nfi":[38],"ng":[0,2,3,7,8,10,12,13,14,15,17,20,22,23,24,25,26,29,30,31,33,34,36,37,38,39,40,41,42],"ngb":[29,30],"ngd":[12,38,42],"ngf":[3,36],"ngh":[17],"ngj":[15,23],"ngl":[7,22,37,39],"ngm":[3,14],"ngn":[20,36],"ngo":[34],"ngq":[0,10],"ngs":[2,3,23,25,39],"ngw":[0,24],"ngx":[17,37],"ngy":[2,20,31,33],"ngz":[10,24,31],"nh":[28,39],"nhe":[39],"nhu":[28],"ni":[2,7,12,20,23,24,30,32,38],"nic":[7,12],"nif":[30],"nig":[20,23,24],"nin":[2],"nis":[32,38],"nj":[15],"nju":[15],"nl":[6,10,16,35,41],"nla":[10,35],"nli":[6],"nlu":[16,41],"nm":[17,33],"nme":[17],"nmo":[33],"no":[8,25],"nob":[25],"nof":[8],"nr":[19],"nre":[19],"ns":[18,33,39],"nsh":[39],"nss":[33],"nst":[18],"nt":[12,15,17,22,24,40],"ntd":[17],"nte":[22],"nth":[24],"nto":[12],"ntr":[15],"ntv":[40],"nu":[36],"nv":[5,21,23],"nve":[23],"nw":[5],"nwi":[5],"nx":[2,4],"nxi":[2],"nxu":[4],"ny":[1,8,11,24,26,35],"nya":[1,35],"nye":[24],"nyi":[11],"nym":[26],"nyu":[8],"nz":[5,9,12,13,16,23,26,37],"nzh":[5,9,12,13,16,23,26,37],"o":[2,5,8,9,10,11,12,16,17,20,23,25,27,28,31,34,35],"oa":[20],"oat":[20],"ob":[25,27],"obl":[25],"obs":[27],"oc":[28],"oce":[28],"od":[4,6,19,24,27],"ode":[19,27],"odm":[6],"ods":[4,24],"oe":[8],"oes":[8],"of":[2,5,8,9,10,11,12,16,17,23,31,34,35],"ofa":[8],"ofc":[31],"ofd":[16,34],"off":[5,8],"ofh":[12],"ofm":[2],"ofo":[17],"ofp":[11],"ofs":[9],"oft":[10,23,31,35],"og":[2,18,35],"oge":[2],"ogu":[18,35],"oi":[24],"oin":[24],"ol":[15,19,30,31],"old":[15],"oli":[19,30],"oll":[31],"om":[0,27],"omi":[27],"omr":[0],"on":[2,3,5,7,10,12,14,20,21,23,25,31,33,34,39],"onc":[7],"ong":[3,10,14,20,23,25,31,34],"onh":[39],"oni":[7,12],"ons":[33],"onv":[5,21],"onw":[5],"oo":[2,4,6,24,31,33,37],"ood":[4,6,24],"oof":[31],"oon":[2,33],"oot":[37],"op":[17],"opu":[17],"or":[2,6,14,18],"ori":[6],"orn":[2],"ors":[14],"os":[11],"ost":[11],"ot":[37],"oth":[37],"ou":[1,7,14,15,41,42],"oug":[1,7],"oup":[15,42],"our":[41],"ous":[14],"ov":[21],"ove":[21],"ow":[11,41],"owe":[11],"oz":[11],"ozh":[11],"p":[1,7,11,29,34,37],"pa":[1,7,11,29,34],"pal":[29],"pan":[1],"par":[11],"pas":[34],"pav":[7],"pe":[1,15,24,42],"per":[24],"pet":[1],"pg":[10],"pga":[10],"ph":[26],"phs":[26],"pi":[37],"pin":[37],"pt":[16],"pth":[16],"pu":[17],"pul":[17],"pw":[6],"pwo":[6],"px":[37],"pxm":[37],"pxml":[37],"pxmld":[37],"pxmldz":[37],"pxmldzz":[37],"py":[1],"q":[0,4,9,10,23,28,35],"qi":[0,4,9,23,35],"qia":[35],"qio":[23],"qis":[4],"qiy":[9],"qiz":[0],"qj":[23],"qjs":[23],"qjsx":[23],"qjsxz":[23],"qjsxzy":[23],"qs":[4],"qsd":[4],"qu":[10,28],"qy":[9,35],"qyl":[35],"qylg":[35],"qz":[0],"qzr":[0],"r":[0,4,19,22,25,28,30,32,36,38],"ra":[1,2,3,4,11,12,28,30],"rac":[30],"rad":[11],"rag":[12],"ran":[2,4,28],"ray":[3],"rc":[1,28,31],"rch":[1],"rci":[31],"rcq":[28],"rd":[3],"rds":[3],"re":[9,13,17,19,22,26,30,32,33,38,39,40,42],"rea":[13,17,26,39],"rec":[22],"red":[9],"rem":[32],"ren":[19,22,33],"rer":[40,42],"ret":[30],"rev":[38],"ri":[0,5,6,8,10,25,36,38,40],"rid":[40],"rie":[6,10,38],"rim":[5],"rin":[8,36],"ris":[0],"riz":[25],"rl":[36],"rld":[36],"rlds":[36],"rldsn":[36],"rm":[12,39],"rmi":[39],"rmo":[12],"rn":[2],"rni":[2],"ro":[0,7,11,15,31,42],"rof":[11],"rol":[31],"rom":[0],"ron":[7],"roo":[31],"rou":[15,42],"rs":[14,24,37,42],"rsf":[14],"rsi":[24],"rso":[37],"rst":[42],"rt":[7,16],"rto":[16],"rtp":[7],"ru":[18,36,41],"ruc":[18],"ruk":[41],"rul":[36],"rv":[0],"rve":[0],"rx":[4],"rxd":[4],"rxdq":[4],"rxdqs":[4],"rxdqsd":[4],"ry":[4,36],"rz":[25],"rzs":[25],"rzsz":[25],"rzszy":[25],"s":[3,4,6,7,9,10,13,14,20,21,23,24,25,26,31,32,33,34,36,38,39],"sc":[31,32,40],"sce":[32,40],"scr":[31],"sd":[4,14,26],"sdr":[26],"sdz":[14],"sdzm":[14],"sdzml":[14],"se":[7,9,11,22,25,33],"see":[22],"sel":[11],"seo":[25],"ser":[7,33],"sev":[9],"sf":[14],"sfi":[14],"sg":[41],"sgl":[41],"sh":[3,4,6,7,10,13,14,20,21,23,24,25,26,32,34,36,38,39,41],"sha":[7,21,39,41],"she":[6,10,24,36,38,39],"shi":[3,4,7,13,14,20,23,25,32,34],"shu":[26],"si":[0,24,27,33,38],"sid":[27],"sil":[33],"sin":[0,24],"sj":[13],"sjz":[13],"sjzm":[13],"sk":[17,23],"sko":[17],"sky":[23],"sl":[6,7,10,39],"sld":[6],"sldj":[6],"sldjy":[6],"slg":[7],"slgs":[7],"slgsh":[7],"slz":[10],"slzq":[10],"sn":[21,36],"so":[5,8,20,34,37],"soa":[20],"sof":[8],"son":[5,34],"soo":[37],"sp":[24,34],"spa":[34],"spe":[24],"sr":[32],"sre":[32],"ss":[7,22,25,33],"sse":[22,25,33],"ssl":[7],"sslg":[7],"sslgs":[7],"sslgsh":[7],"st":[2,3,4,11,18,34,42],"sta":[2,4],"str":[3,18,42],"su":[23],"sun":[23],"sw":[39],"sws":[39],"swsl":[39],"sx":[23,26],"sxz":[23,26],"sxzm":[26],"sxzy":[23],"sy":[12],"sz":[24,25,34],"szg":[34],"szl":[24],"szly":[24],"szlyh":[24],"szy":[25],"t":[3,10,15,23,24,31,35,36,37,42],"ta":[2,4],"tai":[4],"tar":[2],"tc":[5],"tch":[5],"td":[3,17],"tdr":[17],"tdy":[3],"tdys":[3],"te":[9,22,35,39],"ten":[35],"ter":[22,39],"th":[10,16,20,23,24,31,35,36,37],"the":[10,23,24,31,35,37],"thu":[36,37],"ti":[24],"tim":[24],"to":[12,14,16,18,23],"tof":[12,16,23],"tor":[14,18],"tp":[7],"tpa":[7],"tr":[1,3,15,18,30,42],"tra":[1,3,30],"tro":[15,42],"tru":[18],"ts":[20],"tso":[20],"tt":[24],"tti":[24],"tu":[3,15,42],"tua":[15,42],"tud":[3],"tv":[40],"tve":[40],"ty":[31,35],"tyo":[35],"u":[23,38],"ua":[7,9,11,12,15,17,18,24,31,41,42],"uag":[17],"uah":[41],"uan":[9,11,12,15,17,18,31,41,42],"ub":[2],"uba":[2],"uc":[18],"uct":[18],"ud":[1,3],"ude":[1,3],"ue":[2,4,9,14,28,33,42],"ued":[2,4,14,28,33],"uet":[42],"uey":[9],"ug":[1,7,19],"uge":[7],"ugu":[1,19],"ui":[24,26,31,32,40],"uij":[31],"uil":[40],"uis":[24],"uix":[26],"uiy":[32],"uk":[41],"uka":[41],"ul":[14,17,32,36,42],"ula":[42],"ule":[17,36],"uli":[14,32],"un":[16,22,23,36,37,38],"und":[36,37],"unf":[38],"unt":[22],"unv":[23],"unz":[16,37],"uo":[11,19,29],"uod":[19],"uol":[19],"uoz":[11],"up":[15,42],"upe":[15,42],"ur":[36,41],"uru":[41],"ury":[36],"us":[14,17,22],"ush":[14],"usk":[17],"uss":[22],"ut":[15],"utu":[15],"ux":[8,30],"uxi":[8,30],"uy":[2,22],"uyi":[22],"uyu":[2],"uz":[41],"uzh":[41],"v":[39,40,41],"va":[4,19],"val":[4],"vaw":[19],"ve":[0,9,21,23,38,39,40],"ved":[0,21],"vei":[23],"ven":[40],"ver":[9,38,39],"vi":[7,40],"vil":[7],"vir":[40],"vo":[41],"vou":[41],"vy":[12],"vyi":[12],"vz":[40],"vzh":[40],"w":[0,5,12,24,38,39,42],"wa":[19,32,39,42],"wal":[19],"wan":[39,42],"was":[32],"we":[11,38],"wei":[38],"wer":[11],"wh":[12,24],"whi":[12,24],"wi":[0,5],"win":[0],"wit":[5],"wj":[38],"wjd":[38],"wjdx":[38],"wjdxs":[38],"wo":[6,24],"woo":[6,24],"ws":[39],"wsl":[39],"x":[2,4,8,12,16,17,19,23,25,26,30,34,37,38],"xd":[4,12],"xdq":[4],"xdqs":[4],"xdqsd":[4],"xdz":[12],"xg":[2],"xh":[17],"xhj":[17],"xi":[2,8,12,16,17,19,23,25,26,30,34,37,38],"xia":[2,8,12,19,23,26,38],"xie":[12],"xim":[37],"xin":[2,8,16,17,30],"xir":[25],"xis":[34],"xl":[12],"xly":[12],"xlyx":[12],"xlyxd":[12],"xlyxdz":[12],"xm":[37],"xml":[37],"xmld":[37],"xmldz":[37],"xmldzz":[37],"xr":[19,25],"xrz":[25],"xrzs":[25],"xrzsz":[25],"xrzszy":[25],"xs":[34,38],"xsz":[34],"xszg":[34],"xu":[4],"xue":[4],"xx":[17],"xxh":[17],"xxhj":[17],"xy":[2,8],"xyx":[8],"xyy":[2],"xyyd":[2],"xyydx":[2],"xyydxg":[2],"xz":[23,26],"xzm":[26],"xzy":[23],"y":[1,2,3,5,6,8,9,11,12,20,22,23,24,25,27,31,32,33,35,40,42],"ya":[1,5,27,35],"yan":[1,5,35],"yao":[27],"yc":[0],"yca":[0],"yd":[2,33],"ydx":[2],"ydxg":[2],"ydy":[33],"ydyg":[33],"ye":[3,20,23,24,33],"yeg":[33],"yeh":[24],"yer":[3],"yez":[20],"yg":[1,33],"ygd":[1],"ygdp":[1],"ygdpy":[1],"yh":[24],"yi":[6,9,11,12,22,25,32,40],"yil":[11],"yin":[9,22,40],"yix":[12],"yiz":[32],"yl":[11,22,35],"ylg":[35],"ylr":[22],"ylz":[11],"ylzh":[11],"ym":[26,27],"ymd":[27],"ymp":[26],"yo":[1,3,31,35],"yof":[35],"yon":[3,31],"you":[1],"ys":[3,23,34],"ysp":[34],"ysu":[23],"yt":[42],"yu":[2,8,9,11,33,42],"yua":[9,11],"yue":[2,33,42],"yux":[8],"yuy":[2],"yx":[8,12],"yxd":[12],"yxdz":[12],"yy":[2,11],"yyd":[2],"yydx":[2],"yydxg":[2],"yyl":[11],"yylz":[11],"yylzh":[11],"yz":[5,9,20,31,32],"yzh":[31],"yzhj":[31],"yzm":[5],"yzmn":[5],"yzq":[9],"yzqy":[9],"yzs":[20],"yzz":[32],"yzzl":[32],"z":[0,5,9,10,11,12,13,14,16,20,22,23,24,25,26,29,31,32,34,37,40,41],"za":[3],"zar":[3],"zg":[34,41],"zh":[0,5,9,10,11,12,13,14,16,20,22,23,24,25,26,29,31,32,34,37,40,41],"zha":[12],"zhe":[31,37],"zhi":[0,5,9,11,13,16,20,23,24,25,26,29,32,34,40,41],"zhj":[31],"zho":[10,14],"zhu":[22,32],"zl":[24,32],"zly":[24],"zlyh":[24],"zm":[5,13,14,26],"zml":[14],"zmn":[5],"zo":[25],"zon":[25],"zq":[9,10],"zqy":[9],"zr":[0],"zs":[20,25],"zsz":[25],"zszy":[25],"zu":[37],"zun":[37],"zx":[16],"zy":[22,23,25,32,40],"zyl":[22],"zylr":[22],"zyz":[32],"zyzz":[32],"zyzzl":[32],"zz":[3,32,37],"zza":[3],"zzl":[32],"上":[7],"上楼":[7],"与":[2],"与月":[2],"之":[0,5,9,11,13,16,20,23,24,25,26,29,32,34,40,41],"之仪":[25],"之光":[41],"之夜":[23],"之影":[40],"之心":[16],"之旗":[9],"之日":[0],"之林":[24],"之梦":[13,26],"之歌":[34],"之注":[32],"之火":[29],"之花":[11],"之誓":[20],"之魔":[5],"乐":[11,42],"乐团":[42],"乐园":[11],"人":[19,22],"仙":[26],"仙之":[26],"仪":[25],"余":[8],"余响":[8],"光":[41],"典":[27],"冰":[3],"冰风":[3],"剧":[15],"剧团":[15],"勇":[3,31],"勇士":[3],"勇者":[31],"千":[35],"千岩":[35],"华":[17],"华馆":[17],"印":[9],"卷":[31],"古":[1],"古的":[1],"史":[7],"史话":[7],"响":[8],"回":[24],"回声":[24],"团":[15,42],"园":[11],"园遗":[11],"固":[35],"地":[42],"地的":[42],"城":[31],"城勇":[31],"境":[23],"境示":[23],"士":[3,4,14],"士的":[14],"士道":[4],"声":[24],"声之":[24],"夜":[20,23,24,33],"夜之":[20],"夜歌":[33],"夜话":[24],"大":[42],"大地":[42],"女":[5,21],"如":[36],"如雷":[36],"宗":[25],"宗室":[25],"官":[18],"室":[25],"室之":[25],"尊":[37],"尊者":[37],"少":[21],"少女":[21],"岩":[1,35],"岩牢":[35],"幕":[14],"幕礼":[14],"平":[37],"平息":[37],"廊":[10],"廊终":[10],"异":[12],"异想":[12],"录":[39],"形":[17],"形骸":[17],"影":[22,40],"影猎":[22],"往":[39],"往生":[39],"律":[12],"律异":[12],"心":[16],"忆":[6,32],"忆之":[32],"怒":[36],"怜":[21],"怜爱":[21],"思":[38],"息":[37],"息鸣":[37],"悠":[1],"悠古":[1],"想":[12],"想断":[12],"教":[18],"教官":[18],"斗":[14],"斗士":[14],"断":[12],"断章":[12],"旗":[9],"旗印":[9],"日":[0,25],"日宗":[25],"时":[34],"时之":[34],"昔":[25,34],"昔日":[25],"昔时":[34],"星":[2,30],"星与":[2],"晓":[2],"晓歌":[2],"晨":[2],"晨星":[2],"曜":[27],"曜秘":[27],"曲":[10],"月":[2,33],"月的":[2,33],"未":[38],"未竟":[38],"来":[8],"来歆":[8],"林":[6,24],"林夜":[24],"林的":[6],"染":[4,28],"染砗":[28],"染血":[4],"梦":[13,17,26],"梦醒":[17],"楼":[7],"楼阁":[7],"歆":[8],"歆余":[8],"歌":[2,33,34],"水":[26],"水仙":[26],"沉":[16],"沉沦":[16],"沙":[7],"沙上":[7],"沦":[16],"沦之":[16],"注":[32],"注连":[32],"流":[30,42],"流星":[30],"流浪":[42],"浪":[42],"浪大":[42],"海":[28,41],"海染":[28],"海甘":[41],"深":[6,10],"深廊":[10],"深林":[6],"渡":[19],"渡过":[19],"火":[19,29],"火的":[19],"炎":[5],"炎之":[5],"炽":[5],"炽烈":[5],"烈":[5,19],"烈火":[19],"烈的":[5],"烬":[31],"烬城":[31],"爱":[21],"爱的":[21],"牢":[35],"牢固":[35],"猎":[22],"猎人":[22],"现":[23],"现之":[23],"甘":[41],"甘露":[41],"生":[39],"生录":[39],"白":[29],"白之":[29],"的":[1,2,3,4,5,6,14,19,21,30,33,36,37,38,42],"的乐":[42],"的勇":[3],"的夜":[33],"的尊":[37],"的少":[21],"的晓":[2],"的流":[30],"的炎":[5],"的盛":[36],"的磐":[1],"的终":[14],"的记":[6],"的贤":[19],"的遐":[38],"的骑":[4],"盛":[36],"盛怒":[36],"砂":[39],"砂往":[39],"砗":[28],"砗磲":[28],"磐":[1],"磐岩":[1],"磲":[28],"示":[23],"示现":[23],"礼":[14],"秘":[27],"秘典":[27],"穹":[23],"穹境":[23],"竟":[38],"竟的":[38],"章":[12],"纺":[33],"纺月":[33],"终":[10,14],"终幕":[14],"终曲":[10],"绘":[31],"绘卷":[31],"绝":[9],"绝缘":[9],"绿":[40],"绿之":[40],"缘":[9],"缘之":[9],"翠":[40],"翠绿":[40],"者":[31,37],"者绘":[31],"花":[11,41],"花海":[41],"苍":[29],"苍白":[29],"落":[11],"落之":[11],"血":[4],"血的":[4],"被":[21],"被怜":[21],"角":[14],"角斗":[14],"誓":[20],"记":[6,17],"记忆":[6],"话":[7,24],"谐":[12],"谐律":[12],"贤":[19],"贤人":[19],"起":[0],"起之":[0],"辰":[39],"辰砂":[39],"过":[19],"过烈":[19],"连":[32],"迷":[3],"迷途":[3],"追":[32],"追忆":[32],"逆":[30],"逆飞":[30],"逐":[22],"逐影":[22],"途":[3],"途的":[3],"遐":[38],"遐思":[38],"道":[4],"遗":[11],"遗落":[11],"醒":[17],"醒形":[17],"金":[13,15],"金之":[13],"金剧":[15],"长":[20],"长夜":[20],"阁":[7],"阁史":[7],"雷":[36,37],"雷的":[36,37],"露":[41],"露之":[41],"风":[0,3],"风起":[0],"风迷":[3],"飞":[30],"飞的":[30],"饰":[13],"饰金":[13],"馆":[17],"馆梦":[17],"骑":[4],"骑士":[4],"骸":[17],"骸记":[17],"魔":[5],"魔女":[5],"鸣":[37],"鸣雷":[37],"黄":[15],"黄金":[15],"黑":[27],"黑曜":[27]},
+  },
+};
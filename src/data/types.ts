@@ -120,6 +120,25 @@ export type Character = {
   imagePath: string; // Local serving path
 };
 
+// Loaded on demand from public/character-detail/<language>/<id>.json
+export type CharacterTalent = {
+  name: string;
+  description: string;
+};
+
+export type CharacterConstellation = {
+  name: string;
+  description: string;
+};
+
+export type CharacterDetail = {
+  id: string;
+  language: Language;
+  baseInfo: Record<string, string>;
+  talents: CharacterTalent[];
+  constellations: CharacterConstellation[];
+};
+
 export type Weapon = {
   id: string;
   rarity: Rarity;
@@ -336,3 +355,11 @@ export type ArtifactScoreConfig = {
   global: GlobalStatWeights;
   characters: Record<string, StatWeightMap>;
 };
+
+export type SearchCategory = "characters" | "weapons" | "artifacts";
+
+// Prebuilt name search of one category, written by scripts/search_index.py
+export type SearchIndex = {
+  ids: string[];
+  tokens: Record<string, number[]>; // normalized token -> positions in ids
+};
@@ -1,3 +1,8 @@
+import {
+  substatBitOrder,
+  substatDrawMasks,
+  substatDrawProbabilities,
+} from "../data/chanceTables";
 import { elementalMainStats, statPoolWithWeights } from "../data/constants";
 import type {
   MainStat,
@@ -10,15 +15,16 @@ import type {
 
 type SlotKind = "flowerPlume" | "sands" | "goblet" | "circlet";
 
-const SUBSTAT_DRAW_COUNT = 4;
-
 const MAIN_STAT_POOLS: Record<MainStatSlot, Record<MainStat, number>> = {
   sands: statPoolWithWeights.sands as Record<MainStat, number>,
   goblet: statPoolWithWeights.goblet as Record<MainStat, number>,
   circlet: statPoolWithWeights.circlet as Record<MainStat, number>,
 };
 
-const SUBSTAT_POOL = statPoolWithWeights.substat as Record<SubStat, number>;
+// Draw probabilities per main stat are precomputed by scripts/chance_tables.py
+const SUBSTAT_BITS = new Map<SubStat, number>(
+  substatBitOrder.map((stat, index) => [stat, 1 << index])
+);
 
 export interface SlotChanceResult {
   flowerPlume: number;
@@ -91,150 +97,36 @@ function computeSubstatSuccessProbability(
   mainStat: MainStatPlus,
   slotConfig: SlotConfig
 ): number {
-  const pool = Object.entries(SUBSTAT_POOL)
-    .filter(([stat]) => stat !== mainStat)
-    .map(([stat, weight]) => ({ stat: stat as SubStat, weight }));
-
-  if (pool.length < SUBSTAT_DRAW_COUNT) {
-    return 0;
-  }
-
-  const totalWeight = pool.reduce((sum, entry) => sum + entry.weight, 0);
-  if (totalWeight <= 0) {
-    return 0;
-  }
-
-  const mainStatCovers = (stat: SubStat) => stat === mainStat;
-  const effectiveMust = Array.from(new Set(slotConfig.mustPresent)).filter(
-    (stat) => !mainStatCovers(stat)
-  );
-
-  if (effectiveMust.length > SUBSTAT_DRAW_COUNT) {
-    return 0;
-  }
-
-  const poolIndexByStat = new Map<SubStat, number>();
-  let poolIndex = 0;
-  for (const entry of pool) {
-    poolIndexByStat.set(entry.stat, poolIndex);
-    poolIndex++;
-  }
-
-  for (const stat of effectiveMust) {
-    if (!poolIndexByStat.has(stat)) {
-      return 0;
-    }
-  }
-
-  const weights = pool.map((entry) => entry.weight);
-  const memo = new Map<number, number>();
-  memo.set(0, 1);
-
-  const combinationIterator = createCombinationIterator(
-    pool.length,
-    SUBSTAT_DRAW_COUNT
-  );
+  // The main stat can not roll as a substat but still counts towards the filter
+  const mainStatBit = SUBSTAT_BITS.get(mainStat as SubStat) ?? 0;
+  const probabilities = substatDrawProbabilities[mainStatBit ? mainStat : ""];
+  const mustPresentMask = substatMask(slotConfig.mustPresent);
+  const substatsMask = substatMask(slotConfig.substats);
 
   let probability = 0;
 
-  combinationIterator((indices) => {
-    const combination = indices.map((index) => pool[index].stat);
-    if (!effectiveMust.every((stat) => combination.includes(stat))) {
-      return;
-    }
-    if (!checkSlotMatch(combination, mainStat, slotConfig)) {
-      return;
-    }
-    const mask = indices.reduce((acc, index) => acc | (1 << index), 0);
-    probability += subsetProbability(mask, weights, totalWeight, memo);
-  });
-
-  return probability;
-}
-
-function checkSlotMatch(
-  selectedSubstats: SubStat[],
-  mainStat: MainStatPlus,
-  slotConfig: SlotConfig
-): boolean {
-  const available = new Set<SubStat>(selectedSubstats);
-  if (SUBSTAT_POOL[mainStat as SubStat] !== undefined) {
-    available.add(mainStat as SubStat);
+  for (let i = 0; i < substatDrawMasks.length; i++) {
+    if (probabilities[i] === 0) continue;
+    const available = substatDrawMasks[i] | mainStatBit;
+    if ((available & mustPresentMask) !== mustPresentMask) continue;
+    if (countBits(available & substatsMask) < slotConfig.minStatCount) continue;
+    probability += probabilities[i];
   }
 
-  for (const must of slotConfig.mustPresent) {
-    if (!available.has(must)) {
-      return false;
-    }
-  }
-
-  let matchCount = 0;
-  for (const stat of slotConfig.substats) {
-    if (available.has(stat)) {
-      matchCount++;
-    }
-  }
-
-  return matchCount >= slotConfig.minStatCount;
+  return probability;
 }
 
-type CombinationIterator = (callback: (indices: number[]) => void) => void;
-
-function createCombinationIterator(n: number, k: number): CombinationIterator {
-  return (callback: (indices: number[]) => void) => {
-    const indices: number[] = [];
-
-    const backtrack = (start: number, depth: number) => {
-      if (depth === k) {
-        callback([...indices]);
-        return;
-      }
-
-      for (let i = start; i <= n - (k - depth); i++) {
-        indices[depth] = i;
-        backtrack(i + 1, depth + 1);
-      }
-    };
-
-    if (k <= n && k > 0) {
-      backtrack(0, 0);
-    }
-  };
+function substatMask(stats: SubStat[]): number {
+  return stats.reduce((mask, stat) => mask | (SUBSTAT_BITS.get(stat) ?? 0), 0);
 }
 
-function subsetProbability(
-  mask: number,
-  weights: number[],
-  totalWeight: number,
-  memo: Map<number, number>
-): number {
-  if (memo.has(mask)) {
-    return memo.get(mask)!;
+function countBits(mask: number): number {
+  let count = 0;
+  while (mask) {
+    mask &= mask - 1;
+    count++;
   }
-
-  let subsetWeight = 0;
-  for (let i = 0; i < weights.length; i++) {
-    if (mask & (1 << i)) {
-      subsetWeight += weights[i];
-    }
-  }
-
-  let value = 0;
-
-  for (let i = 0; i < weights.length; i++) {
-    if (!(mask & (1 << i))) continue;
-    const weight = weights[i];
-    const maskWithout = mask & ~(1 << i);
-    const sumWithout = subsetWeight - weight;
-    const denominator = totalWeight - sumWithout;
-    if (denominator <= 0) continue;
-    value +=
-      (weight / denominator) *
-      subsetProbability(maskWithout, weights, totalWeight, memo);
-  }
-
-  memo.set(mask, value);
-  return value;
+  return count;
 }
 
 interface MainStatChoice {
@@ -0,0 +1,61 @@
+import type { CharacterDetail, Language } from "@/data/types";
+import { getAssetUrl } from "@/lib/utils";
+
+// Talents and constellations are too large for i18n-game.ts, so each
+// (character, language) is a separate chunk written by scripts/character_details.py
+const cache = new Map<string, Promise<CharacterDetail | null>>();
+
+function isCharacterDetail(data: unknown): data is CharacterDetail {
+  if (!data || typeof data !== "object") return false;
+  const detail = data as Partial<CharacterDetail>;
+  return (
+    typeof detail.id === "string" &&
+    typeof detail.baseInfo === "object" &&
+    Array.isArray(detail.talents) &&
+    Array.isArray(detail.constellations)
+  );
+}
+
+async function loadCharacterDetail(
+  id: string,
+  language: Language
+): Promise<CharacterDetail | null> {
+  const response = await fetch(
+    getAssetUrl(`/character-detail/${language}/${id}.json`)
+  );
+
+  if (!response.ok) {
+    // Not scraped yet (e.g. a newly added character)
+    if (response.status === 404) return null;
+    throw new Error(`Character detail error: ${response.statusText}`);
+  }
+
+  const data: unknown = await response.json();
+  if (!isCharacterDetail(data)) {
+    throw new Error(`Invalid character detail for ${id}`);
+  }
+  return data;
+}
+
+/**
+ * Fetch the talents, constellations and base info of a character.
+ * Requests are cached per (id, language); failed requests are retried on the next call.
+ * @returns The detail, or null if none was written for this character
+ */
+export function fetchCharacterDetail(
+  id: string,
+  language: Language
+): Promise<CharacterDetail | null> {
+  const key = `${language}/${id}`;
+  let request = cache.get(key);
+  if (!request) {
+    request = loadCharacterDetail(id, language);
+    request.catch(() => cache.delete(key));
+    cache.set(key, request);
+  }
+  return request;
+}
+
+export function clearCharacterDetailCache(): void {
+  cache.clear();
+}
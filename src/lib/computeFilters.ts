@@ -3,7 +3,8 @@
  * Based on V3 algorithm with coverage theorem and merge rules
  */
 
-import { artifactHalfSetsById, elementalMainStats } from "../data/constants";
+import { artifactHalfSetMembers, elementalMainStats } from "../data/constants";
+import { artifacts } from "../data/resources";
 import {
   type ArtifactSetConfigs,
   type Build,
@@ -209,20 +210,39 @@ function getRelevantArtifactSets(build: Build): string[] {
     build.halfSet1 !== undefined &&
     build.halfSet2 !== undefined
   ) {
-    const halfSet1 = artifactHalfSetsById[build.halfSet1];
-    const halfSet2 = artifactHalfSetsById[build.halfSet2];
+    const members1 = artifactHalfSetMembers[build.halfSet1];
+    const members2 = artifactHalfSetMembers[build.halfSet2];
 
-    if (!halfSet1 || !halfSet2) {
+    if (!members1 || !members2) {
       return [];
     }
 
-    const setsSet = new Set([...halfSet1.setIds, ...halfSet2.setIds]);
-    return Array.from(setsSet);
+    return mergeSortedIndices(members1, members2).map(
+      (index) => artifacts[index].id
+    );
   }
 
   return [];
 }
 
+/**
+ * Union of two sorted index arrays, in sorted order without duplicates
+ */
+function mergeSortedIndices(a: number[], b: number[]): number[] {
+  const result: number[] = [];
+  let i = 0;
+  let j = 0;
+
+  while (i < a.length || j < b.length) {
+    const next = j >= b.length || (i < a.length && a[i] <= b[j]) ? a[i] : b[j];
+    if (next === a[i]) i++;
+    if (next === b[j]) j++;
+    result.push(next);
+  }
+
+  return result;
+}
+
 /**
  * Create a config from a single build
  */
@@ -0,0 +1,60 @@
+import { searchIndex } from "@/data/searchIndex";
+import type { SearchCategory } from "@/data/types";
+
+const CJK = /[\u3400-\u4dbf\u4e00-\u9fff]/;
+const NON_SEARCHABLE = /[^a-z0-9\u3400-\u4dbf\u4e00-\u9fff]/g;
+
+/**
+ * Same normalization as normalize() in scripts/search_index.py: accents and
+ * full-width forms folded, lowercase, only letters, digits and CJK kept
+ */
+export function normalizeSearchText(text: string): string {
+  return text
+    .normalize("NFKD")
+    .replace(/\p{M}/gu, "")
+    .toLowerCase()
+    .replace(NON_SEARCHABLE, "");
+}
+
+/** Positions of a token; own keys only, "constructor" is a query, not a method */
+function lookup(tokens: Record<string, number[]>, token: string): number[] {
+  return Object.hasOwn(tokens, token) ? tokens[token] : [];
+}
+
+function intersect(a: number[], b: Set<number>): Set<number> {
+  return new Set(a.filter((position) => b.has(position)));
+}
+
+/**
+ * IDs whose EN name, ZH name or pinyin (full or initials) match the query,
+ * or null when the query has nothing searchable (no filtering).
+ * Queries up to the longest indexed n-gram are a single lookup; longer ones
+ * intersect the items of their n-grams, which can let through rare false
+ * positives but never drops a match.
+ * A single letter only matches the start of a word (or a pinyin initial), so
+ * "a" finds "Ayaka" but not every name containing an "a".
+ */
+export function searchIds(
+  category: SearchCategory,
+  query: string
+): Set<string> | null {
+  const q = normalizeSearchText(query);
+  if (!q) return null;
+
+  const { ids, tokens } = searchIndex[category];
+  let positions = new Set(lookup(tokens, q));
+
+  const size = CJK.test(q) ? 2 : 3;
+  if (q.length > size) {
+    let matches: Set<number> | null = null;
+    for (let i = 0; i + size <= q.length; i++) {
+      const gram = lookup(tokens, q.slice(i, i + size));
+      matches = matches ? intersect(gram, matches) : new Set(gram);
+      if (matches.size === 0) break;
+    }
+    // Pinyin initials longer than an n-gram are indexed as they are
+    positions = new Set([...positions, ...(matches ?? [])]);
+  }
+
+  return new Set([...positions].map((position) => ids[position]));
+}
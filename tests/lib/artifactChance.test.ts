@@ -6,6 +6,12 @@
  * we focus on testing behavior (edge cases, constraints) rather than exact numbers.
  */
 
+import {
+  substatBitOrder,
+  substatDrawMasks,
+  substatDrawProbabilities,
+} from "@/data/chanceTables";
+import { statPoolWithWeights } from "@/data/constants";
 import type { SetConfig, SlotConfig } from "@/data/types";
 import { computeSlotChance, computeSlotChances } from "@/lib/artifactChance";
 import { describe, expect, it } from "vitest";
@@ -268,3 +274,30 @@ describe("computeSlotChances", () => {
     expect(result.goblet).toBeLessThan(result.flowerPlume);
   });
 });
+
+describe("chance tables", () => {
+  it("are generated from the current substat weights", () => {
+    // Regenerate with scripts/chance_tables.py when this fails
+    expect(substatBitOrder).toEqual(Object.keys(statPoolWithWeights.substat));
+  });
+
+  it("has a probability distribution per main stat", () => {
+    for (const [mainStat, probabilities] of Object.entries(
+      substatDrawProbabilities
+    )) {
+      expect(probabilities).toHaveLength(substatDrawMasks.length);
+      const total = probabilities.reduce((sum, p) => sum + p, 0);
+      expect(total, mainStat).toBeCloseTo(1, 8);
+    }
+  });
+
+  it("never draws the main stat as a substat", () => {
+    substatBitOrder.forEach((stat, bit) => {
+      substatDrawMasks.forEach((mask, i) => {
+        if (mask & (1 << bit)) {
+          expect(substatDrawProbabilities[stat][i]).toBe(0);
+        }
+      });
+    });
+  });
+});
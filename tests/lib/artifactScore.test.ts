@@ -1,6 +1,10 @@
+import { STAT_WEIGHTS } from "@/data/statWeights";
 import type { ArtifactScoreConfig, CharacterData } from "@/data/types";
 import { calculateArtifactScore } from "@/lib/artifactScore";
+import { type GOODData, convertGOODToAccountData } from "@/lib/goodConversion";
 import { describe, expect, it } from "vitest";
+import goodScoring from "../fixtures/good-scoring.json";
+import goodScoringScores from "../fixtures/good-scoring.scores.json";
 
 // Test config with known weights
 const testConfig: ArtifactScoreConfig = {
@@ -255,3 +259,48 @@ describe("calculateArtifactScore", () => {
     });
   });
 });
+
+// Scores from scripts/scoring.py (regenerate with
+// `python scripts/scoring.py tests/fixtures/good-scoring.json --output tests/fixtures/good-scoring.scores.json`)
+describe("parity with the batch scoring engine", () => {
+  const defaultConfig: ArtifactScoreConfig = {
+    global: { flatAtk: 30, flatHp: 30, flatDef: 30 },
+    characters: STAT_WEIGHTS,
+  };
+  const [expected] = Object.values(goodScoringScores);
+  const { data } = convertGOODToAccountData(goodScoring as GOODData);
+
+  it("scores the same characters", () => {
+    const scored = data.characters
+      .filter((char) => Object.keys(char.artifacts).length > 0)
+      .map((char) => char.key)
+      .sort();
+    expect(scored).toEqual(Object.keys(expected.characters).sort());
+  });
+
+  it.each(Object.entries(expected.characters))(
+    "matches the scores of %s",
+    (key, pythonScore) => {
+      const char = data.characters.find((c) => c.key === key)!;
+      const result = calculateArtifactScore(char, defaultConfig);
+
+      expect(result.mainScore).toBeCloseTo(pythonScore.mainScore, 6);
+      expect(result.subScore).toBeCloseTo(pythonScore.subScore, 6);
+      expect(result.isComplete).toBe(pythonScore.isComplete);
+      for (const [slot, score] of Object.entries(pythonScore.slotMainScores)) {
+        expect(result.slotMainScores[slot]).toBeCloseTo(score, 6);
+      }
+      for (const [slot, score] of Object.entries(pythonScore.slotSubScores)) {
+        expect(result.slotSubScores[slot]).toBeCloseTo(score, 6);
+      }
+      expect(Object.keys(result.slotMaxSubScores).sort()).toEqual(
+        Object.keys(pythonScore.slotMaxSubScores).sort()
+      );
+      for (const [slot, score] of Object.entries(
+        pythonScore.slotMaxSubScores
+      )) {
+        expect(result.slotMaxSubScores[slot]).toBeCloseTo(score as number, 6);
+      }
+    }
+  );
+});
@@ -0,0 +1,81 @@
+import type { CharacterDetail } from "@/data/types";
+import {
+  clearCharacterDetailCache,
+  fetchCharacterDetail,
+} from "@/lib/characterDetails";
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
+
+const detail: CharacterDetail = {
+  id: "furina",
+  language: "en",
+  baseInfo: { Affiliation: "Court of Fontaine" },
+  talents: [{ name: "Soloist's Solicitation", description: "Normal Attack" }],
+  constellations: [{ name: "Love Is a Rebellious Bird", description: "C1" }],
+};
+
+const jsonResponse = (body: unknown, status = 200) =>
+  ({
+    ok: status >= 200 && status < 300,
+    status,
+    statusText: status === 404 ? "Not Found" : "Error",
+    json: () => Promise.resolve(body),
+  }) as Response;
+
+describe("characterDetails", () => {
+  const fetchMock = vi.fn();
+
+  beforeEach(() => {
+    clearCharacterDetailCache();
+    fetchMock.mockReset();
+    vi.stubGlobal("fetch", fetchMock);
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  it("fetches the chunk of the requested language", async () => {
+    fetchMock.mockResolvedValue(jsonResponse(detail));
+
+    await expect(fetchCharacterDetail("furina", "en")).resolves.toEqual(detail);
+    expect(fetchMock).toHaveBeenCalledWith(
+      expect.stringMatching(/\/character-detail\/en\/furina\.json$/)
+    );
+  });
+
+  it("reuses the request for the same character and language", async () => {
+    fetchMock.mockResolvedValue(jsonResponse(detail));
+
+    await Promise.all([
+      fetchCharacterDetail("furina", "en"),
+      fetchCharacterDetail("furina", "en"),
+    ]);
+    await fetchCharacterDetail("furina", "zh");
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+
+  it("returns null for characters without a chunk", async () => {
+    fetchMock.mockResolvedValue(jsonResponse(null, 404));
+
+    await expect(fetchCharacterDetail("new", "en")).resolves.toBeNull();
+  });
+
+  it("rejects invalid chunks and retries on the next call", async () => {
+    fetchMock.mockResolvedValueOnce(jsonResponse({ id: "furina" }));
+    await expect(fetchCharacterDetail("furina", "en")).rejects.toThrow(
+      "Invalid character detail"
+    );
+
+    fetchMock.mockResolvedValueOnce(jsonResponse(detail));
+    await expect(fetchCharacterDetail("furina", "en")).resolves.toEqual(detail);
+  });
+
+  it("rejects on server errors", async () => {
+    fetchMock.mockResolvedValue(jsonResponse(null, 500));
+
+    await expect(fetchCharacterDetail("furina", "en")).rejects.toThrow(
+      "Character detail error"
+    );
+  });
+});
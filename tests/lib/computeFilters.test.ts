@@ -1,3 +1,4 @@
+import { artifactHalfSetsById } from "@/data/constants";
 import { type Build, type BuildGroup, ComputeOptions } from "@/data/types";
 import {
   DEFAULT_COMPUTE_OPTIONS,
@@ -63,6 +64,46 @@ describe("computeArtifactFilters", () => {
       expect(result.length).toBeGreaterThanOrEqual(0);
     });
 
+    it("covers every member set of both half sets for 2pc+2pc", () => {
+      const buildGroups: BuildGroup[] = [
+        createBuildGroup({
+          builds: [
+            createBuild({
+              composition: "2pc+2pc",
+              artifactSet: undefined,
+              halfSet1: 9,
+              halfSet2: 7,
+            }),
+          ],
+        }),
+      ];
+      const result = computeArtifactFilters(buildGroups);
+
+      const expected = new Set([
+        ...artifactHalfSetsById[9].setIds,
+        ...artifactHalfSetsById[7].setIds,
+      ]);
+      expect(new Set(result.map((r) => r.setId))).toEqual(expected);
+      expect(result).toHaveLength(expected.size);
+    });
+
+    it("returns nothing for unknown half sets", () => {
+      const buildGroups: BuildGroup[] = [
+        createBuildGroup({
+          builds: [
+            createBuild({
+              composition: "2pc+2pc",
+              artifactSet: undefined,
+              halfSet1: 9,
+              halfSet2: 9999,
+            }),
+          ],
+        }),
+      ];
+
+      expect(computeArtifactFilters(buildGroups)).toEqual([]);
+    });
+
     it("includes character info in served characters", () => {
       const buildGroups: BuildGroup[] = [createBuildGroup()];
       const result = computeArtifactFilters(buildGroups);
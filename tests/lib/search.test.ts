@@ -0,0 +1,69 @@
+import { searchIndex } from "@/data/searchIndex";
+import { normalizeSearchText, searchIds } from "@/lib/search";
+import { describe, expect, it } from "vitest";
+
+describe("normalizeSearchText", () => {
+  it("lowercases and drops spaces and punctuation", () => {
+    expect(normalizeSearchText("Wolf's Gravestone")).toBe("wolfsgravestone");
+  });
+
+  it("folds accents and full-width letters", () => {
+    expect(normalizeSearchText("Ｃlorinde")).toBe("clorinde");
+    expect(normalizeSearchText("Fréminet")).toBe("freminet");
+  });
+
+  it("keeps CJK characters", () => {
+    expect(normalizeSearchText("胡 桃")).toBe("胡桃");
+  });
+});
+
+describe("searchIds", () => {
+  it("returns null for queries without searchable text", () => {
+    expect(searchIds("characters", "")).toBeNull();
+    expect(searchIds("characters", "  ' ")).toBeNull();
+  });
+
+  it("matches EN names from any word", () => {
+    expect(searchIds("characters", "Hu Tao")).toEqual(new Set(["hu_tao"]));
+    expect(searchIds("characters", "ayaka")).toContain("kamisato_ayaka");
+  });
+
+  it("matches EN substrings inside a word", () => {
+    const matches = searchIds("weapons", "ward");
+    expect(matches).toContain("skyward_harp");
+    expect(matches).toContain("skyward_blade");
+  });
+
+  it("matches ZH names and single characters", () => {
+    expect(searchIds("characters", "胡桃")).toEqual(new Set(["hu_tao"]));
+    expect(searchIds("characters", "桃")).toContain("hu_tao");
+  });
+
+  it("matches full pinyin and initials", () => {
+    expect(searchIds("characters", "hutao")).toContain("hu_tao");
+    expect(searchIds("characters", "ht")).toContain("hu_tao");
+    expect(searchIds("weapons", "tkzy")).toContain("skyward_harp");
+  });
+
+  it("matches a single letter only at the start of a word", () => {
+    expect(searchIds("characters", "a")).toContain("kamisato_ayaka");
+    expect(searchIds("characters", "u")).not.toContain("hu_tao");
+  });
+
+  it("ignores Object.prototype keys", () => {
+    expect(searchIds("characters", "constructor")).toEqual(new Set());
+    expect(searchIds("characters", "toString")).toEqual(new Set());
+    expect(searchIds("characters", "__proto__")).toEqual(new Set());
+  });
+
+  it("returns an empty set when nothing matches", () => {
+    expect(searchIds("artifacts", "zzzz")).toEqual(new Set());
+  });
+
+  it("only returns IDs of the searched category", () => {
+    const ids = new Set(searchIndex.artifacts.ids);
+    for (const id of searchIds("artifacts", "of") ?? []) {
+      expect(ids.has(id)).toBe(true);
+    }
+  });
+});